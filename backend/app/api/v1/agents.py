@@ -20,12 +20,12 @@ from backend.app.services.savage_agents import (
     GammaAgent, SqueezeAgent, OptionsAgent, RedditAgent, MacroAgent
 )
 from backend.app.integrations.unified_monitor_bridge import MonitorBridge
+from core.utils.llm_gateway import LLMGatewayError, get_gateway
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-GROQ_CHAT_URL = "https://api.groq.com/openai/v1/chat/completions"
 GROQ_MODEL_DEFAULT = "llama-3.3-70b-versatile"
 
 # Agent registry
@@ -69,34 +69,22 @@ async def signal_brief(payload: Optional[Dict[str, Any]] = Body(default=None)):
         "Concise bullets; no grounding URLs required."
     )
     model = os.getenv("GROQ_MODEL", GROQ_MODEL_DEFAULT)
-    groq_body = {
-        "model": model,
-        "messages": [
-            {"role": "system", "content": system},
-            {"role": "user", "content": user_block},
-        ],
-        "temperature": 0.35,
-        "max_tokens": 900,
-    }
+    messages = [
+        {"role": "system", "content": system},
+        {"role": "user", "content": user_block},
+    ]
     try:
-        async with httpx.AsyncClient(timeout=45.0) as client:
-            resp = await client.post(
-                GROQ_CHAT_URL,
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-                json=groq_body,
-            )
-        resp.raise_for_status()
-        raw = resp.json()
-        text = (raw.get("choices") or [{}])[0].get("message", {}).get("content") or ""
-        if not text.strip():
-            raise ValueError("empty Groq content")
-        return {"analysis": text.strip(), "model": model, "timestamp": datetime.now().isoformat()}
-    except httpx.HTTPStatusError as e:
-        logger.error("signal-brief Groq HTTP error: %s", e)
-        raise HTTPException(502, detail=f"Groq error: {e.response.status_code}") from e
+        result = await get_gateway().acomplete(
+            messages, model, provider="groq", max_tokens=900, temperature=0.35, timeout=45.0,
+        )
+        return {"analysis": result["content"].strip(), "model": model, "timestamp": datetime.now().isoformat()}
+    except LLMGatewayError as e:
+        cause = e.__cause__
+        if isinstance(cause, httpx.HTTPStatusError):
+            logger.error("signal-brief Groq HTTP error: %s", cause)
+            raise HTTPException(502, detail=f"Groq error: {cause.response.status_code}") from e
+        logger.error("signal-brief failed: %s", e)
+        raise HTTPException(502, detail=str(e)) from e
     except Exception as e:
         logger.error("signal-brief failed: %s", e)
         raise HTTPException(502, detail=str(e)) from e
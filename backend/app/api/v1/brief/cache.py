@@ -1,21 +1,24 @@
 """
-brief/cache.py — Module-level TTL cache + asyncio compute mutex.
+brief/cache.py — /brief/master result cache (tiered cache, single-flight compute).
 
-Only ONE /brief/master computation may run at a time.
-Concurrent requests wait for in-flight compute then serve from cache.
+Only ONE /brief/master computation may run at a time: concurrent requests
+share the in-flight compute (single-flight) and then serve from cache.
 Prevents 2x ThreadPoolExecutor spikes from OOM-ing Render's 512MB instance.
+
+Within BRIEF_STALE_TTL after expiry the previous brief is served immediately
+while one background recompute runs, so TTL boundaries no longer stall requests.
 """
-import asyncio
-import time
 import logging
 
+from core.utils.tiered_cache import MB, get_cache as _named_cache
+
 logger = logging.getLogger(__name__)
 
 BRIEF_CACHE_TTL = 120  # 2-minute TTL
+BRIEF_STALE_TTL = 600  # serve-stale window while a refresh runs
+BRIEF_KEY = "master"
 
-_brief_cache:      dict | None = None
-_brief_cache_time: float | None = None
-_brief_lock = asyncio.Lock()
+_brief_cache = _named_cache("brief", ttl=BRIEF_CACHE_TTL, stale_ttl=BRIEF_STALE_TTL, max_bytes=8 * MB)
 
 # ── Lazy singletons for heavy objects (init once per process, reuse) ─────────
 _singletons: dict = {}
@@ -30,17 +33,14 @@ def lazy(key: str, factory):
 
 def get_cache() -> dict | None:
     """Return cached brief if still within TTL, else None."""
-    global _brief_cache, _brief_cache_time
-    if _brief_cache and _brief_cache_time:
-        age = time.time() - _brief_cache_time
-        if age < BRIEF_CACHE_TTL:
-            logger.info(f"📋 Brief cache hit ({age:.0f}s old)")
-            return _brief_cache
-    return None
+    return _brief_cache.get(BRIEF_KEY)
 
 
 def set_cache(result: dict) -> None:
     """Persist result to cache."""
-    global _brief_cache, _brief_cache_time
-    _brief_cache      = result
-    _brief_cache_time = time.time()
+    _brief_cache.set(BRIEF_KEY, result)
+
+
+async def get_or_compute(compute) -> dict:
+    """Cached brief, stale brief + background refresh, or a single-flight compute()."""
+    return await _brief_cache.aget_or_load(BRIEF_KEY, compute)
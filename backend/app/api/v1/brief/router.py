@@ -28,7 +28,7 @@ from datetime import datetime
 
 from fastapi import APIRouter
 
-from .cache import get_cache, set_cache, _brief_lock
+from .cache import get_or_compute
 from .alert_engine import PreSignalAlertEngine
 from .fetchers.core import (
     fetch_macro_regime, fetch_fedwatch, fetch_veto,
@@ -108,83 +108,76 @@ async def master_brief():
     Wave 2: build_derivatives + build_kill_chain (from shared data, sync)
     Wave 3: hidden_hands + macro + thresholds + nowcast + ADP + GDP + jobless + pivots + squeeze
     """
-    # ── Fast path: cache hit ──────────────────────────────────────────────────
-    cached = get_cache()
-    if cached is not None:
-        return cached
-
-    # ── Slow path: compute under mutex ───────────────────────────────────────
-    async with _brief_lock:
-        cached = get_cache()
-        if cached is not None:
-            return cached
-
-        t0   = time.time()
-        loop = asyncio.get_event_loop()
-        results = {}
-
-        # ── Wave 1: SHARED PRIMITIVES (heaviest: GEX downloads options chain) ─
-        wave1 = {
-            '_gex':             (fetch_gex_shared,   6),
-            '_cot':             (fetch_cot_shared,   4),
-            'fed_intelligence': (fetch_fedwatch,     4),
-            'economic_veto':    (fetch_veto,         4),
-        }
-        w1 = await _run_wave(wave1, loop, max_workers=2)
-        results['fed_intelligence'] = w1.get('fed_intelligence', {'error': 'timeout'})
-        results['economic_veto']    = w1.get('economic_veto', {'error': 'timeout'})
-
-        gex_shared = w1.get('_gex', {'error': 'timeout'})
-        cot_shared = w1.get('_cot', {'error': 'timeout'})
-
-        # ── Wave 2: DERIVED LAYERS (sync — zero API calls, just dict transforms) ─
-        results['derivatives']      = build_derivatives(gex_shared, cot_shared)
-        results['kill_chain_state'] = build_kill_chain(
-            gex_shared, cot_shared,
-            results['fed_intelligence'],
-        )
-
-        # ── Wave 3: REMAINING LAYERS (all independent, 2 workers) ─────────────
-        wave3 = {
-            'hidden_hands':     (fetch_hidden_hands,        8),
-            'macro_regime':     (fetch_macro_regime,        6),
-            'dynamic_thresholds': (fetch_thresholds,        6),
-            'nowcast':          (fetch_nowcast,             5),
-            'adp_prediction':   (fetch_adp_prediction,      5),
-            'gdp_nowcast':      (fetch_gdp_nowcast,         5),
-            'jobless_claims':   (fetch_jobless_claims,      5),
-            'pivots':           (fetch_pivots,              5),
-            'squeeze_context':  (fetch_squeeze_context,     5),
-            'dark_pool':        (fetch_darkpool_context,    6),
-            'vol_regime':       (fetch_vol_regime,          6),
-            'axlfi_walls':      (fetch_axlfi_walls,         6),
-            'ta_consensus':     (fetch_ta_consensus,        6),
-        }
-        results.update(await _run_wave(wave3, loop, max_workers=2))
-
-        # ── Post-processing ──────────────────────────────────────────────────
-        regime_mod = results.get('macro_regime', {}).get('modifier', {}).get('long_penalty', 0)
-        veto_cap   = results.get('economic_veto', {}).get('confidence_cap', 65)
-        kc         = results.get('kill_chain_state', {})
-        kc['regime_modifier'] = regime_mod
-        kc['confidence_cap']  = veto_cap
-        kc['cap_reason'] = (
-            f"{results.get('economic_veto', {}).get('next_event', '')} "
-            f"{results.get('economic_veto', {}).get('hours_away', '')}h"
-        )
-        # Always ensure signals key is present (guards against fallback path)
-        kc.setdefault('signals', [])
-        results['kill_chain_state'] = kc
+    return await get_or_compute(_compute_master_brief)
 
-        try:
-            results['alerts'] = _alert_engine.get_alerts(results)
-        except Exception as e:
-            logger.warning(f"Alert engine failed: {e}")
-            results['alerts'] = []
 
-        results['scan_time'] = round(time.time() - t0, 2)
-        results['as_of']     = datetime.utcnow().isoformat()
-        results['data_quality_flags'] = _build_data_quality_flags(results)
+async def _compute_master_brief() -> dict:
+    """Compute the full brief (runs single-flight under the brief cache)."""
+    t0   = time.time()
+    loop = asyncio.get_event_loop()
+    results = {}
+
+    # ── Wave 1: SHARED PRIMITIVES (heaviest: GEX downloads options chain) ─
+    wave1 = {
+        '_gex':             (fetch_gex_shared,   6),
+        '_cot':             (fetch_cot_shared,   4),
+        'fed_intelligence': (fetch_fedwatch,     4),
+        'economic_veto':    (fetch_veto,         4),
+    }
+    w1 = await _run_wave(wave1, loop, max_workers=2)
+    results['fed_intelligence'] = w1.get('fed_intelligence', {'error': 'timeout'})
+    results['economic_veto']    = w1.get('economic_veto', {'error': 'timeout'})
+
+    gex_shared = w1.get('_gex', {'error': 'timeout'})
+    cot_shared = w1.get('_cot', {'error': 'timeout'})
+
+    # ── Wave 2: DERIVED LAYERS (sync — zero API calls, just dict transforms) ─
+    results['derivatives']      = build_derivatives(gex_shared, cot_shared)
+    results['kill_chain_state'] = build_kill_chain(
+        gex_shared, cot_shared,
+        results['fed_intelligence'],
+    )
+
+    # ── Wave 3: REMAINING LAYERS (all independent, 2 workers) ─────────────
+    wave3 = {
+        'hidden_hands':     (fetch_hidden_hands,        8),
+        'macro_regime':     (fetch_macro_regime,        6),
+        'dynamic_thresholds': (fetch_thresholds,        6),
+        'nowcast':          (fetch_nowcast,             5),
+        'adp_prediction':   (fetch_adp_prediction,      5),
+        'gdp_nowcast':      (fetch_gdp_nowcast,         5),
+        'jobless_claims':   (fetch_jobless_claims,      5),
+        'pivots':           (fetch_pivots,              5),
+        'squeeze_context':  (fetch_squeeze_context,     5),
+        'dark_pool':        (fetch_darkpool_context,    6),
+        'vol_regime':       (fetch_vol_regime,          6),
+        'axlfi_walls':      (fetch_axlfi_walls,         6),
+        'ta_consensus':     (fetch_ta_consensus,        6),
+    }
+    results.update(await _run_wave(wave3, loop, max_workers=2))
+
+    # ── Post-processing ──────────────────────────────────────────────────
+    regime_mod = results.get('macro_regime', {}).get('modifier', {}).get('long_penalty', 0)
+    veto_cap   = results.get('economic_veto', {}).get('confidence_cap', 65)
+    kc         = results.get('kill_chain_state', {})
+    kc['regime_modifier'] = regime_mod
+    kc['confidence_cap']  = veto_cap
+    kc['cap_reason'] = (
+        f"{results.get('economic_veto', {}).get('next_event', '')} "
+        f"{results.get('economic_veto', {}).get('hours_away', '')}h"
+    )
+    # Always ensure signals key is present (guards against fallback path)
+    kc.setdefault('signals', [])
+    results['kill_chain_state'] = kc
+
+    try:
+        results['alerts'] = _alert_engine.get_alerts(results)
+    except Exception as e:
+        logger.warning(f"Alert engine failed: {e}")
+        results['alerts'] = []
+
+    results['scan_time'] = round(time.time() - t0, 2)
+    results['as_of']     = datetime.utcnow().isoformat()
+    results['data_quality_flags'] = _build_data_quality_flags(results)
 
-        set_cache(results)
-        return results
+    return results
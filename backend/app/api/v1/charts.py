@@ -6,12 +6,13 @@ Does NOT compute — reads the cached state from TrapMatrixOrchestrator.
 
 Endpoints:
   GET /charts/{symbol}/matrix  → Full Trap Matrix state (levels, traps, conviction, staleness)
+  GET /charts/matrix?symbols=  → Same, for several symbols from one shared layer fan-out
   GET /charts/{symbol}/ohlc    → yfinance OHLC candle data for chart base layer
 """
 
+import asyncio
 import logging
 import sys
-import time
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
@@ -21,6 +22,8 @@ from fastapi import APIRouter, HTTPException, Query
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from core.utils.tiered_cache import MB, get_cache
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
@@ -45,12 +48,14 @@ def _get_orchestrator():
 
 # ── OHLC Cache (prevents yfinance spam on 30s polls) ─────────────────────────
 
-_ohlc_cache: dict[tuple, dict] = {}  # (symbol, period, interval) -> {data, timestamp}
-
 # Intraday periods change fast — shorter TTL
 _INTRADAY_PERIODS = {"1d", "5d"}
 _INTRADAY_TTL = 30   # 30s — match frontend poll
 _DAILY_TTL = 120      # 2min — daily candles barely change mid-session
+_OHLC_STALE_TTL = 300  # serve previous candles while one refresh runs
+
+# (symbol, period, interval) -> response dict
+_ohlc_cache = get_cache("ohlc", ttl=_DAILY_TTL, stale_ttl=_OHLC_STALE_TTL, max_bytes=32 * MB)
 
 
 def _ohlc_cache_ttl(period: str) -> int:
@@ -60,7 +65,10 @@ def _ohlc_cache_ttl(period: str) -> int:
 # ── Endpoints ────────────────────────────────────────────────────────────────
 
 @router.get("/charts/{symbol}/matrix")
-async def get_trap_matrix(symbol: str):
+async def get_trap_matrix(
+    symbol: str,
+    since: Optional[int] = Query(None, description="Version the client already holds — returns only the delta"),
+):
     """
     Get the full Trap Matrix state for a symbol.
 
@@ -73,16 +81,60 @@ async def get_trap_matrix(symbol: str):
     - Rebuild decision from state diffing
 
     Each data layer uses its own cache TTL — this endpoint never blocks on stale data.
+
+    With ?since=<version> equal to the previous version, only the delta
+    (added/removed/changed traps) is returned; otherwise the full state.
+    Non-empty deltas are also pushed to the /ws/market/{symbol} channel.
+    """
+    state = _build_states([symbol])[symbol.upper()]
+    delta = await _publish_delta(state)
+
+    if since is not None and since == delta.get("from_version"):
+        return {"symbol": state.symbol, "version": state.version, "delta": delta}
+    return state.to_dict()
+
+
+@router.get("/charts/matrix")
+async def get_trap_matrices(
+    symbols: str = Query("SPY,QQQ,IWM", description="Comma-separated symbols"),
+):
+    """
+    Get full Trap Matrix states for several symbols at once.
+
+    All symbols share one concurrent layer fan-out, so a watchlist costs
+    about as much as its slowest layer instead of one build per symbol.
+    Returns {symbol: state}; non-empty deltas are pushed as for a single symbol.
     """
+    wanted = list(dict.fromkeys(s.strip().upper() for s in symbols.split(",") if s.strip()))
+    if not wanted:
+        raise HTTPException(status_code=400, detail="No symbols given")
+    states = _build_states(wanted)
+    for state in states.values():
+        await _publish_delta(state)
+    return {symbol: state.to_dict() for symbol, state in states.items()}
+
+
+def _build_states(symbols):
     orch = _get_orchestrator()
     try:
-        state = orch.get_current_state(symbol.upper())
-        return state.to_dict()
+        return orch.get_states([s.upper() for s in symbols])
     except Exception as e:
-        logger.error(f"Error fetching trap matrix for {symbol}: {e}", exc_info=True)
+        logger.error(f"Error fetching trap matrix for {', '.join(symbols)}: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Trap matrix error: {str(e)}")
 
 
+async def _publish_delta(state) -> dict:
+    """Push a non-empty delta to /ws/market/{symbol}; returns the delta."""
+    delta = state.delta or {}
+    if not delta.get("empty", True):
+        try:
+            from backend.app.core.websocket_manager import websocket_publisher
+            await websocket_publisher.publish_trap_matrix(state.symbol, delta)
+        except Exception as e:
+            logger.debug(f"Trap matrix delta push skipped: {e}")
+    return delta
+
+
 @router.get("/charts/{symbol}/ohlc")
 async def get_ohlc(
     symbol: str,
@@ -96,51 +148,48 @@ async def get_ohlc(
     Cached per (symbol, period, interval) to prevent yfinance spam on polling.
     """
     cache_key = (symbol.upper(), period, interval)
-    now = time.time()
-    ttl = _ohlc_cache_ttl(period)
-
-    # Return cached if fresh
-    cached = _ohlc_cache.get(cache_key)
-    if cached and (now - cached["timestamp"]) < ttl:
-        return cached["data"]
-
     try:
-        import yfinance as yf
-
-        ticker = yf.Ticker(symbol.upper())
-        df = ticker.history(period=period, interval=interval)
-
-        if df is None or df.empty:
-            raise HTTPException(status_code=404, detail=f"No price data for {symbol}")
-
-        # Format for lightweight-charts
-        candles = []
-        for idx, row in df.iterrows():
-            candles.append({
-                "time": int(idx.timestamp()),
-                "open": round(float(row["Open"]), 2),
-                "high": round(float(row["High"]), 2),
-                "low": round(float(row["Low"]), 2),
-                "close": round(float(row["Close"]), 2),
-                "volume": int(row["Volume"]),
-            })
-
-        result = {
-            "symbol": symbol.upper(),
-            "period": period,
-            "interval": interval,
-            "candles": candles,
-            "count": len(candles),
-            "timestamp": datetime.utcnow().isoformat(),
-        }
-
-        # Store in cache
-        _ohlc_cache[cache_key] = {"data": result, "timestamp": now}
-
-        return result
-
+        return await _ohlc_cache.aget_or_load(
+            cache_key,
+            lambda: asyncio.to_thread(_fetch_ohlc, symbol, period, interval),
+            ttl=_ohlc_cache_ttl(period),
+        )
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error fetching OHLC for {symbol}: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"OHLC error: {str(e)}")
+
+
+def _fetch_ohlc(symbol: str, period: str, interval: str) -> dict:
+    """Download and format candles (runs in a worker thread)."""
+    import yfinance as yf
+
+    ticker = yf.Ticker(symbol.upper())
+    df = ticker.history(period=period, interval=interval)
+
+    if df is None or df.empty:
+        raise HTTPException(status_code=404, detail=f"No price data for {symbol}")
+
+    # Format for lightweight-charts
+    candles = []
+    for idx, row in df.iterrows():
+        candles.append({
+            "time": int(idx.timestamp()),
+            "open": round(float(row["Open"]), 2),
+            "high": round(float(row["High"]), 2),
+            "low": round(float(row["Low"]), 2),
+            "close": round(float(row["Close"]), 2),
+            "volume": int(row["Volume"]),
+        })
+
+    result = {
+        "symbol": symbol.upper(),
+        "period": period,
+        "interval": interval,
+        "candles": candles,
+        "count": len(candles),
+        "timestamp": datetime.utcnow().isoformat(),
+    }
+
+    return result
@@ -19,12 +19,13 @@ from pydantic import BaseModel
 from typing import Optional, List, Any
 import logging
 
+from core.utils.llm_gateway import get_gateway
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
-GROQ_MODEL   = "llama-3.3-70b-versatile"
+GROQ_MODEL   = "llama-3.3-70b-versatile"  # served by the LLM gateway's "groq" provider
 
 # ── In-memory oracle cache (hash → {result, cached_until}) ────────────────────
 _oracle_cache: dict = {}
@@ -513,27 +514,17 @@ async def oracle_brief(req: BriefOracleRequest):
         + json.dumps(oracle_payload, indent=2, default=str)
     )
 
-    groq_payload = {
-        "model": GROQ_MODEL,
-        "messages": [
-            {"role": "system", "content": NYX_SYSTEM},
-            {"role": "user",   "content": user_prompt},
-        ],
-        "temperature": 0.25,
-        "max_tokens":  900,
-        "response_format": {"type": "json_object"},
-    }
+    messages = [
+        {"role": "system", "content": NYX_SYSTEM},
+        {"role": "user",   "content": user_prompt},
+    ]
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.post(
-                GROQ_API_URL,
-                headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
-                json=groq_payload,
-            )
-        raw = resp.json()
-        content = raw.get("choices", [{}])[0].get("message", {}).get("content", "")
-        parsed = json.loads(content) if content else {}
+        result = await get_gateway().acomplete(
+            messages, GROQ_MODEL, provider="groq", max_tokens=900, temperature=0.25, timeout=30.0,
+            response_format={"type": "json_object"},
+        )
+        parsed = json.loads(result["content"])
 
         generated_at  = datetime.datetime.utcnow().isoformat()
         cached_until_ts = now + CACHE_TTL_SECONDS
@@ -761,24 +752,15 @@ async def oracle_event_brief(req: EventBriefRequest):
         + json.dumps(context, indent=2, default=str)
     )
 
-    groq_payload = {
-        "model": GROQ_MODEL,
-        "messages": [
-            {"role": "system", "content": NYX_EVENT_SYSTEM},
-            {"role": "user",   "content": user_prompt},
-        ],
-        "max_tokens":  400,
-        "temperature": 0.2,
-    }
+    messages = [
+        {"role": "system", "content": NYX_EVENT_SYSTEM},
+        {"role": "user",   "content": user_prompt},
+    ]
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.post(
-                "https://api.groq.com/openai/v1/chat/completions",
-                headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
-                json=groq_payload,
-            )
-            resp.raise_for_status()
+        completion = await get_gateway().acomplete(
+            messages, GROQ_MODEL, provider="groq", max_tokens=400, temperature=0.2, timeout=15.0,
+        )
     except Exception as exc:
         return {
             "summary": f"BRIEFING_ENGINE_OFFLINE: {exc}",
@@ -787,7 +769,7 @@ async def oracle_event_brief(req: EventBriefRequest):
             "confidence": 0.0,
         }
 
-    raw = resp.json()["choices"][0]["message"]["content"].strip()
+    raw = completion["content"].strip()
     # Strip accidental fences
     if raw.startswith("```"):
         raw = "\n".join(raw.split("\n")[1:])
@@ -875,30 +857,18 @@ async def oracle_analyze(req: OracleRequest):
 
     user_prompt = _build_kc_prompt(req) if req.kill_chain_snapshot else _build_fallback_prompt(req)
 
-    payload = {
-        "model": GROQ_MODEL,
-        "messages": [
-            {"role": "system", "content": ZO_KC_SYSTEM},
-            {"role": "user",   "content": user_prompt},
-        ],
-        "temperature": 0.35,
-        "max_tokens": 1200,
-        "response_format": {"type": "json_object"},
-    }
+    messages = [
+        {"role": "system", "content": ZO_KC_SYSTEM},
+        {"role": "user",   "content": user_prompt},
+    ]
 
     try:
-        async with httpx.AsyncClient(timeout=20.0) as client:
-            resp = await client.post(
-                GROQ_API_URL,
-                headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
-                json=payload,
-            )
-        data = resp.json()
-        text = data.get("choices", [{}])[0].get("message", {}).get("content", "")
-        if text:
-            # text is a JSON string containing the ZO schema
-            return {"analysis": text, "error": False, "mode": "kill_chain" if req.kill_chain_snapshot else "fallback"}
-        return {"analysis": json.dumps({"audit": f"ORACLE_UPLINK_FAILURE: {data.get('error', {}).get('message', 'No content.')}"}), "error": True}
+        result = await get_gateway().acomplete(
+            messages, GROQ_MODEL, provider="groq", max_tokens=1200, temperature=0.35, timeout=20.0,
+            response_format={"type": "json_object"},
+        )
+        # content is a JSON string containing the ZO schema
+        return {"analysis": result["content"], "error": False, "mode": "kill_chain" if req.kill_chain_snapshot else "fallback"}
     except Exception as e:
         return {"analysis": json.dumps({"audit": f"ORACLE_UPLINK_FAILURE: {str(e)}"}), "error": True}
 
@@ -908,7 +878,7 @@ async def oracle_openrouter_brief(payload: dict = None):
     """Oracle brief via OpenRouter — uses gpt-oss-120b:free for synthesis.
     Accepts any context dict and returns a unified trading verdict."""
     import json as _json
-    from backend.app.graph.openrouter_client import call_openrouter, extract_json as _extract_json
+    from backend.app.graph.openrouter_client import acall_openrouter, extract_json as _extract_json
 
     payload = payload or {}
     context = payload.get("context", payload)  # accept context key or raw dict
@@ -925,7 +895,7 @@ Provide a unified trading verdict. Answer in JSON only, no markdown:
   "direction": "BULLISH or BEARISH or MIXED"
 }}"""
 
-    result = call_openrouter(prompt=prompt, role="synthesis", max_tokens=500, timeout=20)
+    result = await acall_openrouter(prompt=prompt, role="synthesis", max_tokens=500, timeout=20)
     parsed = _extract_json(result.get("content", ""))
     return {
         "oracle": parsed or {"error": "parse_failed", "raw": result.get("content", "")[:500]},
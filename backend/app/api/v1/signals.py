@@ -14,9 +14,6 @@ import json
 import logging
 import os
 import sqlite3
-import time
-import threading
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Optional
@@ -26,50 +23,18 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 
 from backend.app.core.dependencies import get_monitor_bridge
 from backend.app.integrations.unified_monitor_bridge import MonitorBridge
+from backend.app.signals.aggregator import get_snapshot, select_signals
 from backend.app.signals.models import DivergenceResponse, DivergenceSignal, SignalResponse
-from backend.app.signals.kill_chain import compute_kill_chain
-from backend.app.signals.sources.alert_db_source import fetch_alert_db_signals
-from backend.app.signals.sources.monitor_source import fetch_monitor_signals
-from backend.app.signals.sources.morning_brief_source import fetch_morning_brief_signals
-from backend.app.signals.sources.darkpool_source import fetch_darkpool_signals
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-# ── Response-level cache (prevents 3+ consumers from each triggering 13s chains)
-_signals_cache = {}  # key → {"data": ..., "expires": timestamp}
-_cache_lock = threading.Lock()
-SIGNALS_CACHE_TTL = 300  # 5 minutes
-
 ROOT = Path(__file__).resolve().parents[4]
 
-SOURCE_TIMEOUT = 3  # fail fast; keep endpoint responsive under upstream slowness
-KC_TIMEOUT = 3      # kill chain is advisory here, not a hard dependency
-
-
-def _safe_fetch(name: str, fn, timeout: int = SOURCE_TIMEOUT, default=None):
-    """Run a source fetch with a timeout — never hang the pipeline."""
-    if default is None:
-        default = []
-    executor = ThreadPoolExecutor(max_workers=1)
-    try:
-        future = executor.submit(fn)
-        value = future.result(timeout=timeout)
-        executor.shutdown(wait=False, cancel_futures=True)
-        return value
-    except FuturesTimeout:
-        logger.warning(f"⏰ {name} timed out after {timeout}s — returning empty")
-        executor.shutdown(wait=False, cancel_futures=True)
-        return default
-    except Exception as exc:
-        logger.warning(f"❌ {name} failed: {exc} — returning empty")
-        executor.shutdown(wait=False, cancel_futures=True)
-        return default
-
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
-def _inject_kill_chain(signals: List[dict], kc: dict) -> List[dict]:
+def _inject_kill_chain(signals: List[dict], kc: dict, context: Optional[dict] = None) -> List[dict]:
     """Annotate each signal with kill chain verdict + optionally adjust confidence.
 
     Economic veto fires FIRST (pre-release risk):
@@ -80,32 +45,23 @@ def _inject_kill_chain(signals: List[dict], kc: dict) -> List[dict]:
     BOOST  → +15 confidence cap at 99
     HARD_VETO → -30 confidence floor at 20
     Direction mismatch → add a warning (don't silently flip direction)
+
+    ``context`` carries the economic window and macro regime already fetched
+    by the source aggregator ({"econ": (hours, event) | None, "macro": dict | None}).
     """
     verdict = kc.get("verdict", "NEUTRAL")
     score = kc.get("score", 0)
     kc_direction = kc.get("direction", "MIXED")
+    context = context or {}
 
     # ── Economic veto — pre-release risk cap ──────────────────────────────
     econ_hours = None
     econ_event = "critical release"
-    try:
-        from live_monitoring.enrichment.apis.te_calendar_scraper import TECalendarScraper
-        _te = TECalendarScraper(cache_ttl=300)
-        result = _te.get_hours_until_next_critical()
-        if result is not None:
-            econ_hours, econ_event = result
-            econ_event = econ_event or "critical release"
-    except Exception as exc:
-        logger.warning(f"Economic veto check failed: {exc}")
+    if context.get("econ"):
+        econ_hours, econ_event = context["econ"]
 
     # ── Macro regime — stagflation/recession modifier ─────────────────────
-    _macro_regime_data = None
-    try:
-        from live_monitoring.agents.economic.macro_regime_detector import MacroRegimeDetector
-        _mrd = MacroRegimeDetector()
-        _macro_regime_data = _mrd.get_regime()
-    except Exception as exc:
-        logger.warning(f"Macro regime check failed: {exc}")
+    _macro_regime_data = context.get("macro")
 
     for sig in signals:
         sig["kill_chain_verdict"] = verdict
@@ -203,27 +159,18 @@ def get_signals(
     signal_type: Optional[str] = Query(None, description="Filter by signal type"),
     monitor_bridge: MonitorBridge = Depends(get_monitor_bridge),
 ):
-    """Aggregate signals from all live sources. No hardcoded signals."""
+    """Aggregate signals from all live sources. No hardcoded signals.
+
+    Sources run concurrently under one deadline (backend.app.signals.aggregator);
+    the unfiltered snapshot is shared across filter combinations and the
+    filters below are applied per request.
+    """
     try:
-        # ── Cache check ───────────────────────────────────────────────
-        cache_key = f"{symbol}:{signal_type}:{master_only}"
-        with _cache_lock:
-            entry = _signals_cache.get(cache_key)
-            if entry and time.time() < entry["expires"]:
-                logger.debug(f"signals cache HIT ({cache_key})")
-                return entry["data"]
-
-        all_signals: List[dict] = []
-
-        # LAYER 0 — REGIME GATE (runs BEFORE any source)
-        regime_tier = 1
-        try:
-            from live_monitoring.enrichment.apis.stockgrid_client import StockgridClient
-            regime = StockgridClient(cache_ttl=300).get_volatility_regime()
-            regime_tier = regime.get("current_regime", 1) if regime else 1
-        except Exception as reg_exc:
-            logger.warning(f"Regime gate: {reg_exc} — defaulting to Tier 1")
+        monitor = monitor_bridge.monitor if monitor_bridge else None
+        snapshot = get_snapshot(symbol or "SPY", monitor)
 
+        # LAYER 0 — REGIME GATE
+        regime_tier = snapshot.regime_tier
         if regime_tier >= 4:
             return {
                 "signals": [],
@@ -232,6 +179,7 @@ def get_signals(
                 "regime_tier": regime_tier,
                 "regime_veto": True,
                 "reason": "REGIME VETO: Tier 4 extreme volatility — all signals suppressed",
+                "sources": snapshot.annotations(),
                 "timestamp": datetime.utcnow().isoformat(),
             }
 
@@ -239,30 +187,8 @@ def get_signals(
         if regime_tier >= 3:
             allowed_directions = ["SHORT", "WATCH", "AVOID"]
 
-        # Source 1: Live monitor buffer (selloff / rally real-time)
-        monitor = monitor_bridge.monitor if monitor_bridge else None
-        all_signals += _safe_fetch("MonitorBuffer", lambda: fetch_monitor_signals(
-            monitor=monitor,
-            symbol=symbol,
-            signal_type=signal_type,
-            master_only=master_only,
-        ))
-
-        # Source 2: AlertDB (options flow, DP, earnings, fed alerts)
-        all_signals += _safe_fetch("AlertDB", lambda: fetch_alert_db_signals(
-            symbol=symbol,
-            master_only=master_only,
-        ))
-
-        # Source 3: Dark pool trend (5d dp_position + GEX Layer 2)
-        all_signals += _safe_fetch("DarkPoolTrend", lambda: fetch_darkpool_signals(
-            symbol=symbol or "SPY",
-            regime_tier=regime_tier,
-        ))
-
-        # Source 4: Morning Brief fallback (only when the other sources are dry)
-        if not all_signals:
-            all_signals += _safe_fetch("MorningBrief", lambda: fetch_morning_brief_signals(symbol=symbol))
+        # Sources 1-4: MonitorBuffer, AlertDB, DarkPoolTrend, MorningBrief fallback
+        all_signals = select_signals(snapshot, symbol=symbol, signal_type=signal_type, master_only=master_only)
 
         # REGIME ENFORCEMENT — suppress disallowed directions
         for sig in all_signals:
@@ -283,33 +209,25 @@ def get_signals(
                 )
 
         # Kill Chain: confidence modifier + direction annotation (no new signals)
-        kc = _safe_fetch("KillChain", lambda: compute_kill_chain(), timeout=KC_TIMEOUT, default=None)
+        kc = snapshot.kill_chain
         if kc:
-            all_signals = _inject_kill_chain(all_signals, kc)
+            all_signals = _inject_kill_chain(all_signals, kc, snapshot.kill_chain_context)
         else:
             logger.warning("Kill chain returned None/timed out — signals pass without KC modifier")
 
         all_signals.sort(key=lambda x: x.get("confidence", 0), reverse=True)
         master_count = sum(1 for s in all_signals if s.get("is_master"))
 
-        result = {
+        return {
             "signals": all_signals,
             "count": len(all_signals),
             "master_count": master_count,
             "regime_tier": regime_tier,
+            "partial": snapshot.partial,
+            "sources": snapshot.annotations(),
             "timestamp": datetime.utcnow().isoformat(),
         }
 
-        # ── Cache store ───────────────────────────────────────────────
-        with _cache_lock:
-            _signals_cache[cache_key] = {
-                "data": result,
-                "expires": time.time() + SIGNALS_CACHE_TTL,
-            }
-            logger.debug(f"signals cache STORED ({cache_key})")
-
-        return result
-
     except Exception as exc:
         logger.error(f"get_signals error: {exc}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(exc))
@@ -8,13 +8,85 @@ Integrates with AlertManager to intercept and broadcast all alerts.
 import json
 import logging
 import asyncio
-from typing import Dict, Set, Optional, Any
+from typing import Dict, Set, Optional, Any, Iterable, List
 from datetime import datetime
 from fastapi import WebSocket, WebSocketDisconnect
-from collections import defaultdict
+from collections import defaultdict, deque
 
 logger = logging.getLogger(__name__)
 
+MAX_QUEUE = 256            # Frames buffered per connection before dropping the oldest
+SEND_TIMEOUT = 5.0         # Seconds a single send may take before the client is dropped
+COALESCE_TYPES = {"market_data"}  # Latest-price-wins on market_{symbol} channels
+
+
+def serialize(message: dict) -> str:
+    """Encode once per broadcast (same format as WebSocket.send_json)."""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+class _Connection:
+    """Bounded send queue + sender task for one WebSocket."""
+
+    def __init__(self, websocket: WebSocket, channel: str, manager: "ConnectionManager",
+                 max_queue: int = MAX_QUEUE, send_timeout: float = SEND_TIMEOUT):
+        self.websocket = websocket
+        self.channel = channel
+        self.manager = manager
+        self.max_queue = max_queue
+        self.send_timeout = send_timeout
+        self.loop = asyncio.get_running_loop()
+        self.queue: deque = deque()             # [coalesce_key, text] entries
+        self.pending: Dict[str, list] = {}      # coalesce_key -> queued entry
+        self.ready = asyncio.Event()
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_depth = 0
+        self.task = self.loop.create_task(self._sender())
+
+    def push(self, text: str, key: Optional[str] = None):
+        """Queue a frame (never blocks). Must run on the connection's loop."""
+        if key is not None:
+            entry = self.pending.get(key)
+            if entry is not None:
+                entry[1] = text  # newer value replaces the queued one in place
+                self.coalesced += 1
+                return
+        if len(self.queue) >= self.max_queue:
+            old_key, _ = self.queue.popleft()
+            if old_key is not None:
+                self.pending.pop(old_key, None)
+            self.dropped += 1
+        entry = [key, text]
+        self.queue.append(entry)
+        if key is not None:
+            self.pending[key] = entry
+        self.max_depth = max(self.max_depth, len(self.queue))
+        self.ready.set()
+
+    async def _sender(self):
+        try:
+            while True:
+                if not self.queue:
+                    self.ready.clear()
+                    await self.ready.wait()
+                    continue
+                entry = self.queue.popleft()
+                key, text = entry
+                if key is not None and self.pending.get(key) is entry:
+                    del self.pending[key]
+                await asyncio.wait_for(self.websocket.send_text(text), self.send_timeout)
+                self.sent += 1
+                meta = self.manager.connection_metadata.get(self.websocket)
+                if meta is not None:
+                    meta["message_count"] += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"WebSocket send failed on '{self.channel}' ({type(e).__name__}: {e}) — dropping client")
+            self.manager.disconnect(self.websocket)
+
 
 class ConnectionManager:
     """
@@ -26,13 +98,23 @@ class ConnectionManager:
     - /ws/signals - Trading signals only
     - /ws/agents/{agent_name} - Agent insights
     - /ws/narrative - Narrative Brain updates
+
+    Broadcasts never await sockets: each message is serialized once and
+    pushed onto every connection's bounded queue; a per-connection sender
+    task writes it out. A slow client only fills (and drops from) its own
+    queue. On market_{symbol} channels, queued market_data frames are
+    replaced by newer ones (latest price wins).
     """
     
-    def __init__(self):
+    def __init__(self, max_queue: int = MAX_QUEUE, send_timeout: float = SEND_TIMEOUT):
         # Active connections by channel
         self.active_connections: Dict[str, Set[WebSocket]] = defaultdict(set)
         # Connection metadata
         self.connection_metadata: Dict[WebSocket, Dict[str, Any]] = {}
+        self.max_queue = max_queue
+        self.send_timeout = send_timeout
+        self._connections: Dict[WebSocket, _Connection] = {}
+        self.stats = {"broadcasts": 0, "frames_queued": 0, "dropped_closed": 0}
         
     async def connect(self, websocket: WebSocket, channel: str = "unified"):
         """Accept WebSocket connection and add to channel"""
@@ -43,10 +125,22 @@ class ConnectionManager:
             "connected_at": datetime.now().isoformat(),
             "message_count": 0
         }
+        self._connections[websocket] = _Connection(
+            websocket, channel, self, max_queue=self.max_queue, send_timeout=self.send_timeout
+        )
         logger.info(f"✅ WebSocket connected to channel '{channel}' (total: {len(self.active_connections[channel])})")
         
     def disconnect(self, websocket: WebSocket):
         """Remove WebSocket connection"""
+        conn = self._connections.pop(websocket, None)
+        if conn is not None:
+            self.stats["dropped_closed"] += conn.dropped
+            try:
+                current = asyncio.current_task()
+            except RuntimeError:
+                current = None
+            if conn.task is not current:
+                conn.task.cancel()
         if websocket in self.connection_metadata:
             channel = self.connection_metadata[websocket].get("channel", "unified")
             self.active_connections[channel].discard(websocket)
@@ -55,32 +149,54 @@ class ConnectionManager:
     
     async def send_personal_message(self, message: dict, websocket: WebSocket):
         """Send message to a specific connection"""
+        conn = self._connections.get(websocket)
+        if conn is not None:
+            self._push(conn, serialize(message), None)
+            return
         try:
             await websocket.send_json(message)
-            if websocket in self.connection_metadata:
-                self.connection_metadata[websocket]["message_count"] += 1
         except Exception as e:
             logger.error(f"Error sending personal message: {e}")
             self.disconnect(websocket)
+
+    def _push(self, conn: _Connection, text: str, key: Optional[str]):
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is conn.loop:
+            conn.push(text, key)
+        else:
+            # Publisher on another thread/loop (e.g. sync alert bridge)
+            conn.loop.call_soon_threadsafe(conn.push, text, key)
+
+    def _fan_out(self, text: str, message: dict, channels: Iterable[str]) -> int:
+        queued = 0
+        for channel in channels:
+            conns = self.active_connections.get(channel)
+            if not conns:
+                continue
+            key = None
+            if channel.startswith("market_") and message.get("type") in COALESCE_TYPES:
+                key = f"{message.get('type')}:{message.get('symbol')}"
+            for websocket in list(conns):
+                conn = self._connections.get(websocket)
+                if conn is not None:
+                    self._push(conn, text, key)
+                    queued += 1
+        self.stats["broadcasts"] += 1
+        self.stats["frames_queued"] += queued
+        return queued
+
+    async def broadcast_many(self, message: dict, channels: Iterable[str]):
+        """Serialize once and queue the message on every connection of each channel"""
+        channels = [c for c in channels if self.active_connections.get(c)]
+        if channels:
+            self._fan_out(serialize(message), message, channels)
     
     async def broadcast_to_channel(self, message: dict, channel: str):
         """Broadcast message to all connections in a channel"""
-        if channel not in self.active_connections:
-            return
-        
-        disconnected = set()
-        for websocket in self.active_connections[channel]:
-            try:
-                await websocket.send_json(message)
-                if websocket in self.connection_metadata:
-                    self.connection_metadata[websocket]["message_count"] += 1
-            except Exception as e:
-                logger.error(f"Error broadcasting to channel '{channel}': {e}")
-                disconnected.add(websocket)
-        
-        # Clean up disconnected connections
-        for ws in disconnected:
-            self.disconnect(ws)
+        await self.broadcast_many(message, [channel])
     
     async def broadcast_unified(self, message: dict):
         """Broadcast to unified channel (all alerts)"""
@@ -104,19 +220,31 @@ class ConnectionManager:
     
     def get_stats(self) -> dict:
         """Get connection statistics"""
+        live: List[_Connection] = list(self._connections.values())
         return {
             "total_connections": sum(len(conns) for conns in self.active_connections.values()),
             "channels": {
                 channel: len(conns) 
                 for channel, conns in self.active_connections.items()
             },
+            "queue": {
+                "max_queue": self.max_queue,
+                "total_depth": sum(len(c.queue) for c in live),
+                "max_depth": max((len(c.queue) for c in live), default=0),
+                "dropped": sum(c.dropped for c in live) + self.stats["dropped_closed"],
+                "coalesced": sum(c.coalesced for c in live),
+                "broadcasts": self.stats["broadcasts"],
+                "frames_queued": self.stats["frames_queued"],
+            },
             "connections": [
                 {
                     "channel": meta.get("channel"),
                     "connected_at": meta.get("connected_at"),
-                    "message_count": meta.get("message_count", 0)
+                    "message_count": meta.get("message_count", 0),
+                    "queue_depth": len(self._connections[ws].queue) if ws in self._connections else 0,
+                    "dropped": self._connections[ws].dropped if ws in self._connections else 0,
                 }
-                for meta in self.connection_metadata.values()
+                for ws, meta in self.connection_metadata.items()
             ]
         }
 
@@ -160,16 +288,14 @@ class WebSocketPublisher:
             "timestamp": datetime.now().isoformat()
         }
         
-        # Broadcast to unified channel (all alerts)
-        await self.connection_manager.broadcast_unified(message)
-        
-        # Broadcast to signals channel if it's a signal
+        # Unified channel (all alerts), signals channel if it's a signal,
+        # symbol-specific market channel — serialized once, queued, never awaited
+        channels = ["unified"]
         if alert_type in ["signal", "synthesis", "narrative"]:
-            await self.connection_manager.broadcast_signals(message)
-        
-        # Broadcast to symbol-specific market channel
+            channels.append("signals")
         if symbol:
-            await self.connection_manager.broadcast_market(symbol, message)
+            channels.append(f"market_{symbol}")
+        await self.connection_manager.broadcast_many(message, channels)
     
     async def publish_signal(self, signal: dict):
         """Publish trading signal"""
@@ -179,14 +305,10 @@ class WebSocketPublisher:
             "timestamp": datetime.now().isoformat()
         }
         
-        await self.connection_manager.broadcast_signals(message)
-        await self.connection_manager.broadcast_unified(message)
-        
+        channels = ["signals", "unified"]
         if signal.get("symbol"):
-            await self.connection_manager.broadcast_market(
-                signal["symbol"], 
-                message
-            )
+            channels.append(f"market_{signal['symbol']}")
+        await self.connection_manager.broadcast_many(message, channels)
     
     async def publish_market_data(self, symbol: str, data: dict):
         """Publish market data update"""
@@ -197,8 +319,18 @@ class WebSocketPublisher:
             "timestamp": datetime.now().isoformat()
         }
         
+        await self.connection_manager.broadcast_many(message, [f"market_{symbol}", "unified"])
+    
+    async def publish_trap_matrix(self, symbol: str, delta: dict):
+        """Publish a Trap Matrix delta (added/removed/changed traps)"""
+        message = {
+            "type": "trap_matrix_delta",
+            "symbol": symbol,
+            "delta": delta,
+            "timestamp": datetime.now().isoformat()
+        }
+        
         await self.connection_manager.broadcast_market(symbol, message)
-        await self.connection_manager.broadcast_unified(message)
     
     async def publish_agent_insight(self, agent_name: str, insight: dict):
         """Publish agent insight"""
@@ -209,8 +341,7 @@ class WebSocketPublisher:
             "timestamp": datetime.now().isoformat()
         }
         
-        await self.connection_manager.broadcast_agent(agent_name, message)
-        await self.connection_manager.broadcast_unified(message)
+        await self.connection_manager.broadcast_many(message, [f"agent_{agent_name}", "unified"])
     
     async def publish_narrative(self, narrative: dict):
         """Publish narrative update"""
@@ -220,8 +351,7 @@ class WebSocketPublisher:
             "timestamp": datetime.now().isoformat()
         }
         
-        await self.connection_manager.broadcast_narrative(message)
-        await self.connection_manager.broadcast_unified(message)
+        await self.connection_manager.broadcast_many(message, ["narrative", "unified"])
 
 
 # Global WebSocket publisher instance
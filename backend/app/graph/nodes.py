@@ -4,26 +4,31 @@ LangGraph nodes for the Alpha pipeline.
 Fan-out (parallel):  MacroNode, FlowNode, RegimeNode
 Fan-in (sequential): SynthesisNode → GateNode → END
 
+The LLM nodes are coroutines: blocking data pulls run in worker threads and
+LLM calls go through the async gateway, so under graph.ainvoke() the three
+fan-out nodes overlap for real instead of queueing behind each other.
+
 IMPORTANT: Parallel nodes must return ONLY their own exclusive output key
 plus their local slice of errors/node_timings (Annotated reducers merge them).
 They must NOT return {**state, ...} — that causes InvalidUpdateError in LangGraph.
 """
+import asyncio
 import logging
 import time
 from typing import Dict, Any
 
 from backend.app.graph.state import AlphaState
-from backend.app.graph.openrouter_client import call_openrouter, extract_json
+from backend.app.graph.openrouter_client import acall_openrouter, extract_json
 
 logger = logging.getLogger(__name__)
 
 
 # ── Shared prompt helpers ─────────────────────────────────────────────────────
 
-def _safe_call(role: str, prompt: str, max_tokens: int = 500, timeout: int = 18) -> str:
+async def _safe_call(role: str, prompt: str, max_tokens: int = 500, timeout: int = 18) -> str:
     """Call OpenRouter and return content string. Never raises."""
     try:
-        result = call_openrouter(prompt=prompt, role=role, max_tokens=max_tokens, timeout=timeout)
+        result = await acall_openrouter(prompt=prompt, role=role, max_tokens=max_tokens, timeout=timeout)
         return result.get("content", "") or ""
     except Exception as e:
         logger.warning(f"_safe_call({role}) failed: {e}")
@@ -32,16 +37,8 @@ def _safe_call(role: str, prompt: str, max_tokens: int = 500, timeout: int = 18)
 
 # ── MacroNode ─────────────────────────────────────────────────────────────────
 
-def macro_node(state: AlphaState) -> Dict[str, Any]:
-    """
-    Reads COT positioning + Fed calendar context.
-    Returns ONLY macro_context, errors slice, node_timings slice.
-    """
-    t0 = time.time()
-    symbol = state.get("symbol", "SPY")
-    errors = []
-    timings = {}
-
+def _macro_inputs(errors: list):
+    """Blocking COT / Fed calendar / VIX pulls (run in a worker thread)."""
     cot_summary = "COT data unavailable"
     fed_summary = "Fed calendar unavailable"
     vix_val = None
@@ -76,6 +73,20 @@ def macro_node(state: AlphaState) -> Dict[str, Any]:
         vix_val = round(yf.Ticker("^VIX").fast_info.get("lastPrice", 0), 2)
     except Exception:
         pass
+    return cot_summary, fed_summary, vix_val
+
+
+async def macro_node(state: AlphaState) -> Dict[str, Any]:
+    """
+    Reads COT positioning + Fed calendar context.
+    Returns ONLY macro_context, errors slice, node_timings slice.
+    """
+    t0 = time.time()
+    symbol = state.get("symbol", "SPY")
+    errors = []
+    timings = {}
+
+    cot_summary, fed_summary, vix_val = await asyncio.to_thread(_macro_inputs, errors)
 
     prompt = f"""You are a macro analyst. Given these live signals for {symbol}:
 
@@ -92,7 +103,7 @@ Answer in JSON only, no markdown:
   "regime": "RISK_ON or RISK_OFF or TRANSITIONAL"
 }}"""
 
-    content = _safe_call("macro", prompt, max_tokens=400)
+    content = await _safe_call("macro", prompt, max_tokens=400)
     parsed_macro = extract_json(content) if content else None
     if parsed_macro:
         content = (
@@ -112,21 +123,12 @@ Answer in JSON only, no markdown:
 
 # ── FlowNode ──────────────────────────────────────────────────────────────────
 
-def flow_node(state: AlphaState) -> Dict[str, Any]:
-    """
-    Reads dark pool + AXLFI option wall data.
-    Returns ONLY flow_context, errors slice, node_timings slice.
-    """
-    t0 = time.time()
-    symbol = state.get("symbol", "SPY")
-    errors = []
-    timings = {}
-
+def _flow_inputs(symbol: str, errors: list) -> Dict[str, Any]:
+    """Blocking Stockgrid / AXLFI pulls (run in a worker thread)."""
     dp_summary = "Dark pool data unavailable"
     axlfi_summary = "AXLFI data unavailable"
     spot_price = None
     sv_pct = None
-    qqq_sv_delta_val = state.get("qqq_sv_delta")  # Pre-seeded from enrichment
 
     _call_wall = None
     _put_wall = None
@@ -150,6 +152,27 @@ def flow_node(state: AlphaState) -> Dict[str, Any]:
             dp_summary = f"Short volume: {sv_pct:.1f}% ({'elevated — distribution signal' if sv_pct > 55 else 'normal — no distribution' if sv_pct < 45 else 'neutral'})"
     except Exception as e:
         errors.append(f"flow_node/axlfi: {e}")
+    return {
+        "dp_summary": dp_summary, "axlfi_summary": axlfi_summary, "spot_price": spot_price,
+        "sv_pct": sv_pct, "call_wall": _call_wall, "put_wall": _put_wall, "above_call": above_call,
+    }
+
+
+async def flow_node(state: AlphaState) -> Dict[str, Any]:
+    """
+    Reads dark pool + AXLFI option wall data.
+    Returns ONLY flow_context, errors slice, node_timings slice.
+    """
+    t0 = time.time()
+    symbol = state.get("symbol", "SPY")
+    errors = []
+    timings = {}
+    qqq_sv_delta_val = state.get("qqq_sv_delta")  # Pre-seeded from enrichment
+
+    inputs = await asyncio.to_thread(_flow_inputs, symbol, errors)
+    dp_summary, axlfi_summary = inputs["dp_summary"], inputs["axlfi_summary"]
+    spot_price, sv_pct = inputs["spot_price"], inputs["sv_pct"]
+    _call_wall, _put_wall, above_call = inputs["call_wall"], inputs["put_wall"], inputs["above_call"]
 
     qqq_delta_str = (
         f"+{qqq_sv_delta_val}pp in 1 day — institutions RE-SHORTING into strength (squeeze fuel above call wall)"
@@ -172,7 +195,7 @@ Answer in JSON only, no markdown:
   "smart_money_bias": "ACCUMULATING or DISTRIBUTING or NEUTRAL — one sentence justification"
 }}"""
 
-    content = _safe_call("flow", prompt, max_tokens=400)
+    content = await _safe_call("flow", prompt, max_tokens=400)
     parsed_flow = extract_json(content) if content else None
     if parsed_flow:
         content = (
@@ -205,16 +228,8 @@ Answer in JSON only, no markdown:
 
 # ── RegimeNode ────────────────────────────────────────────────────────────────
 
-def regime_node(state: AlphaState) -> Dict[str, Any]:
-    """
-    Reads GEX regime + short vol data.
-    Returns ONLY regime_context, errors slice, node_timings slice.
-    """
-    t0 = time.time()
-    symbol = state.get("symbol", "SPY")
-    errors = []
-    timings = {}
-
+def _regime_inputs(errors: list):
+    """Blocking GEX regime / VIX pulls (run in a worker thread)."""
     gex_summary = "GEX data unavailable"
     try:
         from live_monitoring.enrichment.apis.stockgrid_client import StockgridClient
@@ -242,6 +257,20 @@ def regime_node(state: AlphaState) -> Dict[str, Any]:
             gex_summary += f" | VIX: {vix_val}"
     except Exception as _vix_e:
         errors.append(f"regime_node/vix: {_vix_e}")
+    return gex_summary, vix_val
+
+
+async def regime_node(state: AlphaState) -> Dict[str, Any]:
+    """
+    Reads GEX regime + short vol data.
+    Returns ONLY regime_context, errors slice, node_timings slice.
+    """
+    t0 = time.time()
+    symbol = state.get("symbol", "SPY")
+    errors = []
+    timings = {}
+
+    gex_summary, vix_val = await asyncio.to_thread(_regime_inputs, errors)
 
     prompt = f"""You are a volatility regime analyst. Given this GEX data for {symbol}:
 {gex_summary}
@@ -255,7 +284,7 @@ Answer in JSON only, no markdown:
   "vix_read": "one sentence: VIX {vix_val} — suppressed (<15), normal (15-20), elevated (20-30), or extreme (>30)? What does this mean for move size?"
 }}"""
 
-    content = _safe_call("regime", prompt, max_tokens=300)
+    content = await _safe_call("regime", prompt, max_tokens=300)
     parsed = extract_json(content) if content else None
     if parsed:
         regime_text = (
@@ -274,7 +303,7 @@ Answer in JSON only, no markdown:
 
 # ── SynthesisNode ─────────────────────────────────────────────────────────────
 
-def synthesis_node(state: AlphaState) -> Dict[str, Any]:
+async def synthesis_node(state: AlphaState) -> Dict[str, Any]:
     """
     Combines macro + flow + regime into a unified verdict.
     Sequential — reads full state, returns verdict fields + synthesis text.
@@ -349,7 +378,7 @@ Rules:
 - If FLOW says SPY is above the call wall, thesis must reflect that — do not say "pinned between walls"
 - primary_risk must name a price level (e.g. "SPY breaks below 720") not a concept (e.g. "volatility risk"){wall_rule}"""
 
-    content = _safe_call("synthesis", prompt, max_tokens=600, timeout=25)
+    content = await _safe_call("synthesis", prompt, max_tokens=600, timeout=25)
     parsed = extract_json(content) if content else None
 
     if parsed:
@@ -2,6 +2,7 @@
 OpenRouter Multi-LLM Client
 ============================
 Single entry point for all LLM calls in the graph pipeline.
+Requests go through core.utils.llm_gateway (pooled clients, cache, coalescing).
 Routes to the right free model based on role.
 Falls back to Groq llama-3.3-70b if OpenRouter fails.
 
@@ -15,18 +16,16 @@ Model assignments (verified available 2026-05-07):
 import os
 import json
 import logging
-import hashlib
-import time
 import re
-from typing import Optional, Dict, Any
-import httpx
+from typing import Optional, Dict, Any, List
+
+from core.utils.llm_gateway import LLMGatewayError, get_gateway
 
 logger = logging.getLogger(__name__)
 
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY", "")
-OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1/chat/completions"
-GROQ_FALLBACK_URL = "https://api.groq.com/openai/v1/chat/completions"
 GROQ_API_KEY = os.getenv("GROQ_API_KEY", "")
+GROQ_FALLBACK_MODEL = "llama-3.3-70b-versatile"
 
 # Model role registry — free models verified available on OpenRouter 2026-05-07
 MODEL_REGISTRY = {
@@ -38,16 +37,25 @@ MODEL_REGISTRY = {
     "explain":   "openai/gpt-oss-20b:free",                  # fast — structured JSON reads, not prose
 }
 
-# In-memory response cache (prompt_hash → {content, expires})
-_cache: Dict[str, Any] = {}
-_CACHE_TTL = 600  # 10 minutes
 
+def _messages(prompt: str, system: Optional[str]) -> List[Dict[str, str]]:
+    messages = []
+    if system:
+        messages.append({"role": "system", "content": system})
+    messages.append({"role": "user", "content": prompt})
+    return messages
 
-def _cache_key(model: str, prompt: str) -> str:
-    return hashlib.md5(f"{model}:{prompt}".encode()).hexdigest()
 
+def _error_result() -> Dict[str, Any]:
+    return {
+        "content": "",
+        "model": "none",
+        "source": "error",
+        "error": "All LLM backends failed",
+    }
 
-def call_openrouter(
+
+async def acall_openrouter(
     prompt: str,
     role: str = "quick",
     model: Optional[str] = None,
@@ -57,88 +65,81 @@ def call_openrouter(
     use_cache: bool = True,
 ) -> Dict[str, Any]:
     """
-    Call OpenRouter with automatic model selection by role.
+    Async OpenRouter call through the shared LLM gateway (pooled HTTP/2
+    clients, LRU + SQLite response cache, in-flight coalescing).
     Falls back to Groq llama-3.3-70b on any OpenRouter failure.
-    Returns: {"content": str, "model": str, "source": "openrouter"|"groq_fallback"|"error"}
+    Returns: {"content": str, "model": str, "source": "openrouter"|"cache"|"coalesced"|"groq_fallback"|"error"}
     """
     resolved_model = model or MODEL_REGISTRY.get(role, MODEL_REGISTRY["quick"])
-
-    # Cache check
-    if use_cache:
-        key = _cache_key(resolved_model, prompt)
-        cached = _cache.get(key)
-        if cached and cached["expires"] > time.time():
-            logger.debug(f"Cache hit for {resolved_model}")
-            return {**cached["data"], "source": "cache"}
-
-    messages = []
-    if system:
-        messages.append({"role": "system", "content": system})
-    messages.append({"role": "user", "content": prompt})
+    messages = _messages(prompt, system)
+    gateway = get_gateway()
 
     # ── Try OpenRouter first ──────────────────────────────────────────────────
-    if OPENROUTER_API_KEY:
-        try:
-            resp = httpx.post(
-                OPENROUTER_BASE_URL,
-                headers={
-                    "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-                    "HTTP-Referer": "https://lotto-machine.onrender.com",
-                    "X-Title": "Alpha Terminal",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": resolved_model,
-                    "messages": messages,
-                    "max_tokens": max_tokens,
-                    "temperature": 0.3,
-                },
-                timeout=timeout,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            content = data["choices"][0]["message"]["content"]
-            result = {"content": content, "model": resolved_model, "source": "openrouter"}
-            if use_cache:
-                _cache[_cache_key(resolved_model, prompt)] = {
-                    "data": result,
-                    "expires": time.time() + _CACHE_TTL,
-                }
-            logger.info(f"✅ OpenRouter {resolved_model} OK ({len(content)} chars)")
-            return result
-        except Exception as e:
-            logger.warning(f"⚠️ OpenRouter failed ({resolved_model}): {e} — falling back to Groq")
+    try:
+        result = await gateway.acomplete(
+            messages, resolved_model, provider="openrouter", max_tokens=max_tokens,
+            temperature=0.3, timeout=timeout, use_cache=use_cache,
+        )
+        logger.info(f"✅ OpenRouter {resolved_model} OK ({len(result['content'])} chars, {result['source']})")
+        return result
+    except LLMGatewayError as e:
+        logger.warning(f"⚠️ OpenRouter failed ({resolved_model}): {e} — falling back to Groq")
 
     # ── Groq fallback ─────────────────────────────────────────────────────────
-    if GROQ_API_KEY:
-        try:
-            resp = httpx.post(
-                GROQ_FALLBACK_URL,
-                headers={
-                    "Authorization": f"Bearer {GROQ_API_KEY}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": "llama-3.3-70b-versatile",
-                    "messages": messages,
-                    "max_tokens": max_tokens,
-                    "temperature": 0.3,
-                },
-                timeout=timeout,
-            )
-            resp.raise_for_status()
-            content = resp.json()["choices"][0]["message"]["content"]
-            logger.info(f"✅ Groq fallback OK ({len(content)} chars)")
-            return {"content": content, "model": "llama-3.3-70b-versatile", "source": "groq_fallback"}
-        except Exception as e:
-            logger.error(f"💀 Groq fallback also failed: {e}")
+    try:
+        result = await gateway.acomplete(
+            messages, GROQ_FALLBACK_MODEL, provider="groq", max_tokens=max_tokens,
+            temperature=0.3, timeout=timeout, use_cache=False,
+        )
+        logger.info(f"✅ Groq fallback OK ({len(result['content'])} chars)")
+        return {**result, "source": "groq_fallback"}
+    except LLMGatewayError as e:
+        logger.error(f"💀 Groq fallback also failed: {e}")
 
-    return {
-        "content": "",
-        "model": "none",
-        "source": "error",
-        "error": "All LLM backends failed",
-    }
+    return _error_result()
+
+
+def call_openrouter(
+    prompt: str,
+    role: str = "quick",
+    model: Optional[str] = None,
+    system: Optional[str] = None,
+    max_tokens: int = 600,
+    timeout: int = 15,
+    use_cache: bool = True,
+) -> Dict[str, Any]:
+    """
+    Call OpenRouter with automatic model selection by role (blocking).
+    Falls back to Groq llama-3.3-70b on any OpenRouter failure.
+    Returns: {"content": str, "model": str, "source": "openrouter"|"cache"|"coalesced"|"groq_fallback"|"error"}
+
+    Prefer acall_openrouter() inside async routes.
+    """
+    resolved_model = model or MODEL_REGISTRY.get(role, MODEL_REGISTRY["quick"])
+    messages = _messages(prompt, system)
+    gateway = get_gateway()
+
+    try:
+        result = gateway.complete(
+            messages, resolved_model, provider="openrouter", max_tokens=max_tokens,
+            temperature=0.3, timeout=timeout, use_cache=use_cache,
+        )
+        logger.info(f"✅ OpenRouter {resolved_model} OK ({len(result['content'])} chars, {result['source']})")
+        return result
+    except LLMGatewayError as e:
+        logger.warning(f"⚠️ OpenRouter failed ({resolved_model}): {e} — falling back to Groq")
+
+    try:
+        result = gateway.complete(
+            messages, GROQ_FALLBACK_MODEL, provider="groq", max_tokens=max_tokens,
+            temperature=0.3, timeout=timeout, use_cache=False,
+        )
+        logger.info(f"✅ Groq fallback OK ({len(result['content'])} chars)")
+        return {**result, "source": "groq_fallback"}
+    except LLMGatewayError as e:
+        logger.error(f"💀 Groq fallback also failed: {e}")
+
+    return _error_result()
 
 
 def extract_json(content: str) -> Optional[Dict]:
@@ -1,11 +1,12 @@
 """
 Alpha Pipeline — LangGraph StateGraph
 ======================================
-Fan-out: macro_node + flow_node + regime_node run in parallel
+Fan-out: macro_node + flow_node + regime_node run in parallel (async nodes)
 Fan-in:  synthesis_node → gate_node → END
 
 Uses MemorySaver for in-process checkpointing (thread_id = run_id).
 """
+import asyncio
 import uuid
 import time
 import logging
@@ -70,7 +71,7 @@ def get_graph():
 
 # ── Public API ────────────────────────────────────────────────────────────────
 
-def run_alpha_pipeline(
+async def arun_alpha_pipeline(
     symbol: str = "SPY",
     thread_id: Optional[str] = None,
     enrichment: Optional[dict] = None,
@@ -98,7 +99,7 @@ def run_alpha_pipeline(
                 initial_state[k] = v
     config = {"configurable": {"thread_id": run_id}}
     graph = get_graph()
-    final_state = graph.invoke(initial_state, config=config)
+    final_state = await graph.ainvoke(initial_state, config=config)
     elapsed = round(time.time() - initial_state["started_at"], 2)
     logger.info(
         f"✅ Alpha pipeline complete | symbol={symbol} | verdict={final_state.get('verdict')} "
@@ -107,6 +108,15 @@ def run_alpha_pipeline(
     return final_state
 
 
+def run_alpha_pipeline(
+    symbol: str = "SPY",
+    thread_id: Optional[str] = None,
+    enrichment: Optional[dict] = None,
+) -> AlphaState:
+    """Blocking wrapper around arun_alpha_pipeline() for sync callers / worker threads."""
+    return asyncio.run(arun_alpha_pipeline(symbol=symbol, thread_id=thread_id, enrichment=enrichment))
+
+
 def get_pipeline_state(thread_id: str) -> Optional[AlphaState]:
     """Retrieve the last checkpointed state for a thread_id."""
     try:
@@ -467,7 +467,7 @@ async def _alpha_graph_polling_loop():
     await asyncio.sleep(60)  # Let startup finish first
     while True:
         try:
-            from backend.app.graph.pipeline import run_alpha_pipeline
+            from backend.app.graph.pipeline import arun_alpha_pipeline
 
             # Fetch enrichment data to seed the graph state
             def _fetch_enrichment_for_graph():
@@ -519,7 +519,7 @@ async def _alpha_graph_polling_loop():
                 return _enrich
 
             _enrichment = await asyncio.to_thread(_fetch_enrichment_for_graph)
-            result = await asyncio.to_thread(run_alpha_pipeline, symbol="SPY", enrichment=_enrichment)
+            result = await arun_alpha_pipeline(symbol="SPY", enrichment=_enrichment)
             _alpha_graph_cache["SPY"] = {
                 "verdict": result.get("verdict"),
                 "confidence": result.get("confidence"),
@@ -540,10 +540,12 @@ async def list_models():
     """Diagnostic: show which OpenRouter models are assigned to which roles."""
     try:
         from backend.app.graph.openrouter_client import MODEL_REGISTRY, OPENROUTER_API_KEY as _OR_KEY
+        from core.utils.llm_gateway import get_gateway
         return {
             "openrouter_configured": bool(_OR_KEY),
             "model_registry": MODEL_REGISTRY,
             "groq_fallback": bool(os.getenv("GROQ_API_KEY")),
+            "gateway": get_gateway().metrics(),
             "timestamp": datetime.now().isoformat(),
         }
     except Exception as e:
@@ -554,8 +556,7 @@ async def list_models():
 async def run_alpha_graph(payload: dict = None):
     """Run the full LangGraph alpha pipeline. Returns verdict, confidence, thesis within ~30s."""
     import asyncio
-    from concurrent.futures import ThreadPoolExecutor
-    from backend.app.graph.pipeline import run_alpha_pipeline
+    from backend.app.graph.pipeline import arun_alpha_pipeline
 
     payload = payload or {}
     symbol = payload.get("symbol", "SPY")
@@ -601,12 +602,8 @@ async def run_alpha_graph(payload: dict = None):
             pass
         return _e
 
-    loop = asyncio.get_event_loop()
-    with ThreadPoolExecutor(max_workers=1) as pool:
-        _enrichment_data = await loop.run_in_executor(pool, _fetch_enrich_sync)
-        final_state = await loop.run_in_executor(
-            pool, lambda: run_alpha_pipeline(symbol=symbol, thread_id=thread_id, enrichment=_enrichment_data)
-        )
+    _enrichment_data = await asyncio.to_thread(_fetch_enrich_sync)
+    final_state = await arun_alpha_pipeline(symbol=symbol, thread_id=thread_id, enrichment=_enrichment_data)
 
     return {
         "run_id": final_state.get("run_id"),
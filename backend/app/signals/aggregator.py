@@ -0,0 +1,305 @@
+"""
+Signal source aggregation — one concurrent fan-out shared by every /signals caller.
+
+GET /signals used to build a StockgridClient per request, then run the regime
+gate, MonitorBuffer, AlertDB, DarkPoolTrend and the kill chain one after
+another (each with its own 3s timeout) and cache the finished response per
+filter combination. Here:
+
+    - all sources run on a shared pool under ONE overall deadline; a source
+      that misses it or raises contributes its default and is reported as
+      "timeout"/"error" with its latency
+    - the snapshot is computed unfiltered, keyed only by what the sources
+      actually depend on (the dark pool symbol); concurrent callers with any
+      filter combination share one in-flight computation (single-flight)
+    - symbol / signal_type / master_only are applied per request afterwards
+    - long-lived clients (AXLFI, TE calendar, macro regime) are process-wide
+
+Usage:
+    snapshot = get_snapshot(symbol or "SPY", monitor)
+    signals = select_signals(snapshot, symbol, signal_type, master_only)
+"""
+import copy
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backend.app.signals.kill_chain import compute_kill_chain
+from backend.app.signals.sources.alert_db_source import fetch_alert_db_signals
+from backend.app.signals.sources.darkpool_source import fetch_darkpool_signals
+from backend.app.signals.sources.monitor_source import fetch_monitor_signals
+from backend.app.signals.sources.morning_brief_source import fetch_morning_brief_signals
+
+logger = logging.getLogger(__name__)
+
+SOURCE_DEADLINE = 4.0   # seconds for the whole fan-out, not per source
+SNAPSHOT_TTL = 300      # matches the old response cache
+PARTIAL_TTL = 30        # retry sooner when a source missed the deadline
+_POOL_WORKERS = 8
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+_snapshots: Dict[str, "SignalSnapshot"] = {}
+_inflight: Dict[str, Future] = {}
+_snap_lock = threading.Lock()
+_stats = {"builds": 0, "hits": 0, "coalesced": 0}
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(max_workers=_POOL_WORKERS, thread_name_prefix="signals-src")
+    return _pool
+
+
+# ── Process-wide clients ──────────────────────────────────────────────────────
+
+_te_calendar = None
+_macro_detector = None
+_clients_lock = threading.Lock()
+
+
+def _get_te_calendar():
+    global _te_calendar
+    if _te_calendar is None:
+        with _clients_lock:
+            if _te_calendar is None:
+                from live_monitoring.enrichment.apis.te_calendar_scraper import TECalendarScraper
+                _te_calendar = TECalendarScraper(cache_ttl=300)
+    return _te_calendar
+
+
+def _get_macro_detector():
+    global _macro_detector
+    if _macro_detector is None:
+        with _clients_lock:
+            if _macro_detector is None:
+                from live_monitoring.agents.economic.macro_regime_detector import MacroRegimeDetector
+                _macro_detector = MacroRegimeDetector()
+    return _macro_detector
+
+
+def fetch_regime_tier() -> int:
+    """AXLFI volatility regime tier (1-4); Tier 1 when unavailable."""
+    try:
+        from live_monitoring.enrichment.apis.stockgrid_client import get_stockgrid_client
+        regime = get_stockgrid_client().get_volatility_regime()
+        return regime.get("current_regime", 1) if regime else 1
+    except Exception as exc:
+        logger.warning(f"Regime gate: {exc} — defaulting to Tier 1")
+        return 1
+
+
+def fetch_econ_window() -> Optional[Tuple[float, str]]:
+    """(hours, event) until the next critical economic release, or None."""
+    try:
+        result = _get_te_calendar().get_hours_until_next_critical()
+        if result is not None:
+            hours, event = result
+            return hours, event or "critical release"
+    except Exception as exc:
+        logger.warning(f"Economic veto check failed: {exc}")
+    return None
+
+
+def fetch_macro_regime() -> Optional[dict]:
+    """Macro regime + confidence modifier, or None."""
+    try:
+        return _get_macro_detector().get_regime()
+    except Exception as exc:
+        logger.warning(f"Macro regime check failed: {exc}")
+    return None
+
+
+# ── Fan-out ───────────────────────────────────────────────────────────────────
+
+@dataclass
+class SourceResult:
+    value: Any
+    status: str                 # ok | timeout | error
+    latency_ms: float
+    error: Optional[str] = None
+
+    def annotation(self) -> dict:
+        out = {"status": self.status, "latency_ms": self.latency_ms}
+        if isinstance(self.value, list):
+            out["count"] = len(self.value)
+        if self.error:
+            out["error"] = self.error
+        return out
+
+
+def _timed(fn: Callable[[], Any]) -> Callable[[], Tuple[Any, float]]:
+    def run():
+        start = time.monotonic()
+        value = fn()
+        return value, round((time.monotonic() - start) * 1000, 1)
+    return run
+
+
+def fan_out(tasks: Dict[str, Tuple[Callable[[], Any], Any]],
+            deadline: float = SOURCE_DEADLINE,
+            submitted: Optional[Dict[str, Future]] = None) -> Dict[str, SourceResult]:
+    """Run ``{name: (fn, default)}`` concurrently; collect whatever finished by the deadline.
+
+    ``submitted`` holds futures already started (via ``_get_pool().submit(_timed(fn))``)
+    that other tasks depend on; their defaults come from ``tasks``.
+    """
+    started = time.monotonic()
+    futures = dict(submitted or {})
+    for name, (fn, _default) in tasks.items():
+        if name not in futures:
+            futures[name] = _get_pool().submit(_timed(fn))
+    wait(futures.values(), timeout=deadline)
+
+    results = {}
+    for name, future in futures.items():
+        default = tasks[name][1]
+        if not future.done():
+            elapsed = round((time.monotonic() - started) * 1000, 1)
+            logger.warning(f"⏰ {name} missed the {deadline}s deadline — using default")
+            results[name] = SourceResult(default, "timeout", elapsed)
+            continue
+        exc = future.exception()
+        if exc is not None:
+            elapsed = round((time.monotonic() - started) * 1000, 1)
+            logger.warning(f"❌ {name} failed: {exc} — using default")
+            results[name] = SourceResult(default, "error", elapsed, str(exc))
+            continue
+        value, latency = future.result()
+        results[name] = SourceResult(value, "ok", latency)
+    return results
+
+
+# ── Snapshot ──────────────────────────────────────────────────────────────────
+
+@dataclass
+class SignalSnapshot:
+    """Unfiltered source output for one dark pool symbol."""
+    dp_symbol: str
+    results: Dict[str, SourceResult]
+    created: float = field(default_factory=time.time)
+    _brief: Optional[SourceResult] = None
+    _brief_lock: threading.Lock = field(default_factory=threading.Lock)
+
+    @property
+    def regime_tier(self) -> int:
+        return self.results["Regime"].value
+
+    @property
+    def kill_chain(self) -> Optional[dict]:
+        return self.results["KillChain"].value
+
+    @property
+    def kill_chain_context(self) -> dict:
+        return {"econ": self.results["EconCalendar"].value, "macro": self.results["MacroRegime"].value}
+
+    @property
+    def partial(self) -> bool:
+        return any(r.status != "ok" for r in self.results.values())
+
+    def source(self, name: str) -> List[dict]:
+        return self.results[name].value or []
+
+    def morning_brief(self) -> List[dict]:
+        """Fallback source, fetched at most once per snapshot and only when asked for."""
+        with self._brief_lock:
+            if self._brief is None:
+                self._brief = fan_out({"MorningBrief": (lambda: fetch_morning_brief_signals(symbol=None), [])})["MorningBrief"]
+        return self._brief.value or []
+
+    def annotations(self) -> Dict[str, dict]:
+        out = {name: r.annotation() for name, r in self.results.items()}
+        if self._brief is not None:
+            out["MorningBrief"] = self._brief.annotation()
+        return out
+
+
+def _build_snapshot(dp_symbol: str, monitor) -> SignalSnapshot:
+    # DarkPoolTrend needs the regime tier, so the gate is started first and awaited inside its task
+    regime = _get_pool().submit(_timed(fetch_regime_tier))
+    tasks = {
+        "Regime": (fetch_regime_tier, 1),
+        "MonitorBuffer": (lambda: fetch_monitor_signals(monitor=monitor), []),
+        "AlertDB": (lambda: fetch_alert_db_signals(), []),
+        "DarkPoolTrend": (lambda: fetch_darkpool_signals(symbol=dp_symbol, regime_tier=regime.result()[0]), []),
+        "KillChain": (compute_kill_chain, None),
+        "EconCalendar": (fetch_econ_window, None),
+        "MacroRegime": (fetch_macro_regime, None),
+    }
+    results = fan_out(tasks, submitted={"Regime": regime})
+    return SignalSnapshot(dp_symbol=dp_symbol, results=results)
+
+
+def get_snapshot(dp_symbol: str, monitor=None) -> SignalSnapshot:
+    """Cached snapshot for ``dp_symbol``; concurrent misses share one build."""
+    with _snap_lock:
+        snap = _snapshots.get(dp_symbol)
+        if snap is not None and time.time() - snap.created < (PARTIAL_TTL if snap.partial else SNAPSHOT_TTL):
+            _stats["hits"] += 1
+            return snap
+        pending = _inflight.get(dp_symbol)
+        owner = pending is None
+        if owner:
+            pending = _inflight[dp_symbol] = Future()
+        else:
+            _stats["coalesced"] += 1
+    if not owner:
+        return pending.result()
+
+    try:
+        snap = _build_snapshot(dp_symbol, monitor)
+    except BaseException as exc:
+        with _snap_lock:
+            _inflight.pop(dp_symbol, None)
+        pending.set_exception(exc)
+        raise
+    with _snap_lock:
+        _snapshots[dp_symbol] = snap
+        _inflight.pop(dp_symbol, None)
+        _stats["builds"] += 1
+    pending.set_result(snap)
+    return snap
+
+
+def clear_snapshots():
+    with _snap_lock:
+        _snapshots.clear()
+
+
+def get_aggregator_stats() -> dict:
+    with _snap_lock:
+        return {**_stats, "cached": list(_snapshots), "inflight": list(_inflight)}
+
+
+# ── Per-request filters ───────────────────────────────────────────────────────
+
+def select_signals(snapshot: SignalSnapshot, symbol: Optional[str] = None,
+                   signal_type: Optional[str] = None, master_only: bool = False) -> List[dict]:
+    """Apply request filters to a snapshot; returns copies safe to annotate.
+
+    Mirrors the filters each source used to apply itself: MonitorBuffer by
+    symbol/type/master, AlertDB by symbol/master, DarkPoolTrend none (it is
+    keyed by symbol), MorningBrief (only when the rest is empty) by symbol.
+    """
+    def keep(sig, by_type=False, by_master=True):
+        if symbol and sig.get("symbol") != symbol:
+            return False
+        if by_type and signal_type and sig.get("type") != signal_type:
+            return False
+        if by_master and master_only and not sig.get("is_master"):
+            return False
+        return True
+
+    selected = [s for s in snapshot.source("MonitorBuffer") if keep(s, by_type=True)]
+    selected += [s for s in snapshot.source("AlertDB") if keep(s)]
+    selected += snapshot.source("DarkPoolTrend")
+    if not selected:
+        selected = [s for s in snapshot.morning_brief() if keep(s, by_master=False)]
+    return copy.deepcopy(selected)
@@ -17,9 +17,9 @@ class GeoScorer:
         raw_data = {"oil_spike": False, "news_risk_score": 0}
         
         try:
-            import yfinance as yf
+            from live_monitoring.core.market_data import get_market_data
             # Check Crude Oil (CL=F) for sudden daily spikes (>4%)
-            oil = yf.Ticker("CL=F").history(period="5d")
+            oil = get_market_data().get_history("CL=F", period="5d", interval="1d")
             if len(oil) >= 2:
                 today_px = oil['Close'].iloc[-1]
                 t_minus_1 = oil['Close'].iloc[-2]
@@ -67,8 +67,8 @@ class GexScorer:
 
             # Context only VIX
             try:
-                import yfinance as yf
-                vix_data = yf.Ticker('^VIX').history(period='1d')
+                from live_monitoring.core.market_data import get_market_data
+                vix_data = get_market_data().get_history('^VIX', period='1d', interval='1d')
                 if not vix_data.empty:
                     raw_data['vix'] = round(float(vix_data['Close'].iloc[-1]), 2)
             except Exception:
@@ -101,7 +101,7 @@ class GexScorer:
 
             # ── Rule: squeeze risk check ─────────────────────────────────────
             try:
-                t_spy = yf.Ticker('SPY')
+                t_spy = get_market_data().ticker('SPY')
                 spy_info = t_spy.info
                 si_pct = float(spy_info.get('shortPercentOfFloat') or 0) * 100
                 short_ratio = float(spy_info.get('shortRatio') or 0)
@@ -1,16 +1,13 @@
 """
-Live price fetcher with 60-second in-memory cache.
-Uses yfinance fast_info to avoid heavy API calls.
+Live price fetcher with 60-second cache.
+Reads through the process-wide MarketDataBus (fast_info quotes, coalesced).
 """
-import time
 import logging
-from typing import Dict
 
-import yfinance as yf
+from live_monitoring.core.market_data import get_market_data
 
 logger = logging.getLogger(__name__)
 
-_price_cache: Dict[str, dict] = {}
 _CACHE_TTL = 60  # seconds
 
 
@@ -20,16 +17,9 @@ def get_live_price(symbol: str) -> float:
     Returns 0.0 if the symbol cannot be fetched — callers must handle this.
     Never raises.
     """
-    now = time.time()
-    cached = _price_cache.get(symbol)
-    if cached and (now - cached["time"]) < _CACHE_TTL:
-        return cached["price"]
-
     try:
-        ticker = yf.Ticker(symbol)
-        price = ticker.fast_info.last_price
+        price = get_market_data().get_price(symbol, ttl=_CACHE_TTL)
         if price:
-            _price_cache[symbol] = {"price": float(price), "time": now}
             return float(price)
     except Exception as exc:
         logger.warning(f"get_live_price({symbol}) failed: {exc}")
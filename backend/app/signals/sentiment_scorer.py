@@ -21,8 +21,8 @@ class SentimentScorer:
         raw_data = {"vix": None, "vix_regime": None}
 
         try:
-            import yfinance as yf
-            vix_data = yf.Ticker('^VIX').history(period='5d')
+            from live_monitoring.core.market_data import get_market_data
+            vix_data = get_market_data().get_history('^VIX', period='5d', interval='1d')
             if not vix_data.empty:
                 vix = round(float(vix_data['Close'].iloc[-1]), 2)
                 vix_prev = round(float(vix_data['Close'].iloc[-2]), 2) if len(vix_data) >= 2 else vix
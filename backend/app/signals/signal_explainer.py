@@ -23,8 +23,7 @@ from pathlib import Path
 logger = logging.getLogger(__name__)
 
 GROQ_API_KEY = os.getenv("GROQ_API_KEY", "")
-GROQ_MODEL = "llama-3.3-70b-versatile"
-GROQ_URL = "https://api.groq.com/openai/v1/chat/completions"
+GROQ_MODEL = "llama-3.3-70b-versatile"  # served by the LLM gateway's "groq" provider
 
 # 4-hour disk cache — survives restarts, keeps Groq rate limit safe
 _CACHE_DIR = Path("/tmp/kill_shots_explanations")
@@ -168,32 +167,25 @@ class SignalExplainer:
         if not self.api_key:
             return self._template_fallback(signal_name, raw_data)
 
-        # 4. Groq API call (OpenAI-compatible)
+        # 4. Groq via the shared LLM gateway (pooled connection, coalesced duplicates)
         try:
-            import httpx
-            resp = httpx.post(
-                GROQ_URL,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": GROQ_MODEL,
-                    "messages": [
-                        {"role": "system", "content": (
-                            "You are a concise trading intelligence explainer. "
-                            "Answer in exactly 2-3 sentences. No bullet points. "
-                            "No disclaimers. Be direct and actionable."
-                        )},
-                        {"role": "user", "content": prompt},
-                    ],
-                    "temperature": 0.3,
-                    "max_tokens": 200,
-                },
+            from core.utils.llm_gateway import get_gateway
+            result = get_gateway().complete(
+                [
+                    {"role": "system", "content": (
+                        "You are a concise trading intelligence explainer. "
+                        "Answer in exactly 2-3 sentences. No bullet points. "
+                        "No disclaimers. Be direct and actionable."
+                    )},
+                    {"role": "user", "content": prompt},
+                ],
+                GROQ_MODEL,
+                provider="groq",
+                max_tokens=200,
+                temperature=0.3,
                 timeout=15.0,
             )
-            resp.raise_for_status()
-            explanation = resp.json()["choices"][0]["message"]["content"].strip()
+            explanation = result["content"].strip()
 
             self._mem_cache[dk] = explanation
             self._write_disk_cache(dk, explanation)
@@ -40,9 +40,9 @@ def fetch_darkpool_signals(symbol: str = "SPY", regime_tier: int = 1) -> List[di
     """
     results: List[dict] = []
     try:
-        from live_monitoring.enrichment.apis.stockgrid_client import StockgridClient
+        from live_monitoring.enrichment.apis.stockgrid_client import get_stockgrid_client
 
-        client = StockgridClient(cache_ttl=300)
+        client = get_stockgrid_client()
         raw = client.get_ticker_detail_raw(symbol, window=10)
         if not raw:
             logger.warning(f"darkpool_source: no data for {symbol}")
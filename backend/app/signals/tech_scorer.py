@@ -18,11 +18,11 @@ class TechScorer:
         raw_data = {"rsi_14": None, "adx_14": None}
         
         try:
-            import yfinance as yf
             import pandas as pd
             import numpy as np
+            from live_monitoring.core.market_data import get_market_data
             
-            spy = yf.Ticker("SPY").history(period="1mo")
+            spy = get_market_data().get_history("SPY", period="1mo", interval="1d")
             if not spy.empty and len(spy) >= 15:
                 # Basic RSI calculation
                 delta = spy['Close'].diff()
@@ -9,6 +9,8 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass
 from typing import List, Dict
 
+from backtesting.simulation.param_sweep import ParamSweep
+
 @dataclass
 class DPAlert:
     timestamp: datetime
@@ -82,48 +84,36 @@ def calculate_pnl(alert: DPAlert) -> float:
         else:
             return -stop_loss_pct
 
-def test_threshold(alerts: List[DPAlert], min_confluence: float, min_alerts: int) -> Dict:
-    """Test a specific threshold configuration"""
-    trades = []
-    buffer = []
-    last_send = None
-    
-    for alert in alerts:
-        window = alert.timestamp.replace(minute=alert.timestamp.minute // 2 * 2, second=0, microsecond=0)
-        buffer.append(alert)
-        
-        time_check = last_send is None or (window - last_send).total_seconds() >= 120
-        
-        if time_check and buffer:
-            avg_conf = sum(a.confluence_score for a in buffer) / len(buffer)
-            
-            should_send = (
-                avg_conf >= min_confluence or
-                (avg_conf >= min_confluence - 10 and len(buffer) >= min_alerts) or
-                len(buffer) >= 5
-            )
-            
-            if should_send:
-                best = max(buffer, key=lambda a: a.confluence_score)
-                pnl = calculate_pnl(best)
-                trades.append({'alert': best, 'pnl': pnl})
-                last_send = window
-                buffer = []
-    
-    if not trades:
-        return {'trades': 0, 'wins': 0, 'win_rate': 0, 'total_pnl': 0, 'avg_pnl': 0}
-    
-    wins = sum(1 for t in trades if t['pnl'] > 0)
-    total_pnl = sum(t['pnl'] for t in trades)
-    
+def threshold_combo(min_confluence: float, min_alerts: int) -> Dict:
+    """This script's gate (≥min_conf, or ≥min_conf-10 with min_alerts, or 5+ alerts) as TradingParams fields"""
     return {
-        'trades': len(trades),
-        'wins': wins,
-        'win_rate': wins / len(trades) * 100,
-        'total_pnl': total_pnl,
-        'avg_pnl': total_pnl / len(trades)
+        'stop_loss_pct': 0.25,
+        'take_profit_pct': 0.40,
+        'narrative_exceptional_confluence': min_confluence,
+        'narrative_min_confluence': min_confluence - 10,
+        'narrative_min_alerts': min_alerts,
+        'narrative_critical_mass': 5,
     }
 
+def run_thresholds(alerts: List[DPAlert], thresholds: List[tuple]) -> List[Dict]:
+    """Evaluate every (min_confluence, min_alerts) pair in one vectorized sweep"""
+    sweep = ParamSweep(alerts, quiet_period=None)
+    results = sweep.run(combos=[threshold_combo(c, a) for c, a in thresholds]).results
+    return [
+        {
+            'trades': int(row.trades),
+            'wins': int(row.wins),
+            'win_rate': float(row.win_rate),
+            'total_pnl': float(row.total_pnl),
+            'avg_pnl': float(row.expectancy),
+        }
+        for row in results.itertuples()
+    ]
+
+def test_threshold(alerts: List[DPAlert], min_confluence: float, min_alerts: int) -> Dict:
+    """Test a specific threshold configuration"""
+    return run_thresholds(alerts, [(min_confluence, min_alerts)])[0]
+
 def main():
     print("🎯 NARRATIVE BRAIN THRESHOLD SENSITIVITY ANALYSIS")
     print("=" * 70)
@@ -150,9 +140,9 @@ def main():
     print(f"{'Threshold':<30} {'Trades':<8} {'Win Rate':<10} {'Avg P&L':<10} {'Total P&L':<10}")
     print("-" * 70)
     
+    sweep_results = run_thresholds(alerts, [(c, a) for c, a, _ in thresholds])
     results = []
-    for min_conf, min_alerts, label in thresholds:
-        result = test_threshold(alerts, min_conf, min_alerts)
+    for (_, _, label), result in zip(thresholds, sweep_results):
         results.append((label, result))
         print(f"{label:<30} {result['trades']:<8} {result['win_rate']:>6.1f}%   {result['avg_pnl']:>+7.2f}%   {result['total_pnl']:>+7.2f}%")
     
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+🗄️ BAR STORE
+Persistent on-disk OHLCV store for reproducible, offline replays.
+
+yfinance only serves 1m bars for the last 7 days, so replays of older sessions
+silently degraded to 5m and every run re-downloaded the same bars. The store
+keeps each session once, partitioned by interval / symbol / date:
+
+    <root>/<interval>/<SYMBOL>/<YYYY-MM-DD>/
+        index.npy   int64 UTC nanoseconds
+        ohlcv.npy   float64, column-major (Fortran order)
+        meta.json   column names, source
+
+Reads memory-map the arrays and wrap them in a DataFrame without copying: a
+column-major (n, k) array transposes to the C-contiguous block pandas stores.
+Frames come back with a US/Eastern index, same as MarketDataProvider.
+
+Usage:
+    # Backfill from existing exports
+    python -m backtesting.engine.data.bar_store ingest backtesting/data/spy_15min_1mo.json --symbol SPY
+    python -m backtesting.engine.data.bar_store ingest spy_1m_features.csv --symbol SPY
+
+    # Snapshot what yfinance still has (1m = last 7 days)
+    python -m backtesting.engine.data.bar_store fetch SPY QQQ --days 7 --interval 1m
+
+    python -m backtesting.engine.data.bar_store list
+"""
+
+import argparse
+import json
+import os
+import shutil
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+DEFAULT_ROOT = os.path.join(BASE_PATH, "backtesting", "data", "bars")
+
+MARKET_TZ = "US/Eastern"
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+# Finest → coarsest; a request falls back to the next coarser stored interval
+INTERVALS = ["1m", "2m", "5m", "15m", "30m", "60m", "1h", "1d"]
+
+
+class BarStore:
+    """Date-partitioned, memory-mapped OHLCV store."""
+
+    def __init__(self, root: str = DEFAULT_ROOT):
+        self.root = root
+
+    def _partition(self, symbol: str, date_str: str, interval: str) -> str:
+        return os.path.join(self.root, interval, symbol.upper(), date_str)
+
+    def has(self, symbol: str, date_str: str, interval: str = "1m") -> bool:
+        return os.path.exists(os.path.join(self._partition(symbol, date_str, interval), "meta.json"))
+
+    def read(self, symbol: str, date_str: str, interval: str = "1m") -> Optional[pd.DataFrame]:
+        """
+        Bars for one session, or None if the partition is missing.
+
+        The frame is backed by a read-only memory map and is itself read-only:
+        adding or replacing whole columns is fine, but in-place edits
+        (``.loc``/``.iloc`` assignment, ``inplace=True``) raise "assignment
+        destination is read-only". Callers that modify bars must ``.copy()``.
+        """
+        path = self._partition(symbol, date_str, interval)
+        try:
+            with open(os.path.join(path, "meta.json")) as f:
+                meta = json.load(f)
+            index = np.load(os.path.join(path, "index.npy"), mmap_mode="r")
+            values = np.load(os.path.join(path, "ohlcv.npy"), mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+
+        idx = pd.DatetimeIndex(pd.to_datetime(np.asarray(index), unit="ns", utc=True)).tz_convert(MARKET_TZ)
+        idx.name = "Datetime"
+        return pd.DataFrame(values, index=idx, columns=meta["columns"], copy=False)
+
+    def read_best(self, symbol: str, date_str: str, interval: str = "1m"):
+        """
+        The requested interval, else the next coarser one on disk.
+
+        Returns:
+            (frame, interval) or (None, None)
+        """
+        candidates = INTERVALS[INTERVALS.index(interval):] if interval in INTERVALS else [interval]
+        for candidate in candidates:
+            data = self.read(symbol, date_str, candidate)
+            if data is not None:
+                return data, candidate
+        return None, None
+
+    def write(self, symbol: str, interval: str, data: pd.DataFrame, source: str = "") -> List[str]:
+        """
+        Store bars, split into one partition per US/Eastern session date.
+
+        Existing partitions for those dates are replaced atomically.
+
+        Returns:
+            Dates written
+        """
+        if data is None or data.empty:
+            return []
+        data = _normalize(data)
+        columns = [c for c in OHLCV_COLUMNS if c in data.columns]
+
+        written = []
+        for date_str, day in data.groupby(data.index.strftime("%Y-%m-%d"), sort=True):
+            path = self._partition(symbol, date_str, interval)
+            tmp = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+            os.makedirs(tmp, exist_ok=True)
+            np.save(os.path.join(tmp, "index.npy"), day.index.tz_convert("UTC").as_unit("ns").asi8)
+            np.save(os.path.join(tmp, "ohlcv.npy"), np.asfortranarray(day[columns].to_numpy(dtype=np.float64)))
+            with open(os.path.join(tmp, "meta.json"), "w") as f:
+                json.dump({"columns": columns, "rows": len(day), "source": source,
+                           "written_at": datetime.now().isoformat()}, f)
+            if os.path.exists(path):
+                shutil.rmtree(path)
+            os.replace(tmp, path)
+            written.append(date_str)
+        return written
+
+    def dates(self, symbol: str, interval: str = "1m") -> List[str]:
+        path = os.path.join(self.root, interval, symbol.upper())
+        if not os.path.isdir(path):
+            return []
+        return sorted(d for d in os.listdir(path) if not d.startswith(".") and ".tmp-" not in d)
+
+    def inventory(self) -> Dict[str, Dict[str, List[str]]]:
+        """{interval: {symbol: [dates]}} for everything on disk."""
+        result: Dict[str, Dict[str, List[str]]] = {}
+        if not os.path.isdir(self.root):
+            return result
+        for interval in sorted(os.listdir(self.root)):
+            interval_path = os.path.join(self.root, interval)
+            if not os.path.isdir(interval_path):
+                continue
+            result[interval] = {s: self.dates(s, interval) for s in sorted(os.listdir(interval_path))}
+        return result
+
+    # ═══════════════════════════════════════════════════════════════
+    # INGEST
+    # ═══════════════════════════════════════════════════════════════
+
+    def ingest_file(self, path: str, symbol: str, interval: Optional[str] = None,
+                    naive_tz: str = MARKET_TZ) -> List[str]:
+        """
+        Backfill from a JSON (list of records) or CSV bar export.
+
+        Args:
+            path: .json or .csv with a timestamp column and OHLCV columns (any case)
+            symbol: Ticker the file contains
+            interval: Bar size; inferred from timestamp spacing if omitted
+            naive_tz: Timezone for timestamps without an offset
+
+        Returns:
+            Dates written
+        """
+        data = load_bar_file(path, naive_tz=naive_tz)
+        interval = interval or infer_interval(data.index)
+        return self.write(symbol, interval, data, source=os.path.basename(path))
+
+    def fetch(self, symbol: str, interval: str = "1m", days: int = 7) -> List[str]:
+        """Snapshot completed sessions still available from yfinance."""
+        import yfinance as yf
+
+        data = yf.Ticker(symbol).history(period=f"{days}d", interval=interval)
+        if data.empty:
+            return []
+        data = _normalize(data)
+        today = datetime.now().strftime("%Y-%m-%d")
+        data = data[data.index.strftime("%Y-%m-%d") < today]
+        return self.write(symbol, interval, data, source="yfinance")
+
+
+def _normalize(data: pd.DataFrame) -> pd.DataFrame:
+    """US/Eastern index, sorted, de-duplicated, yfinance column names."""
+    if data.index.tz is None:
+        data = data.tz_localize("UTC")
+    data = data.tz_convert(MARKET_TZ)
+    data = data[~data.index.duplicated(keep="last")].sort_index()
+    return data.rename(columns={c: c.capitalize() for c in data.columns if c.lower() in {"open", "high", "low", "close", "volume"}})
+
+
+def load_bar_file(path: str, naive_tz: str = MARKET_TZ) -> pd.DataFrame:
+    """Parse a JSON/CSV bar export into an OHLCV frame indexed by US/Eastern time."""
+    if path.endswith(".json"):
+        with open(path) as f:
+            raw = pd.DataFrame(json.load(f))
+    else:
+        raw = pd.read_csv(path)
+
+    ts_col = next((c for c in raw.columns if c.lower() in ("timestamp", "datetime", "date", "time")), None)
+    if ts_col is None:
+        raise ValueError(f"{path}: no timestamp column")
+    index = pd.to_datetime(raw[ts_col], utc=False)
+    if getattr(index.dt, "tz", None) is None:
+        index = index.dt.tz_localize(naive_tz)
+    raw.index = pd.DatetimeIndex(index).tz_convert(MARKET_TZ)
+    return _normalize(raw.drop(columns=[ts_col]))
+
+
+def infer_interval(index: pd.DatetimeIndex) -> str:
+    """Median bar spacing as a yfinance interval string."""
+    if len(index) < 2:
+        return "1d"
+    minutes = int(round(pd.Series(index).diff().dropna().median().total_seconds() / 60))
+    if minutes >= 24 * 60:
+        return "1d"
+    return f"{minutes}m"
+
+
+_store: Optional[BarStore] = None
+_store_lock = threading.Lock()
+
+
+def get_bar_store() -> BarStore:
+    """Process-wide BarStore (root overridable via BAR_STORE_PATH)."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = BarStore(os.getenv("BAR_STORE_PATH", DEFAULT_ROOT))
+    return _store
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the local bar store")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    ingest = sub.add_parser("ingest", help="Backfill from JSON/CSV exports")
+    ingest.add_argument("files", nargs="+")
+    ingest.add_argument("--symbol", required=True)
+    ingest.add_argument("--interval", help="Bar size (inferred if omitted)")
+    ingest.add_argument("--naive-tz", default=MARKET_TZ, help="Timezone for offset-less timestamps")
+
+    fetch = sub.add_parser("fetch", help="Snapshot completed sessions from yfinance")
+    fetch.add_argument("symbols", nargs="+")
+    fetch.add_argument("--interval", default="1m")
+    fetch.add_argument("--days", type=int, default=7)
+
+    sub.add_parser("list", help="Show stored partitions")
+
+    args = parser.parse_args()
+    store = get_bar_store()
+
+    if args.command == "ingest":
+        for path in args.files:
+            written = store.ingest_file(path, args.symbol, interval=args.interval, naive_tz=args.naive_tz)
+            print(f"✅ {path}: {len(written)} sessions → {args.symbol}" + (f" ({written[0]} … {written[-1]})" if written else ""))
+    elif args.command == "fetch":
+        for symbol in args.symbols:
+            written = store.fetch(symbol, interval=args.interval, days=args.days)
+            print(f"✅ {symbol} {args.interval}: {len(written)} sessions stored")
+    else:
+        for interval, symbols in store.inventory().items():
+            for symbol, dates in symbols.items():
+                span = f"{dates[0]} … {dates[-1]}" if dates else "-"
+                print(f"  {interval:>4} {symbol:<6} {len(dates):>4} sessions  {span}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,11 @@
+import os
 import yfinance as yf
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 
+from .bar_store import BarStore, get_bar_store
+
 class MarketDataProvider:
     """
     Centralized provider for historical market data.
@@ -10,12 +13,21 @@ class MarketDataProvider:
     Fixes the stale VIX bug from the legacy backtester.
     """
     
-    def __init__(self):
+    def __init__(self, bar_store: Optional[BarStore] = None, offline: Optional[bool] = None):
+        """
+        Args:
+            bar_store: local bar store consulted before yfinance (default: shared store)
+            offline: never hit yfinance for bars; defaults to BACKTEST_OFFLINE=1
+        """
         self.cache = {}
+        self.bar_store = bar_store or get_bar_store()
+        self.offline = offline if offline is not None else os.getenv("BACKTEST_OFFLINE", "0") == "1"
 
     def get_historical_bars(self, symbol: str, date_str: str, interval: str = "1m") -> pd.DataFrame:
         """
         Fetch intraday OHLCV bars for a specific date.
+        Served from the local bar store when the session is on disk; completed
+        sessions fetched from yfinance are written through to it.
         """
         cache_key = f"{symbol}_{date_str}_{interval}"
         if cache_key in self.cache:
@@ -26,6 +38,18 @@ class MarketDataProvider:
             today = datetime.now()
             days_ago = (today - date_obj).days
             
+            # 1. Local store (exact interval, else next coarser one on disk)
+            stored, stored_interval = self.bar_store.read_best(symbol, date_str, interval)
+            if stored is not None and (stored_interval == interval or self.offline or days_ago > 7):
+                if stored_interval != interval:
+                    print(f"⚠️ {symbol} {interval} not stored for {date_str}. Using stored {stored_interval} bars.")
+                self.cache[cache_key] = stored
+                return stored
+            if self.offline:
+                print(f"⚠️ {symbol} bars for {date_str} not in bar store (offline mode).")
+                self.cache[cache_key] = pd.DataFrame()
+                return pd.DataFrame()
+            
             ticker = yf.Ticker(symbol)
             
             # yfinance limits 1m data to the last 7 days
@@ -51,6 +75,15 @@ class MarketDataProvider:
 
             # Filter exactly to the requested date in local time
             filtered_data = data[data.index.strftime('%Y-%m-%d') == date_str]
+            
+            # Write-through completed sessions so the next replay is offline
+            if not filtered_data.empty and date_obj.date() < today.date():
+                fetched_interval = "5m" if interval == "1m" and days_ago > 7 else interval
+                try:
+                    self.bar_store.write(symbol, fetched_interval, filtered_data, source="yfinance")
+                except OSError as e:
+                    print(f"⚠️ Could not store {symbol} bars for {date_str}: {e}")
+            
             self.cache[cache_key] = filtered_data
             return filtered_data
             
@@ -74,8 +107,7 @@ class MarketDataProvider:
             start = (date_obj - timedelta(days=1)).strftime('%Y-%m-%d')
             end = (date_obj + timedelta(days=1)).strftime('%Y-%m-%d')
             
-            ticker = yf.Ticker("^VIX")
-            data = ticker.history(start=start, end=end, interval="1d")
+            data = self._daily_bars("^VIX", start, end)
             
             if data.empty:
                 return 20.0 # safe fallback
@@ -93,6 +125,25 @@ class MarketDataProvider:
             print(f"❌ Error fetching VIX for {date_str}: {e}")
             return 20.0
             
+    def _daily_bars(self, symbol: str, start: str, end: str) -> pd.DataFrame:
+        """
+        Daily bars in [start, end). yfinance when online (written through to the
+        bar store), otherwise whatever 1d sessions the store holds.
+        """
+        if not self.offline:
+            data = yf.Ticker(symbol).history(start=start, end=end, interval="1d")
+            if not data.empty:
+                today = datetime.now().strftime('%Y-%m-%d')
+                try:
+                    self.bar_store.write(symbol, "1d", data[data.index.strftime('%Y-%m-%d') < today], source="yfinance")
+                except OSError:
+                    pass
+                return data
+        
+        stored = [self.bar_store.read(symbol, d, "1d") for d in self.bar_store.dates(symbol, "1d") if start <= d < end]
+        stored = [d for d in stored if d is not None]
+        return pd.concat(stored) if stored else pd.DataFrame()
+        
     def get_market_context(self, date_str: str) -> Dict[str, Any]:
         """Provides a cohesive snapshot of the market for a given day."""
         vix = self.get_historical_vix(date_str)
@@ -102,7 +153,7 @@ class MarketDataProvider:
             date_obj = datetime.strptime(date_str, '%Y-%m-%d')
             start = (date_obj - timedelta(days=5)).strftime('%Y-%m-%d')
             end = (date_obj + timedelta(days=1)).strftime('%Y-%m-%d')
-            spy = yf.Ticker("SPY").history(start=start, end=end, interval="1d")
+            spy = self._daily_bars("SPY", start, end)
             
             direction = "UNKNOWN"
             if not spy.empty and len(spy) >= 2:
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+⚡ PARALLEL REPLAY RUNNER
+Shards multi-day `SessionReplayer` work across CPU cores.
+
+Work unit = (date, symbol, detector). The parent process:
+  1. Preloads every (symbol, date) bar frame and session context (I/O bound → threads)
+  2. Hands them to a process pool read-only (fork → copy-on-write, no pickling)
+  3. Merges unit results per date in symbol → registry order, so output is
+     identical to the serial replay regardless of completion order
+  4. Records the Mission Wallet in date order (cached days included) and
+     compiles daily results
+
+Compiled days are cached on disk keyed by (code version, date, symbols), where
+the code version is a content hash of the backtesting engine, simulation
+detectors and signal generator. Editing any of them invalidates the cache.
+
+Usage:
+    runner = ParallelReplayRunner(SessionReplayer(symbols=["SPY", "QQQ"]), workers=8)
+    daily_results = runner.run(["2026-03-02", "2026-03-03", ...])
+"""
+
+import hashlib
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from .replayer import SessionReplayer, build_inst_context, evaluate_detector
+
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_CACHE_DIR = os.path.join(BASE_PATH, "cache", "replay_results")
+
+# Sources whose contents define replay output
+_VERSIONED_PATHS = [
+    os.path.join(BASE_PATH, "backtesting", "engine"),
+    os.path.join(BASE_PATH, "backtesting", "simulation"),
+    os.path.join(BASE_PATH, "live_monitoring", "core", "signal_generator.py"),
+]
+
+
+def code_version() -> str:
+    """Content hash of every source file that can change a replay result."""
+    h = hashlib.blake2b(digest_size=8)
+    files = []
+    for path in _VERSIONED_PATHS:
+        if os.path.isfile(path):
+            files.append(path)
+            continue
+        for root, dirs, names in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+            files.extend(os.path.join(root, n) for n in sorted(names) if n.endswith(".py"))
+    for path in files:
+        h.update(os.path.relpath(path, BASE_PATH).encode())
+        with open(path, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+# ═══════════════════════════════════════════════════════════════
+# WORKER SIDE
+# ═══════════════════════════════════════════════════════════════
+
+_worker_bars: Dict[Tuple[str, str], Any] = {}
+_worker_contexts: Dict[str, Dict[str, Any]] = {}
+_worker_registry = None
+_worker_signal_generator = None
+
+
+def _init_worker(bars: Dict[Tuple[str, str], Any], contexts: Dict[str, Dict[str, Any]]):
+    """Pool initializer: attach shared read-only data, build detectors once per process."""
+    global _worker_bars, _worker_contexts, _worker_registry, _worker_signal_generator
+    from .registry import DetectorRegistry
+    from live_monitoring.core.signal_generator import SignalGenerator
+
+    _worker_bars = bars
+    _worker_contexts = contexts
+    _worker_registry = DetectorRegistry()
+    _worker_registry.load_all()
+    _worker_signal_generator = SignalGenerator(use_narrative=True)
+
+
+def _run_unit(unit: Tuple[str, str, str]):
+    """Evaluate one (date, symbol, detector) unit inside a worker."""
+    date_str, symbol, name = unit
+    detector = _worker_registry.get(name)
+    if detector is None:
+        return unit, [], []
+    inst_context = build_inst_context(date_str, _worker_contexts[date_str])
+    signals, trades = evaluate_detector(
+        name, detector, symbol, _worker_bars[(symbol, date_str)], inst_context, _worker_signal_generator
+    )
+    return unit, signals, trades
+
+
+# ═══════════════════════════════════════════════════════════════
+# RUNNER
+# ═══════════════════════════════════════════════════════════════
+
+class ParallelReplayRunner:
+    """
+    Multi-day replay over a process pool.
+
+    Produces the same daily result dicts as `SessionReplayer.replay_session`,
+    in date order.
+    """
+
+    def __init__(self, replayer: SessionReplayer, workers: int = 0, io_workers: int = 8,
+                 cache_dir: Optional[str] = DEFAULT_CACHE_DIR, use_cache: bool = True):
+        """
+        Args:
+            replayer: SessionReplayer providing symbols, data providers and the detector registry
+            workers: process count (0 = all cores, 1 = evaluate in-process)
+            io_workers: threads used to preload bars and session contexts
+            cache_dir: root of the on-disk results cache
+            use_cache: read/write compiled days from the cache
+        """
+        self.replayer = replayer
+        self.symbols = replayer.symbols
+        self.workers = workers or os.cpu_count() or 1
+        self.io_workers = io_workers
+        self.use_cache = use_cache and cache_dir is not None
+        self.cache_dir = os.path.join(cache_dir, code_version()) if self.use_cache else None
+        self.stats = {"cached_days": 0, "replayed_days": 0, "units": 0}
+        self.wallet = None  # MissionWallet of the last run()
+
+    # ─── cache ───
+
+    def _cache_path(self, date_str: str) -> str:
+        return os.path.join(self.cache_dir, f"{date_str}_{'-'.join(self.symbols)}.json")
+
+    def _load_cached(self, date_str: str) -> Optional[Dict[str, Any]]:
+        if not self.use_cache:
+            return None
+        try:
+            with open(self._cache_path(date_str)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_cached(self, date_str: str, result: Dict[str, Any]):
+        # Today's session is still moving — never freeze it
+        if not self.use_cache or date_str >= datetime.now().strftime('%Y-%m-%d'):
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp = self._cache_path(date_str) + ".tmp"
+            with open(tmp, "w") as f:
+                json.dump(result, f, default=str)
+            os.replace(tmp, self._cache_path(date_str))
+        except OSError as e:
+            print(f"  ⚠️ Could not cache replay for {date_str}: {e}")
+
+    # ─── phases ───
+
+    def _preload(self, dates: List[str]):
+        """Fetch all bars and session contexts up front (network bound → threads)."""
+        provider = self.replayer.market_provider
+        pairs = [(symbol, d) for d in dates for symbol in self.symbols]
+
+        with ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix="replay-io") as pool:
+            bar_futures = {pair: pool.submit(provider.get_historical_bars, pair[0], pair[1], "1m") for pair in pairs}
+            ctx_futures = {d: pool.submit(self.replayer.load_session_context, d) for d in dates}
+            bars = {}
+            for pair, f in bar_futures.items():
+                try:
+                    bars[pair] = f.result()
+                except Exception as e:
+                    print(f"❌ Failed to load {pair[0]} bars for {pair[1]}: {e}")
+            contexts = {}
+            for d, f in ctx_futures.items():
+                try:
+                    contexts[d] = f.result()
+                except Exception as e:
+                    print(f"❌ Failed to load context for {d}: {e}")
+
+        bars = {pair: data for pair, data in bars.items() if data is not None and not data.empty}
+        return bars, contexts
+
+    def _evaluate(self, units: List[Tuple[str, str, str]], bars, contexts) -> Dict[Tuple[str, str, str], Tuple[list, list]]:
+        """Run every unit, in a process pool when workers > 1."""
+        results = {}
+        if self.workers > 1 and len(units) > 1:
+            methods = multiprocessing.get_all_start_methods()
+            ctx = multiprocessing.get_context("fork" if "fork" in methods else None)
+            chunksize = max(1, len(units) // (self.workers * 4))
+            try:
+                with ProcessPoolExecutor(max_workers=min(self.workers, len(units)), mp_context=ctx,
+                                         initializer=_init_worker, initargs=(bars, contexts)) as pool:
+                    for unit, signals, trades in pool.map(_run_unit, units, chunksize=chunksize):
+                        results[unit] = (signals, trades)
+                return results
+            except BrokenProcessPool as e:
+                print(f"⚠️ Replay worker pool died ({e}). Finishing remaining units in-process.")
+
+        registry = self.replayer.registry
+        for unit in units:
+            if unit in results:
+                continue
+            date_str, symbol, name = unit
+            detector = registry.get(name)
+            if detector is None:
+                results[unit] = ([], [])
+                continue
+            inst_context = build_inst_context(date_str, contexts[date_str])
+            results[unit] = evaluate_detector(
+                name, detector, symbol, bars[(symbol, date_str)], inst_context,
+                self.replayer.signal_generator
+            )
+        return results
+
+    def run(self, dates: List[str]) -> List[Dict[str, Any]]:
+        """Replay dates and return their compiled daily results in date order."""
+        from live_monitoring.core.mission_wallet import MissionWallet
+
+        dates = sorted(set(dates))
+        cached = {d: r for d in dates if (r := self._load_cached(d)) is not None}
+        pending = [d for d in dates if d not in cached]
+        self.stats["cached_days"] = len(cached)
+
+        print(f"\n⚡ PARALLEL REPLAY: {len(dates)} days x {len(self.symbols)} symbols "
+              f"({len(cached)} cached, {self.workers} workers)")
+
+        replayed = {}
+        unit_results, bars, contexts, detector_names = {}, {}, {}, []
+        if pending:
+            self.replayer.registry.print_status()
+            bars, contexts = self._preload(pending)
+            detector_names = list(self.replayer.registry.get_all().keys())
+
+            units = []
+            for d in pending:
+                if d not in contexts:
+                    continue
+                for symbol in self.symbols:
+                    if (symbol, d) not in bars:
+                        print(f"  ⚠️ No 1m data found for {symbol} on {d}. Skipping.")
+                        continue
+                    units.extend((d, symbol, name) for name in detector_names)
+            self.stats["units"] = len(units)
+
+            unit_results = self._evaluate(units, bars, contexts)
+
+        # Record every day in date order, cached or fresh, so the wallet ends
+        # with the same total either way
+        self.wallet = MissionWallet()
+        for d in dates:
+            if d in cached:
+                self.wallet.record(d, cached[d]["total_pnl"], cached[d]["total_trades"])
+                continue
+            if d not in contexts:
+                continue
+
+            # Deterministic merge: symbol → registry order, same as the serial loop
+            all_signals, all_trades = [], []
+            for symbol in self.symbols:
+                for name in detector_names:
+                    signals, trades = unit_results.get((d, symbol, name), ([], []))
+                    all_signals.extend(signals)
+                    all_trades.extend(trades)
+
+            net_pnl = sum(t.pnl_pct for t in all_trades)
+            donation_usd = self.wallet.record(d, net_pnl, len(all_trades))
+            result = self.replayer._compile_daily_results(
+                d, contexts[d]["market_ctx"], all_signals, all_trades, donation_usd
+            )
+            replayed[d] = result
+            if any((symbol, d) in bars for symbol in self.symbols):
+                self._save_cached(d, result)
+        self.stats["replayed_days"] = len(replayed)
+
+        return [cached.get(d) or replayed[d] for d in dates if d in cached or d in replayed]
@@ -1,11 +1,12 @@
 import pandas as pd
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from datetime import datetime
 
 from .data.market_data import MarketDataProvider
 from .data.context_data import ContextDataProvider
 from .registry import DetectorRegistry
 from backtesting.simulation.base_detector import BaseDetector, Signal, TradeResult
+from backtesting.simulation.exit_engine import entry_indices
 from live_monitoring.core.signal_generator import SignalGenerator
 from core.ultra_institutional_engine import InstitutionalContext
 
@@ -37,55 +38,13 @@ class SessionReplayer:
         self.registry.print_status()
         
         # 1. Load context
-        dp_snap = self.context_provider.get_dp_snapshot(date_str)
-        # We actively synthesize the narrative here instead of failing silently on an empty JSON
-        from live_monitoring.enrichment.narrative_engine import run_narrative_engine
-        try:
-            print("\n🧠 SYNTHESIZING LIVE NARRATIVE FOR SESSION REPLAY...")
-            # We enforce run_narrative_engine to spit out the actual dict
-            narrative = run_narrative_engine(self.symbols[0], date_str, verbose=False)
-        except Exception as e:
-            print(f"  ❌ Narrative Engine failed: {e}")
-            narrative = self.context_provider.get_narrative_context(date_str)
-            
-        market_ctx = self.market_provider.get_market_context(date_str)
-        
-        print(f"\n📊 PRE-MARKET CONTEXT (Simulated)")
-        print(f"  VIX: {market_ctx['vix']} | Trend: {market_ctx['direction']}")
-        print(f"  Narrative: {narrative.get('direction', 'UNKNOWN')} | Conviction: {narrative.get('conviction', 'LOW')}")
-        print(f"  Dark Pool Alerts (09:00): {dp_snap.get('alerts', 0)}")
+        session_ctx = self.load_session_context(date_str)
+        market_ctx = session_ctx["market_ctx"]
+        inst_context = build_inst_context(date_str, session_ctx)
         
         all_signals = []
         all_trades = []
         
-        # Build InstitutionalContext from our mock context for the kill shots
-        inst_context = InstitutionalContext(
-            symbol="",
-            date=date_str,
-            dp_battlegrounds=dp_snap.get("levels", []),
-            dp_total_volume=dp_snap.get("total_volume", 0),
-            dp_buy_sell_ratio=dp_snap.get("buy_sell_ratio", 1.0),
-            dp_avg_print_size=0.0,
-            dark_pool_pct=dp_snap.get("pct", 50.0),
-            short_volume_pct=0.0,
-            short_interest=0,
-            days_to_cover=0.0,
-            borrow_fee_rate=0.0,
-            max_pain=0.0,
-            put_call_ratio=1.0,
-            total_option_oi=0,
-            institutional_buying_pressure=0.5, # Default mock
-            squeeze_potential=0.5,
-            gamma_pressure=market_ctx.get("gex_proxy", 0.5), # From our mock
-        )
-        if narrative.get("thesis"):
-            # Attach narrative to context so kill shots can score divergence
-            inst_context.narrative = type('NarrativeMock', (), {
-                'thesis': narrative.get('thesis', ''),
-                'conviction': narrative.get('conviction', 'NONE'),
-                'divergences': [{'severity': 'HIGH'}] if narrative.get('conviction') == 'HIGH' else [] # Mock divergence for backtest testing
-            })
-        
         # 2. Replay loop over symbols
         for symbol in self.symbols:
             # 1m OHLC isolated to this specific date
@@ -98,43 +57,11 @@ class SessionReplayer:
             
             # 3. Bar-by-bar evaluation 
             for name, detector in self.registry.get_all().items():
-                try:
-                    # Some detectors expect exactly these kwargs, some don't.
-                    signals = detector.detect_signals(symbol, data)
-                    
-                    # RUN ALPHA'S KILL SHOTS
-                    # This applies the Trap Matrix Danger Zones and Narrative Divergence rules
-                    inst_context.symbol = symbol
-                    current_price = data['Close'].iloc[-1] if not data.empty else 0
-                    valid_signals = self.signal_generator._apply_holistic_kill_shots(
-                        symbol, current_price, inst_context, signals
-                    )
-                    
-                    all_signals.extend(valid_signals)
-                    
-                    # Convert to trades for the VALID signals only
-                    for signal in valid_signals:
-                        entry_idx = _find_bar_idx(data, signal.timestamp)
-                        if entry_idx is not None:
-                            trade = detector.simulate_trade(signal, data, entry_idx)
-                            
-                            # Attach Narrative context AND Divergence to the trade for reporting
-                            if hasattr(inst_context, 'narrative'):
-                                trade._narrative_thesis = inst_context.narrative.thesis
-                                trade._narrative_conviction = inst_context.narrative.conviction
-                            else:
-                                trade._narrative_thesis = "No narrative available."
-                                trade._narrative_conviction = "NONE"
-                                
-                            trade._divergence_score = getattr(signal, 'divergence_score', 0)
-                            trade._is_paper_trade = getattr(signal, 'is_paper_trade', False)
-                            
-                            all_trades.append(trade)
-                            
-                except Exception as e:
-                    import traceback
-                    print(f"  ❌ {name} detector failed on {symbol}: {e}")
-                    traceback.print_exc()
+                valid_signals, trades = evaluate_detector(
+                    name, detector, symbol, data, inst_context, self.signal_generator
+                )
+                all_signals.extend(valid_signals)
+                all_trades.extend(trades)
                     
         # RUN MISSION WALLET HOOK
         from live_monitoring.core.mission_wallet import MissionWallet
@@ -145,6 +72,31 @@ class SessionReplayer:
         # 4. Compile results structure identical to DailyBacktestResult
         return self._compile_daily_results(date_str, market_ctx, all_signals, all_trades, donation_usd)
         
+    def load_session_context(self, date_str: str) -> Dict[str, Any]:
+        """
+        Pre-market context for a date as plain (picklable) dicts:
+        DP snapshot, synthesized narrative and market context.
+        """
+        dp_snap = self.context_provider.get_dp_snapshot(date_str)
+        # We actively synthesize the narrative here instead of failing silently on an empty JSON
+        from live_monitoring.enrichment.narrative_engine import run_narrative_engine
+        try:
+            print("\n🧠 SYNTHESIZING LIVE NARRATIVE FOR SESSION REPLAY...")
+            # We enforce run_narrative_engine to spit out the actual dict
+            narrative = run_narrative_engine(self.symbols[0], date_str, verbose=False)
+        except Exception as e:
+            print(f"  ❌ Narrative Engine failed: {e}")
+            narrative = self.context_provider.get_narrative_context(date_str)
+            
+        market_ctx = self.market_provider.get_market_context(date_str)
+        
+        print(f"\n📊 PRE-MARKET CONTEXT (Simulated)")
+        print(f"  VIX: {market_ctx['vix']} | Trend: {market_ctx['direction']}")
+        print(f"  Narrative: {narrative.get('direction', 'UNKNOWN')} | Conviction: {narrative.get('conviction', 'LOW')}")
+        print(f"  Dark Pool Alerts (09:00): {dp_snap.get('alerts', 0)}")
+        
+        return {"dp_snap": dp_snap, "narrative": narrative, "market_ctx": market_ctx}
+        
     def _compile_daily_results(self, date_str: str, market_ctx: Dict, signals: List[Signal], trades: List[TradeResult], donation_usd: float = 0.0) -> Dict[str, Any]:
         """
         Groups the flat list of trades back into the expected structure.
@@ -181,9 +133,90 @@ class SessionReplayer:
             ]
         }
 
+def build_inst_context(date_str: str, session_ctx: Dict[str, Any]) -> InstitutionalContext:
+    """Build the InstitutionalContext the kill shots expect from a session context dict."""
+    dp_snap = session_ctx["dp_snap"]
+    narrative = session_ctx["narrative"]
+    market_ctx = session_ctx["market_ctx"]
+    
+    inst_context = InstitutionalContext(
+        symbol="",
+        date=date_str,
+        dp_battlegrounds=dp_snap.get("levels", []),
+        dp_total_volume=dp_snap.get("total_volume", 0),
+        dp_buy_sell_ratio=dp_snap.get("buy_sell_ratio", 1.0),
+        dp_avg_print_size=0.0,
+        dark_pool_pct=dp_snap.get("pct", 50.0),
+        short_volume_pct=0.0,
+        short_interest=0,
+        days_to_cover=0.0,
+        borrow_fee_rate=0.0,
+        max_pain=0.0,
+        put_call_ratio=1.0,
+        total_option_oi=0,
+        institutional_buying_pressure=0.5, # Default mock
+        squeeze_potential=0.5,
+        gamma_pressure=market_ctx.get("gex_proxy", 0.5), # From our mock
+    )
+    if narrative.get("thesis"):
+        # Attach narrative to context so kill shots can score divergence
+        inst_context.narrative = type('NarrativeMock', (), {
+            'thesis': narrative.get('thesis', ''),
+            'conviction': narrative.get('conviction', 'NONE'),
+            'divergences': [{'severity': 'HIGH'}] if narrative.get('conviction') == 'HIGH' else [] # Mock divergence for backtest testing
+        })
+    return inst_context
+
+def evaluate_detector(name: str, detector: BaseDetector, symbol: str, data: pd.DataFrame,
+                      inst_context: InstitutionalContext, signal_generator) -> Tuple[List[Signal], List[TradeResult]]:
+    """
+    One (symbol, detector) unit of a session replay: detect, apply kill shots,
+    simulate the surviving signals. Never raises.
+    """
+    try:
+        # Some detectors expect exactly these kwargs, some don't.
+        signals = detector.detect_signals(symbol, data)
+        
+        # RUN ALPHA'S KILL SHOTS
+        # This applies the Trap Matrix Danger Zones and Narrative Divergence rules
+        inst_context.symbol = symbol
+        current_price = data['Close'].iloc[-1] if not data.empty else 0
+        valid_signals = signal_generator._apply_holistic_kill_shots(
+            symbol, current_price, inst_context, signals
+        )
+        
+        # Convert to trades for the VALID signals only (one batched exit pass)
+        tradeable = [(signal, _find_bar_idx(data, signal.timestamp)) for signal in valid_signals]
+        tradeable = [(signal, idx) for signal, idx in tradeable if idx is not None]
+        simulated = detector.simulate_trades(
+            [signal for signal, _ in tradeable], data, [idx for _, idx in tradeable]
+        ) if tradeable else []
+        
+        trades = []
+        for (signal, _), trade in zip(tradeable, simulated):
+            # Attach Narrative context AND Divergence to the trade for reporting
+            if hasattr(inst_context, 'narrative'):
+                trade._narrative_thesis = inst_context.narrative.thesis
+                trade._narrative_conviction = inst_context.narrative.conviction
+            else:
+                trade._narrative_thesis = "No narrative available."
+                trade._narrative_conviction = "NONE"
+                
+            trade._divergence_score = getattr(signal, 'divergence_score', 0)
+            trade._is_paper_trade = getattr(signal, 'is_paper_trade', False)
+            
+            trades.append(trade)
+        return valid_signals, trades
+                
+    except Exception as e:
+        import traceback
+        print(f"  ❌ {name} detector failed on {symbol}: {e}")
+        traceback.print_exc()
+        return [], []
+
 def _find_bar_idx(data: pd.DataFrame, target_time: datetime) -> int:
     """Helper to match a signal timestamp to the closest dataframe index."""
-    for i, idx in enumerate(data.index):
-        if hasattr(idx, 'timestamp') and idx >= target_time:
-            return i
-    return None
+    if not isinstance(data.index, pd.DatetimeIndex):
+        return None
+    idx = entry_indices(data.index, [target_time])[0]
+    return int(idx) if idx >= 0 else None
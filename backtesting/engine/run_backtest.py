@@ -6,6 +6,7 @@ Fully Replaces the old `date_range_backtest.py`.
 
 Usage:
     python -m backtesting.engine.run_backtest --start 2026-03-03 --end 2026-03-09 --symbols SPY,QQQ
+    python -m backtesting.engine.run_backtest --start 2026-01-05 --end 2026-03-27 --workers 0   # all cores
 
 Author: Zo (Alpha's AI)
 """
@@ -23,11 +24,19 @@ if base_path not in sys.path:
     sys.path.insert(0, base_path)
 
 from backtesting.engine.replayer import SessionReplayer
+from backtesting.engine.parallel_runner import ParallelReplayRunner
 
 class MultiDayBacktester:
-    def __init__(self, symbols: List[str] = None, output_dir: str = None):
+    def __init__(self, symbols: List[str] = None, output_dir: str = None, workers: int = 1, use_cache: bool = True):
+        """
+        Args:
+            workers: 1 = serial replay, 0 = all cores, N = N worker processes
+            use_cache: reuse compiled days from cache/replay_results (parallel mode only)
+        """
         self.symbols = symbols or ["SPY", "QQQ"]
         self.replayer = SessionReplayer(symbols=self.symbols)
+        self.workers = workers
+        self.use_cache = use_cache
         
         if not output_dir:
             base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -45,25 +54,27 @@ class MultiDayBacktester:
         print(f"🚀 INITIATING MULTI-DAY BACKTEST: {start_date} to {end_date}")
         print(f"{'='*70}")
         
-        all_results = []
+        dates = []
         current = start
-        
         while current <= end:
             # Skip Weekends
-            if skip_weekends and current.weekday() >= 5:
-                current += timedelta(days=1)
-                continue
-                
-            date_str = current.strftime('%Y-%m-%d')
-            try:
-                # Replay the single session
-                daily_result = self.replayer.replay_session(date_str)
-                all_results.append(daily_result)
-            except Exception as e:
-                print(f"❌ Failed to replay {date_str}: {e}")
-                
+            if not (skip_weekends and current.weekday() >= 5):
+                dates.append(current.strftime('%Y-%m-%d'))
             current += timedelta(days=1)
             
+        if self.workers != 1:
+            runner = ParallelReplayRunner(self.replayer, workers=self.workers, use_cache=self.use_cache)
+            all_results = runner.run(dates)
+        else:
+            all_results = []
+            for date_str in dates:
+                try:
+                    # Replay the single session
+                    daily_result = self.replayer.replay_session(date_str)
+                    all_results.append(daily_result)
+                except Exception as e:
+                    print(f"❌ Failed to replay {date_str}: {e}")
+            
         # Aggregate the results
         self._aggregate_and_save(start_date, end_date, all_results)
         
@@ -115,11 +126,13 @@ def main():
     parser.add_argument('--start', type=str, help='Start Date (YYYY-MM-DD)', required=True)
     parser.add_argument('--end', type=str, help='End Date (YYYY-MM-DD)', required=True)
     parser.add_argument('--symbols', type=str, default='SPY,QQQ', help='Comma-separated symbols')
+    parser.add_argument('--workers', type=int, default=1, help='Replay processes (1 = serial, 0 = all cores)')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore cached daily replay results')
     
     args = parser.parse_args()
     symbols = args.symbols.split(',')
     
-    backtester = MultiDayBacktester(symbols=symbols)
+    backtester = MultiDayBacktester(symbols=symbols, workers=args.workers, use_cache=not args.no_cache)
     backtester.run_range(args.start, args.end)
 
 if __name__ == "__main__":
@@ -29,6 +29,7 @@ from .unified_backtest_runner import UnifiedBacktestRunner
 from .trade_simulator import TradeSimulator
 from .current_system import CurrentSystemSimulator
 from .narrative_brain import NarrativeBrainSimulator
+from .param_sweep import ParamSweep, SweepResult, pareto_frontier
 from .squeeze_detector import SqueezeDetectorSimulator, SqueezeSignal
 from .gamma_detector import GammaDetectorSimulator, GammaBacktestSignal
 from .reddit_detector import RedditSignalSimulator, RedditBacktestResult, RedditBacktestTrade
@@ -65,6 +66,9 @@ __all__ = [
     'TradeSimulator',
     'CurrentSystemSimulator',
     'NarrativeBrainSimulator',
+    'ParamSweep',
+    'SweepResult',
+    'pareto_frontier',
     'SqueezeDetectorSimulator',
     'SqueezeSignal',
     'GammaDetectorSimulator',
@@ -24,6 +24,17 @@ import yfinance as yf
 base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.insert(0, base_path)
 
+from backtesting.simulation.exit_engine import resolve_exits, entry_indices, TIMEOUT, HIT_TARGET
+
+
+def _bar_store():
+    """Shared local bar store, or None if the engine package is unavailable."""
+    try:
+        from backtesting.engine.data.bar_store import get_bar_store
+        return get_bar_store()
+    except ImportError:
+        return None
+
 
 @dataclass
 class Signal:
@@ -140,6 +151,13 @@ class BaseDetector(ABC):
             OHLCV DataFrame filtered to the requested date
         """
         try:
+            # Stored sessions first — reproducible and offline
+            if date:
+                store = _bar_store()
+                stored = store.read(symbol, date, interval) if store else None
+                if stored is not None:
+                    return stored
+            
             ticker = yf.Ticker(symbol)
             
             # If specific date provided, use start/end instead of period
@@ -162,6 +180,12 @@ class BaseDetector(ABC):
                     mask = pd.Series([d == target_date for d in data_dates], index=data.index)
                     data = data[mask]
                 
+                if not data.empty and store and date_obj.date() < datetime.now().date():
+                    try:
+                        store.write(symbol, interval, data, source="yfinance")
+                    except OSError:
+                        pass
+                
                 return data
             else:
                 # Use period for latest data (backward compatibility)
@@ -188,105 +212,94 @@ class BaseDetector(ABC):
         Returns:
             TradeResult with outcome
         """
-        if entry_idx >= len(data) - 1:
-            return TradeResult(
-                signal=signal,
-                exit_price=signal.entry_price,
-                exit_time=None,
-                pnl_pct=0,
-                outcome='NO_DATA',
-                bars_held=0,
-                max_favorable=0,
-                max_adverse=0
-            )
+        return self.simulate_trades([signal], data, [entry_idx])[0]
+    
+    def simulate_trades(
+        self,
+        signals: List[Signal],
+        data: pd.DataFrame,
+        entry_idxs: List[int]
+    ) -> List[TradeResult]:
+        """
+        Simulate a batch of signals against the same price data in one pass.
         
-        max_favorable = 0
-        max_adverse = 0
+        Target is checked before stop on the same bar; timeouts close at the
+        last bar of the holding window.
         
-        for i in range(entry_idx + 1, min(entry_idx + self.max_bars + 1, len(data))):
-            high = data['High'].iloc[i]
-            low = data['Low'].iloc[i]
-            
-            if signal.direction == 'LONG':
-                # Track excursions
-                curr_favorable = (high - signal.entry_price) / signal.entry_price * 100
-                curr_adverse = (signal.entry_price - low) / signal.entry_price * 100
-                max_favorable = max(max_favorable, curr_favorable)
-                max_adverse = max(max_adverse, curr_adverse)
-                
-                # Check target
-                if high >= signal.target_price:
-                    return TradeResult(
-                        signal=signal,
-                        exit_price=signal.target_price,
-                        exit_time=data.index[i] if hasattr(data.index[i], 'isoformat') else None,
-                        pnl_pct=self.target_pct,
-                        outcome='WIN',
-                        bars_held=i - entry_idx,
-                        max_favorable=max_favorable,
-                        max_adverse=max_adverse
-                    )
-                
-                # Check stop
-                if low <= signal.stop_price:
-                    return TradeResult(
-                        signal=signal,
-                        exit_price=signal.stop_price,
-                        exit_time=data.index[i] if hasattr(data.index[i], 'isoformat') else None,
-                        pnl_pct=-self.stop_pct,
-                        outcome='LOSS',
-                        bars_held=i - entry_idx,
-                        max_favorable=max_favorable,
-                        max_adverse=max_adverse
-                    )
+        Args:
+            signals: Signals to trade
+            data: Price data shared by all signals
+            entry_idxs: Entry bar index per signal
             
-            else:  # SHORT
-                curr_favorable = (signal.entry_price - low) / signal.entry_price * 100
-                curr_adverse = (high - signal.entry_price) / signal.entry_price * 100
-                max_favorable = max(max_favorable, curr_favorable)
-                max_adverse = max(max_adverse, curr_adverse)
-                
-                if low <= signal.target_price:
-                    return TradeResult(
-                        signal=signal,
-                        exit_price=signal.target_price,
-                        exit_time=data.index[i] if hasattr(data.index[i], 'isoformat') else None,
-                        pnl_pct=self.target_pct,
-                        outcome='WIN',
-                        bars_held=i - entry_idx,
-                        max_favorable=max_favorable,
-                        max_adverse=max_adverse
-                    )
-                
-                if high >= signal.stop_price:
-                    return TradeResult(
-                        signal=signal,
-                        exit_price=signal.stop_price,
-                        exit_time=data.index[i] if hasattr(data.index[i], 'isoformat') else None,
-                        pnl_pct=-self.stop_pct,
-                        outcome='LOSS',
-                        bars_held=i - entry_idx,
-                        max_favorable=max_favorable,
-                        max_adverse=max_adverse
-                    )
+        Returns:
+            TradeResult per signal, in input order
+        """
+        results: List[Optional[TradeResult]] = [None] * len(signals)
+        live = []
+        for k, (signal, entry_idx) in enumerate(zip(signals, entry_idxs)):
+            if entry_idx >= len(data) - 1:
+                results[k] = TradeResult(
+                    signal=signal,
+                    exit_price=signal.entry_price,
+                    exit_time=None,
+                    pnl_pct=0,
+                    outcome='NO_DATA',
+                    bars_held=0,
+                    max_favorable=0,
+                    max_adverse=0
+                )
+            else:
+                live.append(k)
         
-        # Timeout - close at last price
-        last_price = data['Close'].iloc[min(entry_idx + self.max_bars, len(data) - 1)]
-        if signal.direction == 'LONG':
-            pnl = (last_price - signal.entry_price) / signal.entry_price * 100
-        else:
-            pnl = (signal.entry_price - last_price) / signal.entry_price * 100
+        if not live:
+            return results
         
-        return TradeResult(
-            signal=signal,
-            exit_price=last_price,
-            exit_time=None,
-            pnl_pct=pnl,
-            outcome='WIN' if pnl > 0 else 'LOSS',
-            bars_held=self.max_bars,
-            max_favorable=max_favorable,
-            max_adverse=max_adverse
+        batch = [signals[k] for k in live]
+        exits = resolve_exits(
+            data['High'].to_numpy(dtype=float),
+            data['Low'].to_numpy(dtype=float),
+            data['Close'].to_numpy(dtype=float),
+            entry_idx=[entry_idxs[k] for k in live],
+            is_long=[s.direction == 'LONG' for s in batch],
+            entry_price=[s.entry_price for s in batch],
+            target_price=[s.target_price for s in batch],
+            stop_price=[s.stop_price for s in batch],
+            max_bars=self.max_bars,
         )
+        
+        for j, k in enumerate(live):
+            signal = signals[k]
+            reason = exits.reason[j]
+            exit_i = int(exits.exit_idx[j])
+            
+            if reason == TIMEOUT:
+                # Timeout - close at last price
+                last_price = exits.exit_price[j]
+                if signal.direction == 'LONG':
+                    pnl = (last_price - signal.entry_price) / signal.entry_price * 100
+                else:
+                    pnl = (signal.entry_price - last_price) / signal.entry_price * 100
+                exit_time = None
+                outcome = 'WIN' if pnl > 0 else 'LOSS'
+                bars_held = self.max_bars
+            else:
+                pnl = self.target_pct if reason == HIT_TARGET else -self.stop_pct
+                exit_time = data.index[exit_i] if hasattr(data.index[exit_i], 'isoformat') else None
+                outcome = 'WIN' if reason == HIT_TARGET else 'LOSS'
+                bars_held = int(exits.bars_held[j])
+            
+            results[k] = TradeResult(
+                signal=signal,
+                exit_price=float(exits.exit_price[j]),
+                exit_time=exit_time,
+                pnl_pct=float(pnl),
+                outcome=outcome,
+                bars_held=bars_held,
+                max_favorable=float(exits.max_favorable[j]),
+                max_adverse=float(exits.max_adverse[j])
+            )
+        
+        return results
     
     def backtest_date(
         self, 
@@ -319,23 +332,12 @@ class BaseDetector(ABC):
             signals = self.detect_signals(symbol, data, **kwargs)
             all_signals.extend(signals)
             
-            # Simulate trades
-            for signal in signals:
-                # Find entry bar index
-                entry_idx = None
-                for i, idx in enumerate(data.index):
-                    if hasattr(idx, 'timestamp'):
-                        if idx >= signal.timestamp:
-                            entry_idx = i
-                            break
-                    else:
-                        entry_idx = 0  # Default to start
-                
-                if entry_idx is None:
-                    continue
-                
-                trade = self.simulate_trade(signal, data, entry_idx)
-                all_trades.append(trade)
+            # Simulate trades (entry = first bar at/after the signal)
+            entry_idxs = entry_indices(data.index, [s.timestamp for s in signals])
+            tradeable = [(s, int(i)) for s, i in zip(signals, entry_idxs) if i >= 0]
+            all_trades.extend(self.simulate_trades(
+                [s for s, _ in tradeable], data, [i for _, i in tradeable]
+            ))
         
         return self._calculate_metrics(date, all_signals, all_trades)
     
@@ -378,10 +380,8 @@ class BaseDetector(ABC):
                 signals = self.detect_signals(symbol, date_data, **kwargs)
                 all_signals.extend(signals)
                 
-                for signal in signals:
-                    entry_idx = 0  # Start of day
-                    trade = self.simulate_trade(signal, date_data, entry_idx)
-                    all_trades.append(trade)
+                # Start of day entry for every signal
+                all_trades.extend(self.simulate_trades(signals, date_data, [0] * len(signals)))
             
             result = self._calculate_metrics(date, all_signals, all_trades)
             results.append(result)
@@ -0,0 +1,150 @@
+"""
+🎯 EXIT ENGINE
+Vectorized exit resolution for a batch of trades on one OHLC series.
+
+Every detector used to walk bars one at a time per signal
+(`data['High'].iloc[i]`), tracking excursions as it went. Parameter sweeps
+re-simulate thousands of signals that way. This kernel resolves a whole batch
+against the same arrays in one pass:
+
+- Gather each trade's holding window as a (trades x bars) matrix
+- First target/stop hit per row via argmax over the hit masks
+- MFE/MAE as running maxima (np.fmax.accumulate) read at the exit bar
+
+Same-bar conflicts follow the caller's convention (target-first for
+BaseDetector, stop-first for the daily gamma/squeeze simulators).
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Exit reasons
+TIMEOUT = 0
+HIT_TARGET = 1
+HIT_STOP = 2
+
+
+@dataclass
+class ExitBatch:
+    """Per-trade exit resolution (all arrays aligned with the input batch)."""
+    exit_idx: np.ndarray      # bar index of the exit
+    reason: np.ndarray        # TIMEOUT / HIT_TARGET / HIT_STOP
+    exit_price: np.ndarray    # target, stop, or close at exit_idx
+    bars_held: np.ndarray     # exit_idx - entry_idx
+    max_favorable: np.ndarray  # % excursion in the trade's favor (>= 0)
+    max_adverse: np.ndarray    # % excursion against the trade (>= 0)
+
+
+def resolve_exits(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    entry_idx: Sequence[int],
+    is_long: Sequence[bool],
+    entry_price: Sequence[float],
+    target_price: Sequence[float],
+    stop_price: Sequence[float],
+    max_bars: Optional[int] = None,
+    stop_first: bool = False,
+    force_exit: Optional[np.ndarray] = None,
+) -> ExitBatch:
+    """
+    Resolve exits for a batch of trades on shared OHLC arrays.
+
+    Bars strictly after entry_idx are scanned. A trade exits on the first bar
+    that touches its target or stop; otherwise at the close of the first
+    force_exit bar, or at the close of bar entry_idx + max_bars (clamped to the
+    last bar) as a TIMEOUT.
+
+    Args:
+        high, low, close: per-bar arrays (length n)
+        entry_idx, is_long, entry_price, target_price, stop_price: per-trade arrays
+        max_bars: holding window in bars (None = until the last bar)
+        stop_first: stop wins when a bar touches both levels
+        force_exit: optional per-bar bool array; exit at that bar's close
+    """
+    high = np.asarray(high, dtype=float)
+    low = np.asarray(low, dtype=float)
+    close = np.asarray(close, dtype=float)
+    entry_idx = np.asarray(entry_idx, dtype=np.int64)
+    is_long = np.asarray(is_long, dtype=bool)
+    entry = np.asarray(entry_price, dtype=float)
+    target = np.asarray(target_price, dtype=float)
+    stop = np.asarray(stop_price, dtype=float)
+
+    n = len(close)
+    m = len(entry_idx)
+    if m == 0:
+        empty_i = np.zeros(0, dtype=np.int64)
+        empty_f = np.zeros(0, dtype=float)
+        return ExitBatch(empty_i, empty_i.copy(), empty_f, empty_i.copy(), empty_f.copy(), empty_f.copy())
+
+    width = max_bars if max_bars is not None else max(n - 1 - int(entry_idx.min()), 0)
+    width = max(int(width), 1)
+
+    # (trades x bars) holding windows; bars past the end are masked out
+    idx = entry_idx[:, None] + np.arange(1, width + 1)[None, :]
+    valid = idx < n
+    idx_c = np.minimum(idx, n - 1)
+    h = np.where(valid, high[idx_c], np.nan)
+    lo = np.where(valid, low[idx_c], np.nan)
+
+    long_ = is_long[:, None]
+    tgt = target[:, None]
+    stp = stop[:, None]
+    hit_target = np.where(long_, h >= tgt, lo <= tgt)
+    hit_stop = np.where(long_, lo <= stp, h >= stp)
+    forced = force_exit[idx_c] & valid if force_exit is not None else np.zeros_like(valid)
+
+    any_exit = hit_target | hit_stop | forced
+    has_exit = any_exit.any(axis=1)
+    first = any_exit.argmax(axis=1)
+    rows = np.arange(m)
+
+    t_at = hit_target[rows, first] & has_exit
+    s_at = hit_stop[rows, first] & has_exit
+    if stop_first:
+        reason = np.where(s_at, HIT_STOP, np.where(t_at, HIT_TARGET, TIMEOUT))
+    else:
+        reason = np.where(t_at, HIT_TARGET, np.where(s_at, HIT_STOP, TIMEOUT))
+
+    timeout_idx = np.minimum(entry_idx + (max_bars if max_bars is not None else n), n - 1)
+    exit_idx = np.where(has_exit, entry_idx + 1 + first, timeout_idx)
+    exit_price = np.select(
+        [reason == HIT_TARGET, reason == HIT_STOP],
+        [target, stop],
+        default=close[np.clip(exit_idx, 0, n - 1)],
+    )
+
+    # Running excursions; NaN (past end) never lowers the max
+    e = entry[:, None]
+    favorable = np.where(long_, (h - e) / e * 100, (e - lo) / e * 100)
+    adverse = np.where(long_, (e - lo) / e * 100, (h - e) / e * 100)
+    read_at = np.where(has_exit, first, width - 1)
+    mfe = np.fmax(np.fmax.accumulate(favorable, axis=1)[rows, read_at], 0.0)
+    mae = np.fmax(np.fmax.accumulate(adverse, axis=1)[rows, read_at], 0.0)
+
+    return ExitBatch(
+        exit_idx=exit_idx,
+        reason=reason,
+        exit_price=exit_price,
+        bars_held=exit_idx - entry_idx,
+        max_favorable=mfe,
+        max_adverse=mae,
+    )
+
+
+def entry_indices(index: pd.Index, timestamps: Sequence) -> np.ndarray:
+    """
+    First bar at or after each timestamp (-1 if none).
+
+    Non-datetime indexes map every signal to bar 0, as the per-signal scan did.
+    """
+    if not isinstance(index, pd.DatetimeIndex):
+        return np.zeros(len(timestamps), dtype=np.int64)
+    pos = index.searchsorted(pd.DatetimeIndex(list(timestamps)) if len(timestamps) else [], side="left")
+    pos = np.asarray(pos, dtype=np.int64)
+    return np.where(pos < len(index), pos, -1)
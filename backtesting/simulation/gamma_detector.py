@@ -10,6 +10,7 @@ import yfinance as yf
 import pandas as pd
 
 from ..simulation.trade_simulator import Trade
+from ..simulation.exit_engine import resolve_exits, HIT_STOP, HIT_TARGET
 from ..config.trading_params import TradingParams
 
 
@@ -172,48 +173,18 @@ class GammaDetectorSimulator:
                 target_price = actual_entry * 0.98  # 2% target
                 direction = 'SHORT'
         
-        # Simulate trade through the day
-        exit_price = None
-        exit_time = None
-        exit_reason = None
-        
-        for idx, row in intraday_data.iterrows():
-            if idx <= entry_time:
-                continue
-            
-            high = float(row['High'])
-            low = float(row['Low'])
-            close = float(row['Close'])
-            
-            # Check for stop or target hit
-            if direction == 'LONG':
-                if low <= stop_price:
-                    exit_price = stop_price
-                    exit_time = idx
-                    exit_reason = "HIT_STOP"
-                    break
-                elif high >= target_price:
-                    exit_price = target_price
-                    exit_time = idx
-                    exit_reason = "HIT_TARGET"
-                    break
-            else:  # SHORT
-                if high >= stop_price:
-                    exit_price = stop_price
-                    exit_time = idx
-                    exit_reason = "HIT_STOP"
-                    break
-                elif low <= target_price:
-                    exit_price = target_price
-                    exit_time = idx
-                    exit_reason = "HIT_TARGET"
-                    break
-        
-        # If no exit, use end of day close
-        if exit_price is None:
-            exit_price = float(intraday_data.iloc[-1]['Close'])
-            exit_time = intraday_data.index[-1]
-            exit_reason = "END_OF_DAY"
+        # Simulate trade through the day (stop checked first; else end of day close)
+        exits = resolve_exits(
+            intraday_data['High'].to_numpy(dtype=float),
+            intraday_data['Low'].to_numpy(dtype=float),
+            intraday_data['Close'].to_numpy(dtype=float),
+            entry_idx=[0], is_long=[direction == 'LONG'], entry_price=[actual_entry],
+            target_price=[target_price], stop_price=[stop_price],
+            stop_first=True,
+        )
+        exit_price = float(exits.exit_price[0])
+        exit_time = intraday_data.index[int(exits.exit_idx[0])]
+        exit_reason = {HIT_STOP: "HIT_STOP", HIT_TARGET: "HIT_TARGET"}.get(int(exits.reason[0]), "END_OF_DAY")
         
         # Calculate P&L
         if direction == 'LONG':
@@ -0,0 +1,297 @@
+"""
+🧮 PARAMETER SWEEP
+Evaluate a whole grid of TradingParams against one DPAlert set in a single pass.
+
+Looping TradeSimulator over configurations re-walks every alert per combo.
+The sweep splits the work along what each parameter actually touches:
+
+- Gate params (narrative_* thresholds) decide WHICH alerts get traded. The
+  2-minute synthesis buffer is path dependent, so alerts are walked once in
+  time order with one buffer state per gate combo, held in NumPy arrays.
+- Payoff params (stop_loss_pct, take_profit_pct) only change per-trade P&L,
+  so every stop/target pair is scored at once as a (trades x pairs) matrix.
+
+Results match NarrativeBrainSimulator / CurrentSystemSimulator + TradeSimulator
+for each individual combo.
+
+Usage:
+    sweep = ParamSweep(alerts)
+    result = sweep.run({
+        'stop_loss_pct': [0.15, 0.20, 0.25, 0.30],
+        'take_profit_pct': [0.30, 0.40, 0.50, 0.60],
+        'narrative_min_confluence': range(50, 85, 5),
+        'narrative_min_alerts': [2, 3, 4],
+    })
+    result.results.sort_values('expectancy', ascending=False).head()
+    result.frontier
+"""
+
+import itertools
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ..config.trading_params import DEFAULT_PARAMS, TradingParams
+
+PAYOFF_KEYS = ('stop_loss_pct', 'take_profit_pct')
+GATE_KEYS = (
+    'narrative_min_confluence',
+    'narrative_min_alerts',
+    'narrative_critical_mass',
+    'narrative_exceptional_confluence',
+)
+
+# NarrativeBrainSimulator's "been very quiet" rule
+QUIET_MIN_CONFLUENCE = 60
+QUIET_MIN_ALERTS = 2
+DEFAULT_QUIET_PERIOD = timedelta(hours=12)
+
+# Pareto objectives: (column, maximize?)
+DEFAULT_OBJECTIVES = (('expectancy', True), ('win_rate', True), ('max_drawdown', False))
+
+
+@dataclass
+class SweepResult:
+    """Per-combo metrics plus the non-dominated subset."""
+    results: pd.DataFrame
+    frontier: pd.DataFrame
+
+
+class AlertArrays:
+    """Column view of a DPAlert list (time ordered)."""
+
+    def __init__(self, alerts: Sequence):
+        alerts = sorted(alerts, key=lambda a: a.timestamp)
+        self.alerts = alerts
+        stamps = pd.DatetimeIndex([a.timestamp for a in alerts])
+        # 2-minute synthesis window each alert falls in, as epoch seconds
+        self.window_s = (stamps.floor('2min').as_unit('s').asi8 if len(alerts) else np.zeros(0, dtype=np.int64))
+        self.tz = stamps.tz
+        self.confluence = np.array([a.confluence_score for a in alerts], dtype=float)
+        self.is_bounce = np.array([a.outcome == 'BOUNCE' for a in alerts], dtype=bool)
+        self.max_move = np.array([a.max_move_pct for a in alerts], dtype=float)
+
+    def __len__(self):
+        return len(self.alerts)
+
+
+class ParamSweep:
+    """Vectorized grid evaluation of TradingParams over a fixed alert set."""
+
+    def __init__(self, alerts: Sequence, base_params: TradingParams = DEFAULT_PARAMS,
+                 system: str = 'narrative', quiet_period: Optional[timedelta] = DEFAULT_QUIET_PERIOD,
+                 now: Optional[datetime] = None):
+        """
+        Args:
+            alerts: DPAlert-like objects (timestamp, outcome, max_move_pct, confluence_score)
+            base_params: values for any TradingParams field not in the grid
+            system: 'narrative' (NarrativeBrainSimulator gating) or 'current' (send every window)
+            quiet_period: NarrativeBrainSimulator quiet-period rule; None disables it
+            now: reference time for the quiet-period rule (default: datetime.now())
+        """
+        if system not in ('narrative', 'current'):
+            raise ValueError(f"Unknown system: {system}")
+        self.arrays = AlertArrays(alerts)
+        self.base_params = base_params
+        self.system = system
+        self.quiet_period = quiet_period
+        self.now = now
+
+    # ═══════════════════════════════════════════════════════════════
+    # GRID
+    # ═══════════════════════════════════════════════════════════════
+
+    def _combos(self, grid: Optional[Dict[str, Iterable]], combos: Optional[List[Dict]]) -> pd.DataFrame:
+        base = asdict(self.base_params)
+        unknown = set(grid or {}).union(*(c.keys() for c in combos or [])) - set(PAYOFF_KEYS + GATE_KEYS)
+        if unknown:
+            raise ValueError(f"Not sweepable: {sorted(unknown)}")
+
+        if combos is None:
+            grid = {k: list(v) for k, v in (grid or {}).items()}
+            keys = list(grid)
+            combos = [dict(zip(keys, values)) for values in itertools.product(*grid.values())]
+
+        frame = pd.DataFrame([{**{k: base[k] for k in PAYOFF_KEYS + GATE_KEYS}, **c} for c in combos])
+        # Same constraint TradingParams enforces
+        return frame[frame['stop_loss_pct'] < frame['take_profit_pct']].reset_index(drop=True)
+
+    # ═══════════════════════════════════════════════════════════════
+    # GATING: one time-ordered pass, all gate combos at once
+    # ═══════════════════════════════════════════════════════════════
+
+    def _gate(self, gates: pd.DataFrame) -> List[np.ndarray]:
+        """Alert indices traded by each gate combo (in time order)."""
+        a = self.arrays
+        g = len(gates)
+        interval = self.base_params.synthesis_interval_seconds
+
+        min_conf = gates['narrative_min_confluence'].to_numpy(dtype=float)
+        min_alerts = gates['narrative_min_alerts'].to_numpy(dtype=float)
+        critical = gates['narrative_critical_mass'].to_numpy(dtype=float)
+        exceptional = gates['narrative_exceptional_confluence'].to_numpy(dtype=float)
+
+        buf_sum = np.zeros(g)
+        buf_cnt = np.zeros(g)
+        best_conf = np.full(g, -np.inf)
+        best_idx = np.zeros(g, dtype=np.int64)
+        last_send = np.zeros(g, dtype=np.int64)
+        has_sent = np.zeros(g, dtype=bool)
+
+        now = pd.Timestamp(self.now or datetime.now())
+        if a.tz is not None and now.tz is None:
+            now = now.tz_localize(a.tz)
+        now_s = now.as_unit('s').value
+        quiet_s = self.quiet_period.total_seconds() if self.quiet_period is not None else None
+
+        sent_gate, sent_alert = [], []
+        for i in range(len(a)):
+            conf = a.confluence[i]
+            buf_sum += conf
+            buf_cnt += 1
+            better = conf > best_conf  # max() keeps the first of equal scores
+            best_conf[better] = conf
+            best_idx[better] = i
+
+            window = a.window_s[i]
+            send = ~has_sent | (window - last_send >= interval)
+            if self.system == 'narrative':
+                avg = buf_sum / buf_cnt
+                should = (
+                    (avg >= exceptional)
+                    | ((avg >= min_conf) & (buf_cnt >= min_alerts))
+                    | (buf_cnt >= critical)
+                )
+                if quiet_s is not None:
+                    # Before any send the simulator assumes 6h of quiet
+                    since_last = np.where(has_sent, now_s - last_send, 6 * 3600)
+                    should |= (since_last >= quiet_s) & (avg >= QUIET_MIN_CONFLUENCE) & (buf_cnt >= QUIET_MIN_ALERTS)
+                send &= should
+
+            if send.any():
+                hit = np.flatnonzero(send)
+                sent_gate.append(hit)
+                sent_alert.append(best_idx[hit].copy())
+                last_send[hit] = window
+                has_sent[hit] = True
+                buf_sum[hit] = 0
+                buf_cnt[hit] = 0
+                best_conf[hit] = -np.inf
+
+        if not sent_gate:
+            return [np.zeros(0, dtype=np.int64) for _ in range(g)]
+        gate_ids = np.concatenate(sent_gate)
+        alert_ids = np.concatenate(sent_alert)
+        order = np.argsort(gate_ids, kind='stable')  # keeps time order within a gate
+        gate_ids, alert_ids = gate_ids[order], alert_ids[order]
+        bounds = np.searchsorted(gate_ids, np.arange(g + 1))
+        return [alert_ids[bounds[k]:bounds[k + 1]] for k in range(g)]
+
+    # ═══════════════════════════════════════════════════════════════
+    # PAYOFF: every stop/target pair for one trade list
+    # ═══════════════════════════════════════════════════════════════
+
+    def _score(self, traded: np.ndarray, stops: np.ndarray, targets: np.ndarray) -> Dict[str, np.ndarray]:
+        """Metrics per (stop, target) pair for a fixed set of traded alerts."""
+        p = len(stops)
+        n = len(traded)
+        if n == 0:
+            zeros = np.zeros(p)
+            return {'trades': zeros.astype(int), 'wins': zeros.astype(int), 'losses': zeros.astype(int),
+                    'win_rate': zeros, 'total_pnl': zeros, 'expectancy': zeros, 'avg_win': zeros,
+                    'avg_loss': zeros, 'profit_factor': zeros, 'max_drawdown': zeros}
+
+        a = self.arrays
+        # Win iff the level held and the move reached the target (TradeSimulator)
+        win = a.is_bounce[traded][:, None] & (a.max_move[traded][:, None] >= targets[None, :])
+        pnl = np.where(win, targets[None, :], -stops[None, :])
+
+        wins = win.sum(axis=0)
+        losses = n - wins
+        gross_win = wins * targets
+        gross_loss = losses * stops
+        total = gross_win - gross_loss
+
+        cum = np.cumsum(pnl, axis=0)
+        peak = np.maximum.accumulate(np.maximum(cum, 0.0), axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            profit_factor = np.where(gross_loss > 0, gross_win / gross_loss, np.where(gross_win > 0, np.inf, 0.0))
+
+        return {
+            'trades': np.full(p, n),
+            'wins': wins,
+            'losses': losses,
+            'win_rate': wins / n * 100,
+            'total_pnl': total,
+            'expectancy': total / n,
+            'avg_win': np.where(wins > 0, targets, 0.0),
+            'avg_loss': np.where(losses > 0, -stops, 0.0),
+            'profit_factor': profit_factor,
+            'max_drawdown': (peak - cum).max(axis=0),
+        }
+
+    def run(self, grid: Optional[Dict[str, Iterable]] = None, combos: Optional[List[Dict]] = None,
+            objectives=DEFAULT_OBJECTIVES) -> SweepResult:
+        """
+        Evaluate every combination.
+
+        Args:
+            grid: {TradingParams field: values}; the cartesian product is evaluated
+            combos: explicit list of {field: value} dicts (instead of a grid)
+            objectives: ((column, maximize), ...) for the Pareto frontier
+
+        Returns:
+            SweepResult(results, frontier). Combos with stop >= target are dropped.
+        """
+        frame = self._combos(grid, combos)
+        if frame.empty:
+            empty = pd.DataFrame(columns=list(PAYOFF_KEYS + GATE_KEYS))
+            return SweepResult(results=empty, frontier=empty)
+
+        gate_cols = list(GATE_KEYS)
+        gate_id = frame.groupby(gate_cols, sort=False).ngroup().to_numpy()
+        gates = frame.drop_duplicates(gate_cols)[gate_cols].reset_index(drop=True)
+        traded = self._gate(gates)
+
+        metrics = {}
+        for g, alerts_idx in enumerate(traded):
+            rows = np.flatnonzero(gate_id == g)
+            scored = self._score(
+                alerts_idx,
+                frame['stop_loss_pct'].to_numpy(dtype=float)[rows],
+                frame['take_profit_pct'].to_numpy(dtype=float)[rows],
+            )
+            for name, values in scored.items():
+                metrics.setdefault(name, np.zeros(len(frame), dtype=np.asarray(values).dtype))[rows] = values
+
+        results = pd.concat([frame, pd.DataFrame(metrics)], axis=1)
+        return SweepResult(results=results, frontier=pareto_frontier(results[results['trades'] > 0], objectives))
+
+
+def pareto_frontier(results: pd.DataFrame, objectives=DEFAULT_OBJECTIVES, chunk: int = 1024) -> pd.DataFrame:
+    """
+    Rows not dominated on the given objectives.
+
+    A row is dominated if another is at least as good on every objective and
+    strictly better on one.
+    """
+    if results.empty:
+        return results
+    # Orient everything as "bigger is better"
+    values = np.column_stack([
+        results[col].to_numpy(dtype=float) * (1.0 if maximize else -1.0) for col, maximize in objectives
+    ])
+    unique, inverse = np.unique(values, axis=0, return_inverse=True)
+    inverse = np.asarray(inverse).reshape(-1)
+
+    dominated = np.zeros(len(unique), dtype=bool)
+    for start in range(0, len(unique), chunk):
+        block = unique[start:start + chunk]
+        ge = (unique[None, :, :] >= block[:, None, :]).all(axis=2)
+        gt = (unique[None, :, :] > block[:, None, :]).any(axis=2)
+        dominated[start:start + chunk] = (ge & gt).any(axis=1)
+
+    return results[~dominated[inverse]]
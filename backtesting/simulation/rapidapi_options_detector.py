@@ -438,14 +438,20 @@ class RapidAPIOptionsDetector(BaseDetector):
         print(f"   📊 Options Flow: {len(signals)} signals after filtering")
         
         # Simulate trades
-        trades = []
-        for signal in signals:
-            data = self.get_intraday_data(signal.symbol, period="1d", interval="5m")
+        by_symbol = {}
+        for pos, signal in enumerate(signals):
+            by_symbol.setdefault(signal.symbol, []).append(pos)
+        
+        trades_by_pos = {}
+        for symbol, positions in by_symbol.items():
+            data = self.get_intraday_data(symbol, period="1d", interval="5m")
             if data.empty:
                 continue
             
-            trade = self.simulate_trade(signal, data, entry_idx=0)
-            trades.append(trade)
+            simulated = self.simulate_trades([signals[p] for p in positions], data, [0] * len(positions))
+            trades_by_pos.update(zip(positions, simulated))
+        
+        trades = [trades_by_pos[p] for p in sorted(trades_by_pos)]
         
         return self._calculate_metrics(date, signals, trades)
 
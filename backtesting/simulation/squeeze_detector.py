@@ -7,9 +7,11 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import List, Optional
 import yfinance as yf
+import numpy as np
 import pandas as pd
 
 from ..simulation.trade_simulator import Trade
+from ..simulation.exit_engine import resolve_exits, HIT_STOP, HIT_TARGET
 from ..config.trading_params import TradingParams
 
 
@@ -172,43 +174,20 @@ class SqueezeDetectorSimulator:
             stop_price = actual_entry * 0.99  # 1% stop
             target_price = actual_entry * 1.02  # 2% target
         
-        # Simulate trade through the day
-        exit_price = None
-        exit_time = None
-        exit_reason = None
-        
-        for idx, row in intraday_data.iterrows():
-            if idx <= entry_time:
-                continue
-            
-            high = float(row['High'])
-            low = float(row['Low'])
-            close = float(row['Close'])
-            
-            # Check for stop or target hit
-            if low <= stop_price:
-                exit_price = stop_price
-                exit_time = idx
-                exit_reason = "HIT_STOP"
-                break
-            elif high >= target_price:
-                exit_price = target_price
-                exit_time = idx
-                exit_reason = "HIT_TARGET"
-                break
-            
-            # Check end of day (4:00 PM ET)
-            if idx.hour >= 16:
-                exit_price = close
-                exit_time = idx
-                exit_reason = "END_OF_DAY"
-                break
-        
-        if exit_price is None:
-            # No exit found, use last price
-            exit_price = float(intraday_data['Close'].iloc[-1])
-            exit_time = intraday_data.index[-1]
-            exit_reason = "END_OF_DAY"
+        # Simulate trade through the day (stop checked first; exit at close
+        # of the first bar at/after 4:00 PM ET, else the last bar)
+        exits = resolve_exits(
+            intraday_data['High'].to_numpy(dtype=float),
+            intraday_data['Low'].to_numpy(dtype=float),
+            intraday_data['Close'].to_numpy(dtype=float),
+            entry_idx=[0], is_long=[True], entry_price=[actual_entry],
+            target_price=[target_price], stop_price=[stop_price],
+            stop_first=True,
+            force_exit=np.asarray(intraday_data.index.hour >= 16),
+        )
+        exit_price = float(exits.exit_price[0])
+        exit_time = intraday_data.index[int(exits.exit_idx[0])]
+        exit_reason = {HIT_STOP: "HIT_STOP", HIT_TARGET: "HIT_TARGET"}.get(int(exits.reason[0]), "END_OF_DAY")
         
         # Calculate P&L (LONG trade)
         pnl = exit_price - actual_entry
@@ -28,6 +28,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from backtesting.simulation.base_detector import BacktestResult, Signal
+from backtesting.simulation.exit_engine import entry_indices
 from backtesting.simulation.market_context_detector import MarketContextDetector, MarketContext
 from backtesting.simulation.composite_signal_filter import CompositeSignalFilter, EnhancedSignal
 
@@ -281,29 +282,28 @@ class UnifiedBacktestRunner:
         if not detector:
             return result
         
-        filtered_trades = []
-        for signal in filtered_signals:
-            # Get price data for simulation
-            data = detector.get_intraday_data(signal.symbol, period="1d", interval="1m")
+        by_symbol: Dict[str, List[int]] = {}
+        for pos, signal in enumerate(filtered_signals):
+            by_symbol.setdefault(signal.symbol, []).append(pos)
+        
+        trades_by_pos = {}
+        for symbol, positions in by_symbol.items():
+            # Get price data for simulation (once per symbol)
+            data = detector.get_intraday_data(symbol, period="1d", interval="1m")
             if data.empty:
                 continue
             
             # Find entry bar index
-            entry_idx = None
-            for i, idx in enumerate(data.index):
-                if hasattr(idx, 'timestamp'):
-                    if idx >= signal.timestamp:
-                        entry_idx = i
-                        break
-                else:
-                    entry_idx = 0
+            entry_idxs = entry_indices(data.index, [filtered_signals[p].timestamp for p in positions])
+            tradeable = [(p, int(i)) for p, i in zip(positions, entry_idxs) if i >= 0]
             
-            if entry_idx is None:
-                continue
-            
-            # Simulate trade
-            trade = detector.simulate_trade(signal, data, entry_idx)
-            filtered_trades.append(trade)
+            # Simulate trades in one batch
+            simulated = detector.simulate_trades(
+                [filtered_signals[p] for p, _ in tradeable], data, [i for _, i in tradeable]
+            )
+            trades_by_pos.update(zip((p for p, _ in tradeable), simulated))
+        
+        filtered_trades = [trades_by_pos[p] for p in sorted(trades_by_pos)]
         
         # Recalculate metrics
         return detector._calculate_metrics(result.date, filtered_signals, filtered_trades)
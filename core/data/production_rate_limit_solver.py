@@ -10,7 +10,6 @@ PRODUCTION-READY RATE LIMIT SOLVER INTEGRATION
 import logging
 import time
 import random
-import json
 import os
 import re
 from datetime import datetime, timedelta
@@ -21,6 +20,8 @@ import yfinance as yf
 import pandas as pd
 import numpy as np
 
+from core.utils.tiered_cache import MB, get_cache
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -53,42 +54,11 @@ class ProductionRateLimitSolver:
             'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         ]
         
-        # Create cache directory
-        os.makedirs(self.cache_dir, exist_ok=True)
-        
-    def _get_cache_path(self, source: str, ticker: str, data_type: str) -> str:
-        """Get cache file path"""
-        return os.path.join(self.cache_dir, f"{source}_{ticker}_{data_type}.json")
-    
-    def _is_cache_valid(self, cache_path: str) -> bool:
-        """Check if cache is still valid"""
-        try:
-            if not os.path.exists(cache_path):
-                return False
-            
-            file_age = time.time() - os.path.getmtime(cache_path)
-            return file_age < self.cache_duration
-            
-        except Exception as e:
-            logger.error(f"Error checking cache validity: {e}")
-            return False
-    
-    def _load_from_cache(self, cache_path: str) -> Optional[Dict[str, Any]]:
-        """Load data from cache"""
-        try:
-            with open(cache_path, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"Error loading from cache: {e}")
-            return None
-    
-    def _save_to_cache(self, cache_path: str, data: Dict[str, Any]) -> None:
-        """Save data to cache"""
-        try:
-            with open(cache_path, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
-        except Exception as e:
-            logger.error(f"Error saving to cache: {e}")
+        # Memory + disk cache (last known good survives restarts and total source failure)
+        self.cache = get_cache(
+            "market_data_fallback", ttl=self.cache_duration, disk_dir=self.cache_dir,
+            serializer="json", max_bytes=4 * MB, max_disk_bytes=32 * MB,
+        )
     
     def _enforce_rate_limit(self, source: str) -> bool:
         """Enforce rate limiting with jitter"""
@@ -134,31 +104,36 @@ class ProductionRateLimitSolver:
             logger.info(f"🔍 GETTING MARKET DATA FOR {ticker}")
             
             # Try cache first
-            cache_path = self._get_cache_path("cached", ticker, "market_data")
-            if self._is_cache_valid(cache_path):
-                cached_data = self._load_from_cache(cache_path)
-                if cached_data:
-                    logger.info(f"✅ Using cached data for {ticker}")
-                    return cached_data
+            cache_key = f"cached_{ticker}_market_data"
+            cached_data = self.cache.get(cache_key)
+            if cached_data:
+                logger.info(f"✅ Using cached data for {ticker}")
+                return cached_data
             
             # Try yfinance first
             yfinance_data = self._try_yfinance(ticker)
             if yfinance_data and self._validate_data(yfinance_data):
-                self._save_to_cache(cache_path, yfinance_data)
+                self.cache.set(cache_key, yfinance_data)
                 return yfinance_data
             
             # Try RapidAPI as fallback
             rapidapi_data = self._try_rapidapi(ticker)
             if rapidapi_data and self._validate_data(rapidapi_data):
-                self._save_to_cache(cache_path, rapidapi_data)
+                self.cache.set(cache_key, rapidapi_data)
                 return rapidapi_data
             
             # Try Yahoo Finance direct
             yahoo_data = self._try_yahoo_direct(ticker)
             if yahoo_data and self._validate_data(yahoo_data):
-                self._save_to_cache(cache_path, yahoo_data)
+                self.cache.set(cache_key, yahoo_data)
                 return yahoo_data
             
+            # Last known good beats zeros
+            expired = self.cache.peek(cache_key)
+            if expired is not None:
+                logger.warning(f"All data sources failed for {ticker}, using cached data from {expired[1]:.0f}s ago")
+                return expired[0]
+            
             # Return minimal data if all fail
             logger.warning(f"All data sources failed for {ticker}")
             return {
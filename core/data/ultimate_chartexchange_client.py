@@ -13,6 +13,7 @@ ULTIMATE CHARTEXCHANGE API CLIENT
 
 import requests
 import logging
+import threading
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
@@ -92,27 +93,38 @@ class UltimateChartExchangeClient:
         self.api_key = api_key
         self.tier = tier
         self.base_url = "https://chartexchange.com/api/v1"
-        self.session = requests.Session()
+        self._local = threading.local()  # One requests.Session per thread (scanners call concurrently)
         
         self.rate_limits = {1: 60, 2: 250, 3: 1000}
         self.request_times = []
+        self._rate_lock = threading.Lock()
         
         logger.info(f"🚀 Ultimate ChartExchange Client initialized - Tier {tier}")
         logger.info(f"   API Key: {api_key[:10]}...")
     
+    @property
+    def session(self) -> requests.Session:
+        """This thread's HTTP session"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+    
     def _wait_for_rate_limit(self):
-        """Rate limiting logic"""
-        now = time.time()
-        self.request_times = [t for t in self.request_times if now - t < 60]
-        
-        if len(self.request_times) >= self.rate_limits[self.tier]:
-            sleep_time = 61 - (now - self.request_times[0])
-            if sleep_time > 0:
-                logger.warning(f"Rate limit reached, sleeping {sleep_time:.1f}s")
-                time.sleep(sleep_time)
-                self.request_times = []
-        
-        self.request_times.append(now)
+        """Rate limiting logic (thread-safe: callers queue while the window is full)"""
+        with self._rate_lock:
+            now = time.time()
+            self.request_times = [t for t in self.request_times if now - t < 60]
+            
+            if len(self.request_times) >= self.rate_limits[self.tier]:
+                sleep_time = 61 - (now - self.request_times[0])
+                if sleep_time > 0:
+                    logger.warning(f"Rate limit reached, sleeping {sleep_time:.1f}s")
+                    time.sleep(sleep_time)
+                    self.request_times = []
+                    now = time.time()
+            
+            self.request_times.append(now)
     
     def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Any]:
         """Make API request with error handling"""
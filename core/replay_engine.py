@@ -87,6 +87,11 @@ class ReplayEngine:
         # All DP levels sorted by price
         self.all_dp_levels = dp_levels_df.sort_values('level')['level'].values
         
+        # Unique sorted levels + aligned volumes for searchsorted lookups
+        # (volume of the first row at each level, as the equality filter picks)
+        self._level_array, first_rows = np.unique(dp_levels_df['level'].values, return_index=True)
+        self._level_volumes = dp_levels_df['volume'].values[first_rows].astype(np.int64)
+        
         # Regime detection parameters
         self.regime_window = 20  # 20-minute window
         self.trend_threshold = 0.005  # 0.5% move = trend
@@ -153,20 +158,22 @@ class ReplayEngine:
         Returns:
             (support_price, resistance_price, support_volume, resistance_volume)
         """
+        levels = self._level_array
+        s_idx = np.searchsorted(levels, price, side='left') - 1
+        r_idx = np.searchsorted(levels, price, side='right')
+        
         # Find nearest support (below price)
-        supports = self.all_dp_levels[self.all_dp_levels < price]
-        if len(supports) > 0:
-            nearest_support = supports[-1]  # Closest below
-            support_volume = int(self.dp_levels_df[self.dp_levels_df['level'] == nearest_support]['volume'].iloc[0])
+        if s_idx >= 0:
+            nearest_support = levels[s_idx]  # Closest below
+            support_volume = int(self._level_volumes[s_idx])
         else:
             nearest_support = None
             support_volume = None
         
         # Find nearest resistance (above price)
-        resistances = self.all_dp_levels[self.all_dp_levels > price]
-        if len(resistances) > 0:
-            nearest_resistance = resistances[0]  # Closest above
-            resistance_volume = int(self.dp_levels_df[self.dp_levels_df['level'] == nearest_resistance]['volume'].iloc[0])
+        if r_idx < len(levels):
+            nearest_resistance = levels[r_idx]  # Closest above
+            resistance_volume = int(self._level_volumes[r_idx])
         else:
             nearest_resistance = None
             resistance_volume = None
@@ -192,18 +199,56 @@ class ReplayEngine:
         volatility = returns.std()
         momentum = (price_series.iloc[-1] - price_series.iloc[0]) / price_series.iloc[0]
         
-        # Classify regime
+        return self._classify_regime(momentum, volatility), trend_strength, volatility, momentum
+    
+    def _classify_regime(self, momentum: float, volatility: float) -> str:
+        """Classify regime from window momentum and return volatility"""
         if abs(momentum) > self.trend_threshold:
             if momentum > 0:
-                regime = "UPTREND"
-            else:
-                regime = "DOWNTREND"
+                return "UPTREND"
+            return "DOWNTREND"
         elif volatility > 0.01:  # High vol but no direction
-            regime = "CHOP"
-        else:
-            regime = "RANGE"
+            return "CHOP"
+        return "RANGE"
+    
+    def precompute_features(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Compute every per-minute input of process_cycle for a whole session in one pass
+        
+        Windows match replay_session: bar i sees Close/Volume[max(0, i - regime_window) : i + 1].
         
-        return regime, trend_strength, volatility, momentum
+        Returns:
+            Dict of arrays aligned with df rows: trend_strength, volatility, momentum,
+            avg_volume, has_regime, support_idx, resistance_idx
+        """
+        close = df['Close'].astype(float)
+        n = len(close)
+        w = self.regime_window
+        
+        returns = close.pct_change()
+        trend_strength = returns.rolling(w, min_periods=1).mean().to_numpy()
+        volatility = returns.rolling(w, min_periods=2).std().to_numpy()
+        
+        prices = close.to_numpy()
+        start = np.maximum(np.arange(n) - w, 0)
+        momentum = (prices - prices[start]) / prices[start]
+        
+        avg_volume = df['Volume'].astype(float).rolling(w + 1, min_periods=1).mean().to_numpy()
+        
+        # Nearest strictly-below / strictly-above levels; -1 / len(levels) mean none
+        levels = self._level_array
+        support_idx = np.searchsorted(levels, prices, side='left') - 1
+        resistance_idx = np.searchsorted(levels, prices, side='right')
+        
+        return {
+            'trend_strength': trend_strength,
+            'volatility': volatility,
+            'momentum': momentum,
+            'avg_volume': avg_volume,
+            'has_regime': np.arange(n) >= 4,  # detect_regime needs 5 prices
+            'support_idx': support_idx,
+            'resistance_idx': resistance_idx,
+        }
     
     def check_flow_confirmation(self, volume: int, avg_volume: float, momentum: float, 
                                  at_support: bool, at_resistance: bool) -> Tuple[bool, bool]:
@@ -294,16 +339,27 @@ class ReplayEngine:
         volume = int(bar['Volume'])
         
         # Find nearest DP levels
-        nearest_support, nearest_resistance, support_volume, resistance_volume = self.find_nearest_dp_levels(price)
-        
-        distance_to_support = price - nearest_support if nearest_support else None
-        distance_to_resistance = nearest_resistance - price if nearest_resistance else None
+        levels = self.find_nearest_dp_levels(price)
         
         # Detect regime
-        regime, trend_strength, volatility, momentum = self.detect_regime(price_window)
+        regime = self.detect_regime(price_window)
         
         # Volume analysis
         avg_volume = volume_window.mean() if len(volume_window) > 0 else volume
+        
+        return self._build_cycle_state(timestamp, bar['Open'], bar['High'], bar['Low'], price, volume,
+                                       levels, regime, avg_volume)
+    
+    def _build_cycle_state(self, timestamp: datetime, open_: float, high: float, low: float,
+                           price: float, volume: int, levels: Tuple, regime_info: Tuple,
+                           avg_volume: float) -> CycleState:
+        """Flow/magnet/decision logic shared by the per-bar and vectorized replays"""
+        nearest_support, nearest_resistance, support_volume, resistance_volume = levels
+        regime, trend_strength, volatility, momentum = regime_info
+        
+        distance_to_support = price - nearest_support if nearest_support else None
+        distance_to_resistance = nearest_resistance - price if nearest_resistance else None
+        
         volume_vs_avg = volume / avg_volume if avg_volume > 0 else 1.0
         volume_spike = volume > (avg_volume * self.volume_multiplier)
         
@@ -389,10 +445,10 @@ class ReplayEngine:
             timestamp=timestamp,
             price=price,
             volume=volume,
-            open=bar['Open'],
-            high=bar['High'],
-            low=bar['Low'],
-            close=bar['Close'],
+            open=open_,
+            high=high,
+            low=low,
+            close=price,
             nearest_support=nearest_support,
             nearest_resistance=nearest_resistance,
             distance_to_support=distance_to_support,
@@ -418,7 +474,8 @@ class ReplayEngine:
         
         return state
     
-    def replay_session(self, ticker: str, date: str, output_file: str = None) -> List[CycleState]:
+    def replay_session(self, ticker: str, date: str, output_file: str = None,
+                       vectorized: bool = True, log_cycles: bool = True) -> List[CycleState]:
         """
         Replay entire session with minute-by-minute logging
         
@@ -426,6 +483,8 @@ class ReplayEngine:
             ticker: Stock symbol
             date: Date to replay
             output_file: Optional CSV file path for logging
+            vectorized: Precompute rolling features once (replay_bars) instead of per-bar windows
+            log_cycles: Log every cycle; turn off for multi-week replays
         
         Returns:
             List of CycleState objects
@@ -439,21 +498,23 @@ class ReplayEngine:
             logger.error("❌ REPLAY ABORTED: No data available")
             return []
         
-        # Process each minute
-        states = []
-        
-        for i, (timestamp, bar) in enumerate(df.iterrows()):
-            # Get rolling windows
-            start_idx = max(0, i - self.regime_window)
-            price_window = df['Close'].iloc[start_idx:i+1]
-            volume_window = df['Volume'].iloc[start_idx:i+1]
-            
-            # Process cycle
-            state = self.process_cycle(timestamp, bar, price_window, volume_window)
-            states.append(state)
-            
-            # Log cycle
-            self._log_cycle(state, i+1, len(df))
+        if vectorized:
+            states = self.replay_bars(df, log_cycles=log_cycles)
+        else:
+            states = []
+            for i, (timestamp, bar) in enumerate(df.iterrows()):
+                # Get rolling windows
+                start_idx = max(0, i - self.regime_window)
+                price_window = df['Close'].iloc[start_idx:i+1]
+                volume_window = df['Volume'].iloc[start_idx:i+1]
+                
+                # Process cycle
+                state = self.process_cycle(timestamp, bar, price_window, volume_window)
+                states.append(state)
+                
+                # Log cycle
+                if log_cycles:
+                    self._log_cycle(state, i+1, len(df))
         
         logger.info("=" * 80)
         logger.info(f"🏁 REPLAY COMPLETE: {len(states)} cycles processed")
@@ -467,6 +528,57 @@ class ReplayEngine:
         
         return states
     
+    def replay_bars(self, df: pd.DataFrame, log_cycles: bool = False) -> List[CycleState]:
+        """
+        Vectorized replay over already-loaded minute bars
+        
+        Rolling regime/volume features and nearest DP levels come from
+        precompute_features; only the stateful magnet tracker and the
+        decision logic still run per bar. Emits the same CycleState records
+        as the per-bar path.
+        """
+        if df.empty:
+            return []
+        
+        feats = self.precompute_features(df)
+        levels, level_volumes = self._level_array, self._level_volumes
+        n_levels = len(levels)
+        
+        opens = df['Open'].to_numpy(dtype=float)
+        highs = df['High'].to_numpy(dtype=float)
+        lows = df['Low'].to_numpy(dtype=float)
+        closes = df['Close'].to_numpy(dtype=float)
+        volumes = df['Volume'].to_numpy()
+        
+        states = []
+        total = len(df)
+        for i, timestamp in enumerate(df.index):
+            s_idx = feats['support_idx'][i]
+            r_idx = feats['resistance_idx'][i]
+            nearest = (
+                levels[s_idx] if s_idx >= 0 else None,
+                levels[r_idx] if r_idx < n_levels else None,
+                int(level_volumes[s_idx]) if s_idx >= 0 else None,
+                int(level_volumes[r_idx]) if r_idx < n_levels else None,
+            )
+            
+            if feats['has_regime'][i]:
+                momentum = feats['momentum'][i]
+                volatility = feats['volatility'][i]
+                regime = (self._classify_regime(momentum, volatility),
+                          feats['trend_strength'][i], volatility, momentum)
+            else:
+                regime = ("INSUFFICIENT_DATA", 0.0, 0.0, 0.0)
+            
+            state = self._build_cycle_state(timestamp, opens[i], highs[i], lows[i], closes[i],
+                                            int(volumes[i]), nearest, regime, feats['avg_volume'][i])
+            states.append(state)
+            
+            if log_cycles:
+                self._log_cycle(state, i+1, total)
+        
+        return states
+    
     def _log_cycle(self, state: CycleState, cycle_num: int, total_cycles: int):
         """Log a single cycle"""
         logger.info(f"[{state.timestamp}] CYCLE {cycle_num}/{total_cycles}")
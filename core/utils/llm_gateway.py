@@ -0,0 +1,418 @@
+"""
+🤖 LLM Gateway
+==============
+Single path for every chat-completion call (OpenRouter, Groq, ...).
+
+Callers used to fire one-shot httpx.post / requests.post calls: a fresh TCP +
+TLS handshake per prompt, an unbounded module-level cache dict, and blocking
+I/O inside async FastAPI routes. The gateway provides:
+
+- One pooled (HTTP/2 when `h2` is installed) AsyncClient per provider
+- Per-provider concurrency limits (asyncio.Semaphore)
+- Response cache: bounded in-memory LRU + SQLite persistence, keyed by a
+  hash of model + messages + sampling params
+- Coalescing: identical prompts in flight share one upstream request
+- Latency / token / cache metrics per provider
+
+All requests run on one gateway event loop (daemon thread), so sync callers
+(worker threads) and async callers (any event loop) share the same pools,
+cache and in-flight map.
+
+Usage:
+    from core.utils.llm_gateway import get_gateway
+
+    gw = get_gateway()
+    result = gw.complete([{"role": "user", "content": "hi"}], model="openai/gpt-oss-20b:free")
+    result = await gw.acomplete(messages, model=..., provider="groq")
+    print(result["content"], result["source"], result["latency_ms"])
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+
+import httpx
+
+from core.utils.sqlite_pool import get_store
+from core.utils.tiered_cache import TieredCache
+
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+CACHE_TTL = 600            # seconds a cached response is served
+CACHE_ENTRIES = 512        # in-memory LRU size
+PERSIST_MAX_ROWS = 5000    # SQLite cache rows kept
+PRUNE_EVERY = 100          # persisted writes between prunes
+LATENCY_WINDOW = 256       # samples kept per provider for percentiles
+
+
+class LLMGatewayError(Exception):
+    """Upstream LLM call failed (HTTP error, timeout, empty content, not configured)."""
+
+
+@dataclass
+class Provider:
+    """An OpenAI-compatible chat-completions endpoint."""
+    name: str
+    url: str
+    api_key_env: str
+    max_concurrency: int = 4
+    headers: Dict[str, str] = field(default_factory=dict)
+    api_key: Optional[str] = None   # overrides api_key_env (tests / local stubs)
+
+    def key(self) -> str:
+        return self.api_key if self.api_key is not None else os.getenv(self.api_key_env, "").strip()
+
+
+PROVIDERS: Dict[str, Provider] = {
+    "openrouter": Provider(
+        name="openrouter",
+        url="https://openrouter.ai/api/v1/chat/completions",
+        api_key_env="OPENROUTER_API_KEY",
+        max_concurrency=6,
+        headers={"HTTP-Referer": "https://lotto-machine.onrender.com", "X-Title": "Alpha Terminal"},
+    ),
+    "groq": Provider(
+        name="groq",
+        url="https://api.groq.com/openai/v1/chat/completions",
+        api_key_env="GROQ_API_KEY",
+        max_concurrency=4,
+    ),
+}
+
+
+class _ProviderMetrics:
+    def __init__(self):
+        self.counts = dict.fromkeys(
+            ("requests", "errors", "memory_hits", "sqlite_hits", "coalesced", "prompt_tokens", "completion_tokens"), 0)
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.in_flight = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = dict(self.counts)
+        out["in_flight"] = self.in_flight
+        lat = sorted(self.latencies)
+        if lat:
+            out["latency_ms"] = {
+                "p50": round(lat[len(lat) // 2], 1),
+                "p95": round(lat[min(len(lat) - 1, int(len(lat) * 0.95))], 1),
+                "max": round(lat[-1], 1),
+            }
+        return out
+
+
+class LLMGateway:
+    """Pooled, cached, coalescing async client for chat-completion providers."""
+
+    def __init__(
+        self,
+        providers: Optional[Dict[str, Provider]] = None,
+        cache_ttl: float = CACHE_TTL,
+        cache_entries: int = CACHE_ENTRIES,
+        cache_db: Optional[str] = None,
+        persist_max_rows: int = PERSIST_MAX_ROWS,
+        http2: bool = True,
+    ):
+        """
+        Args:
+            providers: name -> Provider (default: PROVIDERS)
+            cache_ttl: seconds a response stays servable (memory and SQLite)
+            cache_entries: in-memory LRU size
+            cache_db: SQLite file for the persistent cache (None = memory only)
+            persist_max_rows: SQLite rows kept (oldest pruned)
+            http2: negotiate HTTP/2 when the h2 package is installed
+        """
+        self.providers = dict(providers or PROVIDERS)
+        self.cache_ttl = cache_ttl
+        self.persist_max_rows = persist_max_rows
+        self.http2 = http2 and HTTP2_AVAILABLE
+
+        self._memory = TieredCache("llm_responses", ttl=cache_ttl, max_entries=cache_entries)
+        self._store = get_store(cache_db) if cache_db else None
+        if self._store is not None:
+            self._store.executescript("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    provider TEXT,
+                    model TEXT,
+                    content TEXT,
+                    prompt_tokens INTEGER,
+                    completion_tokens INTEGER,
+                    created_at REAL
+                );
+                CREATE INDEX IF NOT EXISTS idx_llm_cache_created ON llm_cache(created_at);
+            """)
+        self._persisted = 0
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+
+        # Owned by the gateway loop
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._metrics: Dict[str, _ProviderMetrics] = {name: _ProviderMetrics() for name in self.providers}
+
+    # ═══════════════════════════════════════════════════════════════
+    # PUBLIC API
+    # ═══════════════════════════════════════════════════════════════
+
+    def complete(self, messages: List[Dict[str, str]], model: str, provider: str = "openrouter",
+                 max_tokens: int = 600, temperature: float = 0.3, timeout: float = 30,
+                 use_cache: bool = True, response_format: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Blocking chat completion (for sync code / worker threads).
+
+        Args:
+            response_format: passed through to the provider, e.g. {"type": "json_object"}
+
+        Returns {"content", "model", "provider", "source", "latency_ms", "usage"};
+        source is the provider name, "cache" or "coalesced". Raises LLMGatewayError.
+        """
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("LLMGateway.complete() called from the gateway loop; use acomplete()")
+        future = asyncio.run_coroutine_threadsafe(
+            self._complete(messages, model, provider, max_tokens, temperature, timeout, use_cache, response_format),
+            self._ensure_loop(),
+        )
+        return future.result()
+
+    async def acomplete(self, messages: List[Dict[str, str]], model: str, provider: str = "openrouter",
+                        max_tokens: int = 600, temperature: float = 0.3, timeout: float = 30,
+                        use_cache: bool = True, response_format: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Async chat completion, awaitable from any event loop."""
+        coro = self._complete(messages, model, provider, max_tokens, temperature, timeout, use_cache,
+                              response_format)
+        loop = self._ensure_loop()
+        if asyncio.get_running_loop() is loop:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+    def metrics(self) -> Dict[str, Any]:
+        """Per-provider latency / token / cache counters."""
+        return {
+            "http2": self.http2,
+            "cache": self._memory.stats(),
+            "providers": {name: m.snapshot() for name, m in self._metrics.items()},
+        }
+
+    def close(self):
+        """Close pooled clients and stop the gateway loop."""
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._aclose(), self._loop).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop = self._thread = None
+        if self._store is not None:
+            self._store.flush()
+
+    @staticmethod
+    def cache_key(model: str, messages: List[Dict[str, str]], max_tokens: int, temperature: float,
+                  response_format: Optional[Dict[str, Any]] = None) -> str:
+        parts: List[Any] = [model, messages, max_tokens, temperature]
+        if response_format is not None:
+            parts.append(response_format)
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    # ═══════════════════════════════════════════════════════════════
+    # GATEWAY LOOP
+    # ═══════════════════════════════════════════════════════════════
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is not None:
+            return self._loop
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="llm-gateway", daemon=True)
+                thread.start()
+                self._thread = thread
+                self._loop = loop
+        return self._loop
+
+    async def _aclose(self):
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
+        self._semaphores.clear()
+
+    def _client(self, provider: Provider) -> httpx.AsyncClient:
+        client = self._clients.get(provider.name)
+        if client is None:
+            limits = httpx.Limits(max_connections=provider.max_concurrency * 2,
+                                  max_keepalive_connections=provider.max_concurrency)
+            client = self._clients[provider.name] = httpx.AsyncClient(http2=self.http2, limits=limits)
+            self._semaphores[provider.name] = asyncio.Semaphore(provider.max_concurrency)
+        return client
+
+    # ═══════════════════════════════════════════════════════════════
+    # REQUEST PATH
+    # ═══════════════════════════════════════════════════════════════
+
+    async def _complete(self, messages, model, provider_name, max_tokens, temperature, timeout, use_cache,
+                        response_format=None):
+        provider = self.providers.get(provider_name)
+        if provider is None:
+            raise LLMGatewayError(f"Unknown LLM provider: {provider_name}")
+        metrics = self._metrics.setdefault(provider_name, _ProviderMetrics())
+        key = self.cache_key(model, messages, max_tokens, temperature, response_format)
+
+        if use_cache:
+            cached = self._memory.get(key)
+            if cached is not None:
+                metrics.counts["memory_hits"] += 1
+                return {**cached, "source": "cache", "latency_ms": 0.0}
+            cached = await self._load_persisted(key)
+            if cached is not None:
+                metrics.counts["sqlite_hits"] += 1
+                self._memory.set(key, cached)
+                return {**cached, "source": "cache", "latency_ms": 0.0}
+
+        # Identical prompt already in flight: share its result
+        pending = self._inflight.get(key)
+        if pending is not None:
+            metrics.counts["coalesced"] += 1
+            result = await asyncio.shield(pending)
+            return {**result, "source": "coalesced"}
+
+        task = self._inflight[key] = asyncio.ensure_future(
+            self._request(provider, metrics, messages, model, max_tokens, temperature, timeout, response_format)
+        )
+        try:
+            result = await asyncio.shield(task)
+        finally:
+            if self._inflight.get(key) is task:
+                del self._inflight[key]
+
+        if use_cache:
+            self._memory.set(key, result)
+            self._persist(key, result)
+        return result
+
+    async def _request(self, provider, metrics, messages, model, max_tokens, temperature, timeout,
+                       response_format=None):
+        api_key = provider.key()
+        if not api_key:
+            raise LLMGatewayError(f"{provider.name}: {provider.api_key_env} not set")
+        client = self._client(provider)
+        headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json", **provider.headers}
+        body = {"model": model, "messages": messages, "max_tokens": max_tokens, "temperature": temperature}
+        if response_format is not None:
+            body["response_format"] = response_format
+
+        async with self._semaphores[provider.name]:
+            metrics.counts["requests"] += 1
+            metrics.in_flight += 1
+            t0 = time.perf_counter()
+            try:
+                resp = await client.post(provider.url, headers=headers, json=body, timeout=timeout)
+                resp.raise_for_status()
+                data = resp.json()
+            except (httpx.HTTPError, ValueError) as e:
+                metrics.counts["errors"] += 1
+                raise LLMGatewayError(f"{provider.name} {model}: {e}") from e
+            finally:
+                metrics.in_flight -= 1
+                latency_ms = (time.perf_counter() - t0) * 1000
+                metrics.latencies.append(latency_ms)
+
+        content = ((data.get("choices") or [{}])[0].get("message") or {}).get("content") or ""
+        if not content.strip():
+            metrics.counts["errors"] += 1
+            raise LLMGatewayError(f"{provider.name} {model}: empty response")
+        usage = data.get("usage") or {}
+        metrics.counts["prompt_tokens"] += int(usage.get("prompt_tokens") or 0)
+        metrics.counts["completion_tokens"] += int(usage.get("completion_tokens") or 0)
+        return {
+            "content": content,
+            "model": model,
+            "provider": provider.name,
+            "source": provider.name,
+            "latency_ms": round(latency_ms, 1),
+            "usage": {k: usage.get(k) for k in ("prompt_tokens", "completion_tokens") if k in usage},
+        }
+
+    # ═══════════════════════════════════════════════════════════════
+    # PERSISTENT CACHE
+    # ═══════════════════════════════════════════════════════════════
+
+    async def _load_persisted(self, key: str) -> Optional[Dict[str, Any]]:
+        if self._store is None:
+            return None
+
+        def _read():
+            return self._store.query_one(
+                "SELECT provider, model, content, prompt_tokens, completion_tokens FROM llm_cache "
+                "WHERE key = ? AND created_at > ?",
+                (key, time.time() - self.cache_ttl),
+            )
+
+        try:
+            row = await asyncio.to_thread(_read)
+        except Exception as e:
+            logger.warning(f"⚠️ LLM cache read failed: {e}")
+            return None
+        if row is None:
+            return None
+        provider, model, content, prompt_tokens, completion_tokens = row
+        usage = {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens}
+        return {"content": content, "model": model, "provider": provider, "source": provider,
+                "latency_ms": 0.0, "usage": {k: v for k, v in usage.items() if v is not None}}
+
+    def _persist(self, key: str, result: Dict[str, Any]):
+        if self._store is None:
+            return
+        usage = result.get("usage") or {}
+        self._store.enqueue(
+            "INSERT OR REPLACE INTO llm_cache (key, provider, model, content, prompt_tokens, completion_tokens, "
+            "created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, result["provider"], result["model"], result["content"],
+             usage.get("prompt_tokens"), usage.get("completion_tokens"), time.time()),
+        )
+        self._persisted += 1
+        if self._persisted % PRUNE_EVERY == 0:
+            self._store.enqueue("DELETE FROM llm_cache WHERE created_at < ?", (time.time() - self.cache_ttl,))
+            self._store.enqueue(
+                "DELETE FROM llm_cache WHERE key IN "
+                "(SELECT key FROM llm_cache ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                (self.persist_max_rows,),
+            )
+
+
+# ═══════════════════════════════════════════════════════════════
+# SINGLETON
+# ═══════════════════════════════════════════════════════════════
+
+_gateway: Optional[LLMGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_gateway() -> LLMGateway:
+    """Process-wide gateway (persistent cache in data/llm_cache.db)."""
+    global _gateway
+    if _gateway is None:
+        with _gateway_lock:
+            if _gateway is None:
+                try:
+                    from core.utils.persistent_storage import get_database_path
+                    cache_db = str(get_database_path("llm_cache.db"))
+                except Exception as e:
+                    logger.warning(f"⚠️ LLM cache persistence disabled: {e}")
+                    cache_db = None
+                _gateway = LLMGateway(cache_db=cache_db)
+    return _gateway
@@ -0,0 +1,308 @@
+"""
+🗃️ SQLite Access Layer
+======================
+Shared, thread-safe access to the local SQLite databases
+(dp_learning.db, alerts_history.db, checker_health.db, ...).
+
+Every component used to open a fresh sqlite3.connect() per read or write,
+from several threads at once (monitor loop, OutcomeTracker, FastAPI). Under
+alert bursts that meant connect/commit overhead per alert and
+`database is locked` stalls. This layer provides:
+
+- One pooled connection per (database, thread), opened once
+- WAL journal mode + busy timeout: readers never block the writer
+- Prepared statement reuse (per-connection statement cache)
+- A write queue drained by a single writer thread in batched transactions
+  (fire-and-forget logging: alerts, checker runs, ...)
+- Synchronous transactions for writes that need lastrowid / read-back
+
+Reads through the store first wait for queued writes, so a caller always sees
+its own enqueued rows.
+
+Usage:
+    from core.utils.sqlite_pool import get_store
+
+    store = get_store("data/alerts_history.db")
+    store.enqueue("INSERT INTO alerts (...) VALUES (?, ?)", (a, b))   # batched
+    row_id = store.write("INSERT INTO ... VALUES (?)", (x,))           # immediate
+    rows = store.query("SELECT ... WHERE symbol = ?", ("SPY",))
+"""
+
+import atexit
+import logging
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+BUSY_TIMEOUT_MS = 5000
+STATEMENT_CACHE_SIZE = 256
+MAX_BATCH = 500           # Max queued statements per writer transaction
+LINGER_SECONDS = 0.05     # Writer waits this long for a burst to accumulate
+
+
+class SQLiteStore:
+    """Pooled connections + batched writer for one SQLite database file."""
+
+    def __init__(self, path: str, busy_timeout_ms: int = BUSY_TIMEOUT_MS,
+                 max_batch: int = MAX_BATCH, linger: float = LINGER_SECONDS):
+        self.path = str(path)
+        self.busy_timeout_ms = busy_timeout_ms
+        self.max_batch = max_batch
+        self.linger = linger
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._local = threading.local()
+        self._pid = os.getpid()
+        self._queue: "queue.Queue[Optional[Tuple[str, Any, bool]]]" = queue.Queue()
+        self._pending = 0
+        self._pending_cond = threading.Condition()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        self._closed = False
+
+        self.stats = {'batches': 0, 'queued_writes': 0, 'sync_writes': 0, 'errors': 0}
+
+        # Switch the file to WAL once (persists in the database header)
+        conn = self.connection()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.DatabaseError as e:
+            logger.warning(f"⚠️ Could not enable WAL for {self.path}: {e}")
+
+    # ═══════════════════════════════════════════════════════════════
+    # CONNECTIONS
+    # ═══════════════════════════════════════════════════════════════
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.busy_timeout_ms / 1000,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+            isolation_level=None,  # autocommit; transactions are explicit
+        )
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+        conn.execute("PRAGMA synchronous=NORMAL")  # safe with WAL, far fewer fsyncs
+        return conn
+
+    def connection(self) -> sqlite3.Connection:
+        """This thread's pooled connection (opened on first use)."""
+        if os.getpid() != self._pid:
+            self._reset_after_fork()
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._open()
+            self._local.conn = conn
+        return conn
+
+    def _reset_after_fork(self):
+        # Connections and the writer thread do not survive fork()
+        self._pid = os.getpid()
+        self._local = threading.local()
+        self._queue = queue.Queue()
+        self._pending = 0
+        self._pending_cond = threading.Condition()
+        self._writer = None
+        self._writer_lock = threading.Lock()
+
+    # ═══════════════════════════════════════════════════════════════
+    # READS
+    # ═══════════════════════════════════════════════════════════════
+
+    def execute(self, sql: str, params: Sequence = (), row_factory=None) -> sqlite3.Cursor:
+        """Run a read statement on this thread's connection; returns the cursor."""
+        self.flush()
+        cursor = self.connection().cursor()
+        if row_factory is not None:
+            cursor.row_factory = row_factory
+        return cursor.execute(sql, params)
+
+    def query(self, sql: str, params: Sequence = (), row_factory=None) -> List[Any]:
+        return self.execute(sql, params, row_factory=row_factory).fetchall()
+
+    def query_one(self, sql: str, params: Sequence = (), row_factory=None) -> Optional[Any]:
+        return self.execute(sql, params, row_factory=row_factory).fetchone()
+
+    # ═══════════════════════════════════════════════════════════════
+    # SYNCHRONOUS WRITES
+    # ═══════════════════════════════════════════════════════════════
+
+    @contextmanager
+    def transaction(self):
+        """
+        BEGIN IMMEDIATE ... COMMIT on this thread's connection.
+
+        Queued writes are flushed first so statement order is preserved.
+        """
+        self.flush()
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+
+    def write(self, sql: str, params: Sequence = ()) -> Optional[int]:
+        """Execute one write immediately; returns lastrowid."""
+        with self.transaction() as conn:
+            cursor = conn.execute(sql, params)
+            self.stats['sync_writes'] += 1
+            return cursor.lastrowid
+
+    def executescript(self, script: str):
+        """Schema setup (CREATE TABLE ... ; CREATE INDEX ...)."""
+        self.flush()
+        self.connection().executescript(script)
+
+    # ═══════════════════════════════════════════════════════════════
+    # BATCHED WRITES
+    # ═══════════════════════════════════════════════════════════════
+
+    def enqueue(self, sql: str, params: Sequence = ()):
+        """Queue a write for the writer thread (returns immediately)."""
+        self._put((sql, tuple(params), False))
+
+    def enqueue_many(self, sql: str, rows: Iterable[Sequence]):
+        """Queue an executemany() write."""
+        self._put((sql, [tuple(r) for r in rows], True))
+
+    def _put(self, item):
+        if self._closed:
+            raise RuntimeError(f"SQLiteStore({self.path}) is closed")
+        if os.getpid() != self._pid:
+            self._reset_after_fork()
+        self._ensure_writer()
+        with self._pending_cond:
+            self._pending += 1
+        self.stats['queued_writes'] += 1
+        self._queue.put(item)
+
+    def flush(self, timeout: Optional[float] = 10.0) -> bool:
+        """Block until every queued write is committed. Returns False on timeout."""
+        if self._pending == 0:
+            return True
+        if threading.current_thread() is self._writer:
+            return True
+        with self._pending_cond:
+            return self._pending_cond.wait_for(lambda: self._pending == 0, timeout=timeout)
+
+    def _ensure_writer(self):
+        if self._writer is not None and self._writer.is_alive():
+            return
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                name = f"sqlite-writer-{os.path.basename(self.path)}"
+                self._writer = threading.Thread(target=self._writer_loop, name=name, daemon=True)
+                self._writer.start()
+
+    def _writer_loop(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            # Let a burst accumulate, then take everything up to max_batch
+            if self.linger and self._queue.empty():
+                threading.Event().wait(self.linger)
+            stop = False
+            while len(batch) < self.max_batch:
+                try:
+                    nxt = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    stop = True
+                    break
+                batch.append(nxt)
+
+            try:
+                self._commit_batch(batch)
+            except Exception as e:
+                self.stats['errors'] += len(batch)
+                logger.error(f"❌ SQLite writer error on {self.path}: {e}")
+            finally:
+                with self._pending_cond:
+                    self._pending -= len(batch)
+                    self._pending_cond.notify_all()
+            if stop:
+                return
+
+    def _commit_batch(self, batch: List[Tuple[str, Any, bool]]):
+        conn = self.connection()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for sql, params, many in batch:
+                (conn.executemany if many else conn.execute)(sql, params)
+            conn.execute("COMMIT")
+            self.stats['batches'] += 1
+            return
+        except sqlite3.Error as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            logger.warning(f"⚠️ Batched write to {self.path} failed ({e}); retrying individually")
+
+        # One bad statement must not drop the rest of the burst
+        for sql, params, many in batch:
+            try:
+                (conn.executemany if many else conn.execute)(sql, params)
+            except sqlite3.Error as e:
+                self.stats['errors'] += 1
+                logger.error(f"❌ SQLite write failed on {self.path}: {e} | {sql.strip()[:80]}")
+
+    def close(self):
+        """Flush queued writes and stop the writer thread."""
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join(timeout=5)
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, 'pending': self._pending, 'path': self.path}
+
+
+# ═══════════════════════════════════════════════════════════════
+# REGISTRY
+# ═══════════════════════════════════════════════════════════════
+
+_stores: Dict[str, SQLiteStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(path) -> SQLiteStore:
+    """Process-wide SQLiteStore for a database file (keyed by absolute path)."""
+    key = os.path.abspath(str(path))
+    store = _stores.get(key)
+    if store is None or store._closed:
+        with _stores_lock:
+            store = _stores.get(key)
+            if store is None or store._closed:
+                store = SQLiteStore(str(path))
+                _stores[key] = store
+    return store
+
+
+def flush_all(timeout: Optional[float] = 10.0):
+    """Flush queued writes on every open store."""
+    for store in list(_stores.values()):
+        store.flush(timeout=timeout)
+
+
+atexit.register(flush_all)
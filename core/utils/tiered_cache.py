@@ -0,0 +1,512 @@
+"""
+🗄️ Tiered Cache
+===============
+One cache subsystem for every API client / endpoint that used to keep its
+own TTL dict or disk pickle (Stockgrid, COT, Reddit, OHLC, brief, ...).
+
+- Memory tier: LRU bounded by a byte budget (and optional entry count)
+- Disk tier (optional): one file per key, survives restarts, own TTL
+- Per-key TTLs
+- Stale-while-revalidate: within `stale_ttl` after expiry the old value is
+  served immediately and a single background refresh is started
+- Stale-if-error: a failed load falls back to the last known value
+- Single-flight: concurrent misses on one key share one loader call
+- Hit / stale / miss / load / eviction counters per cache
+
+Usage:
+    from core.utils.tiered_cache import get_cache
+
+    cache = get_cache("stockgrid", ttl=300, stale_ttl=600, max_bytes=16 * MB)
+    walls = cache.get_or_load(("walls", "SPY"), lambda: client.fetch_walls("SPY"))
+
+    # async callers (FastAPI)
+    brief = await cache.aget_or_load("master", compute_brief)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+DEFAULT_MAX_BYTES = 16 * MB
+REFRESH_WORKERS = 4
+DISK_PRUNE_EVERY = 64        # Writes between disk budget checks
+
+_MISSING = object()
+
+_refresh_pool: Optional[ThreadPoolExecutor] = None
+_refresh_pool_lock = threading.Lock()
+
+
+def _refresh_executor() -> ThreadPoolExecutor:
+    global _refresh_pool
+    if _refresh_pool is None:
+        with _refresh_pool_lock:
+            if _refresh_pool is None:
+                _refresh_pool = ThreadPoolExecutor(max_workers=REFRESH_WORKERS, thread_name_prefix="cache-refresh")
+    return _refresh_pool
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate in-memory footprint of a cached value in bytes."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value) + 49
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage):  # pandas DataFrame / Series
+        try:
+            usage = memory_usage(deep=True)
+            return int(usage.sum() if hasattr(usage, "sum") else usage)
+        except Exception:
+            pass
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):  # numpy arrays
+        return nbytes
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+@dataclass
+class _Entry:
+    value: Any
+    stored_at: float      # wall clock when the value was produced
+    expires_at: float     # wall clock when it stops being fresh
+    size: int
+
+
+class TieredCache:
+    """Memory LRU (+ optional disk tier) with TTLs, SWR and single-flight loads."""
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float = 300,
+        stale_ttl: float = 0,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entries: Optional[int] = None,
+        disk_dir: Optional[str] = None,
+        disk_ttl: Optional[float] = None,
+        max_disk_bytes: Optional[int] = None,
+        serializer: str = "pickle",
+        cache_none: bool = False,
+        sizeof: Callable[[Any], int] = estimate_size,
+    ):
+        """
+        Args:
+            name: cache name (metrics, log lines)
+            ttl: default freshness in seconds
+            stale_ttl: seconds after expiry during which get_or_load serves the
+                old value and refreshes in the background (0 = disabled)
+            max_bytes / max_entries: memory tier budget (LRU eviction)
+            disk_dir: enable the disk tier in this directory
+            disk_ttl: freshness of disk entries (default: ttl)
+            max_disk_bytes: prune oldest disk files beyond this budget
+            serializer: "pickle" or "json" for the disk tier
+            cache_none: store None results (default: treat None as a failed load)
+        """
+        if serializer not in ("pickle", "json"):
+            raise ValueError(f"serializer must be 'pickle' or 'json', got {serializer!r}")
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.disk_ttl = disk_ttl if disk_ttl is not None else ttl
+        self.max_disk_bytes = max_disk_bytes
+        self.serializer = serializer
+        self.cache_none = cache_none
+        self.sizeof = sizeof
+
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._inflight: Dict[Hashable, Future] = {}
+        self._ainflight: Dict[Hashable, asyncio.Future] = {}
+        self._disk_writes = 0
+        self._stats = dict.fromkeys(
+            ("hits", "stale_hits", "disk_hits", "misses", "loads", "refreshes",
+             "load_errors", "stale_on_error", "evictions"), 0)
+
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    # ═══════════════════════════════════════════════════════════════
+    # BASIC OPERATIONS
+    # ═══════════════════════════════════════════════════════════════
+
+    def get(self, key: Hashable, default: Any = None, allow_stale: bool = False) -> Any:
+        """Fresh value for key (or any cached value if allow_stale), else default."""
+        entry = self._lookup(key)
+        if entry is None:
+            return default
+        if allow_stale or entry.expires_at > time.time():
+            return entry.value
+        return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Store value in memory (and on disk when the disk tier is enabled)."""
+        now = time.time()
+        ttl = self.ttl if ttl is None else ttl
+        self._store(key, _Entry(value, now, now + ttl, self._safe_sizeof(value)))
+        if self.disk_dir:
+            self._disk_write(key, value, now)
+
+    def peek(self, key: Hashable, max_age: Optional[float] = None) -> Optional[Tuple[Any, float]]:
+        """(value, age_seconds) for the last known value, expired or not."""
+        entry = self._lookup(key, fresh_disk_only=False)
+        if entry is None:
+            return None
+        age = time.time() - entry.stored_at
+        if max_age is not None and age > max_age:
+            return None
+        return entry.value, age
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry.size
+        if self.disk_dir:
+            try:
+                os.remove(self._disk_path(key))
+            except OSError:
+                pass
+
+    def clear(self, prefix: Optional[str] = None) -> int:
+        """
+        Drop everything, or only keys whose str() starts with prefix.
+
+        Returns the number of entries removed (disk files when the disk tier is on).
+        """
+        with self._lock:
+            keys = [k for k in self._entries if prefix is None or str(k).startswith(prefix)]
+            for k in keys:
+                self._bytes -= self._entries.pop(k).size
+        if not self.disk_dir:
+            return len(keys)
+        removed = 0
+        if os.path.isdir(self.disk_dir):
+            safe_prefix = self._safe_name(prefix) if prefix else ""
+            for fname in os.listdir(self.disk_dir):
+                if fname.startswith(safe_prefix) and not fname.endswith(".tmp"):
+                    try:
+                        os.remove(os.path.join(self.disk_dir, fname))
+                        removed += 1
+                    except OSError:
+                        pass
+        return removed
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ═══════════════════════════════════════════════════════════════
+    # LOAD-THROUGH
+    # ═══════════════════════════════════════════════════════════════
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any], ttl: Optional[float] = None,
+                    stale_ttl: Optional[float] = None) -> Any:
+        """
+        Fresh value, else (within the stale window) the stale value plus a
+        background refresh, else a single-flight load.
+
+        A failed load (exception, or None when cache_none is False) falls back
+        to the last known value; with nothing cached the exception propagates
+        and None is returned as-is.
+        """
+        now = time.time()
+        stale_ttl = self.stale_ttl if stale_ttl is None else stale_ttl
+        entry = self._lookup(key)
+        if entry is not None:
+            if entry.expires_at > now:
+                self._count("hits")
+                return entry.value
+            if now < entry.expires_at + stale_ttl:
+                self._count("stale_hits")
+                self._refresh_in_background(key, loader, ttl)
+                return entry.value
+
+        self._count("misses")
+        return self._load_single_flight(key, loader, ttl)
+
+    def _load_single_flight(self, key, loader, ttl):
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        if not owner:
+            return future.result()
+
+        try:
+            value = self._run_loader(key, loader, ttl)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _run_loader(self, key, loader, ttl):
+        self._count("loads")
+        try:
+            value = loader()
+        except Exception as e:
+            self._count("load_errors")
+            fallback = self.peek(key)
+            if fallback is not None:
+                self._count("stale_on_error")
+                logger.warning(f"⚠️ [{self.name}] load failed for {key!r} ({e}); serving value from {fallback[1]:.0f}s ago")
+                return fallback[0]
+            raise
+        if value is None and not self.cache_none:
+            fallback = self.peek(key)
+            if fallback is not None:
+                self._count("stale_on_error")
+                return fallback[0]
+            return None
+        self.set(key, value, ttl)
+        return value
+
+    def _refresh_in_background(self, key, loader, ttl):
+        with self._lock:
+            if key in self._inflight:
+                return
+            future = self._inflight[key] = Future()
+        self._count("refreshes")
+
+        def _refresh():
+            try:
+                future.set_result(self._run_loader(key, loader, ttl))
+            except BaseException as e:
+                logger.warning(f"⚠️ [{self.name}] background refresh failed for {key!r}: {e}")
+                future.set_exception(e)
+            finally:
+                with self._lock:
+                    self._inflight.pop(key, None)
+
+        _refresh_executor().submit(_refresh)
+
+    async def aget_or_load(self, key: Hashable, loader: Callable[[], Any], ttl: Optional[float] = None,
+                           stale_ttl: Optional[float] = None) -> Any:
+        """
+        Async get_or_load: loader is a coroutine function. Single-flight and
+        background refresh run on the current event loop.
+        """
+        now = time.time()
+        stale_ttl = self.stale_ttl if stale_ttl is None else stale_ttl
+        entry = self._lookup(key)
+        if entry is not None:
+            if entry.expires_at > now:
+                self._count("hits")
+                return entry.value
+            if now < entry.expires_at + stale_ttl:
+                self._count("stale_hits")
+                if key not in self._ainflight:
+                    self._count("refreshes")
+                    self._ainflight[key] = asyncio.ensure_future(self._arun_loader(key, loader, ttl))
+                    self._ainflight[key].add_done_callback(lambda f: self._adone(key, f))
+                return entry.value
+
+        self._count("misses")
+        task = self._ainflight.get(key)
+        if task is None:
+            task = self._ainflight[key] = asyncio.ensure_future(self._arun_loader(key, loader, ttl))
+            task.add_done_callback(lambda f: self._adone(key, f))
+        return await asyncio.shield(task)
+
+    def _adone(self, key, task: asyncio.Future):
+        if self._ainflight.get(key) is task:
+            self._ainflight.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"⚠️ [{self.name}] async load failed for {key!r}: {task.exception()}")
+
+    async def _arun_loader(self, key, loader, ttl):
+        self._count("loads")
+        try:
+            value = await loader()
+        except Exception:
+            self._count("load_errors")
+            fallback = self.peek(key)
+            if fallback is not None:
+                self._count("stale_on_error")
+                return fallback[0]
+            raise
+        if value is None and not self.cache_none:
+            fallback = self.peek(key)
+            return fallback[0] if fallback is not None else None
+        self.set(key, value, ttl)
+        return value
+
+    # ═══════════════════════════════════════════════════════════════
+    # MEMORY TIER
+    # ═══════════════════════════════════════════════════════════════
+
+    def _lookup(self, key: Hashable, fresh_disk_only: bool = True) -> Optional[_Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if not self.disk_dir:
+            return None
+        return self._disk_read(key, fresh_only=fresh_disk_only)
+
+    def _store(self, key: Hashable, entry: _Entry):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+            if entry.size > self.max_bytes:
+                return  # never let one value flush the whole cache
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while self._entries and (
+                self._bytes > self.max_bytes
+                or (self.max_entries is not None and len(self._entries) > self.max_entries)
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self._stats["evictions"] += 1
+
+    def _safe_sizeof(self, value: Any) -> int:
+        try:
+            return int(self.sizeof(value))
+        except Exception:
+            return sys.getsizeof(value)
+
+    def _count(self, stat: str):
+        self._stats[stat] += 1
+
+    # ═══════════════════════════════════════════════════════════════
+    # DISK TIER
+    # ═══════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def _safe_name(key: Any) -> str:
+        return re.sub(r"[^A-Za-z0-9._=-]+", "_", str(key))[:120]
+
+    def _disk_path(self, key: Hashable) -> str:
+        digest = hashlib.blake2b(repr(key).encode(), digest_size=6).hexdigest()
+        ext = "json" if self.serializer == "json" else "pkl"
+        return os.path.join(self.disk_dir, f"{self._safe_name(key)}.{digest}.{ext}")
+
+    def _disk_write(self, key: Hashable, value: Any, stored_at: float):
+        path = self._disk_path(key)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        record = {"key": repr(key), "stored_at": stored_at, "value": value}
+        try:
+            if self.serializer == "json":
+                with open(tmp, "w") as f:
+                    json.dump(record, f)
+            else:
+                with open(tmp, "wb") as f:
+                    pickle.dump(record, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except Exception as e:
+            logger.warning(f"⚠️ [{self.name}] disk write failed for {key!r}: {e}")
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return
+        self._disk_writes += 1
+        if self.max_disk_bytes and self._disk_writes % DISK_PRUNE_EVERY == 0:
+            self._prune_disk()
+
+    def _disk_read(self, key: Hashable, fresh_only: bool) -> Optional[_Entry]:
+        path = self._disk_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            if self.serializer == "json":
+                with open(path) as f:
+                    record = json.load(f)
+            else:
+                with open(path, "rb") as f:
+                    record = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"⚠️ [{self.name}] disk read failed for {key!r}: {e}")
+            return None
+
+        now = time.time()
+        stored_at = float(record.get("stored_at", os.path.getmtime(path)))
+        disk_expiry = stored_at + self.disk_ttl
+        if fresh_only and now >= disk_expiry + self.stale_ttl:
+            return None  # past the stale window; peek() can still read it
+        value = record.get("value")
+        entry = _Entry(value, stored_at, min(now + self.ttl, disk_expiry), self._safe_sizeof(value))
+        self._store(key, entry)
+        self._count("disk_hits")
+        return entry
+
+    def _prune_disk(self):
+        try:
+            files = [os.path.join(self.disk_dir, f) for f in os.listdir(self.disk_dir) if not f.endswith(".tmp")]
+            stats = sorted(((os.path.getmtime(p), os.path.getsize(p), p) for p in files))
+            total = sum(s for _, s, _ in stats)
+            for _, size, path in stats:
+                if total <= self.max_disk_bytes:
+                    break
+                os.remove(path)
+                total -= size
+        except OSError as e:
+            logger.debug(f"[{self.name}] disk prune skipped: {e}")
+
+    # ═══════════════════════════════════════════════════════════════
+    # METRICS
+    # ═══════════════════════════════════════════════════════════════
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            s = dict(self._stats)
+            s.update(name=self.name, entries=len(self._entries), bytes=self._bytes, max_bytes=self.max_bytes)
+        lookups = s["hits"] + s["stale_hits"] + s["misses"]
+        s["hit_rate"] = round((s["hits"] + s["stale_hits"]) / lookups, 4) if lookups else None
+        return s
+
+
+# ═══════════════════════════════════════════════════════════════
+# REGISTRY
+# ═══════════════════════════════════════════════════════════════
+
+_caches: Dict[str, TieredCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache(name: str, **kwargs) -> TieredCache:
+    """Process-wide named cache; kwargs apply on first creation only."""
+    cache = _caches.get(name)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.get(name)
+            if cache is None:
+                cache = _caches[name] = TieredCache(name, **kwargs)
+    return cache
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Metrics for every registered cache."""
+    return {name: cache.stats() for name, cache in list(_caches.items())}
@@ -4,11 +4,10 @@
 SQLite persistence for dark pool interactions and patterns.
 """
 
-import sqlite3
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, List, Optional, Tuple
 
 from .models import DPInteraction, DPOutcome, DPPattern, Outcome, LevelType, ApproachDirection
 
@@ -23,6 +22,16 @@ except ImportError:
     PERSISTENT_STORAGE_AVAILABLE = False
     logger.warning("⚠️  Persistent storage utility not available, using default path")
 
+from core.utils.sqlite_pool import get_store
+
+# Tracker checkpoint name -> dp_interactions column
+_CHECKPOINT_COLUMNS = {
+    'price_5min': 'price_at_5min',
+    'price_15min': 'price_at_15min',
+    'price_30min': 'price_at_30min',
+    'price_60min': 'price_at_60min',
+}
+
 
 class DPDatabase:
     """SQLite database for dark pool learning."""
@@ -43,17 +52,15 @@ class DPDatabase:
         
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.store = get_store(self.db_path)
         
         self._init_db()
         logger.info(f"📊 DPDatabase initialized: {self.db_path}")
     
     def _init_db(self):
         """Create tables if they don't exist."""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
         # Interactions table
-        cursor.execute("""
+        self.store.executescript("""
             CREATE TABLE IF NOT EXISTS dp_interactions (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 timestamp TEXT NOT NULL,
@@ -86,11 +93,13 @@ class DPDatabase:
                 price_at_60min REAL,
                 
                 notes TEXT
-            )
+            );
+            CREATE INDEX IF NOT EXISTS idx_dp_interactions_outcome ON dp_interactions(outcome);
+            CREATE INDEX IF NOT EXISTS idx_dp_interactions_symbol_ts ON dp_interactions(symbol, timestamp);
         """)
         
         # Patterns table (cached learned patterns)
-        cursor.execute("""
+        self.store.executescript("""
             CREATE TABLE IF NOT EXISTS dp_patterns (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 pattern_name TEXT UNIQUE NOT NULL,
@@ -102,15 +111,28 @@ class DPDatabase:
             )
         """)
         
-        conn.commit()
-        conn.close()
+        # Online learner state: per-pattern counters (raw + time-decayed) and the
+        # outcome each interaction contributed, so updates stay O(1) and idempotent
+        self.store.executescript("""
+            CREATE TABLE IF NOT EXISTS dp_pattern_counters (
+                pattern_name TEXT PRIMARY KEY,
+                bounce_count INTEGER DEFAULT 0,
+                break_count INTEGER DEFAULT 0,
+                fade_count INTEGER DEFAULT 0,
+                decayed_bounce REAL DEFAULT 0,
+                decayed_break REAL DEFAULT 0,
+                decayed_fade REAL DEFAULT 0,
+                decay_ts REAL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS dp_learned_outcomes (
+                interaction_id INTEGER PRIMARY KEY,
+                outcome TEXT NOT NULL
+            );
+        """)
     
     def save_interaction(self, interaction: DPInteraction) -> int:
         """Save a new interaction, return the ID."""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute("""
+        interaction_id = self.store.write("""
             INSERT INTO dp_interactions (
                 timestamp, symbol, level_price, level_volume, level_type, level_date,
                 approach_price, approach_direction, distance_pct, touch_count,
@@ -137,19 +159,12 @@ class DPDatabase:
             interaction.notes
         ))
         
-        interaction_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        
         logger.info(f"💾 Saved interaction #{interaction_id}: {interaction.symbol} @ ${interaction.level_price:.2f}")
         return interaction_id
     
     def update_outcome(self, interaction_id: int, outcome: DPOutcome):
-        """Update an interaction with its outcome."""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute("""
+        """Update an interaction with its outcome (queued; committed by the writer thread)."""
+        self.store.enqueue("""
             UPDATE dp_interactions SET
                 outcome = ?,
                 outcome_timestamp = ?,
@@ -172,19 +187,26 @@ class DPDatabase:
             interaction_id
         ))
         
-        conn.commit()
-        conn.close()
-        
         logger.info(f"📝 Updated outcome for #{interaction_id}: {outcome.outcome.value}")
     
+    def save_checkpoints(self, checkpoints: List[Tuple[str, float, int]]):
+        """
+        Persist intermediate checkpoint prices in one batch (queued).
+
+        Args:
+            checkpoints: (checkpoint, price, interaction_id), checkpoint in
+                'price_5min' / 'price_15min' / 'price_30min' / 'price_60min'
+        """
+        by_column: Dict[str, list] = {}
+        for checkpoint, price, interaction_id in checkpoints:
+            by_column.setdefault(_CHECKPOINT_COLUMNS[checkpoint], []).append((price, interaction_id))
+        for column, rows in by_column.items():
+            self.store.enqueue_many(f"UPDATE dp_interactions SET {column} = ? WHERE id = ?", rows)
+    
     def get_interaction(self, interaction_id: int) -> Optional[DPInteraction]:
         """Get a single interaction by ID."""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT * FROM dp_interactions WHERE id = ?", (interaction_id,))
+        cursor = self.store.execute("SELECT * FROM dp_interactions WHERE id = ?", (interaction_id,))
         row = cursor.fetchone()
-        conn.close()
         
         if row:
             return self._row_to_interaction(row, cursor.description)
@@ -192,73 +214,52 @@ class DPDatabase:
     
     def get_pending_interactions(self) -> List[DPInteraction]:
         """Get all interactions waiting for outcome."""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT * FROM dp_interactions WHERE outcome = 'PENDING'")
+        cursor = self.store.execute("SELECT * FROM dp_interactions WHERE outcome = 'PENDING'")
         rows = cursor.fetchall()
         description = cursor.description
-        conn.close()
         
         return [self._row_to_interaction(row, description) for row in rows]
     
     def get_all_interactions(self, symbol: str = None, limit: int = 100) -> List[DPInteraction]:
         """Get recent interactions, optionally filtered by symbol."""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
         if symbol:
-            cursor.execute(
+            cursor = self.store.execute(
                 "SELECT * FROM dp_interactions WHERE symbol = ? ORDER BY timestamp DESC LIMIT ?",
                 (symbol, limit)
             )
         else:
-            cursor.execute(
+            cursor = self.store.execute(
                 "SELECT * FROM dp_interactions ORDER BY timestamp DESC LIMIT ?",
                 (limit,)
             )
         
         rows = cursor.fetchall()
         description = cursor.description
-        conn.close()
         
         return [self._row_to_interaction(row, description) for row in rows]
     
-    def get_completed_interactions(self, limit: int = 100) -> List[DPInteraction]:
-        """Get interactions with known outcomes (for learning)."""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute("""
+    def get_completed_interactions(self, limit: Optional[int] = 100) -> List[DPInteraction]:
+        """Get interactions with known outcomes (for learning). limit=None returns all."""
+        cursor = self.store.execute("""
             SELECT * FROM dp_interactions 
             WHERE outcome IN ('BOUNCE', 'BREAK', 'FADE')
             ORDER BY timestamp DESC LIMIT ?
-        """, (limit,))
+        """, (-1 if limit is None else limit,))
         
         rows = cursor.fetchall()
         description = cursor.description
-        conn.close()
         
         return [self._row_to_interaction(row, description) for row in rows]
     
     def get_stats(self) -> dict:
         """Get database statistics."""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT COUNT(*) FROM dp_interactions")
-        total = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM dp_interactions WHERE outcome = 'PENDING'")
-        pending = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM dp_interactions WHERE outcome = 'BOUNCE'")
-        bounces = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM dp_interactions WHERE outcome = 'BREAK'")
-        breaks = cursor.fetchone()[0]
-        
-        conn.close()
+        total, pending, bounces, breaks = self.store.query_one("""
+            SELECT COUNT(*),
+                   COALESCE(SUM(outcome = 'PENDING'), 0),
+                   COALESCE(SUM(outcome = 'BOUNCE'), 0),
+                   COALESCE(SUM(outcome = 'BREAK'), 0)
+            FROM dp_interactions
+        """)
         
         return {
             'total': total,
@@ -302,10 +303,8 @@ class DPDatabase:
     # ─── Pattern Persistence ───────────────────────────────────
     
     def save_pattern(self, pattern: DPPattern) -> None:
-        """Upsert a single pattern to dp_patterns table."""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        cursor.execute("""
+        """Upsert a single pattern to dp_patterns table (queued)."""
+        self.store.enqueue("""
             INSERT INTO dp_patterns (pattern_name, total_samples, bounce_count, break_count, fade_count, last_updated)
             VALUES (?, ?, ?, ?, ?, ?)
             ON CONFLICT(pattern_name) DO UPDATE SET
@@ -322,16 +321,63 @@ class DPDatabase:
             pattern.fade_count,
             datetime.now().isoformat()
         ))
-        conn.commit()
-        conn.close()
+    
+    def save_pattern_counters(self, counters: List[tuple], learned: List[Tuple[int, str]] = ()):
+        """
+        Upsert learner counters and the outcomes they include (queued).
+
+        Args:
+            counters: (pattern_name, bounce, break, fade, decayed_bounce,
+                decayed_break, decayed_fade, decay_ts) rows
+            learned: (interaction_id, outcome) rows now reflected in the counters
+        """
+        self.store.enqueue_many("""
+            INSERT OR REPLACE INTO dp_pattern_counters
+            (pattern_name, bounce_count, break_count, fade_count,
+             decayed_bounce, decayed_break, decayed_fade, decay_ts)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, counters)
+        if learned:
+            self.store.enqueue_many(
+                "INSERT OR REPLACE INTO dp_learned_outcomes (interaction_id, outcome) VALUES (?, ?)", learned
+            )
+    
+    def clear_pattern_counters(self):
+        """Drop all learner counters (before a full rebuild)."""
+        with self.store.transaction() as conn:
+            conn.execute("DELETE FROM dp_pattern_counters")
+            conn.execute("DELETE FROM dp_learned_outcomes")
+    
+    def get_pattern_counters(self) -> List[tuple]:
+        """All rows of dp_pattern_counters (same column order as save_pattern_counters)."""
+        return self.store.query("""
+            SELECT pattern_name, bounce_count, break_count, fade_count,
+                   decayed_bounce, decayed_break, decayed_fade, decay_ts
+            FROM dp_pattern_counters
+        """)
+    
+    def get_learned_outcomes(self) -> Dict[int, str]:
+        """interaction_id -> outcome already counted by the learner."""
+        return dict(self.store.query("SELECT interaction_id, outcome FROM dp_learned_outcomes"))
+    
+    def get_unlearned_interactions(self) -> List[DPInteraction]:
+        """Completed interactions whose outcome is not (or differently) reflected in the counters."""
+        cursor = self.store.execute("""
+            SELECT i.* FROM dp_interactions i
+            LEFT JOIN dp_learned_outcomes l ON l.interaction_id = i.id
+            WHERE i.outcome IN ('BOUNCE', 'BREAK', 'FADE')
+              AND (l.outcome IS NULL OR l.outcome != i.outcome)
+            ORDER BY i.timestamp ASC
+        """)
+        rows = cursor.fetchall()
+        description = cursor.description
+        return [self._row_to_interaction(row, description) for row in rows]
     
     def get_all_patterns(self) -> List[DPPattern]:
         """Load all persisted patterns from dp_patterns table."""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        cursor.execute("SELECT pattern_name, total_samples, bounce_count, break_count, fade_count FROM dp_patterns")
-        rows = cursor.fetchall()
-        conn.close()
+        rows = self.store.query(
+            "SELECT pattern_name, total_samples, bounce_count, break_count, fade_count FROM dp_patterns"
+        )
         
         return [
             DPPattern(
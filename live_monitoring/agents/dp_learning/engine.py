@@ -15,6 +15,7 @@ from .models import (
 from .database import DPDatabase
 from .tracker import OutcomeTracker
 from .learner import PatternLearner
+from .level_index import notify_settled
 
 logger = logging.getLogger(__name__)
 
@@ -53,7 +54,7 @@ class DPLearningEngine:
             on_prediction: Callback when a prediction is made
         """
         self.db = DPDatabase()
-        self.learner = PatternLearner(self.db)
+        self.learner = PatternLearner(self.db, min_samples=3)
         self.tracker = OutcomeTracker(self.db, on_outcome=self._on_outcome_detected)
         
         self.on_outcome = on_outcome
@@ -214,9 +215,11 @@ class DPLearningEngine:
     def _on_outcome_detected(self, interaction_id: int, outcome: DPOutcome):
         """Called when an outcome is determined."""
         logger.info(f"🎯 Outcome detected for #{interaction_id}: {outcome.outcome.value}")
+        interaction = self._update_level_index(interaction_id)
         
-        # Re-learn patterns with new data
-        self.learner.learn(min_samples=3)
+        # Fold the new outcome into the pattern counters (O(1), no re-scan)
+        if interaction:
+            self.learner.observe(interaction, outcome.outcome)
         
         # Call external callback
         if self.on_outcome:
@@ -225,6 +228,17 @@ class DPLearningEngine:
             except Exception as e:
                 logger.error(f"❌ Outcome callback error: {e}")
     
+    def _update_level_index(self, interaction_id: int) -> Optional[DPInteraction]:
+        """Push a settled interaction into the in-memory DP level index. Returns it."""
+        try:
+            interaction = self.db.get_interaction(interaction_id)
+            if interaction:
+                notify_settled(self.db.db_path, interaction)
+            return interaction
+        except Exception as e:
+            logger.debug(f"⚠️ Level index update failed for #{interaction_id}: {e}")
+        return None
+    
     def get_status(self) -> dict:
         """Get current engine status."""
         stats = self.db.get_stats()
@@ -297,9 +311,11 @@ class DPLearningEngine:
         )
         
         self.db.update_outcome(interaction_id, dp_outcome)
+        interaction = self._update_level_index(interaction_id)
         
-        # Re-learn
-        self.learner.learn(min_samples=3)
+        # Re-count (replaces any outcome this interaction contributed before)
+        if interaction:
+            self.learner.observe(interaction, outcome)
         
         logger.info(f"📝 Manual outcome set for #{interaction_id}: {outcome_str}")
 
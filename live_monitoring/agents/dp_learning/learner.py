@@ -2,11 +2,17 @@
 🧠 DP Learning Engine - Pattern Learner
 =======================================
 Learns patterns from historical interactions to predict future outcomes.
+
+Learning is online: every settled outcome bumps the counters of the few
+patterns it matches (O(1)), counters are persisted as they change, and
+predictions are served from a table keyed by the set of matching patterns.
+A full rebuild over ALL completed interactions (no row cap) only happens
+when no counters exist yet or on request.
 """
 
 import logging
-from typing import Dict, List, Optional
-from collections import defaultdict
+import threading
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 from .models import DPInteraction, DPPattern, DPPrediction, Outcome, LevelType, ApproachDirection
@@ -14,6 +20,47 @@ from .database import DPDatabase
 
 logger = logging.getLogger(__name__)
 
+SETTLED = (Outcome.BOUNCE, Outcome.BREAK, Outcome.FADE)
+
+
+class PatternCounter:
+    """Raw and exponentially time-decayed outcome counts for one pattern."""
+    
+    __slots__ = ('name', 'counts', 'decayed', 'decay_ts')
+    
+    def __init__(self, name: str, counts=(0, 0, 0), decayed=(0.0, 0.0, 0.0), decay_ts: float = 0.0):
+        self.name = name
+        self.counts = list(counts)      # bounce, break, fade
+        self.decayed = list(decayed)    # same, each sample weighted 0.5 ** (age / half_life)
+        self.decay_ts = decay_ts        # epoch seconds the decayed weights are expressed at
+    
+    @staticmethod
+    def slot(outcome: Outcome) -> int:
+        return 0 if outcome == Outcome.BOUNCE else 1 if outcome == Outcome.BREAK else 2
+    
+    def add(self, outcome: Outcome, sample_ts: float, half_life: Optional[float], sign: int = 1):
+        i = self.slot(outcome)
+        self.counts[i] += sign
+        if not half_life:
+            self.decayed[i] += sign
+            return
+        if sample_ts > self.decay_ts:
+            factor = 0.5 ** ((sample_ts - self.decay_ts) / half_life)
+            self.decayed = [w * factor for w in self.decayed]
+            self.decay_ts = sample_ts
+        self.decayed[i] = max(0.0, self.decayed[i] + sign * 0.5 ** ((self.decay_ts - sample_ts) / half_life))
+    
+    @property
+    def total(self) -> int:
+        return sum(self.counts)
+    
+    def to_pattern(self) -> DPPattern:
+        return DPPattern(pattern_name=self.name, total_samples=self.total, bounce_count=self.counts[0],
+                         break_count=self.counts[1], fade_count=self.counts[2])
+    
+    def to_row(self) -> tuple:
+        return (self.name, *self.counts, *self.decayed, self.decay_ts)
+
 
 class PatternLearner:
     """
@@ -25,6 +72,9 @@ class PatternLearner:
     - By touch count (1st, 2nd, 3rd+)
     - By level type (support vs resistance)
     - By market trend (up, down, chop)
+    
+    With ``half_life_days`` set, bounce/break rates come from time-decayed
+    counts so recent behaviour dominates; sample counts stay raw.
     """
     
     # Volume brackets
@@ -41,9 +91,15 @@ class PatternLearner:
         ('afternoon', 14, 16)    # 2:00 - 4:00
     ]
     
-    def __init__(self, database: DPDatabase):
+    def __init__(self, database: DPDatabase, half_life_days: Optional[float] = None, min_samples: int = 5):
         self.db = database
+        self.half_life = half_life_days * 86400 if half_life_days else None
+        self.min_samples = min_samples
         self.patterns: Dict[str, DPPattern] = {}
+        self.counters: Dict[str, PatternCounter] = {}
+        self._learned: Dict[int, str] = {}   # interaction_id -> outcome counted
+        self._table: Dict[Tuple[str, ...], Tuple[float, float, List[str]]] = {}
+        self._lock = threading.RLock()
         
         # Auto-load persisted patterns (survive restarts)
         self.load_patterns()
@@ -52,158 +108,156 @@ class PatternLearner:
         else:
             logger.info("🧠 PatternLearner initialized — no persisted patterns yet")
     
-    def learn(self, min_samples: int = 5):
-        """
-        Learn patterns from all completed interactions.
+    # ─── Pattern Membership ────────────────────────────────────
+    
+    def pattern_keys(self, interaction: DPInteraction) -> Tuple[str, ...]:
+        """Every pattern an interaction belongs to, in learning order."""
+        keys = []
+        volume = interaction.level_volume
+        hour = interaction.timestamp.hour
+        touch = interaction.touch_count
         
-        Args:
-            min_samples: Minimum samples needed to form a pattern
+        for name, lo, hi in self.VOLUME_BRACKETS:
+            if lo <= volume < hi:
+                keys.append(name)
+        for name, lo, hi in self.TIME_BRACKETS:
+            if lo <= hour < hi:
+                keys.append(name)
+        if touch == 1:
+            keys.append('touch_1')
+        elif touch == 2:
+            keys.append('touch_2')
+        elif touch >= 3:
+            keys.append('touch_3_plus')
+        if interaction.level_type in (LevelType.SUPPORT, LevelType.RESISTANCE):
+            keys.append(interaction.level_type.value.lower())
+        if 9 <= hour < 11 and volume >= 1_000_000:
+            keys.append('morning_high_vol')
+        if touch == 2 and interaction.level_type == LevelType.RESISTANCE:
+            keys.append('2nd_touch_resistance')
+        return tuple(keys)
+    
+    # ─── Online Learning ───────────────────────────────────────
+    
+    def observe(self, interaction: DPInteraction, outcome: Optional[Outcome] = None):
         """
-        interactions = self.db.get_completed_interactions(limit=1000)
+        Fold one settled outcome into the counters (O(patterns matched)).
         
-        if len(interactions) < min_samples:
-            logger.info(f"⚠️ Not enough data yet ({len(interactions)} < {min_samples})")
+        Re-observing the same interaction is a no-op; a changed outcome
+        (e.g. manual override) replaces the previously counted one.
+        """
+        outcome = outcome or interaction.outcome
+        if outcome not in SETTLED or interaction.id is None:
             return
-        
-        logger.info(f"🧠 Learning from {len(interactions)} interactions...")
-        
-        # Reset patterns
-        self.patterns = {}
-        
-        # Learn by volume
-        self._learn_by_volume(interactions, min_samples)
-        
-        # Learn by time of day
-        self._learn_by_time(interactions, min_samples)
-        
-        # Learn by touch count
-        self._learn_by_touch_count(interactions, min_samples)
-        
-        # Learn by level type
-        self._learn_by_level_type(interactions, min_samples)
-        
-        # Learn combined patterns
-        self._learn_combined(interactions, min_samples)
-        
-        logger.info(f"🧠 Learned {len(self.patterns)} patterns")
-        
-        # Auto-persist to disk
-        self.save_patterns()
-        logger.info(f"💾 Persisted {len(self.patterns)} patterns to dp_patterns table")
+        with self._lock:
+            changed = self._apply(interaction, outcome)
+            if changed:
+                self._publish(changed)
+                self.db.save_pattern_counters([self.counters[k].to_row() for k in changed],
+                                              [(interaction.id, outcome.value)])
     
-    def _learn_by_volume(self, interactions: List[DPInteraction], min_samples: int):
-        """Learn patterns by volume bracket."""
-        for bracket_name, min_vol, max_vol in self.VOLUME_BRACKETS:
-            pattern = DPPattern(pattern_name=bracket_name)
-            
-            for i in interactions:
-                if min_vol <= i.level_volume < max_vol:
-                    pattern.total_samples += 1
-                    if i.outcome == Outcome.BOUNCE:
-                        pattern.bounce_count += 1
-                    elif i.outcome == Outcome.BREAK:
-                        pattern.break_count += 1
-                    else:
-                        pattern.fade_count += 1
-            
-            if pattern.total_samples >= min_samples:
-                self.patterns[bracket_name] = pattern
-                logger.info(f"   {bracket_name}: {pattern.bounce_rate:.1%} bounce ({pattern.total_samples} samples)")
+    def _apply(self, interaction: DPInteraction, outcome: Outcome) -> Tuple[str, ...]:
+        previous = self._learned.get(interaction.id)
+        if previous == outcome.value:
+            return ()
+        keys = self.pattern_keys(interaction)
+        sample_ts = interaction.timestamp.timestamp()
+        for key in keys:
+            counter = self.counters.get(key)
+            if counter is None:
+                counter = self.counters[key] = PatternCounter(key)
+            if previous is not None:
+                counter.add(Outcome(previous), sample_ts, self.half_life, sign=-1)
+            counter.add(outcome, sample_ts, self.half_life)
+        self._learned[interaction.id] = outcome.value
+        return keys
     
-    def _learn_by_time(self, interactions: List[DPInteraction], min_samples: int):
-        """Learn patterns by time of day."""
-        for bracket_name, start_hour, end_hour in self.TIME_BRACKETS:
-            pattern = DPPattern(pattern_name=bracket_name)
-            
-            for i in interactions:
-                hour = i.timestamp.hour
-                if start_hour <= hour < end_hour:
-                    pattern.total_samples += 1
-                    if i.outcome == Outcome.BOUNCE:
-                        pattern.bounce_count += 1
-                    elif i.outcome == Outcome.BREAK:
-                        pattern.break_count += 1
-                    else:
-                        pattern.fade_count += 1
-            
-            if pattern.total_samples >= min_samples:
-                self.patterns[bracket_name] = pattern
-                logger.info(f"   {bracket_name}: {pattern.bounce_rate:.1%} bounce ({pattern.total_samples} samples)")
+    def _publish(self, keys, persist: bool = True):
+        """Refresh the published patterns for ``keys`` and drop cached predictions."""
+        for key in keys:
+            counter = self.counters[key]
+            if counter.total >= self.min_samples:
+                self.patterns[key] = counter.to_pattern()
+                if persist:
+                    self.db.save_pattern(self.patterns[key])
+            else:
+                self.patterns.pop(key, None)
+        self._table.clear()
     
-    def _learn_by_touch_count(self, interactions: List[DPInteraction], min_samples: int):
-        """Learn patterns by touch count."""
-        for touch in [1, 2, 3]:
-            pattern_name = f"touch_{touch}" if touch < 3 else "touch_3_plus"
-            pattern = DPPattern(pattern_name=pattern_name)
+    def learn(self, min_samples: int = 5, rebuild: bool = False):
+        """
+        Bring the counters up to date with every completed interaction.
+        
+        Only outcomes not yet counted are folded in, so this is cheap after
+        the first run. ``rebuild=True`` recomputes everything from scratch.
+        
+        Args:
+            min_samples: Minimum samples needed to form a pattern
+            rebuild: Discard persisted counters and recount all interactions
+        """
+        with self._lock:
+            self.min_samples = min_samples
+            if rebuild or not self.counters:
+                self.counters, self._learned = {}, {}
+                self.db.clear_pattern_counters()
+                pending = self.db.get_completed_interactions(limit=None)
+                pending.sort(key=lambda i: i.timestamp)
+            else:
+                pending = self.db.get_unlearned_interactions()
             
-            for i in interactions:
-                match = (i.touch_count == touch) if touch < 3 else (i.touch_count >= 3)
-                if match:
-                    pattern.total_samples += 1
-                    if i.outcome == Outcome.BOUNCE:
-                        pattern.bounce_count += 1
-                    elif i.outcome == Outcome.BREAK:
-                        pattern.break_count += 1
-                    else:
-                        pattern.fade_count += 1
+            changed = set()
+            for interaction in pending:
+                changed.update(self._apply(interaction, interaction.outcome))
             
-            if pattern.total_samples >= min_samples:
-                self.patterns[pattern_name] = pattern
-                logger.info(f"   {pattern_name}: {pattern.bounce_rate:.1%} bounce ({pattern.total_samples} samples)")
+            self.patterns = {}
+            self._publish(list(self.counters), persist=bool(changed))
+            if changed:
+                self.db.save_pattern_counters([self.counters[k].to_row() for k in changed],
+                                              [(i.id, i.outcome.value) for i in pending])
+                logger.info(f"🧠 Learned from {len(pending)} new interactions → {len(self.patterns)} patterns")
+                for name, p in self.patterns.items():
+                    logger.debug(f"   {name}: {p.bounce_rate:.1%} bounce ({p.total_samples} samples)")
     
-    def _learn_by_level_type(self, interactions: List[DPInteraction], min_samples: int):
-        """Learn patterns by level type (support vs resistance)."""
-        for level_type in [LevelType.SUPPORT, LevelType.RESISTANCE]:
-            pattern_name = level_type.value.lower()
-            pattern = DPPattern(pattern_name=pattern_name)
+    def _rates(self, key: str) -> Tuple[float, float, float]:
+        """(bounce_rate, break_rate, weight) for a published pattern."""
+        pattern = self.patterns[key]
+        counter = self.counters.get(key)
+        weight = min(pattern.total_samples / 10, 3)  # Weight by sample size, capped at 3x
+        if self.half_life and counter is not None:
+            total = sum(counter.decayed)
+            if total > 0:
+                return counter.decayed[0] / total, counter.decayed[1] / total, weight
+        return pattern.bounce_rate, pattern.break_rate, weight
+    
+    def _lookup(self, keys: Tuple[str, ...]) -> Tuple[float, float, List[str]]:
+        """Blended probabilities for a set of matching patterns (memoized until the next update)."""
+        with self._lock:
+            cached = self._table.get(keys)
+            if cached is not None:
+                return cached
+            matching_patterns = []
+            total_bounce_weight = 0
+            total_break_weight = 0
+            total_weight = 0
+            for key in keys:
+                if key not in self.patterns:
+                    continue
+                matching_patterns.append(key)
+                bounce_rate, break_rate, weight = self._rates(key)
+                total_bounce_weight += bounce_rate * weight
+                total_break_weight += break_rate * weight
+                total_weight += weight
             
-            for i in interactions:
-                if i.level_type == level_type:
-                    pattern.total_samples += 1
-                    if i.outcome == Outcome.BOUNCE:
-                        pattern.bounce_count += 1
-                    elif i.outcome == Outcome.BREAK:
-                        pattern.break_count += 1
-                    else:
-                        pattern.fade_count += 1
+            if total_weight > 0:
+                bounce_prob = total_bounce_weight / total_weight
+                break_prob = total_break_weight / total_weight
+            else:
+                # No matching patterns, use 50/50
+                bounce_prob = 0.5
+                break_prob = 0.5
             
-            if pattern.total_samples >= min_samples:
-                self.patterns[pattern_name] = pattern
-                logger.info(f"   {pattern_name}: {pattern.bounce_rate:.1%} bounce ({pattern.total_samples} samples)")
-    
-    def _learn_combined(self, interactions: List[DPInteraction], min_samples: int):
-        """Learn combined patterns (e.g., morning + high volume)."""
-        # Morning + High Volume
-        pattern = DPPattern(pattern_name="morning_high_vol")
-        for i in interactions:
-            if 9 <= i.timestamp.hour < 11 and i.level_volume >= 1_000_000:
-                pattern.total_samples += 1
-                if i.outcome == Outcome.BOUNCE:
-                    pattern.bounce_count += 1
-                elif i.outcome == Outcome.BREAK:
-                    pattern.break_count += 1
-                else:
-                    pattern.fade_count += 1
-        
-        if pattern.total_samples >= min_samples:
-            self.patterns["morning_high_vol"] = pattern
-            logger.info(f"   morning_high_vol: {pattern.bounce_rate:.1%} bounce ({pattern.total_samples} samples)")
-        
-        # 2nd touch + resistance (classic rejection pattern)
-        pattern = DPPattern(pattern_name="2nd_touch_resistance")
-        for i in interactions:
-            if i.touch_count == 2 and i.level_type == LevelType.RESISTANCE:
-                pattern.total_samples += 1
-                if i.outcome == Outcome.BOUNCE:
-                    pattern.bounce_count += 1
-                elif i.outcome == Outcome.BREAK:
-                    pattern.break_count += 1
-                else:
-                    pattern.fade_count += 1
-        
-        if pattern.total_samples >= min_samples:
-            self.patterns["2nd_touch_resistance"] = pattern
-            logger.info(f"   2nd_touch_resistance: {pattern.bounce_rate:.1%} bounce ({pattern.total_samples} samples)")
+            self._table[keys] = result = (bounce_prob, break_prob, matching_patterns)
+            return result
     
     def predict(self, interaction: DPInteraction) -> DPPrediction:
         """
@@ -215,31 +269,8 @@ class PatternLearner:
         Returns:
             DPPrediction with probability estimates
         """
-        matching_patterns = []
-        total_bounce_weight = 0
-        total_break_weight = 0
-        total_weight = 0
-        
-        # Check each pattern
-        for pattern_name, pattern in self.patterns.items():
-            if self._matches_pattern(interaction, pattern_name):
-                matching_patterns.append(pattern_name)
-                
-                # Weight by sample size (more samples = more weight)
-                weight = min(pattern.total_samples / 10, 3)  # Cap at 3x weight
-                
-                total_bounce_weight += pattern.bounce_rate * weight
-                total_break_weight += pattern.break_rate * weight
-                total_weight += weight
-        
-        # Calculate probabilities
-        if total_weight > 0:
-            bounce_prob = total_bounce_weight / total_weight
-            break_prob = total_break_weight / total_weight
-        else:
-            # No matching patterns, use 50/50
-            bounce_prob = 0.5
-            break_prob = 0.5
+        bounce_prob, break_prob, matching_patterns = self._lookup(self.pattern_keys(interaction))
+        matching_patterns = list(matching_patterns)
         
         # Determine predicted outcome
         if bounce_prob > 0.6:
@@ -277,47 +308,12 @@ class PatternLearner:
     
     def _matches_pattern(self, interaction: DPInteraction, pattern_name: str) -> bool:
         """Check if an interaction matches a pattern."""
-        
-        # Volume patterns
-        if pattern_name == 'vol_500k':
-            return 500_000 <= interaction.level_volume < 1_000_000
-        elif pattern_name == 'vol_1m':
-            return 1_000_000 <= interaction.level_volume < 2_000_000
-        elif pattern_name == 'vol_2m_plus':
-            return interaction.level_volume >= 2_000_000
-        
-        # Time patterns
-        elif pattern_name == 'morning':
-            return 9 <= interaction.timestamp.hour < 11
-        elif pattern_name == 'midday':
-            return 11 <= interaction.timestamp.hour < 14
-        elif pattern_name == 'afternoon':
-            return 14 <= interaction.timestamp.hour < 16
-        
-        # Touch count patterns
-        elif pattern_name == 'touch_1':
-            return interaction.touch_count == 1
-        elif pattern_name == 'touch_2':
-            return interaction.touch_count == 2
-        elif pattern_name == 'touch_3_plus':
-            return interaction.touch_count >= 3
-        
-        # Level type patterns
-        elif pattern_name == 'support':
-            return interaction.level_type == LevelType.SUPPORT
-        elif pattern_name == 'resistance':
-            return interaction.level_type == LevelType.RESISTANCE
-        
-        # Combined patterns
-        elif pattern_name == 'morning_high_vol':
-            return 9 <= interaction.timestamp.hour < 11 and interaction.level_volume >= 1_000_000
-        elif pattern_name == '2nd_touch_resistance':
-            return interaction.touch_count == 2 and interaction.level_type == LevelType.RESISTANCE
-        
-        return False
+        return pattern_name in self.pattern_keys(interaction)
     
     def get_patterns_summary(self) -> Dict[str, dict]:
         """Get a summary of all learned patterns."""
+        with self._lock:
+            patterns = list(self.patterns.items())
         return {
             name: {
                 'samples': p.total_samples,
@@ -325,20 +321,27 @@ class PatternLearner:
                 'break_rate': f"{p.break_rate:.1%}",
                 'confidence': p.confidence
             }
-            for name, p in self.patterns.items()
+            for name, p in patterns
         }
 
     # ─── Pattern Persistence ───────────────────────────────────
     
     def save_patterns(self) -> None:
-        """Persist all in-memory patterns to the database."""
-        for pattern in self.patterns.values():
-            self.db.save_pattern(pattern)
+        """Persist all in-memory patterns and counters to the database."""
+        with self._lock:
+            for pattern in self.patterns.values():
+                self.db.save_pattern(pattern)
+            self.db.save_pattern_counters([c.to_row() for c in self.counters.values()])
     
     def load_patterns(self) -> None:
-        """Load persisted patterns from database into memory."""
-        db_patterns = self.db.get_all_patterns()
-        for p in db_patterns:
+        """Load persisted counters (or legacy patterns) from database into memory."""
+        for row in self.db.get_pattern_counters():
+            self.counters[row[0]] = PatternCounter(row[0], row[1:4], row[4:7], row[7])
+        self._learned = self.db.get_learned_outcomes()
+        if self.counters:
+            self._publish(list(self.counters), persist=False)
+            return
+        for p in self.db.get_all_patterns():
             self.patterns[p.pattern_name] = p
     
     def predict_from_context(self, level_type: str = 'SUPPORT', 
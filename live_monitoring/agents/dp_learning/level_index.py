@@ -0,0 +1,325 @@
+"""
+🧠 DP Learning Engine - Level Index
+===================================
+In-memory, per-symbol index of settled DP levels.
+
+ConfluenceGate used to SELECT the 200 latest settled interactions, regroup
+them onto a $0.50 grid and scan every level on each should_fire() call. The
+index keeps that same view resident instead:
+
+- Per symbol: sorted grid prices (bisect) + bounce/break aggregates per level
+- Sliding window of the latest N settled interactions (same as LIMIT 200)
+- Updated incrementally when DPLearningEngine settles an interaction
+- "Nearest strong level within X%" walks outward from the bisect point
+
+Usage:
+    index = get_level_index("data/dp_learning.db")
+    level = index.nearest_strong_level("SPY", 685.10, threshold_pct=0.5)
+    if level:
+        print(level.price, level.bounce_rate, level.total)
+"""
+
+import bisect
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from core.utils.sqlite_pool import get_store
+
+logger = logging.getLogger(__name__)
+
+GRID = 0.5                 # Levels snap to a $0.50 grid
+WINDOW = 200               # Latest settled interactions kept per symbol
+REFRESH_SECONDS = 300      # Reload from SQLite (picks up other processes' writes)
+SETTLED = ('BOUNCE', 'BREAK')
+
+
+@dataclass
+class LevelStats:
+    """Aggregated history of one grid level."""
+    symbol: str
+    price: float
+    level_type: str
+    bounces: int = 0
+    breaks: int = 0
+    touches: int = 0
+    distance_pct: Optional[float] = None
+
+    @property
+    def total(self) -> int:
+        return self.bounces + self.breaks
+
+    @property
+    def bounce_rate(self) -> float:
+        """Bounce rate in percent (0-100)."""
+        return self.bounces / self.total * 100 if self.total else 0.0
+
+
+@dataclass
+class _Level:
+    level_type: str = ''
+    latest: Tuple = ()              # (timestamp, id) of the row that set level_type
+    bounces: int = 0
+    breaks: int = 0
+    touches: Counter = field(default_factory=Counter)
+
+    @property
+    def total(self) -> int:
+        return self.bounces + self.breaks
+
+
+class _SymbolLevels:
+    """Sorted grid prices + windowed aggregates for one symbol."""
+
+    def __init__(self, window: int):
+        self.window = window
+        self.prices: List[float] = []
+        self.levels: Dict[float, _Level] = {}
+        self.order: List[Tuple] = []            # sorted (timestamp, id) of rows in window
+        self.rows: Dict[int, Tuple] = {}        # id -> (key, grid, outcome, level_type, touch)
+
+    def add(self, key: Tuple, row_id: int, grid: float, outcome: str, level_type: str, touch: int):
+        if len(self.order) >= self.window and key < self.order[0]:
+            return  # older than everything in a full window
+        bisect.insort(self.order, key)
+        self.rows[row_id] = (key, grid, outcome, level_type, touch)
+
+        level = self.levels.get(grid)
+        if level is None:
+            level = self.levels[grid] = _Level()
+            bisect.insort(self.prices, grid)
+        if outcome == 'BOUNCE':
+            level.bounces += 1
+        else:
+            level.breaks += 1
+        level.touches[touch] += 1
+        if key >= level.latest:
+            level.latest = key
+            level.level_type = level_type
+
+        while len(self.order) > self.window:
+            self.remove(self.order[0][1])
+
+    def remove(self, row_id: int):
+        entry = self.rows.pop(row_id, None)
+        if entry is None:
+            return
+        key, grid, outcome, _, touch = entry
+        del self.order[bisect.bisect_left(self.order, key)]
+
+        level = self.levels[grid]
+        if outcome == 'BOUNCE':
+            level.bounces -= 1
+        else:
+            level.breaks -= 1
+        level.touches[touch] -= 1
+        if level.touches[touch] <= 0:
+            del level.touches[touch]
+        if level.total == 0:
+            del self.levels[grid]
+            del self.prices[bisect.bisect_left(self.prices, grid)]
+        elif key == level.latest:
+            # Newest row for the level left the window: take the next newest
+            remaining = [self.rows[i] for i in self.rows if self.rows[i][1] == grid]
+            newest = max(remaining, key=lambda r: r[0])
+            level.latest, level.level_type = newest[0], newest[3]
+
+
+class DPLevelIndex:
+    """
+    Per-symbol index of settled DP levels, answering proximity queries by bisect.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, window: int = WINDOW, grid: float = GRID,
+                 refresh_seconds: Optional[float] = REFRESH_SECONDS):
+        self.db_path = str(db_path) if db_path else None
+        self.window = window
+        self.grid = grid
+        self.refresh_seconds = refresh_seconds
+        self._symbols: Dict[str, _SymbolLevels] = {}
+        self._lock = threading.RLock()
+        self._loaded_at = 0.0
+
+    # ═══════════════════════════════════════════════════════════════
+    # MAINTENANCE
+    # ═══════════════════════════════════════════════════════════════
+
+    def load(self):
+        """(Re)build the index from dp_interactions."""
+        if not self.db_path:
+            return
+        rows = get_store(self.db_path).query(
+            "SELECT id, symbol, timestamp, level_price, level_type, outcome, touch_count "
+            "FROM dp_interactions WHERE outcome IN ('BOUNCE','BREAK') ORDER BY timestamp, id"
+        )
+        with self._lock:
+            self._symbols = {}
+            for row in rows:
+                self._add(*row)
+            self._loaded_at = time.monotonic()
+        logger.debug(f"📇 DP level index loaded: {len(rows)} settled interactions, {len(self._symbols)} symbols")
+
+    def _maybe_refresh(self):
+        if self.db_path is None:
+            return
+        stale = self.refresh_seconds is not None and time.monotonic() - self._loaded_at > self.refresh_seconds
+        if not self._loaded_at or stale:
+            self.load()
+
+    def _add(self, row_id, symbol, timestamp, level_price, level_type, outcome, touch_count):
+        if outcome not in SETTLED or level_price is None:
+            return
+        if isinstance(timestamp, datetime):
+            timestamp = timestamp.isoformat()
+        levels = self._symbols.get(symbol)
+        if levels is None:
+            levels = self._symbols[symbol] = _SymbolLevels(self.window)
+        grid = round(level_price / self.grid) * self.grid
+        levels.add((timestamp or '', row_id), row_id, grid, outcome, level_type, touch_count or 1)
+
+    def record(self, interaction_id: int, symbol: str, timestamp, level_price: float,
+               level_type: str, outcome: str, touch_count: int = 1):
+        """Apply a settled (or re-settled) interaction."""
+        with self._lock:
+            levels = self._symbols.get(symbol)
+            if levels is not None:
+                levels.remove(interaction_id)
+            self._add(interaction_id, symbol, timestamp, level_price, level_type, outcome, touch_count)
+
+    def record_interaction(self, interaction):
+        """Apply a DPInteraction whose outcome has been set."""
+        self.record(
+            interaction.id, interaction.symbol, interaction.timestamp, interaction.level_price,
+            interaction.level_type.value, interaction.outcome.value, interaction.touch_count,
+        )
+
+    # ═══════════════════════════════════════════════════════════════
+    # QUERIES
+    # ═══════════════════════════════════════════════════════════════
+
+    def _stats(self, symbol: str, price: float, level: _Level, ref: Optional[float]) -> LevelStats:
+        return LevelStats(
+            symbol=symbol,
+            price=price,
+            level_type=level.level_type,
+            bounces=level.bounces,
+            breaks=level.breaks,
+            touches=max(level.touches) if level.touches else 0,
+            distance_pct=abs(ref - price) / ref * 100 if ref else None,
+        )
+
+    def nearest_strong_level(self, symbol: str, price: float, threshold_pct: float = 0.5,
+                             min_samples: int = 3, min_bounce_rate: float = 70.0) -> Optional[LevelStats]:
+        """
+        Closest level within threshold_pct of price that has at least
+        min_samples settled interactions and bounce_rate >= min_bounce_rate.
+        """
+        if not price:
+            return None
+        self._maybe_refresh()
+        with self._lock:
+            levels = self._symbols.get(symbol)
+            if levels is None or not levels.prices:
+                return None
+            prices = levels.prices
+            hi = bisect.bisect_left(prices, price)
+            lo = hi - 1
+
+            # Walk outward in order of distance; first qualifying level wins
+            while lo >= 0 or hi < len(prices):
+                d_lo = price - prices[lo] if lo >= 0 else float('inf')
+                d_hi = prices[hi] - price if hi < len(prices) else float('inf')
+                if d_lo <= d_hi:
+                    candidate, lo = prices[lo], lo - 1
+                    dist = d_lo
+                else:
+                    candidate, hi = prices[hi], hi + 1
+                    dist = d_hi
+                if dist / price * 100 > threshold_pct:
+                    break
+                level = levels.levels[candidate]
+                if level.total >= min_samples and level.bounces / level.total * 100 >= min_bounce_rate:
+                    return self._stats(symbol, candidate, level, price)
+            return None
+
+    def level_at(self, symbol: str, price: float, tolerance_pct: float = 0.0) -> Optional[LevelStats]:
+        """Stats for the grid level nearest price (within tolerance_pct, or the same grid cell)."""
+        self._maybe_refresh()
+        with self._lock:
+            levels = self._symbols.get(symbol)
+            if levels is None or not levels.prices:
+                return None
+            grid = round(price / self.grid) * self.grid
+            if grid in levels.levels:
+                return self._stats(symbol, grid, levels.levels[grid], price)
+            if tolerance_pct <= 0:
+                return None
+            nearby = self.levels_between(symbol, price * (1 - tolerance_pct / 100), price * (1 + tolerance_pct / 100))
+            if not nearby:
+                return None
+            best = min(nearby, key=lambda s: abs(s.price - price))
+            best.distance_pct = abs(price - best.price) / price * 100
+            return best
+
+    def levels_between(self, symbol: str, low: float, high: float) -> List[LevelStats]:
+        """All indexed levels with low <= price <= high, ascending."""
+        self._maybe_refresh()
+        with self._lock:
+            levels = self._symbols.get(symbol)
+            if levels is None:
+                return []
+            i = bisect.bisect_left(levels.prices, low)
+            j = bisect.bisect_right(levels.prices, high)
+            return [self._stats(symbol, p, levels.levels[p], None) for p in levels.prices[i:j]]
+
+    def zone_stats(self, symbol: str, low: float, high: float) -> Tuple[Optional[float], int]:
+        """(bounce_rate %, settled samples) pooled over every grid cell overlapping [low, high]."""
+        half = self.grid / 2
+        levels = self.levels_between(symbol, low - half, high + half)
+        bounces = sum(s.bounces for s in levels)
+        total = sum(s.total for s in levels)
+        return (bounces / total * 100 if total else None), total
+
+
+# ═══════════════════════════════════════════════════════════════
+# REGISTRY
+# ═══════════════════════════════════════════════════════════════
+
+_indexes: Dict[str, DPLevelIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_level_index(db_path) -> DPLevelIndex:
+    """Process-wide DPLevelIndex for a dp_learning database (lazy-loaded)."""
+    key = os.path.abspath(str(db_path))
+    index = _indexes.get(key)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.get(key)
+            if index is None:
+                index = _indexes[key] = DPLevelIndex(db_path)
+    return index
+
+
+def notify_settled(db_path, interaction):
+    """Push a settled interaction into an already-loaded index (no-op otherwise)."""
+    index = _indexes.get(os.path.abspath(str(db_path)))
+    if index is not None and index._loaded_at:
+        index.record_interaction(interaction)
+
+
+def default_level_index() -> Optional[DPLevelIndex]:
+    """Index for the deployment's dp_learning.db, or None if there is no database yet."""
+    try:
+        from core.utils.persistent_storage import get_database_path
+        path = get_database_path("dp_learning.db")
+    except ImportError:
+        path = os.path.join("data", "dp_learning.db")
+    if not os.path.exists(path):
+        return None
+    return get_level_index(path)
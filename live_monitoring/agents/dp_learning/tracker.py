@@ -12,11 +12,10 @@ FIXED: Now properly determines if level HELD or BROKE by:
 
 import logging
 import threading
-import time
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Callable, List
 
-import yfinance as yf
+from live_monitoring.core.outcome_service import PriceWindow, fetch_prices, get_outcome_service
 
 from .models import DPInteraction, DPOutcome, Outcome, LevelType
 from .database import DPDatabase
@@ -41,41 +40,54 @@ class OutcomeTracker:
     # Maximum tracking time (minutes)
     MAX_TRACKING_TIME = 60
     
+    # Poll interval (seconds) on the shared OutcomeService
+    POLL_INTERVAL = 30
+    
+    # Checkpoints recorded along the way: name -> minutes after alert
+    CHECKPOINTS = (('price_5min', 5), ('price_15min', 15), ('price_30min', 30), ('price_60min', 60))
+    
     # Thresholds
     BREACH_THRESHOLD = 0.001   # 0.1% through level = breach
     BOUNCE_CONFIRM = 0.002     # 0.2% reversal confirms bounce
     BREAK_CONFIRM = 0.003      # 0.3% continuation confirms break
     
-    def __init__(self, database: DPDatabase, on_outcome: Callable = None):
+    def __init__(self, database: DPDatabase, on_outcome: Callable = None, service=None):
         self.db = database
         self.on_outcome = on_outcome  # Callback when outcome determined
         
         # Active tracking jobs
         self.tracking_jobs: Dict[int, dict] = {}  # interaction_id -> job info
+        self._jobs_lock = threading.Lock()
         
-        # Background thread for tracking
+        # Polling happens on the shared OutcomeService (one batch per distinct symbol)
+        self._service = service
         self._running = False
-        self._thread: Optional[threading.Thread] = None
         
         logger.info("⏱️ OutcomeTracker initialized (FIXED version)")
         logger.info(f"   Min tracking time: {self.MIN_TRACKING_TIME} min")
         logger.info(f"   Breach threshold: {self.BREACH_THRESHOLD:.2%}")
     
+    @property
+    def service(self):
+        if self._service is None:
+            self._service = get_outcome_service()
+        return self._service
+    
     def start(self):
-        """Start the tracking background thread."""
+        """Register with the shared outcome service and start its poll thread."""
         if self._running:
             return
         
         self._running = True
-        self._thread = threading.Thread(target=self._tracking_loop, daemon=True)
-        self._thread.start()
+        self.service.register(f"dp_learning:{id(self)}", self._tracked_symbols, self._check_all_jobs,
+                              interval=self.POLL_INTERVAL)
+        self.service.start()
         logger.info("⏱️ Outcome tracking started")
     
     def stop(self):
-        """Stop the tracking background thread."""
+        """Stop tracking (the shared service keeps serving other trackers)."""
         self._running = False
-        if self._thread:
-            self._thread.join(timeout=5)
+        self.service.unregister(f"dp_learning:{id(self)}")
         logger.info("⏱️ Outcome tracking stopped")
     
     def track_interaction(self, interaction: DPInteraction, interaction_id: int):
@@ -86,7 +98,7 @@ class OutcomeTracker:
             interaction: The DPInteraction that was just alerted
             interaction_id: The database ID of the interaction
         """
-        self.tracking_jobs[interaction_id] = {
+        job = {
             'interaction': interaction,
             'start_time': datetime.now(),
             'start_price': interaction.approach_price,
@@ -94,61 +106,63 @@ class OutcomeTracker:
             'level_type': interaction.level_type,
             'symbol': interaction.symbol,
             'checkpoints': {},  # Will store price at each checkpoint
-            'price_history': [interaction.approach_price],  # All prices seen
+            'prices': PriceWindow(interaction.approach_price),  # Recent prices + running min/max
             'min_price': interaction.approach_price,
             'max_price': interaction.approach_price,
             'level_breached': False,
             'outcome': None
         }
+        with self._jobs_lock:
+            self.tracking_jobs[interaction_id] = job
         
         logger.info(f"⏱️ Started tracking #{interaction_id}: {interaction.symbol} @ ${interaction.level_price:.2f} ({interaction.level_type.value})")
     
-    def _tracking_loop(self):
-        """Background loop that checks on tracked interactions."""
-        while self._running:
-            try:
-                self._check_all_jobs()
-                time.sleep(30)  # Check every 30 seconds
-            except Exception as e:
-                logger.error(f"❌ Tracking loop error: {e}")
-                time.sleep(60)
+    def _tracked_symbols(self) -> List[str]:
+        """Distinct symbols with open jobs (what the shared service fetches)."""
+        with self._jobs_lock:
+            return list({job['symbol'] for job in self.tracking_jobs.values()})
     
-    def _check_all_jobs(self):
-        """Check all active tracking jobs."""
+    def _check_all_jobs(self, prices: Optional[Dict[str, Optional[float]]] = None):
+        """
+        Check all active tracking jobs against one price per symbol.
+        
+        Args:
+            prices: {SYMBOL: price} from the shared service; fetched in one
+                batch for the distinct job symbols when not given
+        """
+        if prices is None:
+            prices = fetch_prices(self._tracked_symbols())
+        
         completed_ids = []
+        checkpoint_rows = []
+        
+        with self._jobs_lock:
+            jobs = list(self.tracking_jobs.items())
         
-        for interaction_id, job in list(self.tracking_jobs.items()):
+        for interaction_id, job in jobs:
             try:
                 elapsed = (datetime.now() - job['start_time']).total_seconds() / 60  # minutes
                 
-                # Get current price
-                current_price = self._get_current_price(job['symbol'])
+                current_price = prices.get(job['symbol'].upper())
                 if current_price is None:
                     continue
                 
-                # Update price tracking
-                job['price_history'].append(current_price)
-                job['min_price'] = min(job['min_price'], current_price)
-                job['max_price'] = max(job['max_price'], current_price)
+                # Update price tracking (bounded ring + running min/max)
+                window = job['prices']
+                window.add(current_price)
+                job['min_price'] = window.min
+                job['max_price'] = window.max
                 
                 # Check if level was breached
                 self._check_breach(job, current_price)
                 
                 # Record price at checkpoints
-                if elapsed >= 5 and 'price_5min' not in job['checkpoints']:
-                    job['checkpoints']['price_5min'] = current_price
-                    logger.info(f"   #{interaction_id} 5min: ${current_price:.2f} | Min: ${job['min_price']:.2f} | Max: ${job['max_price']:.2f}")
-                
-                if elapsed >= 15 and 'price_15min' not in job['checkpoints']:
-                    job['checkpoints']['price_15min'] = current_price
-                    logger.info(f"   #{interaction_id} 15min: ${current_price:.2f}")
-                
-                if elapsed >= 30 and 'price_30min' not in job['checkpoints']:
-                    job['checkpoints']['price_30min'] = current_price
-                    logger.info(f"   #{interaction_id} 30min: ${current_price:.2f}")
-                
-                if elapsed >= 60 and 'price_60min' not in job['checkpoints']:
-                    job['checkpoints']['price_60min'] = current_price
+                for name, minutes in self.CHECKPOINTS:
+                    if elapsed >= minutes and name not in job['checkpoints']:
+                        job['checkpoints'][name] = current_price
+                        checkpoint_rows.append((name, current_price, interaction_id))
+                        if minutes < 60:
+                            logger.info(f"   #{interaction_id} {minutes}min: ${current_price:.2f} | Min: ${job['min_price']:.2f} | Max: ${job['max_price']:.2f}")
                 
                 # Only try to determine outcome after MIN_TRACKING_TIME
                 if elapsed >= self.MIN_TRACKING_TIME:
@@ -161,10 +175,17 @@ class OutcomeTracker:
             except Exception as e:
                 logger.error(f"❌ Error checking job #{interaction_id}: {e}")
         
+        # Persist this cycle's checkpoints in one batched write
+        if checkpoint_rows:
+            try:
+                self.db.save_checkpoints(checkpoint_rows)
+            except Exception as e:
+                logger.error(f"❌ Checkpoint write failed: {e}")
+        
         # Remove completed jobs
-        for interaction_id in completed_ids:
-            if interaction_id in self.tracking_jobs:
-                del self.tracking_jobs[interaction_id]
+        with self._jobs_lock:
+            for interaction_id in completed_ids:
+                self.tracking_jobs.pop(interaction_id, None)
     
     def _check_breach(self, job: dict, current_price: float):
         """Check if the level has been breached."""
@@ -304,19 +325,10 @@ class OutcomeTracker:
             except Exception as e:
                 logger.error(f"❌ Outcome callback error: {e}")
     
-    def _get_current_price(self, symbol: str) -> Optional[float]:
-        """Get current price for a symbol."""
-        try:
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period='1d', interval='1m')
-            if not hist.empty:
-                return float(hist['Close'].iloc[-1])
-        except Exception as e:
-            logger.debug(f"Price fetch error for {symbol}: {e}")
-        return None
-    
     def get_active_jobs(self) -> Dict[int, dict]:
         """Get info on currently tracked interactions."""
+        with self._jobs_lock:
+            jobs = list(self.tracking_jobs.items())
         return {
             k: {
                 'symbol': v['symbol'],
@@ -328,5 +340,5 @@ class OutcomeTracker:
                 'level_breached': v['level_breached'],
                 'checkpoints': list(v['checkpoints'].keys())
             }
-            for k, v in self.tracking_jobs.items()
+            for k, v in jobs
         }
@@ -12,6 +12,7 @@ import yfinance as yf
 
 from .models import Battleground, LevelType
 from live_monitoring.enrichment.apis.stockgrid_client import StockgridClient
+from live_monitoring.agents.dp_learning.level_index import DPLevelIndex, default_level_index
 
 logger = logging.getLogger(__name__)
 
@@ -28,14 +29,18 @@ class BattlegroundAnalyzer:
     """
     
     MIN_VOLUME = 500_000  # Minimum volume to consider
+    HISTORY_TOLERANCE_PCT = 0.1  # Learned levels this close count as the same battleground
     
-    def __init__(self, api_key: str = None, dp_client: Optional[StockgridClient] = None):
+    def __init__(self, api_key: str = None, dp_client: Optional[StockgridClient] = None,
+                 level_index: Optional[DPLevelIndex] = None):
         """
         Args:
             api_key: Legacy/Ignored (Stockgrid is free)
             dp_client: StockgridClient instance
+            level_index: DP level index for learned bounce rates (default: dp_learning.db)
         """
         self.dp_client = dp_client or StockgridClient(cache_ttl=300)
+        self.level_index = level_index or default_level_index()
         self._cache: Dict[str, dict] = {}  # symbol -> {date, battlegrounds}
     
     def get_battlegrounds(
@@ -122,6 +127,13 @@ class BattlegroundAnalyzer:
                 bg.level_type = LevelType.SUPPORT
             else:
                 bg.level_type = LevelType.RESISTANCE
+            
+            # Learned outcome history around this level
+            if self.level_index is not None:
+                tol = bg.price * self.HISTORY_TOLERANCE_PCT / 100
+                bg.bounce_rate, bg.history_samples = self.level_index.zone_stats(
+                    bg.symbol, bg.price - tol, bg.price + tol
+                )
         
         # Sort by distance (closest first)
         battlegrounds.sort(key=lambda x: x.distance_pct)
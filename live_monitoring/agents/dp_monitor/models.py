@@ -51,6 +51,10 @@ class Battleground:
     distance_pct: Optional[float] = None
     current_price: Optional[float] = None
     
+    # Learned history at this level (DP level index)
+    bounce_rate: Optional[float] = None
+    history_samples: int = 0
+    
     @property
     def volume_tier(self) -> str:
         """Volume significance tier."""
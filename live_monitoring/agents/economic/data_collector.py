@@ -200,47 +200,80 @@ class EconomicDataCollector:
         Returns:
             Dict with spy_change_1hr, tlt_change_1hr, vix_change_1hr
         """
-        result = {
+        return self.fetch_market_reactions([date])[date]
+    
+    def fetch_market_reactions(self, dates: List[str]) -> Dict[str, Dict]:
+        """
+        Market reactions for many release dates from ONE daily download.
+        
+        SPY/TLT/VIX daily bars covering all dates are fetched in a single
+        yf.download call and each date is looked up in them.
+        
+        Returns:
+            {date: reaction dict as returned by fetch_market_reaction}
+        """
+        results = {date: self._empty_reaction() for date in dates}
+        if not dates:
+            return results
+        
+        try:
+            first = min(dates)
+            last = datetime.strptime(max(dates), '%Y-%m-%d') + timedelta(days=1)
+            
+            # Fetch daily data (more reliable than intraday)
+            data = yf.download(['SPY', 'TLT', '^VIX'], start=first, end=last.strftime('%Y-%m-%d'),
+                               group_by='ticker', progress=False)
+            if data.empty:
+                return results
+            frames = {symbol: data[symbol].dropna(how='all') for symbol in ('SPY', 'TLT', '^VIX')
+                      if symbol in data.columns.get_level_values(0)}
+            
+            for date in dates:
+                rows = {symbol: frame[frame.index.strftime('%Y-%m-%d') == date] for symbol, frame in frames.items()}
+                results[date] = self._reaction_from_daily(rows)
+        
+        except Exception as e:
+            logger.debug(f"Market reaction fetch error for {len(dates)} dates: {e}")
+        
+        return results
+    
+    @staticmethod
+    def _empty_reaction() -> Dict:
+        return {
             'spy_change_1hr': 0.0,
             'spy_change_24hr': 0.0,
             'tlt_change_1hr': 0.0,
             'vix_change_1hr': 0.0,
             'volume_spike': 1.0
         }
-        
-        try:
-            # Parse date
-            release_date = datetime.strptime(date, '%Y-%m-%d')
-            next_day = release_date + timedelta(days=1)
-            
-            # Fetch daily data (more reliable than intraday)
-            spy = yf.download('SPY', start=date, end=next_day.strftime('%Y-%m-%d'), progress=False)
-            tlt = yf.download('TLT', start=date, end=next_day.strftime('%Y-%m-%d'), progress=False)
-            vix = yf.download('^VIX', start=date, end=next_day.strftime('%Y-%m-%d'), progress=False)
-            
-            if not spy.empty and len(spy) > 0:
-                # Calculate intraday move (open to close as proxy for 1hr)
-                open_price = float(spy['Open'].iloc[0])
-                close_price = float(spy['Close'].iloc[0])
-                result['spy_change_1hr'] = float((close_price - open_price) / open_price * 100) if open_price > 0 else 0.0
-                
-                # Volume spike
-                avg_vol = float(spy['Volume'].mean()) if len(spy) > 0 else 1.0
-                vol = float(spy['Volume'].iloc[0])
-                result['volume_spike'] = float(vol / avg_vol) if avg_vol > 0 else 1.0
-            
-            if not tlt.empty and len(tlt) > 0:
-                open_price = float(tlt['Open'].iloc[0])
-                close_price = float(tlt['Close'].iloc[0])
-                result['tlt_change_1hr'] = float((close_price - open_price) / open_price * 100) if open_price > 0 else 0.0
-            
-            if not vix.empty and len(vix) > 0:
-                open_price = float(vix['Open'].iloc[0])
-                close_price = float(vix['Close'].iloc[0])
-                result['vix_change_1hr'] = float(close_price - open_price)  # VIX in points
+    
+    def _reaction_from_daily(self, rows: Dict) -> Dict:
+        """Reaction dict from the release day's daily bar per symbol."""
+        result = self._empty_reaction()
+        
+        spy = rows.get('SPY')
+        if spy is not None and not spy.empty:
+            # Calculate intraday move (open to close as proxy for 1hr)
+            open_price = float(spy['Open'].iloc[0])
+            close_price = float(spy['Close'].iloc[0])
+            result['spy_change_1hr'] = float((close_price - open_price) / open_price * 100) if open_price > 0 else 0.0
             
-        except Exception as e:
-            logger.debug(f"Market reaction fetch error for {date}: {e}")
+            # Volume spike
+            avg_vol = float(spy['Volume'].mean()) if len(spy) > 0 else 1.0
+            vol = float(spy['Volume'].iloc[0])
+            result['volume_spike'] = float(vol / avg_vol) if avg_vol > 0 else 1.0
+        
+        tlt = rows.get('TLT')
+        if tlt is not None and not tlt.empty:
+            open_price = float(tlt['Open'].iloc[0])
+            close_price = float(tlt['Close'].iloc[0])
+            result['tlt_change_1hr'] = float((close_price - open_price) / open_price * 100) if open_price > 0 else 0.0
+        
+        vix = rows.get('^VIX')
+        if vix is not None and not vix.empty:
+            open_price = float(vix['Open'].iloc[0])
+            close_price = float(vix['Close'].iloc[0])
+            result['vix_change_1hr'] = float(close_price - open_price)  # VIX in points
         
         return result
     
@@ -248,16 +281,14 @@ class EconomicDataCollector:
         """
         Enrich releases with market reaction data.
         
-        This is expensive (one API call per release) so use sparingly!
+        All release dates share one daily download (fetch_market_reactions).
         """
-        enriched = []
-        total = len(releases)
+        reactions = self.fetch_market_reactions(sorted({release.date for release in releases}))
+        logger.info(f"   Enriching market data: {len(releases)} releases, {len(reactions)} dates")
         
-        for i, release in enumerate(releases):
-            if (i + 1) % 10 == 0:
-                logger.info(f"   Enriching market data: {i+1}/{total}")
-            
-            market = self.fetch_market_reaction(release.date, release.time)
+        enriched = []
+        for release in releases:
+            market = reactions[release.date]
             
             release.spy_change_1hr = market['spy_change_1hr']
             release.spy_change_24hr = market.get('spy_change_24hr', 0)
@@ -311,13 +311,15 @@ class EconomicIntelligenceEngine:
         # Save
         self.db.save_release(release)
         
-        # Re-learn pattern for this type
-        releases = self.db.get_releases_by_type(event_type_enum)
-        if len(releases) >= 5:
-            pattern = self.learner.learn_pattern(releases)
-            if pattern:
-                self.db.save_pattern(pattern)
-                self.predictor.patterns[event_type_enum.value] = pattern
+        # Update pattern for this type: fold into the fitted model if we have
+        # one, otherwise learn it from history once
+        if self.learner.has_model(event_type_enum):
+            pattern = self.learner.add_release(release)
+        else:
+            pattern = self.learner.learn_pattern(self.db.get_releases_by_type(event_type_enum))
+        if pattern:
+            self.db.save_pattern(pattern)
+            self.predictor.patterns[event_type_enum.value] = pattern
         
         logger.info(f"📊 Recorded: {event_type_enum.value} = {actual} (forecast: {forecast})")
         logger.info(f"   Fed Watch: {fed_watch_before}% → {fed_watch_after}% ({fed_watch_after - fed_watch_before:+.1f}%)")
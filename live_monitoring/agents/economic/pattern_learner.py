@@ -6,21 +6,26 @@ Statistical learning engine that discovers patterns between:
 - Context factors (FOMC proximity, VIX, DP signals) and impact magnitude
 
 Uses simple but robust methods:
-- Linear regression for base relationships
-- Correlation analysis for context multipliers
+- One least-squares fit per event type for the base slope and the
+  context interactions (see regression.py)
+- Incremental updates from sufficient statistics as releases arrive
 - Cross-validation for model quality
 """
 
 import logging
-import statistics
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional
 from datetime import datetime
 
 from .models import EconomicRelease, LearnedPattern, EventType
+from .regression import RegressionFit, RegressionModel, build_models, fit_models
 
 logger = logging.getLogger(__name__)
 
 
+def _event_key(release: EconomicRelease) -> str:
+    return release.event_type.value if isinstance(release.event_type, EventType) else str(release.event_type)
+
+
 class PatternLearner:
     """
     Learns patterns from historical economic data.
@@ -31,7 +36,13 @@ class PatternLearner:
     - Context multipliers: FOMC proximity, VIX level, DP confirmation
     """
     
+    RELEASE_WINDOW = 100  # Most recent releases each event type is fit on (get_releases_by_type)
+    
     def __init__(self):
+        # Per event type sufficient statistics, kept for incremental updates,
+        # and the releases behind them (newest first)
+        self.models: Dict[str, RegressionModel] = {}
+        self.windows: Dict[str, List[EconomicRelease]] = {}
         logger.info("🧠 PatternLearner initialized")
     
     def learn_pattern(self, releases: List[EconomicRelease]) -> Optional[LearnedPattern]:
@@ -44,222 +55,105 @@ class PatternLearner:
         Returns:
             LearnedPattern or None if not enough data
         """
-        if len(releases) < 5:
-            logger.warning(f"Not enough data ({len(releases)} < 5)")
+        if not releases:
+            logger.warning("Not enough data (0 < 5)")
             return None
         
-        # Filter for releases with Fed Watch data
-        valid = [r for r in releases if r.fed_watch_shift_1hr != 0 and r.surprise_sigma != 0]
-        
-        if len(valid) < 3:
-            logger.warning(f"Not enough valid data ({len(valid)} < 3)")
-            return None
-        
-        event_type = valid[0].event_type
-        
-        # Calculate base impact (Fed Watch shift per σ surprise)
-        base_impact, r_squared = self._calc_base_impact(valid)
-        
-        # Calculate FOMC proximity boost
-        fomc_boost = self._calc_fomc_boost(valid)
+        key = _event_key(releases[0])
+        self.windows[key] = sorted(releases, key=lambda r: r.date, reverse=True)
+        model = self.models[key] = build_models(releases, key=lambda r: key)[key]
+        return self._to_pattern(releases[0].event_type, model, model.fit())
+    
+    def add_release(self, release: EconomicRelease) -> Optional[LearnedPattern]:
+        """
+        Fold one new release into an already-learned event type and refit.
         
-        # Calculate high VIX multiplier
-        vix_mult = self._calc_vix_multiplier(valid)
+        Only updates the sufficient statistics - no history reload. Call
+        learn_pattern first for event types that have no model yet.
         
-        # Calculate DP confirmation boost
-        dp_boost = self._calc_dp_boost(valid)
+        Mirrors the database: a release re-recorded for the same date
+        replaces the earlier one, and only the RELEASE_WINDOW most recent
+        releases are kept (older ones are taken back out of the model).
+        """
+        key = _event_key(release)
+        window, model = self.windows[key], self.models[key]
+        for i, r in enumerate(window):
+            if r.date == release.date:
+                model.discard(window.pop(i))
+                break
+        if len(window) < self.RELEASE_WINDOW or release.date >= window[-1].date:
+            # Newest first; a release dated like existing ones goes ahead of them
+            at = next((i for i, r in enumerate(window) if r.date <= release.date), len(window))
+            window.insert(at, release)
+            model.add(release)
+            while len(window) > self.RELEASE_WINDOW:
+                model.discard(window.pop())
+        return self._to_pattern(release.event_type, model, model.fit())
+    
+    def has_model(self, event_type) -> bool:
+        key = event_type.value if isinstance(event_type, EventType) else str(event_type)
+        return key in self.models
+    
+    def _to_pattern(self, event_type, model: RegressionModel, fit: RegressionFit) -> Optional[LearnedPattern]:
+        """Apply the minimum-data rules and turn a fit into a LearnedPattern."""
+        if model.release_count < 5:
+            logger.warning(f"Not enough data ({model.release_count} < 5)")
+            return None
         
-        # Calculate mean absolute error
-        mae = self._calc_mae(valid, base_impact)
+        if fit.sample_count < 3:
+            logger.warning(f"Not enough valid data ({fit.sample_count} < 3)")
+            return None
         
         pattern = LearnedPattern(
             event_type=event_type,
-            base_impact=round(base_impact, 3),
+            base_impact=round(fit.base_impact, 3),
             surprise_scaling=1.0,  # Linear for now
-            fomc_proximity_boost=round(fomc_boost, 3),
-            high_vix_multiplier=round(vix_mult, 3),
-            dp_confirmation_boost=round(dp_boost, 3),
-            sample_count=len(valid),
-            r_squared=round(r_squared, 3),
-            mean_absolute_error=round(mae, 3),
+            fomc_proximity_boost=round(fit.fomc_boost, 3),
+            high_vix_multiplier=round(fit.vix_multiplier, 3),
+            dp_confirmation_boost=round(fit.dp_boost, 3),
+            sample_count=fit.sample_count,
+            r_squared=round(fit.r_squared, 3),
+            mean_absolute_error=round(fit.mae, 3),
             last_updated=datetime.now().isoformat()
         )
         
         logger.info(f"🧠 Learned pattern for {event_type}:")
-        logger.info(f"   Base impact: {base_impact:+.2f}% per σ")
-        logger.info(f"   FOMC boost: {fomc_boost:+.1%}")
-        logger.info(f"   VIX multiplier: {vix_mult:.2f}x")
-        logger.info(f"   DP boost: {dp_boost:+.1%}")
-        logger.info(f"   R²: {r_squared:.3f} | MAE: {mae:.2f}%")
-        logger.info(f"   Samples: {len(valid)}")
+        logger.info(f"   Base impact: {fit.base_impact:+.2f}% per σ")
+        logger.info(f"   FOMC boost: {fit.fomc_boost:+.1%}")
+        logger.info(f"   VIX multiplier: {fit.vix_multiplier:.2f}x")
+        logger.info(f"   DP boost: {fit.dp_boost:+.1%}")
+        logger.info(f"   R²: {fit.r_squared:.3f} | MAE: {fit.mae:.2f}%")
+        logger.info(f"   Samples: {fit.sample_count}")
         
         return pattern
     
-    def _calc_base_impact(self, releases: List[EconomicRelease]) -> Tuple[float, float]:
-        """
-        Calculate base impact coefficient using linear regression.
-        
-        Returns:
-            (base_impact, r_squared)
-        """
-        x = [r.surprise_sigma for r in releases]
-        y = [r.fed_watch_shift_1hr for r in releases]
-        
-        # Simple linear regression: y = a*x + b
-        # We want slope (a) = base impact
-        
-        n = len(x)
-        sum_x = sum(x)
-        sum_y = sum(y)
-        sum_xy = sum(xi * yi for xi, yi in zip(x, y))
-        sum_xx = sum(xi * xi for xi in x)
-        
-        # Calculate slope
-        denom = n * sum_xx - sum_x * sum_x
-        if denom == 0:
-            return 0, 0
-        
-        slope = (n * sum_xy - sum_x * sum_y) / denom
-        
-        # Calculate R²
-        mean_y = sum_y / n
-        ss_tot = sum((yi - mean_y) ** 2 for yi in y)
-        
-        intercept = (sum_y - slope * sum_x) / n
-        predictions = [slope * xi + intercept for xi in x]
-        ss_res = sum((yi - pi) ** 2 for yi, pi in zip(y, predictions))
-        
-        r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
-        r_squared = max(0, r_squared)
-        
-        return slope, r_squared
-    
-    def _calc_fomc_boost(self, releases: List[EconomicRelease]) -> float:
-        """
-        Calculate how much impact increases near FOMC meetings.
-        """
-        near_fomc = [r for r in releases if r.days_to_fomc < 7]
-        far_fomc = [r for r in releases if r.days_to_fomc >= 14]
-        
-        if not near_fomc or not far_fomc:
-            return 0.0
-        
-        # Calculate average impact per σ for each group
-        near_impacts = [abs(r.fed_watch_shift_1hr / r.surprise_sigma) 
-                       for r in near_fomc if r.surprise_sigma != 0]
-        far_impacts = [abs(r.fed_watch_shift_1hr / r.surprise_sigma) 
-                      for r in far_fomc if r.surprise_sigma != 0]
-        
-        if not near_impacts or not far_impacts:
-            return 0.0
-        
-        near_avg = statistics.mean(near_impacts)
-        far_avg = statistics.mean(far_impacts)
-        
-        # Boost = how much bigger near-FOMC impact is
-        boost = (near_avg / far_avg) - 1 if far_avg != 0 else 0
-        
-        return max(0, min(boost, 2.0))  # Cap at 200% boost
-    
-    def _calc_vix_multiplier(self, releases: List[EconomicRelease]) -> float:
-        """
-        Calculate how much impact increases when VIX is high (>20).
-        """
-        high_vix = [r for r in releases if r.vix_level > 20]
-        low_vix = [r for r in releases if r.vix_level <= 20]
-        
-        if not high_vix or not low_vix:
-            return 1.0
-        
-        high_impacts = [abs(r.fed_watch_shift_1hr / r.surprise_sigma) 
-                       for r in high_vix if r.surprise_sigma != 0]
-        low_impacts = [abs(r.fed_watch_shift_1hr / r.surprise_sigma) 
-                      for r in low_vix if r.surprise_sigma != 0]
-        
-        if not high_impacts or not low_impacts:
-            return 1.0
-        
-        high_avg = statistics.mean(high_impacts)
-        low_avg = statistics.mean(low_impacts)
-        
-        mult = high_avg / low_avg if low_avg != 0 else 1.0
-        
-        return max(0.5, min(mult, 2.5))  # Bound between 0.5x and 2.5x
-    
-    def _calc_dp_boost(self, releases: List[EconomicRelease]) -> float:
-        """
-        Calculate boost when Dark Pool data confirms the direction.
-        
-        Confirmation = DP buy ratio > 0.55 and surprise > 0 (both bullish)
-                    OR DP buy ratio < 0.45 and surprise < 0 (both bearish)
-        """
-        confirmed = []
-        unconfirmed = []
-        
-        for r in releases:
-            if r.dp_buy_ratio_before == 0.5:  # No DP data
-                continue
-            
-            # Check if DP confirms direction
-            dp_bullish = r.dp_buy_ratio_before > 0.55
-            dp_bearish = r.dp_buy_ratio_before < 0.45
-            surprise_positive = r.surprise_sigma > 0
-            surprise_negative = r.surprise_sigma < 0
-            
-            is_confirmed = (dp_bullish and surprise_positive) or (dp_bearish and surprise_negative)
-            
-            impact = abs(r.fed_watch_shift_1hr / r.surprise_sigma) if r.surprise_sigma != 0 else 0
-            
-            if is_confirmed:
-                confirmed.append(impact)
-            else:
-                unconfirmed.append(impact)
-        
-        if not confirmed or not unconfirmed:
-            return 0.0
-        
-        conf_avg = statistics.mean(confirmed)
-        unconf_avg = statistics.mean(unconfirmed)
-        
-        boost = (conf_avg / unconf_avg) - 1 if unconf_avg != 0 else 0
-        
-        return max(0, min(boost, 1.0))  # Cap at 100% boost
-    
-    def _calc_mae(self, releases: List[EconomicRelease], base_impact: float) -> float:
-        """
-        Calculate Mean Absolute Error of predictions.
-        """
-        errors = []
-        
-        for r in releases:
-            predicted = base_impact * r.surprise_sigma
-            actual = r.fed_watch_shift_1hr
-            errors.append(abs(actual - predicted))
-        
-        return statistics.mean(errors) if errors else 0
-    
     def learn_all_patterns(self, releases: List[EconomicRelease]) -> Dict[str, LearnedPattern]:
         """
         Learn patterns for all event types in the data.
         
+        Releases are loaded into arrays once and every event type is solved
+        in the same batched least-squares step.
+        
         Args:
             releases: List of all releases
         
         Returns:
             Dict mapping event_type to LearnedPattern
         """
-        # Group by event type
-        by_type = {}
+        models = build_models(releases, key=_event_key)
+        # Fit on the whole history; incremental models are windowed, so the
+        # next add_release for these types relearns from get_releases_by_type
+        for key in models:
+            self.models.pop(key, None)
+            self.windows.pop(key, None)
+        
+        event_types = {}
         for r in releases:
-            key = r.event_type.value if isinstance(r.event_type, EventType) else str(r.event_type)
-            if key not in by_type:
-                by_type[key] = []
-            by_type[key].append(r)
+            event_types.setdefault(_event_key(r), r.event_type)
         
-        # Learn pattern for each type
         patterns = {}
-        for event_type, type_releases in by_type.items():
-            pattern = self.learn_pattern(type_releases)
+        for (event_type, model), fit in zip(models.items(), fit_models(models.values())):
+            pattern = self._to_pattern(event_types[event_type], model, fit)
             if pattern:
                 patterns[event_type] = pattern
         
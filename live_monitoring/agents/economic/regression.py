@@ -0,0 +1,186 @@
+"""
+Economic Intelligence - Least-Squares Backend
+
+Fits every pattern coefficient in one multivariate regression per event type:
+
+    shift = a + s * (base + fomc * near_fomc + vix * high_vix + dp * dp_confirmed)
+
+where s is the surprise in σ and the context flags are the same splits the
+learner always used (FOMC < 7 days, VIX > 20, DP buy ratio > 0.55 / < 0.45
+agreeing with the surprise sign). The interaction slopes are turned back into
+the LearnedPattern boosts/multipliers the predictor applies.
+
+Each event type keeps sufficient statistics (XᵀX, Xᵀy, yᵀy), so:
+- a new release is folded in with a rank-one update instead of a refit
+  (and one leaving a rolling window is taken out with a rank-one downdate)
+- all event types are solved together as one stacked pseudo-inverse
+- R² comes straight from the statistics; MAE is one vectorized pass
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+FEATURES = ("intercept", "surprise", "surprise_near_fomc", "surprise_high_vix", "surprise_dp_confirmed")
+K = len(FEATURES)
+
+
+def release_arrays(releases: Sequence, shift_attr: str = "fed_watch_shift_1hr") -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Design rows for a list of releases.
+
+    Works for both release models: context fields missing from a model
+    (VIX, DP) leave their interaction column at zero.
+
+    Returns:
+        (X, y, valid) - valid marks releases with a shift and a surprise
+    """
+    n = len(releases)
+    s = np.fromiter((r.surprise_sigma or 0.0 for r in releases), dtype=float, count=n)
+    y = np.fromiter((getattr(r, shift_attr) or 0.0 for r in releases), dtype=float, count=n)
+    days = np.fromiter((r.days_to_fomc for r in releases), dtype=float, count=n)
+    vix = np.fromiter((getattr(r, "vix_level", 0.0) or 0.0 for r in releases), dtype=float, count=n)
+    dp = np.fromiter((getattr(r, "dp_buy_ratio_before", 0.5) for r in releases), dtype=float, count=n)
+
+    dp_confirmed = ((dp > 0.55) & (s > 0)) | ((dp < 0.45) & (s < 0))
+    X = np.column_stack([np.ones(n), s, s * (days < 7), s * (vix > 20), s * dp_confirmed])
+    return X, y, (y != 0) & (s != 0)
+
+
+@dataclass
+class RegressionFit:
+    """Solved coefficients for one event type."""
+    coef: np.ndarray
+    sample_count: int
+    r_squared: float
+    mae: float
+
+    @property
+    def base_impact(self) -> float:
+        return float(self.coef[1])
+
+    def _relative(self, column: int) -> Optional[float]:
+        return float(self.coef[column] / self.coef[1]) if self.coef[1] != 0 else None
+
+    @property
+    def fomc_boost(self) -> float:
+        boost = self._relative(2)
+        return max(0.0, min(boost, 2.0)) if boost is not None else 0.0  # Cap at 200% boost
+
+    @property
+    def vix_multiplier(self) -> float:
+        extra = self._relative(3)
+        return max(0.5, min(1 + extra, 2.5)) if extra is not None else 1.0  # Bound between 0.5x and 2.5x
+
+    @property
+    def dp_boost(self) -> float:
+        boost = self._relative(4)
+        return max(0.0, min(boost, 1.0)) if boost is not None else 0.0  # Cap at 100% boost
+
+
+class RegressionModel:
+    """Sufficient statistics (and rows, for MAE) for one event type."""
+
+    def __init__(self):
+        self.xtx = np.zeros((K, K))
+        self.xty = np.zeros(K)
+        self.yty = 0.0
+        self.release_count = 0          # All releases seen, valid or not
+        self.X = np.empty((0, K))
+        self.y = np.empty(0)
+
+    @property
+    def n(self) -> int:
+        return len(self.y)
+
+    def extend(self, X: np.ndarray, y: np.ndarray, release_count: int):
+        """Add valid rows (and the number of releases they came from)."""
+        self.xtx += X.T @ X
+        self.xty += X.T @ y
+        self.yty += float(y @ y)
+        self.release_count += release_count
+        self.X = np.vstack([self.X, X])
+        self.y = np.concatenate([self.y, y])
+
+    def add(self, release, shift_attr: str = "fed_watch_shift_1hr"):
+        """Fold in one new release (rank-one update; invalid releases only bump the count)."""
+        X, y, valid = release_arrays([release], shift_attr)
+        self.extend(X[valid], y[valid], 1)
+
+    def discard(self, release, shift_attr: str = "fed_watch_shift_1hr"):
+        """Take one release back out (rank-one downdate), e.g. when it leaves a rolling window."""
+        X, y, valid = release_arrays([release], shift_attr)
+        self.release_count -= 1
+        if not valid[0]:
+            return
+        self.xtx -= np.outer(X[0], X[0])
+        self.xty -= X[0] * y[0]
+        self.yty -= float(y[0] ** 2)
+        match = np.flatnonzero((self.X == X[0]).all(axis=1) & (self.y == y[0]))
+        if len(match):
+            self.X = np.delete(self.X, match[0], axis=0)
+            self.y = np.delete(self.y, match[0])
+
+    def fit(self) -> RegressionFit:
+        return fit_models([self])[0]
+
+
+def build_models(releases: Sequence, key: Callable[[object], str],
+                 shift_attr: str = "fed_watch_shift_1hr") -> Dict[str, RegressionModel]:
+    """Load releases into arrays once and split the statistics by event type."""
+    if not releases:
+        return {}
+    X, y, valid = release_arrays(releases, shift_attr)
+    names, group = np.unique(np.array([str(key(r)) for r in releases]), return_inverse=True)
+
+    counts = np.bincount(group, minlength=len(names))
+    xtx = np.zeros((len(names), K, K))
+    xty = np.zeros((len(names), K))
+    yty = np.bincount(group[valid], weights=y[valid] ** 2, minlength=len(names))
+    np.add.at(xtx, group[valid], X[valid, :, None] * X[valid, None, :])
+    np.add.at(xty, group[valid], X[valid] * y[valid, None])
+
+    models = {}
+    for g, name in enumerate(names):
+        model = RegressionModel()
+        rows = valid & (group == g)
+        model.xtx, model.xty, model.yty = xtx[g], xty[g], float(yty[g])
+        model.release_count = int(counts[g])
+        model.X, model.y = X[rows], y[rows]
+        models[str(name)] = model
+    return models
+
+
+def fit_models(models: Iterable[RegressionModel]) -> List[RegressionFit]:
+    """
+    Solve every model in one stacked least-squares step.
+
+    Uses the pseudo-inverse of XᵀX, so a sample too small for every column
+    gets the minimum-norm solution rather than a singular system.
+    """
+    models = list(models)
+    if not models:
+        return []
+    xtx = np.stack([m.xtx for m in models])
+    xty = np.stack([m.xty for m in models])
+    yty = np.array([m.yty for m in models])
+    n = np.array([m.n for m in models], dtype=float)
+
+    # A context slope is only identified when the context splits the sample
+    # (some releases with the flag, some without) - otherwise leave it at zero
+    diag = np.diagonal(xtx, axis1=1, axis2=2)
+    keep = np.ones_like(diag, dtype=bool)
+    keep[:, 2:] = (diag[:, 2:] > 0) & (diag[:, 2:] < diag[:, 1:2] * (1 - 1e-9))
+    gram = np.where(keep[:, :, None] & keep[:, None, :], xtx, 0.0)
+    coef = (np.linalg.pinv(gram, hermitian=True) @ np.where(keep, xty, 0.0)[..., None])[..., 0]
+
+    ss_res = yty - 2 * np.einsum("gk,gk->g", coef, xty) + np.einsum("gk,gkj,gj->g", coef, xtx, coef)
+    ss_tot = yty - np.divide(xty[:, 0] ** 2, n, out=np.zeros_like(n), where=n > 0)
+    r_squared = np.where(ss_tot > 1e-12, 1 - np.maximum(ss_res, 0) / np.maximum(ss_tot, 1e-12), 0.0)
+
+    fits = []
+    for m, c, r2 in zip(models, coef, r_squared):
+        mae = float(np.mean(np.abs(m.y - m.X @ c))) if m.n else 0.0
+        fits.append(RegressionFit(coef=c, sample_count=m.n, r_squared=float(max(r2, 0.0)), mae=mae))
+    return fits
@@ -24,6 +24,8 @@ import statistics
 # Add parent paths
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from live_monitoring.agents.economic.regression import RegressionFit, RegressionModel, build_models, fit_models
+
 logger = logging.getLogger(__name__)
 
 
@@ -366,77 +368,114 @@ class PatternLearner:
     - FOMC proximity boost (extra impact when close to FOMC)
     """
     
+    EVENT_TYPES = [
+        "nonfarm payrolls", "unemployment", "cpi", "core cpi",
+        "ppi", "pce", "core pce", "retail sales", "gdp",
+        "ism manufacturing", "initial jobless claims"
+    ]
+    
+    RELEASE_WINDOW = 100  # Most recent releases each event type is fit on
+    
     def __init__(self, db: EconomicDatabase):
         self.db = db
+        # Per event type sufficient statistics, kept for incremental updates,
+        # and the releases in each model's window (newest first)
+        self.models: Dict[str, RegressionModel] = {}
+        self.windows: Dict[str, List[EconomicRelease]] = {}
         logger.info("🧠 PatternLearner initialized")
     
     def learn_pattern(self, event_type: str) -> Optional[LearnedPattern]:
         """
         Learn pattern for an event type from historical data.
         
-        Uses simple linear regression:
-        fed_watch_shift = base_impact * surprise_sigma * fomc_multiplier
+        Least-squares fit (see economic/regression.py):
+        fed_watch_shift = a + surprise_sigma * (base_impact + fomc_term * near_fomc)
         """
-        releases = self.db.get_releases_by_event(event_type, limit=100)
-        
-        if len(releases) < 5:
-            logger.warning(f"Not enough data for {event_type} (only {len(releases)} releases)")
-            return None
-        
-        # Filter releases with valid Fed Watch data
-        valid_releases = [
-            r for r in releases 
-            if r.fed_watch_shift != 0 and r.surprise_sigma != 0
-        ]
-        
-        if len(valid_releases) < 3:
-            logger.warning(f"Not enough valid data for {event_type}")
-            return None
-        
-        # Calculate correlations
-        surprises = [r.surprise_sigma for r in valid_releases]
-        shifts = [r.fed_watch_shift for r in valid_releases]
-        fomc_days = [r.days_to_fomc for r in valid_releases]
-        
-        # Simple regression: shift = base * surprise
-        # Base impact = average shift per unit surprise
-        base_impacts = [s / (su + 0.001) for s, su in zip(shifts, surprises) if abs(su) > 0.3]
-        base_impact = statistics.mean(base_impacts) if base_impacts else 0
+        key = event_type.lower()
+        self._load(key)
+        return self._save_pattern(key, self.models[key], self.models[key].fit())
+    
+    def add_release(self, release: EconomicRelease) -> Optional[LearnedPattern]:
+        """
+        Fold one new release into every model whose event type matches it and
+        refit from the sufficient statistics.
         
-        # Calculate how impact varies with FOMC proximity
-        # Near FOMC (< 7 days): should see bigger moves
-        near_fomc = [(s, su) for s, su, d in zip(shifts, surprises, fomc_days) if d < 7]
-        far_fomc = [(s, su) for s, su, d in zip(shifts, surprises, fomc_days) if d >= 14]
+        Matching and windowing follow learn_pattern's query: a model for
+        "cpi" takes any release whose name contains "cpi" (so "Core CPI"
+        too), and keeps only its RELEASE_WINDOW most recent releases.
         
-        near_avg = statistics.mean([s/su for s, su in near_fomc if abs(su) > 0.3]) if near_fomc else base_impact
-        far_avg = statistics.mean([s/su for s, su in far_fomc if abs(su) > 0.3]) if far_fomc else base_impact
+        Returns the pattern for the release's own event name, learned from
+        history if there is no model for it yet.
+        """
+        name = release.event_name.lower()
+        own = None
+        for key in [key for key in self.models if key in name]:
+            pattern = self._fold(key, release)
+            if key == name:
+                own = pattern
+        if name not in self.models:
+            own = self.learn_pattern(release.event_name)
+        return own
+    
+    def learn_all_patterns(self) -> Dict[str, LearnedPattern]:
+        """Learn patterns for all major event types (one batched solve)."""
+        for event_type in self.EVENT_TYPES:
+            self._load(event_type)
         
-        fomc_boost = (near_avg / far_avg) - 1 if far_avg != 0 else 0
-        fomc_boost = max(0, min(fomc_boost, 2))  # Cap at 200% boost
+        fits = fit_models(self.models[event_type] for event_type in self.EVENT_TYPES)
         
-        # Calculate surprise multiplier (how impact scales)
-        # For now, assume linear scaling
-        surprise_multiplier = 1.0
+        patterns = {}
+        for event_type, fit in zip(self.EVENT_TYPES, fits):
+            pattern = self._save_pattern(event_type, self.models[event_type], fit)
+            if pattern:
+                patterns[event_type] = pattern
         
-        # Calculate R² (how well model fits)
-        predictions = [base_impact * s for s in surprises]
-        ss_res = sum((a - p) ** 2 for a, p in zip(shifts, predictions))
-        ss_tot = sum((s - statistics.mean(shifts)) ** 2 for s in shifts)
-        r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
-        r_squared = max(0, r_squared)
+        return patterns
+    
+    def _load(self, key: str):
+        releases = self.db.get_releases_by_event(key, limit=self.RELEASE_WINDOW)
+        self.windows[key] = releases
+        self.models[key] = self._build_model(releases)
+    
+    def _fold(self, key: str, release: EconomicRelease) -> Optional[LearnedPattern]:
+        """Add a release to one model's window, evicting the oldest past RELEASE_WINDOW."""
+        window, model = self.windows[key], self.models[key]
+        # The database keeps one row per (date, event_name): a re-recorded release replaces it
+        for i, r in enumerate(window):
+            if (r.date, r.event_name) == (release.date, release.event_name):
+                model.discard(window.pop(i), shift_attr="fed_watch_shift")
+                break
+        if len(window) < self.RELEASE_WINDOW or release.date >= window[-1].date:
+            # Newest first; a release dated like existing ones goes ahead of them
+            at = next((i for i, r in enumerate(window) if r.date <= release.date), len(window))
+            window.insert(at, release)
+            model.add(release, shift_attr="fed_watch_shift")
+            if len(window) > self.RELEASE_WINDOW:
+                model.discard(window.pop(), shift_attr="fed_watch_shift")
+        return self._save_pattern(key, model, model.fit())
+    
+    @staticmethod
+    def _build_model(releases: List[EconomicRelease]) -> RegressionModel:
+        # Releases for an event type match by name, so one group per call
+        return build_models(releases, key=lambda r: "", shift_attr="fed_watch_shift").get("", RegressionModel())
+    
+    def _save_pattern(self, event_type: str, model: RegressionModel, fit: RegressionFit) -> Optional[LearnedPattern]:
+        if model.release_count < 5:
+            logger.warning(f"Not enough data for {event_type} (only {model.release_count} releases)")
+            return None
         
-        # Average prediction error
-        errors = [abs(a - p) for a, p in zip(shifts, predictions)]
-        avg_error = statistics.mean(errors) if errors else 0
+        if fit.sample_count < 3:
+            logger.warning(f"Not enough valid data for {event_type}")
+            return None
         
         pattern = LearnedPattern(
-            event_type=event_type.lower(),
-            base_impact=round(base_impact, 3),
-            surprise_multiplier=round(surprise_multiplier, 3),
-            fomc_proximity_boost=round(fomc_boost, 3),
-            sample_count=len(valid_releases),
-            r_squared=round(r_squared, 3),
-            avg_prediction_error=round(avg_error, 3),
+            event_type=event_type,
+            base_impact=round(fit.base_impact, 3),
+            surprise_multiplier=1.0,  # Linear scaling for now
+            fomc_proximity_boost=round(fit.fomc_boost, 3),
+            sample_count=fit.sample_count,
+            r_squared=round(fit.r_squared, 3),
+            avg_prediction_error=round(fit.mae, 3),
             last_5_predictions=[],
             last_updated=datetime.now().isoformat()
         )
@@ -451,22 +490,6 @@ class PatternLearner:
         logger.info(f"   Samples: {pattern.sample_count}")
         
         return pattern
-    
-    def learn_all_patterns(self) -> Dict[str, LearnedPattern]:
-        """Learn patterns for all major event types."""
-        event_types = [
-            "nonfarm payrolls", "unemployment", "cpi", "core cpi",
-            "ppi", "pce", "core pce", "retail sales", "gdp",
-            "ism manufacturing", "initial jobless claims"
-        ]
-        
-        patterns = {}
-        for event_type in event_types:
-            pattern = self.learn_pattern(event_type)
-            if pattern:
-                patterns[event_type] = pattern
-        
-        return patterns
 
 
 # ========================================================================================
@@ -865,8 +888,8 @@ class EconomicLearningEngine:
         
         self.db.save_release(release)
         
-        # Re-learn pattern with new data
-        self.learner.learn_pattern(event_name)
+        # Update pattern with new data
+        self.learner.add_release(release)
         
         logger.info(f"📊 Recorded release: {event_name} = {actual} (forecast: {forecast})")
         logger.info(f"   Fed Watch: {fed_watch_before}% → {fed_watch_after}% ({release.fed_watch_shift:+.1f}%)")
@@ -219,6 +219,12 @@ class FedOfficialsDatabase:
             except sqlite3.OperationalError:
                 pass  # Column already exists — safe to ignore
         
+        # 4hr moves resolve less often than 1hr ones — count them separately
+        try:
+            cursor.execute("ALTER TABLE market_impact_patterns ADD COLUMN sample_count_4hr INTEGER")
+        except sqlite3.OperationalError:
+            pass  # Column already exists — safe to ignore
+        
         conn.commit()
         conn.close()
         logger.info(f"📊 Fed Officials & Hidden Layers DB initialized: {self.db_path}")
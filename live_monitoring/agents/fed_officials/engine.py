@@ -157,18 +157,16 @@ class FedOfficialsEngine:
         This is the loop that makes ImpactLearner real, not theater.
         """
         try:
+            from datetime import datetime, timedelta
             recent = self.db.get_recent_comments(hours=24, limit=20)
-            for comment in recent:
-                # Only learn from comments older than 4 hours
-                if hasattr(comment, 'timestamp') and comment.timestamp:
-                    from datetime import datetime, timedelta
-                    age = datetime.now() - comment.timestamp
-                    if age > timedelta(hours=4):
-                        self.impact_learner.learn_from_outcome(
-                            comment_id=getattr(comment, 'id', 0) or 0,
-                            official_name=comment.official_name,
-                            sentiment=comment.sentiment,
-                        )
+            # Only learn from comments older than 4 hours; measured as one batch
+            ready = [
+                (getattr(comment, 'id', 0) or 0, comment.official_name, comment.sentiment)
+                for comment in recent
+                if getattr(comment, 'timestamp', None)
+                and datetime.now() - comment.timestamp > timedelta(hours=4)
+            ]
+            self.impact_learner.learn_from_outcomes(ready)
         except Exception as e:
             logger.debug(f"Learning loop skipped: {e}")
 
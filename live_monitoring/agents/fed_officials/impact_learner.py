@@ -5,9 +5,8 @@ NOT hardcoded weights! Learns: Official + Sentiment → Actual Market Move
 """
 
 import logging
-import yfinance as yf
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import datetime
+from typing import Iterable, Optional, Tuple
 from .database import FedOfficialsDatabase
 from .models import MarketImpactPattern
 
@@ -72,77 +71,78 @@ class ImpactLearner:
         
         Should be called 1-4 hours after comment to see actual impact.
         """
+        self.learn_from_outcomes([(comment_id, official_name, sentiment)])
+    
+    def learn_from_outcomes(self, outcomes: Iterable[Tuple[int, str, str]]) -> int:
+        """
+        Learn from a batch of (comment_id, official_name, sentiment).
+        
+        All comments are measured against one load of SPY bars (EventStudy),
+        so a backfill of hundreds of comments is one data load, not hundreds.
+        
+        Returns: number of comments learned from
+        """
         try:
-            # Get comment timestamp
+            outcomes = list(outcomes)
+            if not outcomes:
+                return 0
+            
             import sqlite3
             conn = sqlite3.connect(self.db.db_path)
             conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT timestamp FROM comments WHERE id = ?", (comment_id,))
-            row = cursor.fetchone()
-            if not row:
-                conn.close()
-                return
-            
-            comment_time = datetime.fromisoformat(row['timestamp'])
+            ids = [comment_id for comment_id, _, _ in outcomes]
+            placeholders = ",".join("?" * len(ids))
+            rows = conn.execute(f"SELECT id, timestamp FROM comments WHERE id IN ({placeholders})", ids).fetchall()
             conn.close()
             
-            # Get SPY price at comment time and 1hr/4hr later
-            spy_1hr = self._get_spy_move(comment_time, hours=1)
-            spy_4hr = self._get_spy_move(comment_time, hours=4)
-            
-            if spy_1hr is None:
-                return
-            
-            # Update pattern
-            self._update_pattern(official_name, sentiment, spy_1hr, spy_4hr)
-            
-            logger.info(f"📚 Learned: {official_name} {sentiment} → {spy_1hr:.2f}% SPY (1hr)")
+            comment_times = {row['id']: datetime.fromisoformat(row['timestamp']) for row in rows}
+            known = [o for o in outcomes if o[0] in comment_times]
+            if not known:
+                return 0
+            
+            # SPY move 1hr/4hr after each comment
+            matrix = self._measure_spy([comment_times[comment_id] for comment_id, _, _ in known])
+            
+            learned = 0
+            for i, (_, official_name, sentiment) in enumerate(known):
+                spy_1hr = matrix.move(i, 60)
+                spy_4hr = matrix.move(i, 240)
+                if spy_1hr is None:
+                    continue
+                
+                # Update pattern
+                self._update_pattern(official_name, sentiment, spy_1hr, spy_4hr)
+                learned += 1
+                
+                logger.info(f"📚 Learned: {official_name} {sentiment} → {spy_1hr:.2f}% SPY (1hr)")
+            return learned
         
         except Exception as e:
             logger.warning(f"Impact learning error: {e}")
+            return 0
+    
+    def _measure_spy(self, comment_times, horizons=(60, 240)):
+        from live_monitoring.core.event_study import get_event_study
+        return get_event_study("SPY").measure(comment_times, horizons=horizons)
     
     def _get_spy_move(self, comment_time: datetime, hours: int) -> Optional[float]:
         """Get SPY price move X hours after comment."""
         try:
-            ticker = yf.Ticker("SPY")
-            
-            # Get minute data around comment time
-            start = comment_time - timedelta(minutes=30)
-            end = comment_time + timedelta(hours=hours+1)
-            
-            hist = ticker.history(start=start, end=end, interval='1m')
-            if hist.empty:
-                return None
-            
-            # Price at comment time (or closest)
-            comment_idx = hist.index.get_indexer([comment_time], method='nearest')[0]
-            if comment_idx < 0:
-                return None
-            
-            price_at_comment = float(hist['Close'].iloc[comment_idx])
-            
-            # Price X hours later
-            later_time = comment_time + timedelta(hours=hours)
-            later_idx = hist.index.get_indexer([later_time], method='nearest')[0]
-            if later_idx < 0 or later_idx >= len(hist):
-                return None
-            
-            price_later = float(hist['Close'].iloc[later_idx])
-            
-            # Calculate % move
-            move_pct = ((price_later - price_at_comment) / price_at_comment) * 100
-            return move_pct
-        
+            return self._measure_spy([comment_time], horizons=(hours * 60,)).move(0, hours * 60)
         except Exception as e:
             logger.debug(f"SPY move calculation error: {e}")
             return None
     
-    def _update_pattern(self, official_name: str, sentiment: str, move_1hr: float, move_4hr: float):
-        """Update learned pattern in database."""
+    def _update_pattern(self, official_name: str, sentiment: str, move_1hr: float, move_4hr: Optional[float]):
+        """
+        Update learned pattern in database.
+        
+        The 4hr average has its own sample count, so a comment whose 4hr move
+        has not resolved (None) still counts for the 1hr average only.
+        """
         import sqlite3
         conn = sqlite3.connect(self.db.db_path)
+        conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
         # Check if pattern exists
@@ -155,21 +155,30 @@ class ImpactLearner:
         
         if row:
             # Update existing
-            sample_count = row[5] + 1
-            avg_1hr = (row[3] * row[5] + move_1hr) / sample_count
-            avg_4hr = (row[4] * row[5] + move_4hr) / sample_count
+            sample_count = row['sample_count'] + 1
+            avg_1hr = (row['avg_spy_move_1hr'] * row['sample_count'] + move_1hr) / sample_count
+            
+            # Rows from before the separate count had a 4hr move for every sample
+            count_4hr = row['sample_count_4hr']
+            if count_4hr is None:
+                count_4hr = row['sample_count'] if row['avg_spy_move_4hr'] is not None else 0
+            avg_4hr = row['avg_spy_move_4hr']
+            if move_4hr is not None:
+                avg_4hr = ((avg_4hr or 0.0) * count_4hr + move_4hr) / (count_4hr + 1)
+                count_4hr += 1
             
             # Simple accuracy: how often prediction matched direction
             predicted = "BULLISH" if avg_1hr > 0 else "BEARISH" if avg_1hr < 0 else "NEUTRAL"
             actual = "BULLISH" if move_1hr > 0 else "BEARISH" if move_1hr < 0 else "NEUTRAL"
-            accuracy = (row[6] * row[5] + (1.0 if predicted == actual else 0.0)) / sample_count
+            accuracy = (row['accuracy'] * row['sample_count'] + (1.0 if predicted == actual else 0.0)) / sample_count
             
             cursor.execute("""
                 UPDATE market_impact_patterns
                 SET avg_spy_move_1hr = ?, avg_spy_move_4hr = ?,
-                    sample_count = ?, accuracy = ?, last_updated = ?
+                    sample_count = ?, sample_count_4hr = ?, accuracy = ?, last_updated = ?
                 WHERE official_name = ? AND sentiment = ?
-            """, (avg_1hr, avg_4hr, sample_count, accuracy, datetime.now().isoformat(), official_name, sentiment))
+            """, (avg_1hr, avg_4hr, sample_count, count_4hr, accuracy, datetime.now().isoformat(),
+                  official_name, sentiment))
         else:
             # Create new
             predicted = "BULLISH" if move_1hr > 0 else "BEARISH" if move_1hr < 0 else "NEUTRAL"
@@ -178,9 +187,11 @@ class ImpactLearner:
             
             cursor.execute("""
                 INSERT INTO market_impact_patterns
-                (official_name, sentiment, avg_spy_move_1hr, avg_spy_move_4hr, sample_count, accuracy, last_updated)
-                VALUES (?, ?, ?, ?, 1, ?, ?)
-            """, (official_name, sentiment, move_1hr, move_4hr, accuracy, datetime.now().isoformat()))
+                (official_name, sentiment, avg_spy_move_1hr, avg_spy_move_4hr, sample_count, sample_count_4hr,
+                 accuracy, last_updated)
+                VALUES (?, ?, ?, ?, 1, ?, ?, ?)
+            """, (official_name, sentiment, move_1hr, move_4hr, int(move_4hr is not None), accuracy,
+                  datetime.now().isoformat()))
         
         conn.commit()
         conn.close()
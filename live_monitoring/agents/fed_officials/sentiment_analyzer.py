@@ -14,8 +14,7 @@ from typing import Tuple
 
 logger = logging.getLogger(__name__)
 
-# ── Groq Config (same as signal_explainer.py) ──
-GROQ_URL = "https://api.groq.com/openai/v1/chat/completions"
+# ── Groq Config (same as signal_explainer.py; requests go through the LLM gateway) ──
 GROQ_MODEL = "llama-3.3-70b-versatile"
 
 
@@ -67,30 +66,23 @@ Official: {official_name}
 Speech: {text[:1500]}"""
 
         try:
-            import httpx
-            resp = httpx.post(
-                GROQ_URL,
-                headers={
-                    "Authorization": f"Bearer {self._groq_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": GROQ_MODEL,
-                    "messages": [
-                        {"role": "system", "content": (
-                            "You are a Fed monetary policy tone analyzer. "
-                            "Analyze the text and return ONLY a JSON object. "
-                            "No markdown, no explanation, no code blocks."
-                        )},
-                        {"role": "user", "content": prompt},
-                    ],
-                    "temperature": 0.1,
-                    "max_tokens": 200,
-                },
+            from core.utils.llm_gateway import get_gateway
+            result = get_gateway().complete(
+                [
+                    {"role": "system", "content": (
+                        "You are a Fed monetary policy tone analyzer. "
+                        "Analyze the text and return ONLY a JSON object. "
+                        "No markdown, no explanation, no code blocks."
+                    )},
+                    {"role": "user", "content": prompt},
+                ],
+                GROQ_MODEL,
+                provider="groq",
+                max_tokens=200,
+                temperature=0.1,
                 timeout=10.0,
             )
-            resp.raise_for_status()
-            raw_text = resp.json()["choices"][0]["message"]["content"].strip()
+            raw_text = result["content"].strip()
 
             # Parse JSON from response
             json_match = re.search(r'\{[^}]+\}', raw_text)
@@ -55,6 +55,8 @@ class SupportZone:
     rank: ZoneRank
     zone_type: str  # SUPPORT or RESISTANCE
     distance_pct: float = 0.0
+    bounce_rate: Optional[float] = None  # Learned bounce rate inside the zone (DP level index)
+    history_samples: int = 0
     
     @property
     def volume_str(self) -> str:
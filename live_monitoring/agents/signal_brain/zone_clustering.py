@@ -12,6 +12,7 @@ from typing import List, Dict, Optional
 from dataclasses import dataclass
 
 from .models import SupportZone, ZoneRank
+from live_monitoring.agents.dp_learning.level_index import DPLevelIndex, default_level_index
 
 logger = logging.getLogger(__name__)
 
@@ -32,8 +33,10 @@ class ZoneClusterer:
     VOLUME_SECONDARY = 1_000_000
     VOLUME_TERTIARY = 500_000
     
-    def __init__(self, cluster_threshold_pct: float = CLUSTER_THRESHOLD_PCT):
+    def __init__(self, cluster_threshold_pct: float = CLUSTER_THRESHOLD_PCT,
+                 level_index: Optional[DPLevelIndex] = None):
         self.cluster_threshold = cluster_threshold_pct
+        self.level_index = level_index or default_level_index()
     
     def cluster_levels(
         self,
@@ -82,32 +85,21 @@ class ZoneClusterer:
         return support_zones, resistance_zones
     
     def _find_clusters(self, sorted_levels: List[Dict]) -> List[List[Dict]]:
-        """Find clusters of nearby levels."""
+        """
+        Find clusters of nearby levels.
+        
+        Levels are sorted by price, so the nearest cluster member is always the
+        last one added: a single sweep comparing neighbours is enough.
+        """
         clusters = []
-        used = set()
         
-        for i, level in enumerate(sorted_levels):
-            if i in used:
-                continue
-            
-            # Start new cluster
-            cluster = [level]
-            used.add(i)
-            
-            # Find all levels within threshold
-            for j, other in enumerate(sorted_levels):
-                if j in used:
+        for level in sorted_levels:
+            if clusters:
+                last = clusters[-1][-1]['price']
+                if abs(level['price'] - last) / last * 100 <= self.cluster_threshold:
+                    clusters[-1].append(level)
                     continue
-                
-                # Check if within threshold of any level in cluster
-                for c_level in cluster:
-                    pct_diff = abs(other['price'] - c_level['price']) / c_level['price'] * 100
-                    if pct_diff <= self.cluster_threshold:
-                        cluster.append(other)
-                        used.add(j)
-                        break
-            
-            clusters.append(cluster)
+            clusters.append([level])
         
         return clusters
     
@@ -138,6 +130,11 @@ class ZoneClusterer:
         # Distance from current price
         distance_pct = abs(current_price - center) / center * 100
         
+        # Learned outcome history inside the zone
+        bounce_rate, history_samples = (None, 0)
+        if self.level_index is not None:
+            bounce_rate, history_samples = self.level_index.zone_stats(symbol, min(prices), max(prices))
+        
         return SupportZone(
             symbol=symbol,
             center_price=round(center, 2),
@@ -149,6 +146,8 @@ class ZoneClusterer:
             rank=rank,
             zone_type=zone_type,
             distance_pct=round(distance_pct, 2),
+            bounce_rate=bounce_rate,
+            history_samples=history_samples,
         )
     
     def get_primary_zones(
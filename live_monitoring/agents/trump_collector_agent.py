@@ -406,79 +406,65 @@ class MarketReactionLinker:
     def link_market_data(self, statement: TrumpStatement) -> TrumpStatement:
         """
         Link market reaction data to a statement.
-        Uses yfinance to get SPY prices at various intervals.
+        Uses the shared event study (bar store, then yfinance) for SPY/VIX prices.
         """
-        import yfinance as yf
+        return self.link_market_data_batch([statement])[0]
+    
+    def link_market_data_batch(self, statements: List[TrumpStatement]) -> List[TrumpStatement]:
+        """
+        Link market reaction data to many statements from one SPY and one VIX bar load.
+        """
+        from live_monitoring.core.event_study import get_event_study
+        
+        if not statements:
+            return statements
         
         try:
-            timestamp = statement.timestamp
-            
-            # Fetch minute-level data around the statement time
-            start = timestamp - timedelta(hours=1)
-            end = timestamp + timedelta(days=2)
-            
-            spy = yf.Ticker("SPY")
-            vix = yf.Ticker("^VIX")
-            
-            # Get intraday data (1-minute)
-            spy_data = spy.history(start=start, end=end, interval="1m")
-            vix_data = vix.history(start=start, end=end, interval="1m")
-            
-            if spy_data.empty:
+            timestamps = [statement.timestamp for statement in statements]
+            spy = get_event_study("SPY").measure(timestamps, horizons=(1, 5, 15, 60))
+            vix = get_event_study("^VIX").measure(timestamps, horizons=(60,))
+        except Exception as e:
+            logger.error(f"Error linking market data: {e}")
+            return statements
+        
+        for i, statement in enumerate(statements):
+            spy_row, vix_row = spy.row(i), vix.row(i)
+            if spy_row['base_price'] is None:
                 logger.warning(f"No SPY data for statement {statement.id}")
-                return statement
+                continue
             
-            # Find closest price at statement time
-            spy_data.index = spy_data.index.tz_localize(None)
-            closest_idx = spy_data.index.get_indexer([timestamp], method='nearest')[0]
+            statement.spy_price_at_statement = spy_row['base_price']
             
-            if closest_idx >= 0 and closest_idx < len(spy_data):
-                base_price = spy_data.iloc[closest_idx]['Close']
-                statement.spy_price_at_statement = float(base_price)
-                
-                # Calculate changes at different intervals
-                for minutes, attr in [(1, 'spy_change_1min'), (5, 'spy_change_5min'), 
-                                      (15, 'spy_change_15min'), (60, 'spy_change_1hr')]:
-                    target_idx = closest_idx + minutes
-                    if target_idx < len(spy_data):
-                        target_price = spy_data.iloc[target_idx]['Close']
-                        change = (target_price - base_price) / base_price * 100
-                        setattr(statement, attr, round(change, 4))
-            
-            # Get daily data for T+1day
-            spy_daily = spy.history(start=timestamp.date(), end=timestamp.date() + timedelta(days=2), interval="1d")
-            if len(spy_daily) >= 2:
-                day_change = (spy_daily.iloc[1]['Close'] - spy_daily.iloc[0]['Close']) / spy_daily.iloc[0]['Close'] * 100
-                statement.spy_change_1day = round(day_change, 4)
+            # Changes at different intervals
+            for minutes, attr in [(1, 'spy_change_1min'), (5, 'spy_change_5min'),
+                                  (15, 'spy_change_15min'), (60, 'spy_change_1hr')]:
+                change = spy_row[f'move_{minutes}m']
+                if change is not None:
+                    setattr(statement, attr, round(change, 4))
+            
+            # T+1day: next session close vs statement session close
+            if spy_row['next_session'] is not None:
+                statement.spy_change_1day = round(spy_row['next_session'], 4)
             
             # VIX data
-            if not vix_data.empty:
-                vix_data.index = vix_data.index.tz_localize(None)
-                vix_closest_idx = vix_data.index.get_indexer([timestamp], method='nearest')[0]
-                if vix_closest_idx >= 0 and vix_closest_idx < len(vix_data):
-                    statement.vix_at_statement = float(vix_data.iloc[vix_closest_idx]['Close'])
-                    
-                    vix_1hr_idx = vix_closest_idx + 60
-                    if vix_1hr_idx < len(vix_data):
-                        vix_change = (vix_data.iloc[vix_1hr_idx]['Close'] - statement.vix_at_statement) / statement.vix_at_statement * 100
-                        statement.vix_change_1hr = round(vix_change, 4)
+            if vix_row['base_price'] is not None:
+                statement.vix_at_statement = vix_row['base_price']
+                if vix_row['move_60m'] is not None:
+                    statement.vix_change_1hr = round(vix_row['move_60m'], 4)
             
             statement.market_data_collected = True
             
-            logger.info(f"📊 Linked market data: SPY {statement.spy_change_1hr:+.2f}% (1hr)")
-            
-        except Exception as e:
-            logger.error(f"Error linking market data: {e}")
+            if statement.spy_change_1hr is not None:
+                logger.info(f"📊 Linked market data: SPY {statement.spy_change_1hr:+.2f}% (1hr)")
         
-        return statement
+        return statements
     
     def process_pending_statements(self, limit: int = 20) -> int:
         """Process statements that need market data"""
         statements = self.db.get_statements_needing_market_data(limit=limit)
         
         processed = 0
-        for statement in statements:
-            updated = self.link_market_data(statement)
+        for updated in self.link_market_data_batch(statements):
             if updated.market_data_collected:
                 self.db.save_statement(updated)
                 processed += 1
@@ -19,6 +19,7 @@ from trump_data_models import (
     TrumpStatement, StatementSource, TopicCorrelation, 
     Prediction, AgentAccuracy
 )
+from trump_statement_index import StatementIndex
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +40,9 @@ class TrumpDatabase:
         # Ensure directory exists
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         
+        # Similar-statement index (maintained by save_statement)
+        self.index = StatementIndex(db_path)
+        
         # Initialize schema
         self._init_schema()
         
@@ -152,6 +156,12 @@ class TrumpDatabase:
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_statements_topics ON statements(topics)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_predictions_statement ON predictions(statement_id)')
             
+            # Inverted topic/entity index for similar-statement lookups
+            StatementIndex.create_schema(cursor)
+            backfilled = self.index.backfill(cursor, self._row_to_statement)
+            if backfilled:
+                logger.info(f"📇 Indexed {backfilled} existing statements")
+            
             conn.commit()
     
     # ==================== STATEMENT OPERATIONS ====================
@@ -197,7 +207,10 @@ class TrumpDatabase:
                     statement.created_at.isoformat()
                 ))
                 
-                return True
+                doc = self.index.write(cursor, statement)
+            
+            self.index.apply(doc)
+            return True
                 
         except Exception as e:
             logger.error(f"Error saving statement: {e}")
@@ -219,6 +232,33 @@ class TrumpDatabase:
             logger.error(f"Error getting statement: {e}")
             return None
     
+    def get_statements(self, statement_ids: List[str]) -> Dict[str, TrumpStatement]:
+        """Get several statements by ID in one query"""
+        if not statement_ids:
+            return {}
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                placeholders = ",".join("?" * len(statement_ids))
+                cursor.execute(f'SELECT * FROM statements WHERE id IN ({placeholders})', list(statement_ids))
+                return {row['id']: self._row_to_statement(row) for row in cursor.fetchall()}
+                
+        except Exception as e:
+            logger.error(f"Error getting statements: {e}")
+            return {}
+    
+    def find_similar(self, statement: TrumpStatement, top_k: int = 10,
+                     text_weight: float = 0.0) -> List[Dict[str, Any]]:
+        """
+        Top-k similar statements with market data, via the inverted index.
+        
+        Returns list of {'statement_id', 'similarity', 'reaction'}, best first.
+        """
+        return [
+            {'statement_id': sid, 'similarity': score, 'reaction': reaction}
+            for sid, score, reaction in self.index.top_k(statement, top_k=top_k, text_weight=text_weight)
+        ]
+    
     def get_statements_by_topic(self, topic: str, limit: int = 100) -> List[TrumpStatement]:
         """Get statements by topic"""
         try:
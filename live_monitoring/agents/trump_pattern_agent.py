@@ -15,7 +15,7 @@ import numpy as np
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Dict, Optional, Any, Tuple
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -27,6 +27,8 @@ from trump_database import TrumpDatabase
 
 logger = logging.getLogger(__name__)
 
+STATEMENT_CACHE_SIZE = 512  # similar statements kept in memory, keyed by (id, reaction)
+
 
 class TrumpPatternAgent:
     """
@@ -46,6 +48,7 @@ class TrumpPatternAgent:
         # Cache for performance
         self._correlation_cache: Dict[str, TopicCorrelation] = {}
         self._cache_updated = None
+        self._statement_cache: "OrderedDict[Tuple[str, float], TrumpStatement]" = OrderedDict()
         
         logger.info("🧠 Trump Pattern Agent initialized")
     
@@ -139,43 +142,41 @@ class TrumpPatternAgent:
         # Check database
         return self.db.get_topic_correlation(topic)
     
-    def find_similar_statements(self, statement: TrumpStatement, top_k: int = 10) -> List[SimilarStatement]:
+    def find_similar_statements(self, statement: TrumpStatement, top_k: int = 10,
+                                text_weight: float = 0.0) -> List[SimilarStatement]:
         """
         Find historically similar statements.
-        Uses topic overlap and entity overlap for similarity.
+        Uses topic overlap and entity overlap for similarity, looked up through
+        the database's inverted index (only statements sharing a term are scored).
         
-        In the future: Use embeddings for semantic similarity.
+        text_weight > 0 blends in MinHash text similarity.
         """
-        all_statements = self.db.get_all_statements_with_market_data()
-        
-        if not all_statements:
+        matches = self.db.find_similar(statement, top_k=top_k, text_weight=text_weight)
+        if not matches:
             return []
         
-        similarities = []
+        missing = [m['statement_id'] for m in matches
+                   if (m['statement_id'], m['reaction']) not in self._statement_cache]
+        for sid, hist_stmt in self.db.get_statements(missing).items():
+            self._statement_cache[(sid, hist_stmt.spy_change_1hr)] = hist_stmt
+            self._statement_cache.move_to_end((sid, hist_stmt.spy_change_1hr))
+        while len(self._statement_cache) > STATEMENT_CACHE_SIZE:
+            self._statement_cache.popitem(last=False)
         
-        for hist_stmt in all_statements:
-            if hist_stmt.id == statement.id:
+        similarities = []
+        for m in matches:
+            key = (m['statement_id'], m['reaction'])
+            hist_stmt = self._statement_cache.get(key)
+            if hist_stmt is None:
                 continue
-            
-            # Calculate similarity based on topics and entities
-            topic_overlap = len(set(statement.topics) & set(hist_stmt.topics))
-            entity_overlap = len(set(statement.entities) & set(hist_stmt.entities))
-            
-            # Weighted similarity score
-            similarity = (topic_overlap * 0.6 + entity_overlap * 0.4) / max(
-                len(statement.topics) + len(statement.entities), 1
-            )
-            
-            if similarity > 0.2 and hist_stmt.spy_change_1hr is not None:
-                similarities.append(SimilarStatement(
-                    statement=hist_stmt,
-                    similarity_score=round(similarity, 3),
-                    market_reaction=hist_stmt.spy_change_1hr
-                ))
-        
-        # Sort by similarity and return top_k
-        similarities.sort(key=lambda x: x.similarity_score, reverse=True)
-        return similarities[:top_k]
+            self._statement_cache.move_to_end(key)
+            similarities.append(SimilarStatement(
+                statement=hist_stmt,
+                similarity_score=m['similarity'],
+                market_reaction=m['reaction']
+            ))
+        
+        return similarities
     
     def predict_impact(self, statement: TrumpStatement) -> Dict[str, Any]:
         """
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+TRUMP STATEMENT INDEX
+=====================
+Inverted index from topic / entity (and optional MinHash LSH band) to
+statement IDs, for similar-statement lookups on the live path.
+
+find_similar_statements used to load every statement with market data and
+compute set overlap against all of them on each call. Here:
+
+- statement_terms (kind, term, statement_id) is the persistent inverted index,
+  statement_index holds what scoring needs (SPY 1hr reaction, timestamp,
+  MinHash signature) plus a change sequence number. Both are written by
+  TrumpDatabase.save_statement in the same transaction as the statement.
+- An in-memory copy answers queries by walking only the postings of the query's
+  topics/entities: cost scales with matching statements, not history size.
+  Saves in this process are applied immediately; rows written by other
+  processes are picked up by seq (checked at most every REFRESH_INTERVAL).
+- MinHash over word bigrams estimates text Jaccard; LSH bands are stored as
+  'lsh' postings so text-similar statements with no shared topic are still
+  candidates when text_weight > 0.
+"""
+
+import heapq
+import json
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+NUM_PERM = 32
+LSH_BANDS = 8                      # 8 bands x 4 rows
+REFRESH_INTERVAL = 5.0             # seconds between cross-process delta checks
+MIN_SIMILARITY = 0.2
+
+_PRIME = (1 << 31) - 1
+_rng = np.random.RandomState(1337)
+_PERM_A = _rng.randint(1, _PRIME, size=NUM_PERM).astype(np.uint64)
+_PERM_B = _rng.randint(0, _PRIME, size=NUM_PERM).astype(np.uint64)
+_WORD = re.compile(r"[a-z0-9$%']+")
+
+
+def minhash_signature(text: str) -> Optional[List[int]]:
+    """MinHash of word bigrams (single words for one-word texts); None for empty text."""
+    words = _WORD.findall((text or "").lower())
+    shingles = {f"{a} {b}" for a, b in zip(words, words[1:])} or set(words)
+    if not shingles:
+        return None
+    hashes = np.fromiter((zlib.crc32(s.encode()) for s in shingles), dtype=np.uint64, count=len(shingles))
+    return ((_PERM_A[:, None] * hashes[None, :] + _PERM_B[:, None]) % _PRIME).min(axis=1).tolist()
+
+
+def lsh_bands(signature: Optional[List[int]]) -> List[str]:
+    if not signature:
+        return []
+    rows = NUM_PERM // LSH_BANDS
+    return [f"{b}:{zlib.crc32(json.dumps(signature[b * rows:(b + 1) * rows]).encode())}" for b in range(LSH_BANDS)]
+
+
+def _terms(statement) -> Set[Tuple[str, str]]:
+    terms = {("topic", t) for t in statement.topics}
+    terms |= {("entity", e) for e in statement.entities}
+    terms |= {("lsh", band) for band in lsh_bands(minhash_signature(statement.raw_text))}
+    return terms
+
+
+class StatementIndex:
+    """Persistent topic/entity/LSH postings with an in-memory query copy."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._postings: Dict[Tuple[str, str], Set[str]] = defaultdict(set)
+        self._docs: Dict[str, dict] = {}   # statement_id -> {terms, reaction, ts, sig}
+        self._seq = 0
+        self._loaded = False
+        self._checked = 0.0
+
+    # ==================== PERSISTENCE ====================
+
+    @staticmethod
+    def create_schema(cursor: sqlite3.Cursor):
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS statement_terms (
+                kind TEXT NOT NULL,          -- topic | entity | lsh
+                term TEXT NOT NULL,
+                statement_id TEXT NOT NULL,
+                PRIMARY KEY (kind, term, statement_id)
+            ) WITHOUT ROWID
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_statement_terms_id ON statement_terms(statement_id)')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS statement_index (
+                statement_id TEXT PRIMARY KEY,
+                seq INTEGER NOT NULL,
+                timestamp REAL NOT NULL,
+                reaction REAL,               -- spy_change_1hr when market data is collected
+                minhash TEXT                 -- JSON signature
+            )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_statement_index_seq ON statement_index(seq)')
+
+    def write(self, cursor: sqlite3.Cursor, statement) -> dict:
+        """Index one statement inside the caller's transaction; returns the in-memory doc to apply after commit."""
+        signature = minhash_signature(statement.raw_text)
+        terms = _terms(statement)
+        reaction = statement.spy_change_1hr if statement.market_data_collected else None
+
+        cursor.execute('DELETE FROM statement_terms WHERE statement_id = ?', (statement.id,))
+        cursor.executemany('INSERT OR IGNORE INTO statement_terms (kind, term, statement_id) VALUES (?, ?, ?)',
+                           [(kind, term, statement.id) for kind, term in terms])
+        cursor.execute('''
+            INSERT OR REPLACE INTO statement_index (statement_id, seq, timestamp, reaction, minhash)
+            VALUES (?, (SELECT COALESCE(MAX(seq), 0) + 1 FROM statement_index), ?, ?, ?)
+        ''', (statement.id, statement.timestamp.timestamp(), reaction,
+              json.dumps(signature) if signature else None))
+        return {"id": statement.id, "terms": terms, "reaction": reaction,
+                "ts": statement.timestamp.timestamp(), "sig": signature}
+
+    def backfill(self, cursor: sqlite3.Cursor, row_to_statement) -> int:
+        """Index statements saved before the index existed."""
+        rows = cursor.execute('''
+            SELECT s.* FROM statements s
+            LEFT JOIN statement_index i ON i.statement_id = s.id
+            WHERE i.statement_id IS NULL
+        ''').fetchall()
+        for row in rows:
+            self.write(cursor, row_to_statement(row))
+        return len(rows)
+
+    # ==================== IN-MEMORY COPY ====================
+
+    def apply(self, doc: dict):
+        """Apply a committed write to the in-memory copy (no-op until first load)."""
+        with self._lock:
+            if self._loaded:
+                self._put(doc)
+
+    def _put(self, doc: dict):
+        old = self._docs.get(doc["id"])
+        if old:
+            for term in old["terms"] - doc["terms"]:
+                ids = self._postings.get(term)
+                if ids is not None:
+                    ids.discard(doc["id"])
+                    if not ids:
+                        del self._postings[term]
+        for term in doc["terms"]:
+            self._postings[term].add(doc["id"])
+        self._docs[doc["id"]] = doc
+
+    def refresh(self, force: bool = False):
+        """Load rows with seq above the last one seen (all rows on first call)."""
+        now = time.monotonic()
+        if not force and self._loaded and now - self._checked < REFRESH_INTERVAL:
+            return
+        with self._lock:
+            self._checked = now
+            conn = sqlite3.connect(self.db_path)
+            try:
+                rows = conn.execute(
+                    'SELECT statement_id, seq, timestamp, reaction, minhash FROM statement_index WHERE seq > ? ORDER BY seq',
+                    (self._seq,),
+                ).fetchall()
+                if not rows:
+                    self._loaded = True
+                    return
+                terms: Dict[str, Set[Tuple[str, str]]] = defaultdict(set)
+                if self._loaded:
+                    ids = [r[0] for r in rows]
+                    for start in range(0, len(ids), 500):
+                        chunk = ids[start:start + 500]
+                        for kind, term, sid in conn.execute(
+                            f'SELECT kind, term, statement_id FROM statement_terms WHERE statement_id IN ({",".join("?" * len(chunk))})',
+                            chunk,
+                        ):
+                            terms[sid].add((kind, term))
+                else:
+                    for kind, term, sid in conn.execute('SELECT kind, term, statement_id FROM statement_terms'):
+                        terms[sid].add((kind, term))
+            finally:
+                conn.close()
+
+            for sid, seq, ts, reaction, minhash in rows:
+                self._put({"id": sid, "terms": terms.get(sid, set()), "reaction": reaction,
+                           "ts": ts, "sig": json.loads(minhash) if minhash else None})
+                self._seq = max(self._seq, seq)
+            self._loaded = True
+
+    # ==================== QUERY ====================
+
+    def top_k(self, statement, top_k: int = 10, text_weight: float = 0.0,
+              min_similarity: float = MIN_SIMILARITY) -> List[Tuple[str, float, float]]:
+        """
+        Most similar statements that have a 1hr SPY reaction.
+
+        Score is the topic/entity overlap used by TrumpPatternAgent
+        ((0.6 * topics + 0.4 * entities) / query term count); with text_weight > 0
+        it is blended with the MinHash Jaccard estimate.
+
+        Returns:
+            [(statement_id, score rounded to 3, reaction)], best first, newest first on ties
+        """
+        self.refresh()
+        topics, entities = set(statement.topics), set(statement.entities)
+        denom = max(len(statement.topics) + len(statement.entities), 1)
+        signature = minhash_signature(statement.raw_text) if text_weight > 0 else None
+
+        with self._lock:
+            overlap: Dict[str, List[int]] = defaultdict(lambda: [0, 0])   # sid -> [topics, entities]
+            for topic in topics:
+                for sid in self._postings.get(("topic", topic), ()):
+                    overlap[sid][0] += 1
+            for entity in entities:
+                for sid in self._postings.get(("entity", entity), ()):
+                    overlap[sid][1] += 1
+            if signature:
+                for band in lsh_bands(signature):
+                    for sid in self._postings.get(("lsh", band), ()):
+                        overlap.setdefault(sid, [0, 0])
+
+            scored = []
+            query_sig = np.asarray(signature) if signature else None
+            for sid, (topic_overlap, entity_overlap) in overlap.items():
+                doc = self._docs.get(sid)
+                if sid == statement.id or doc is None or doc["reaction"] is None:
+                    continue
+                score = (topic_overlap * 0.6 + entity_overlap * 0.4) / denom
+                if query_sig is not None:
+                    jaccard = float(np.mean(query_sig == np.asarray(doc["sig"]))) if doc["sig"] else 0.0
+                    score = (1 - text_weight) * score + text_weight * jaccard
+                if score > min_similarity:
+                    scored.append((round(score, 3), doc["ts"], sid, doc["reaction"]))
+
+        best = heapq.nlargest(top_k, scored, key=lambda x: (x[0], x[1]))
+        return [(sid, score, reaction) for score, _, sid, reaction in best]
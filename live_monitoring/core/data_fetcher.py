@@ -10,7 +10,6 @@ import pandas as pd
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 import logging
-import pickle
 from pathlib import Path
 import sys
 
@@ -21,6 +20,7 @@ sys.path.append(str(Path(__file__).parent.parent.parent / 'core'))
 from ultimate_chartexchange_client import UltimateChartExchangeClient
 from ultra_institutional_engine import UltraInstitutionalEngine
 from alpha_vantage_client import AlphaVantageClient
+from core.utils.tiered_cache import MB, get_cache
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +31,10 @@ class DataFetcher:
         self.api_key = api_key
         self.use_cache = use_cache
         self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache = get_cache(
+            f"inst_context:{self.cache_dir.resolve()}", ttl=24 * 3600,
+            disk_dir=str(self.cache_dir), max_bytes=16 * MB,
+        )
         
         # Initialize clients
         self.cx_client = UltimateChartExchangeClient(api_key, tier=3)
@@ -109,59 +112,26 @@ class DataFetcher:
         
         return None
     
-    def _cache_filename(self, symbol: str, date: str) -> Path:
-        """Generate cache filename"""
-        return self.cache_dir / f"inst_context_{symbol}_{date}.pkl"
+    def _cache_key(self, symbol: str, date: str) -> str:
+        """Generate cache key"""
+        return f"inst_context_{symbol}_{date}"
     
     def _save_to_cache(self, symbol: str, date: str, context: Any):
-        """Save institutional context to cache"""
-        try:
-            filename = self._cache_filename(symbol, date)
-            with open(filename, 'wb') as f:
-                pickle.dump({
-                    'context': context,
-                    'cached_at': datetime.now(),
-                    'symbol': symbol,
-                    'date': date
-                }, f)
-            logger.debug(f"Cached institutional context: {filename}")
-        except Exception as e:
-            logger.warning(f"Failed to cache data: {e}")
+        """Save institutional context to cache (memory + disk)"""
+        self.cache.set(self._cache_key(symbol, date), context)
+        logger.debug(f"Cached institutional context: {symbol} {date}")
     
     def _load_from_cache(self, symbol: str, date: str, max_age_hours: int = 24) -> Optional[Any]:
         """Load institutional context from cache"""
-        try:
-            filename = self._cache_filename(symbol, date)
-            
-            if not filename.exists():
-                return None
-            
-            with open(filename, 'rb') as f:
-                cached = pickle.load(f)
-            
-            # Check age
-            age = datetime.now() - cached['cached_at']
-            if age.total_seconds() / 3600 > max_age_hours:
-                logger.debug(f"Cache too old ({age.total_seconds()/3600:.1f}h), skipping")
-                return None
-            
-            return cached['context']
-            
-        except Exception as e:
-            logger.warning(f"Failed to load from cache: {e}")
+        hit = self.cache.peek(self._cache_key(symbol, date), max_age=max_age_hours * 3600)
+        if hit is None:
             return None
+        return hit[0]
     
     def clear_cache(self, symbol: Optional[str] = None):
         """Clear cache for symbol or all"""
-        if symbol:
-            pattern = f"inst_context_{symbol}_*.pkl"
-        else:
-            pattern = "inst_context_*.pkl"
-        
-        count = 0
-        for file in self.cache_dir.glob(pattern):
-            file.unlink()
-            count += 1
+        prefix = f"inst_context_{symbol}_" if symbol else "inst_context_"
+        count = self.cache.clear(prefix=prefix)
         
         logger.info(f"Cleared {count} cache files")
 
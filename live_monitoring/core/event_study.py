@@ -0,0 +1,305 @@
+"""
+📐 EVENT STUDY ENGINE
+
+Batch measurement of market reactions after timestamped events (Fed comments,
+Trump statements, economic releases).
+
+ImpactLearner downloaded a fresh window of SPY 1m history for every comment
+and every horizon; MarketReactionLinker did the same per statement. Backfilling
+a few hundred events meant a few hundred yfinance calls. Here a batch of events
+is measured against ONE load of the sessions they touch:
+
+- Sessions come from the local BarStore (backtesting/data/bars); sessions it
+  lacks are fetched from yfinance in one ranged call and completed ones are
+  written through, so a second backfill is fully offline.
+- Event and horizon bars are resolved with vectorized searchsorted (nearest
+  bar, same as the old get_indexer(method='nearest')), but only count when
+  the bar is within one bar interval of the time asked for. Events outside
+  market hours (evenings, weekends) and horizons landing after the close are
+  left unmeasured rather than read off the last bar as a 0% move.
+- Results come back as a ReactionMatrix: % move per horizon, to the session
+  close (EOD) and to the next session close, plus MFE / MAE over the longest
+  horizon.
+
+Naive timestamps are taken as US/Eastern (what the collectors store).
+
+Usage:
+    from live_monitoring.core.event_study import get_event_study
+
+    study = get_event_study('SPY')
+    matrix = study.measure([comment.timestamp for comment in comments], horizons=(60, 240))
+    matrix.move(0, 60)        # % SPY move 1h after the first comment (None if unavailable)
+    matrix.row(0)             # {'base_price', 'move_60m', 'move_240m', 'eod', 'next_session', 'mfe', 'mae'}
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+MARKET_TZ = "US/Eastern"
+DEFAULT_HORIZONS = (60, 240)    # minutes
+LOOKAHEAD_DAYS = 4              # calendar days loaded after each event (covers weekends for next_session)
+YF_1M_CHUNK_DAYS = 7            # yfinance serves at most 7 days of 1m bars per request
+
+Event = Union[datetime, pd.Timestamp, Tuple[datetime, Sequence[int]]]
+
+
+@dataclass
+class ReactionMatrix:
+    """Reactions for a batch of events; NaN where a value could not be measured."""
+    timestamps: pd.DatetimeIndex      # event times, US/Eastern
+    horizons: Tuple[int, ...]         # minutes, column order of ``moves``
+    base_price: np.ndarray            # (n,) close of the bar at each event (NaN off-hours)
+    moves: np.ndarray                 # (n, h) % move to the bar at event + horizon
+    eod: np.ndarray                   # (n,) % move to the event session's last close
+    next_session: np.ndarray          # (n,) % move from session close to next session close
+    mfe: np.ndarray                   # (n,) max favorable (high) excursion %, over the longest horizon
+    mae: np.ndarray                   # (n,) max adverse (low) excursion %, over the longest horizon
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def move(self, i: int, horizon: int) -> Optional[float]:
+        value = self.moves[i, self.horizons.index(horizon)]
+        return None if np.isnan(value) else float(value)
+
+    def row(self, i: int) -> Dict[str, Optional[float]]:
+        out = {"base_price": _opt(self.base_price[i])}
+        for j, horizon in enumerate(self.horizons):
+            out[f"move_{horizon}m"] = _opt(self.moves[i, j])
+        out.update(eod=_opt(self.eod[i]), next_session=_opt(self.next_session[i]),
+                   mfe=_opt(self.mfe[i]), mae=_opt(self.mae[i]))
+        return out
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame([self.row(i) for i in range(len(self))], index=self.timestamps)
+
+
+def _opt(value: float) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
+
+
+def _nan(*shape) -> np.ndarray:
+    return np.full(shape, np.nan)
+
+
+def _to_eastern(ts) -> pd.Timestamp:
+    ts = pd.Timestamp(ts)
+    return ts.tz_localize(MARKET_TZ) if ts.tzinfo is None else ts.tz_convert(MARKET_TZ)
+
+
+def nearest_index(index_ns: np.ndarray, targets_ns: np.ndarray) -> np.ndarray:
+    """Index of the nearest element of sorted ``index_ns`` for each target (ties go left)."""
+    right = np.searchsorted(index_ns, targets_ns, side="left")
+    right = np.clip(right, 0, len(index_ns) - 1)
+    left = np.clip(right - 1, 0, len(index_ns) - 1)
+    take_left = np.abs(targets_ns - index_ns[left]) <= np.abs(index_ns[right] - targets_ns)
+    return np.where(take_left, left, right)
+
+
+def bar_interval_ns(index_ns: np.ndarray) -> np.int64:
+    """Typical spacing of a sorted bar index (median gap, so overnight gaps don't count)."""
+    gaps = np.diff(index_ns)
+    gaps = gaps[gaps > 0]
+    return np.int64(np.median(gaps)) if len(gaps) else np.int64(60 * 10**9)
+
+
+class EventStudy:
+    """Measures reactions of one symbol to batches of events."""
+
+    def __init__(self, symbol: str = "SPY", interval: str = "1m", store=None, fetch_missing: bool = True):
+        """
+        Args:
+            symbol: Instrument whose reaction is measured
+            interval: Bar size to read (the store falls back to coarser stored bars)
+            store: BarStore (default: shared store)
+            fetch_missing: Fetch sessions the store lacks from yfinance
+        """
+        self.symbol = symbol
+        self.interval = interval
+        self.fetch_missing = fetch_missing
+        if store is None:
+            from backtesting.engine.data.bar_store import get_bar_store
+            store = get_bar_store()
+        self.store = store
+        self._sessions: Dict[str, Optional[pd.DataFrame]] = {}
+        self._lock = threading.Lock()
+
+    # ═══════════════════════════════════════════════════════════════
+    # LOADING
+    # ═══════════════════════════════════════════════════════════════
+
+    def load(self, dates: Iterable[date]) -> pd.DataFrame:
+        """
+        Bars for the given session dates as one sorted frame (US/Eastern index).
+
+        Store reads and fetched sessions are memoized on the instance. Today's
+        session and sessions whose fetch failed are not, so they are retried.
+        """
+        wanted = sorted({d.strftime("%Y-%m-%d") for d in dates if d.weekday() < 5})
+        with self._lock:
+            missing = [d for d in wanted if d not in self._sessions]
+            for date_str in missing:
+                data, _ = self.store.read_best(self.symbol, date_str, self.interval)
+                self._sessions[date_str] = data
+            unfetched = [d for d in missing if self._sessions[d] is None]
+            if unfetched and self.fetch_missing:
+                self._fetch(unfetched)
+            today = datetime.now().strftime("%Y-%m-%d")
+            frames = [self._sessions[d] for d in wanted if self._sessions.get(d) is not None]
+            if not self.fetch_missing:
+                for date_str in unfetched:
+                    self._sessions.pop(date_str, None)
+            self._sessions.pop(today, None)
+
+        if not frames:
+            return pd.DataFrame(columns=["Open", "High", "Low", "Close", "Volume"])
+        return pd.concat(frames).sort_index()
+
+    def _fetch(self, date_strs: List[str]):
+        """One ranged yfinance history call per chunk of missing sessions; completed ones are stored."""
+        import yfinance as yf
+
+        ticker = yf.Ticker(self.symbol)
+        chunk_days = YF_1M_CHUNK_DAYS if self.interval == "1m" else 365
+        today = datetime.now().strftime("%Y-%m-%d")
+        days = [datetime.strptime(d, "%Y-%m-%d") for d in date_strs]
+
+        chunks, start = [], 0
+        for i in range(1, len(days) + 1):
+            if i == len(days) or (days[i] - days[start]).days >= chunk_days:
+                chunks.append((days[start], days[i - 1]))
+                start = i
+
+        for first, last in chunks:
+            try:
+                data = ticker.history(start=first, end=last + timedelta(days=1), interval=self.interval)
+            except Exception as e:
+                logger.warning(f"Event study fetch failed for {self.symbol} {first:%Y-%m-%d}..{last:%Y-%m-%d}: {e}")
+                for date_str in date_strs:
+                    if first.strftime("%Y-%m-%d") <= date_str <= last.strftime("%Y-%m-%d"):
+                        self._sessions.pop(date_str, None)
+                continue
+            if data.empty:
+                continue
+            data.index = (data.index.tz_localize("UTC") if data.index.tz is None else data.index).tz_convert(MARKET_TZ)
+            for date_str, day in data.groupby(data.index.strftime("%Y-%m-%d")):
+                if date_str not in self._sessions:
+                    continue
+                self._sessions[date_str] = day
+                if date_str < today:
+                    try:
+                        self.store.write(self.symbol, self.interval, day, source="yfinance")
+                    except OSError as e:
+                        logger.debug(f"Could not store {self.symbol} bars for {date_str}: {e}")
+
+    # ═══════════════════════════════════════════════════════════════
+    # MEASUREMENT
+    # ═══════════════════════════════════════════════════════════════
+
+    def measure(self, events: Sequence[Event], horizons: Sequence[int] = DEFAULT_HORIZONS,
+                lookahead_days: int = LOOKAHEAD_DAYS) -> ReactionMatrix:
+        """
+        Reaction matrix for a batch of events.
+
+        Args:
+            events: Timestamps, or (timestamp, horizons) pairs for per-event horizons
+            horizons: Minutes after the event, used for events without their own
+            lookahead_days: Calendar days after each event to load (EOD / next session)
+
+        Returns:
+            ReactionMatrix with one row per event, in input order. Columns are the
+            union of all horizons; horizons an event did not ask for are NaN.
+        """
+        stamps, per_event = [], []
+        for event in events:
+            if isinstance(event, tuple):
+                ts, event_horizons = event
+            else:
+                ts, event_horizons = event, horizons
+            stamps.append(_to_eastern(ts))
+            per_event.append(tuple(int(h) for h in event_horizons))
+
+        columns = tuple(sorted({h for hs in per_event for h in hs}))
+        n, k = len(stamps), len(columns)
+        matrix = ReactionMatrix(pd.DatetimeIndex(stamps, tz=MARKET_TZ),
+                                columns, _nan(n), _nan(n, k), _nan(n), _nan(n), _nan(n), _nan(n))
+        if n == 0:
+            return matrix
+
+        max_minutes = max(columns, default=0)
+        dates = set()
+        for ts in stamps:
+            span = pd.date_range(ts.normalize(), ts + timedelta(minutes=max_minutes, days=lookahead_days), freq="D")
+            dates.update(d.date() for d in span)
+        bars = self.load(dates)
+        if bars.empty:
+            logger.warning(f"Event study: no {self.symbol} bars for {n} events")
+            return matrix
+
+        index_ns = bars.index.tz_convert("UTC").as_unit("ns").asi8
+        close = bars["Close"].to_numpy(dtype=float)
+        high = bars["High"].to_numpy(dtype=float)
+        low = bars["Low"].to_numpy(dtype=float)
+
+        # A bar only stands for a time within one bar interval of it
+        tolerance = bar_interval_ns(index_ns)
+
+        event_ns = matrix.timestamps.tz_convert("UTC").as_unit("ns").asi8
+        base_idx = nearest_index(index_ns, event_ns)
+        measured = np.abs(index_ns[base_idx] - event_ns) <= tolerance
+        if not measured.any():
+            logger.info(f"Event study: none of {n} events fall in {self.symbol} trading hours")
+            return matrix
+        base = close[base_idx]
+        matrix.base_price[measured] = base[measured]
+
+        # Horizon targets: the bar at event + h
+        minute_ns = np.int64(60 * 10**9)
+        target_ns = event_ns[:, None] + np.asarray(columns, dtype=np.int64)[None, :] * minute_ns
+        target_idx = nearest_index(index_ns, target_ns.ravel()).reshape(n, k)
+        requested = np.array([[h in hs for h in columns] for hs in per_event], dtype=bool).reshape(n, k)
+        in_range = (np.abs(index_ns[target_idx] - target_ns) <= tolerance) \
+            & (target_idx >= base_idx[:, None]) & requested & measured[:, None]
+        matrix.moves[in_range] = ((close[target_idx] - base[:, None]) / base[:, None] * 100)[in_range]
+
+        # Session boundaries → EOD and next-session closes
+        session_key = bars.index.normalize().asi8
+        starts = np.flatnonzero(np.r_[True, session_key[1:] != session_key[:-1]])
+        ends = np.r_[starts[1:] - 1, len(close) - 1]
+        session = np.searchsorted(starts, base_idx, side="right") - 1
+        eod_close = close[ends[session]]
+        matrix.eod[measured] = ((eod_close - base) / base * 100)[measured]
+        has_next = (session + 1 < len(starts)) & measured
+        next_close = close[ends[np.minimum(session + 1, len(starts) - 1)]]
+        matrix.next_session[has_next] = ((next_close - eod_close) / eod_close * 100)[has_next]
+
+        # Excursions over [event, longest measured horizon]; EOD when no horizon resolved
+        window_end = np.where(in_range, target_idx, -1).max(axis=1) if k else np.full(n, -1)
+        window_end = np.where(window_end >= 0, window_end, ends[session])
+        for i in np.flatnonzero(measured):
+            lo, hi = base_idx[i], window_end[i] + 1
+            matrix.mfe[i] = (high[lo:hi].max() - base[i]) / base[i] * 100
+            matrix.mae[i] = (low[lo:hi].min() - base[i]) / base[i] * 100
+
+        return matrix
+
+
+_studies: Dict[Tuple[str, str], EventStudy] = {}
+_studies_lock = threading.Lock()
+
+
+def get_event_study(symbol: str = "SPY", interval: str = "1m") -> EventStudy:
+    """Process-wide EventStudy per (symbol, interval), sharing loaded sessions."""
+    key = (symbol.upper(), interval)
+    with _studies_lock:
+        if key not in _studies:
+            _studies[key] = EventStudy(symbol.upper(), interval)
+        return _studies[key]
@@ -20,6 +20,13 @@ import logging
 import yfinance as yf
 import numpy as np
 
+try:
+    from live_monitoring.core.options_analytics import ChainArrays, gex_by_strike, gamma_flip_nearest, model_gamma
+    from live_monitoring.core.market_data import get_market_data
+except ImportError:  # loaded via sys.path as a top-level module (signal_generator)
+    from options_analytics import ChainArrays, gex_by_strike, gamma_flip_nearest, model_gamma
+    from market_data import get_market_data
+
 logger = logging.getLogger(__name__)
 
 
@@ -65,9 +72,11 @@ class GammaExposureTracker:
             GammaExposureData with gamma analysis
         """
         try:
-            # Get options chain from yfinance (ChartExchange only has summary)
-            ticker = yf.Ticker(symbol)
-            expirations = ticker.options
+            # Get options chain from yfinance (ChartExchange only has summary).
+            # Shared bus → same chain snapshot across calls, so the greeks
+            # engine only re-runs d1/d2 when price moves.
+            bus = get_market_data()
+            expirations = bus.get_options(symbol)
             
             if not expirations:
                 logger.warning(f"No options expirations found for {symbol}")
@@ -75,47 +84,21 @@ class GammaExposureTracker:
             
             # Use nearest expiration for gamma calculation
             nearest_exp = expirations[0]
-            opt_chain = ticker.option_chain(nearest_exp)
+            opt_chain = bus.get_option_chain(symbol, nearest_exp)
+            if opt_chain is None:
+                logger.warning(f"No options chain for {symbol} {nearest_exp}")
+                return None
             
-            gamma_by_strike = {}
+            chain = ChainArrays.from_frames(opt_chain.calls, opt_chain.puts, expiration=nearest_exp)
             
-            # Process calls
-            for _, call in opt_chain.calls.iterrows():
-                strike = float(call['strike'])
-                oi = int(call['openInterest']) if 'openInterest' in call and not np.isnan(call['openInterest']) else 0
-                # Gamma may not always be available in yfinance, use delta as proxy if needed
-                if 'gamma' in call and not np.isnan(call['gamma']):
-                    gamma = float(call['gamma'])
-                elif 'delta' in call and not np.isnan(call['delta']):
-                    # Use delta as rough proxy (gamma is derivative of delta)
-                    gamma = abs(float(call['delta'])) * 0.1  # Rough approximation
-                else:
-                    gamma = 0.0
-                
-                # Dealers are opposite side (market makers short calls when retail buys)
-                # Net gamma = -call_oi * gamma (dealers short = negative gamma)
-                if strike not in gamma_by_strike:
-                    gamma_by_strike[strike] = 0.0
-                gamma_by_strike[strike] -= oi * gamma * 100  # Convert to shares (100 per contract)
+            # yfinance ships IV but no gamma → Black-Scholes gamma from IV/expiry
+            gamma = model_gamma(chain, spot=price)
             
-            # Process puts
-            for _, put in opt_chain.puts.iterrows():
-                strike = float(put['strike'])
-                oi = int(put['openInterest']) if 'openInterest' in put and not np.isnan(put['openInterest']) else 0
-                # Gamma may not always be available in yfinance, use delta as proxy if needed
-                if 'gamma' in put and not np.isnan(put['gamma']):
-                    gamma = float(put['gamma'])
-                elif 'delta' in put and not np.isnan(put['delta']):
-                    # Use delta as rough proxy (gamma is derivative of delta)
-                    gamma = abs(float(put['delta'])) * 0.1  # Rough approximation
-                else:
-                    gamma = 0.0
-                
-                # Dealers are opposite side (market makers short puts when retail buys)
-                # Net gamma = +put_oi * gamma (dealers short puts = positive gamma)
-                if strike not in gamma_by_strike:
-                    gamma_by_strike[strike] = 0.0
-                gamma_by_strike[strike] += oi * gamma * 100  # Convert to shares
+            # Dealers are opposite side of retail:
+            # calls → dealers short = negative gamma, puts → positive gamma.
+            # x100 converts contracts to shares.
+            strikes, gex, _ = gex_by_strike(chain, call_sign=-1.0, put_sign=1.0, scale=100.0, gamma=gamma)
+            gamma_by_strike = dict(zip(strikes.tolist(), gex.tolist()))
             
             # Find gamma flip point (where GEX crosses zero)
             gamma_flip = self._find_gamma_flip(gamma_by_strike, price)
@@ -150,21 +133,11 @@ class GammaExposureTracker:
         if not gamma_by_strike:
             return None
         
-        # Sort strikes by distance from current price
-        strikes = sorted(gamma_by_strike.keys(), key=lambda s: abs(s - current_price))
-        
-        # Find where cumulative GEX crosses zero
-        cumulative_gex = 0.0
-        for strike in strikes:
-            cumulative_gex += gamma_by_strike[strike]
-            
-            # If we've crossed zero, return this strike
-            if cumulative_gex <= 0:
-                return strike
-        
-        # If never crossed zero, return strike with minimum GEX
-        min_gex_strike = min(gamma_by_strike.items(), key=lambda x: abs(x[1]))
-        return min_gex_strike[0]
+        # Walk strikes outward from price; first point where cumulative GEX <= 0.
+        # If it never crosses zero, the strike with minimum |GEX|.
+        strikes = np.fromiter(gamma_by_strike.keys(), dtype=float)
+        gex = np.fromiter(gamma_by_strike.values(), dtype=float)
+        return gamma_flip_nearest(strikes, gex, current_price)
     
     def should_trade_based_on_gamma(self, price: float, gamma_data: GammaExposureData, 
                                    signal_action: str) -> Tuple[bool, str]:
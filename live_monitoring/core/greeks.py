@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+BLACK-SCHOLES GREEKS ENGINE
+===========================
+Vectorized delta / gamma / vanna / charm for whole options chains.
+
+yfinance chains ship implied volatility but no gamma, so GEX used to fall
+back to abs(delta) * 0.1 — effectively noise. This engine computes real
+Black-Scholes greeks from (strike, time-to-expiry, IV, spot, rate) as array
+math, with no per-row Python cost.
+
+Caching:
+- Spot-independent terms (ln K, sigma*sqrt(T), drift, discount factors) are
+  cached per chain snapshot, keyed by (strike, IV, call/put) only. When only
+  spot moves, recomputation is a single d1/d2 update over the cached arrays.
+- Time-to-expiry is not part of the key: it shrinks on every fetch, so the
+  snapshot keeps its T until the caller's T drifts by more than a minute,
+  then refreshes just the T-dependent terms.
+- The last result per snapshot is kept, so repeated calls at the same spot
+  are free.
+
+Usage:
+    engine = get_greeks_engine()
+    g = engine.compute(strike, t_years, iv, is_call, spot=512.3)
+    g.gamma, g.delta, g.vanna, g.charm
+"""
+
+import hashlib
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+
+try:
+    from scipy.special import ndtr as _norm_cdf
+except ImportError:  # scipy is optional — fall back to math.erf
+    _erf = np.vectorize(math.erf, otypes=[float])
+
+    def _norm_cdf(x):
+        return 0.5 * (1.0 + _erf(np.asarray(x, dtype=float) / math.sqrt(2.0)))
+
+
+DEFAULT_RATE = 0.045           # Annualized risk-free rate
+MIN_T_YEARS = 1.0 / (365 * 24)  # Floor at one hour so 0DTE does not divide by zero
+T_TOLERANCE_YEARS = 60.0 / (365 * 24 * 3600)  # Reuse a snapshot's T until it is a minute stale
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+
+def _norm_pdf(x: np.ndarray) -> np.ndarray:
+    return _INV_SQRT_2PI * np.exp(-0.5 * x * x)
+
+
+def years_to_expiry(expiration, now: Optional[datetime] = None) -> float:
+    """
+    Year fraction until 16:00 on the expiration date.
+
+    Args:
+        expiration: 'YYYY-MM-DD' string or datetime
+    """
+    now = now or datetime.now()
+    if isinstance(expiration, str):
+        expiration = datetime.strptime(expiration[:10], '%Y-%m-%d')
+    expiry = expiration.replace(hour=16, minute=0, second=0, microsecond=0)
+    return max((expiry - now).total_seconds() / (365.0 * 24 * 3600), MIN_T_YEARS)
+
+
+@dataclass
+class Greeks:
+    """Per-contract greeks (NaN where IV/T are unusable)."""
+    delta: np.ndarray
+    gamma: np.ndarray
+    vanna: np.ndarray
+    charm: np.ndarray  # per year; divide by 365 for per-day decay
+
+
+class _Snapshot:
+    """Spot-independent terms for one chain snapshot."""
+
+    __slots__ = ('log_k', 'sig_sqrt_t', 'drift', 't', 'sigma', 'is_call', 'valid',
+                 'disc_q', 'rate', 'div', 'last_spot', 'last_result')
+
+    def __init__(self, strike, t, iv, is_call, rate, div):
+        strike = np.asarray(strike, dtype=float)
+        sigma = np.asarray(iv, dtype=float) * np.ones_like(strike)
+
+        self.valid = (strike > 0) & np.isfinite(sigma) & (sigma > 0)
+        safe_sigma = np.where(self.valid, sigma, 1.0)
+        safe_strike = np.where(self.valid, strike, 1.0)
+
+        self.sigma = safe_sigma
+        self.log_k = np.log(safe_strike)
+        self.is_call = np.asarray(is_call, dtype=bool) * np.ones(strike.shape, dtype=bool)
+        self.rate = rate
+        self.div = div
+        self.set_t(t)
+
+    def _broadcast_t(self, t) -> np.ndarray:
+        return np.maximum(np.asarray(t, dtype=float) * np.ones_like(self.sigma), MIN_T_YEARS)
+
+    def matches_t(self, t) -> bool:
+        """True if t is within T_TOLERANCE_YEARS of the cached time-to-expiry."""
+        return np.allclose(self._broadcast_t(t), self.t, rtol=0.0, atol=T_TOLERANCE_YEARS, equal_nan=True)
+
+    def set_t(self, t):
+        """Recompute the time-dependent terms (and drop the cached result)."""
+        t = self._broadcast_t(t)
+        self.t = t
+        self.sig_sqrt_t = self.sigma * np.sqrt(t)
+        self.drift = (self.rate - self.div + 0.5 * self.sigma ** 2) * t
+        self.disc_q = np.exp(-self.div * t)
+        self.last_spot = None
+        self.last_result: Optional[Greeks] = None
+
+    def at_spot(self, spot: float) -> Greeks:
+        if self.last_spot == spot and self.last_result is not None:
+            return self.last_result
+
+        d1 = (math.log(spot) - self.log_k + self.drift) / self.sig_sqrt_t
+        d2 = d1 - self.sig_sqrt_t
+        pdf = _norm_pdf(d1)
+        cdf = _norm_cdf(d1)
+
+        delta = np.where(self.is_call, self.disc_q * cdf, self.disc_q * (cdf - 1.0))
+        gamma = self.disc_q * pdf / (spot * self.sig_sqrt_t)
+        vanna = -self.disc_q * pdf * d2 / self.sigma
+        charm_common = -self.disc_q * pdf * (2 * (self.rate - self.div) * self.t - d2 * self.sig_sqrt_t) \
+            / (2 * self.t * self.sig_sqrt_t)
+        charm = np.where(
+            self.is_call,
+            self.div * self.disc_q * cdf + charm_common,
+            -self.div * self.disc_q * (1.0 - cdf) + charm_common,
+        )
+
+        nan = np.nan
+        result = Greeks(
+            delta=np.where(self.valid, delta, nan),
+            gamma=np.where(self.valid, gamma, nan),
+            vanna=np.where(self.valid, vanna, nan),
+            charm=np.where(self.valid, charm, nan),
+        )
+        self.last_spot = spot
+        self.last_result = result
+        return result
+
+
+class GreeksEngine:
+    """Vectorized Black-Scholes greeks with per-snapshot caching."""
+
+    def __init__(self, rate: float = DEFAULT_RATE, dividend_yield: float = 0.0, max_snapshots: int = 64):
+        self.rate = rate
+        self.dividend_yield = dividend_yield
+        self.max_snapshots = max_snapshots
+        self._snapshots: "OrderedDict[str, _Snapshot]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'snapshots_built': 0, 'spot_updates': 0, 't_refreshes': 0, 'hits': 0}
+
+    @staticmethod
+    def snapshot_key(strike, iv, is_call) -> str:
+        """Content hash of the chain identity (cheap: hashes raw array bytes)."""
+        h = hashlib.blake2b(digest_size=16)
+        for arr in (strike, iv, is_call):
+            h.update(np.ascontiguousarray(arr).tobytes())
+        return h.hexdigest()
+
+    def compute(self, strike, t, iv, is_call, spot: float, snapshot_key: Optional[str] = None) -> Greeks:
+        """
+        Greeks for every contract.
+
+        Args:
+            strike, t, iv, is_call: per-contract arrays (t in years; scalars broadcast)
+            spot: underlying price
+            snapshot_key: caller-supplied chain identity; hashed from strike/iv/is_call if omitted
+        """
+        strike = np.asarray(strike, dtype=float)
+        t = np.asarray(t, dtype=float)
+        iv = np.asarray(iv, dtype=float)
+        is_call = np.asarray(is_call, dtype=bool)
+        key = snapshot_key or self.snapshot_key(strike, iv, is_call)
+
+        with self._lock:
+            snap = self._snapshots.get(key)
+            if snap is None:
+                snap = _Snapshot(strike, t, iv, is_call, self.rate, self.dividend_yield)
+                self._snapshots[key] = snap
+                self.stats['snapshots_built'] += 1
+                while len(self._snapshots) > self.max_snapshots:
+                    self._snapshots.popitem(last=False)
+            else:
+                self._snapshots.move_to_end(key)
+                if not snap.matches_t(t):
+                    snap.set_t(t)
+                    self.stats['t_refreshes'] += 1
+                elif snap.last_spot == spot:
+                    self.stats['hits'] += 1
+                else:
+                    self.stats['spot_updates'] += 1
+            return snap.at_spot(float(spot))
+
+    def clear(self):
+        with self._lock:
+            self._snapshots.clear()
+
+
+_engine: Optional[GreeksEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_greeks_engine() -> GreeksEngine:
+    """Process-wide GreeksEngine singleton."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = GreeksEngine()
+    return _engine
@@ -0,0 +1,327 @@
+"""
+📡 MARKET DATA BUS
+
+Process-wide read-through cache in front of yfinance.
+
+Every checker, tracker and API route used to build its own yf.Ticker() and
+re-download the same SPY/QQQ quotes and 1m history several times a minute.
+This module gives them one shared service:
+
+- Request coalescing: one in-flight fetch per (kind, symbol, params) key;
+  concurrent callers wait on the same result instead of hitting Yahoo again.
+- TTL cache for quotes, bars, expirations and option chains (bounded LRU).
+- Batched multi-symbol history via yf.download().
+
+Usage:
+    from live_monitoring.core.market_data import get_market_data
+
+    bus = get_market_data()
+    price = bus.get_price('SPY')
+    bars = bus.get_history('SPY', period='1d', interval='1m')
+    chain = bus.get_option_chain('SPY', bus.get_options('SPY')[0])
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import yfinance as yf
+except ImportError:  # pragma: no cover - yfinance is a core dependency
+    yf = None
+
+
+# TTLs in seconds by data kind
+QUOTE_TTL = 15
+OPTIONS_TTL = 300
+CHAIN_TTL = 120
+HISTORY_TTL_BY_INTERVAL = {
+    '1m': 30,
+    '2m': 60,
+    '5m': 60,
+    '15m': 120,
+    '30m': 300,
+    '60m': 300,
+    '1h': 300,
+    '1d': 900,
+}
+DEFAULT_HISTORY_TTL = 300
+
+
+class _InFlight:
+    """A fetch in progress that other callers can wait on."""
+
+    __slots__ = ('event', 'value', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+class MarketDataBus:
+    """
+    Shared, thread-safe market data service.
+
+    All public getters are fail-safe in the same way the call sites they
+    replace were: quotes return None and frames return an empty DataFrame
+    (or None for chains) when Yahoo has nothing.
+    """
+
+    def __init__(self, max_entries: int = 512, ticker_factory: Optional[Callable[[str], Any]] = None,
+                 download_fn: Optional[Callable] = None):
+        """
+        Args:
+            max_entries: LRU bound on cached results (all kinds combined)
+            ticker_factory: fn(symbol) -> yf.Ticker-like object (for tests)
+            download_fn: yf.download-compatible batch function (for tests)
+        """
+        self.max_entries = max_entries
+        self._ticker_factory = ticker_factory or (lambda s: yf.Ticker(s))
+        self._download_fn = download_fn or (lambda *a, **kw: yf.download(*a, **kw))
+
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._in_flight: Dict[Tuple, _InFlight] = {}
+        self._tickers: Dict[str, Any] = {}
+
+        self.stats = {'hits': 0, 'misses': 0, 'coalesced': 0, 'errors': 0}
+
+    # ═══════════════════════════════════════════════════════════════
+    # CORE: cache + single-flight
+    # ═══════════════════════════════════════════════════════════════
+
+    def _get_or_fetch(self, key: Tuple, ttl: float, fetch: Callable[[], Any]) -> Any:
+        """Return cached value for key, or run fetch() once for all concurrent callers."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] > now:
+                self._cache.move_to_end(key)
+                self.stats['hits'] += 1
+                return entry[1]
+
+            flight = self._in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = _InFlight()
+                self._in_flight[key] = flight
+                self.stats['misses'] += 1
+            else:
+                self.stats['coalesced'] += 1
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            value = fetch()
+            flight.value = value
+            self._store(key, value, ttl)
+            return value
+        except BaseException as e:
+            flight.error = e
+            with self._lock:
+                self.stats['errors'] += 1
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            flight.event.set()
+
+    def _store(self, key: Tuple, value: Any, ttl: float):
+        with self._lock:
+            self._cache[key] = (time.monotonic() + ttl, value)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    def ticker(self, symbol: str):
+        """Shared yf.Ticker instance per symbol (keeps yfinance's own session/cookies warm)."""
+        symbol = symbol.upper()
+        with self._lock:
+            t = self._tickers.get(symbol)
+            if t is None:
+                t = self._ticker_factory(symbol)
+                self._tickers[symbol] = t
+            return t
+
+    def invalidate(self, symbol: Optional[str] = None):
+        """Drop cached entries for one symbol, or everything."""
+        with self._lock:
+            if symbol is None:
+                self._cache.clear()
+                return
+            symbol = symbol.upper()
+            for key in [k for k in self._cache if k[1] == symbol]:
+                del self._cache[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            stats['entries'] = len(self._cache)
+            stats['in_flight'] = len(self._in_flight)
+        total = stats['hits'] + stats['misses'] + stats['coalesced']
+        stats['hit_rate'] = round((stats['hits'] + stats['coalesced']) / total, 3) if total else 0.0
+        return stats
+
+    # ═══════════════════════════════════════════════════════════════
+    # QUOTES
+    # ═══════════════════════════════════════════════════════════════
+
+    def get_price(self, symbol: str, ttl: float = QUOTE_TTL) -> Optional[float]:
+        """Latest trade price (fast_info, falling back to last 1m close). None on failure."""
+        symbol = symbol.upper()
+
+        def fetch():
+            t = self.ticker(symbol)
+            price = None
+            try:
+                price = t.fast_info.last_price
+            except Exception:
+                price = None
+            if not price:
+                hist = self.get_history(symbol, period='1d', interval='1m')
+                if hist is not None and not hist.empty:
+                    price = hist['Close'].iloc[-1]
+            return float(price) if price else None
+
+        try:
+            return self._get_or_fetch(('quote', symbol), ttl, fetch)
+        except Exception as e:
+            logger.debug(f"MarketDataBus.get_price({symbol}) failed: {e}")
+            return None
+
+    def get_prices(self, symbols: Iterable[str]) -> Dict[str, Optional[float]]:
+        """Latest prices for several symbols, using one batched 1m download for the misses."""
+        symbols = [s.upper() for s in symbols]
+        self.download(symbols, period='1d', interval='1m')
+        return {s: self.get_last_close(s, period='1d', interval='1m') for s in symbols}
+
+    def get_last_close(self, symbol: str, period: str = '1d', interval: str = '1m') -> Optional[float]:
+        """Close of the most recent bar for (period, interval). None if no bars."""
+        hist = self.get_history(symbol, period=period, interval=interval)
+        if hist is None or hist.empty:
+            return None
+        return float(hist['Close'].iloc[-1])
+
+    # ═══════════════════════════════════════════════════════════════
+    # BARS
+    # ═══════════════════════════════════════════════════════════════
+
+    def get_history(self, symbol: str, period: Optional[str] = '1d', interval: str = '1d',
+                    start: Optional[str] = None, end: Optional[str] = None,
+                    ttl: Optional[float] = None):
+        """
+        OHLCV bars, same arguments as yf.Ticker.history().
+
+        The returned DataFrame is shared with other callers — copy before mutating.
+        """
+        symbol = symbol.upper()
+        if start or end:
+            period = None
+        key = ('history', symbol, period, interval, start, end)
+        if ttl is None:
+            ttl = HISTORY_TTL_BY_INTERVAL.get(interval, DEFAULT_HISTORY_TTL)
+
+        def fetch():
+            kwargs = {'interval': interval}
+            if period:
+                kwargs['period'] = period
+            if start:
+                kwargs['start'] = start
+            if end:
+                kwargs['end'] = end
+            return self.ticker(symbol).history(**kwargs)
+
+        try:
+            return self._get_or_fetch(key, ttl, fetch)
+        except Exception as e:
+            logger.debug(f"MarketDataBus.get_history({symbol}, {period}, {interval}) failed: {e}")
+            import pandas as pd
+            return pd.DataFrame()
+
+    def download(self, symbols: Iterable[str], period: str = '1d', interval: str = '1m') -> List[str]:
+        """
+        Warm the history cache for several symbols with one yf.download() call.
+
+        Only symbols without a fresh entry are requested. Frames are stored
+        under the same key get_history() uses, so they are fetched the way
+        Ticker.history() fetches (split/dividend-adjusted, with actions).
+        Returns the symbols that were fetched.
+        """
+        symbols = [s.upper() for s in symbols]
+        now = time.monotonic()
+        with self._lock:
+            missing = []
+            for s in symbols:
+                entry = self._cache.get(('history', s, period, interval, None, None))
+                if entry is None or entry[0] <= now:
+                    missing.append(s)
+        if not missing:
+            return []
+
+        ttl = HISTORY_TTL_BY_INTERVAL.get(interval, DEFAULT_HISTORY_TTL)
+        if len(missing) == 1:
+            self.get_history(missing[0], period=period, interval=interval)
+            return missing
+
+        try:
+            data = self._download_fn(missing, period=period, interval=interval, group_by='ticker',
+                                     progress=False, threads=True, auto_adjust=True, actions=True)
+        except Exception as e:
+            logger.debug(f"MarketDataBus.download({missing}) failed: {e}")
+            return []
+
+        with self._lock:
+            self.stats['misses'] += len(missing)
+        for s in missing:
+            try:
+                frame = data[s].dropna(how='all')
+            except Exception:
+                continue
+            self._store(('history', s, period, interval, None, None), frame, ttl)
+        return missing
+
+    # ═══════════════════════════════════════════════════════════════
+    # OPTIONS
+    # ═══════════════════════════════════════════════════════════════
+
+    def get_options(self, symbol: str, ttl: float = OPTIONS_TTL) -> Tuple[str, ...]:
+        """Available option expirations (empty tuple on failure)."""
+        symbol = symbol.upper()
+        try:
+            return self._get_or_fetch(('options', symbol), ttl, lambda: tuple(self.ticker(symbol).options or ()))
+        except Exception as e:
+            logger.debug(f"MarketDataBus.get_options({symbol}) failed: {e}")
+            return ()
+
+    def get_option_chain(self, symbol: str, expiration: str, ttl: float = CHAIN_TTL):
+        """yfinance option chain (namedtuple with .calls/.puts). None on failure."""
+        symbol = symbol.upper()
+        try:
+            return self._get_or_fetch(('chain', symbol, expiration), ttl,
+                                      lambda: self.ticker(symbol).option_chain(expiration))
+        except Exception as e:
+            logger.debug(f"MarketDataBus.get_option_chain({symbol}, {expiration}) failed: {e}")
+            return None
+
+
+_bus: Optional[MarketDataBus] = None
+_bus_lock = threading.Lock()
+
+
+def get_market_data() -> MarketDataBus:
+    """Process-wide MarketDataBus singleton."""
+    global _bus
+    if _bus is None:
+        with _bus_lock:
+            if _bus is None:
+                _bus = MarketDataBus()
+    return _bus
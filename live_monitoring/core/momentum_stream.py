@@ -0,0 +1,189 @@
+"""
+📈 MOMENTUM STREAM
+
+Streaming state behind SignalGenerator's real-time selloff/rally detection.
+
+The detectors used to rebuild everything from the minute-bar DataFrame on every
+call: slice the last 30 bars, walk them with iloc to count red/green bars,
+re-average volume. MomentumStream keeps the same quantities per symbol and
+updates them in O(1) per bar:
+
+- day open (first bar's Open)
+- consecutive red / green closes (capped at 9, as the old 10-bar scan was)
+- 10-bar rolling change (ring of the last 10 closes)
+- mean volume of the 29 bars before the last one (ring + running sum)
+
+Live callers pass the day's DataFrame and sync() ingests only the bars added
+since the previous call; the still-forming last bar is replaced in place.
+Backtests push() bars one at a time and read features().
+
+Usage:
+    stream = MomentumStream()
+    for o, c, v in bars:
+        stream.push(o, c, v)
+        features = stream.features()
+        signal = signal_generator._detect_realtime_selloff(symbol, c, None, features=features)
+"""
+
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import pandas as pd
+
+MIN_BARS = 5            # detectors stay silent below this many bars
+RECENT_BARS = 30        # momentum / volume window
+ROLLING_BARS = 10       # rolling-change window
+STREAK_CAP = 9          # the old scan compared at most 9 bar pairs
+
+
+@dataclass(frozen=True)
+class MomentumFeatures:
+    """Inputs the selloff/rally detectors need, as of the last bar."""
+    bars: int
+    day_open: float
+    current_close: float
+    pct_from_open: float
+    consecutive_red: int
+    consecutive_green: int
+    rolling_change: float
+    avg_volume: float
+    last_volume: float
+
+
+class MomentumStream:
+    """O(1)-per-bar momentum state for one symbol's session."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.day_open: Optional[float] = None
+        self.first_key: Any = None
+        self.last_key: Any = None
+        self._closes = deque(maxlen=ROLLING_BARS)
+        self._volumes = deque(maxlen=RECENT_BARS)
+        self._vol_sum = 0.0
+        self._vol_n = 0
+        self._red = self._green = 0
+        self._prev_red = self._prev_green = 0
+        self._prev_bar = None       # (key, open, close, volume) of the bar before last
+        self._last_open = None
+
+    # ═══════════════════════════════════════════════════════════════
+    # INGEST
+    # ═══════════════════════════════════════════════════════════════
+
+    def push(self, open_: float, close: float, volume: float, key: Any = None):
+        """
+        Append a bar. A bar with the same key as the last one replaces it
+        (the live feed keeps updating the current minute).
+        """
+        if self.count and key is not None and key == self.last_key:
+            self._pop_last()
+        elif self.count:
+            self._prev_bar = (self.last_key, self._last_open, self._closes[-1], self._volumes[-1])
+            self._prev_red, self._prev_green = self._red, self._green
+
+        if self.count == 0:
+            self.day_open = float(open_)
+            self.first_key = key
+            self._red = self._green = 0
+        else:
+            prev_close = self._closes[-1]
+            self._red = self._prev_red + 1 if close < prev_close else 0
+            self._green = self._prev_green + 1 if close > prev_close else 0
+
+        if len(self._volumes) == self._volumes.maxlen:
+            self._drop_volume(self._volumes[0])
+        self._volumes.append(volume)
+        if not math.isnan(volume):
+            self._vol_sum += volume
+            self._vol_n += 1
+        self._closes.append(close)
+        self._last_open = open_
+        self.last_key = key
+        self.count += 1
+
+    def _pop_last(self):
+        self._drop_volume(self._volumes.pop())
+        self._closes.pop()
+        self._red, self._green = self._prev_red, self._prev_green
+        self.count -= 1
+        if self.count == 0:
+            self.reset()
+
+    def _drop_volume(self, volume: float):
+        if not math.isnan(volume):
+            self._vol_sum -= volume
+            self._vol_n -= 1
+
+    def sync(self, minute_bars: pd.DataFrame) -> Optional[MomentumFeatures]:
+        """
+        Bring the stream up to date with the day's minute bars.
+
+        Bars are assumed append-only apart from the last (forming) one; if the
+        frame no longer lines up with what was ingested (new session, different
+        slice) the stream is rebuilt from the frame.
+        """
+        n = len(minute_bars)
+        start = 0
+        if self._lines_up(minute_bars, n):
+            start = self.count - 1      # re-push the bar that may have been forming
+        else:
+            self.reset()
+
+        tail_opens = minute_bars["Open"].iloc[start:].to_numpy(dtype=float)
+        tail_closes = minute_bars["Close"].iloc[start:].to_numpy(dtype=float)
+        tail_volumes = minute_bars["Volume"].iloc[start:].to_numpy(dtype=float)
+        for offset, key in enumerate(minute_bars.index[start:]):
+            self.push(float(tail_opens[offset]), float(tail_closes[offset]), float(tail_volumes[offset]), key=key)
+        return self.features()
+
+    def _lines_up(self, minute_bars: pd.DataFrame, n: int) -> bool:
+        if not self.count or n < self.count:
+            return False
+        index = minute_bars.index
+        if index[0] != self.first_key or index[self.count - 1] != self.last_key:
+            return False
+        if float(minute_bars["Open"].iloc[0]) != self.day_open:
+            return False
+        if self._prev_bar is not None:
+            key, open_, close, volume = self._prev_bar
+            row = minute_bars.iloc[self.count - 2]
+            if index[self.count - 2] != key or float(row["Close"]) != close or float(row["Open"]) != open_:
+                return False
+        return True
+
+    # ═══════════════════════════════════════════════════════════════
+    # READ
+    # ═══════════════════════════════════════════════════════════════
+
+    def features(self) -> Optional[MomentumFeatures]:
+        """Current detector inputs, or None with fewer than MIN_BARS bars."""
+        if self.count < MIN_BARS:
+            return None
+        current_close = self._closes[-1]
+        last_volume = self._volumes[-1]
+
+        # Mean of the window's volumes before the last bar (NaNs skipped, as pandas does)
+        prior_sum, prior_n = self._vol_sum, self._vol_n
+        if not math.isnan(last_volume):
+            prior_sum -= last_volume
+            prior_n -= 1
+        avg_volume = prior_sum / prior_n if prior_n else float('nan')
+
+        start_price = self._closes[0]
+        return MomentumFeatures(
+            bars=self.count,
+            day_open=self.day_open,
+            current_close=current_close,
+            pct_from_open=(current_close - self.day_open) / self.day_open,
+            consecutive_red=min(self._red, STREAK_CAP),
+            consecutive_green=min(self._green, STREAK_CAP),
+            rolling_change=(current_close - start_price) / start_price,
+            avg_volume=avg_volume,
+            last_volume=last_volume,
+        )
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+OPTIONS CHAIN ANALYTICS
+=======================
+NumPy-backed max pain, per-strike GEX, gamma flip and call/put walls.
+
+Shared by GammaTracker (exploitation), GammaExposureTracker (core) and
+GEXCalculator (enrichment). Every routine works on flat arrays, so chains
+from several expirations can simply be concatenated.
+
+- Max pain: O((S + C) log C) via sorted cumulative sums instead of
+  O(S x C) iterrows() loops.
+- GEX by strike: one np.unique + np.bincount aggregation.
+- Missing gamma is filled from Black-Scholes (greeks.py) using IV/expiry.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from live_monitoring.core.greeks import GreeksEngine, get_greeks_engine, years_to_expiry
+except ImportError:  # loaded via sys.path as a top-level module (signal_generator)
+    from greeks import GreeksEngine, get_greeks_engine, years_to_expiry
+
+
+@dataclass
+class ChainArrays:
+    """Flat per-contract arrays for one or more expirations."""
+    strike: np.ndarray          # float64
+    open_interest: np.ndarray   # float64, NaN/negative already zeroed
+    gamma: np.ndarray           # float64, NaN where unknown
+    is_call: np.ndarray         # bool
+    delta: Optional[np.ndarray] = None
+    iv: Optional[np.ndarray] = None         # implied vol (decimal)
+    t: Optional[np.ndarray] = None          # years to expiry
+
+    def __len__(self) -> int:
+        return len(self.strike)
+
+    @property
+    def calls(self) -> "ChainArrays":
+        return self._mask(self.is_call)
+
+    @property
+    def puts(self) -> "ChainArrays":
+        return self._mask(~self.is_call)
+
+    def _mask(self, mask: np.ndarray) -> "ChainArrays":
+        return ChainArrays(
+            strike=self.strike[mask],
+            open_interest=self.open_interest[mask],
+            gamma=self.gamma[mask],
+            is_call=self.is_call[mask],
+            delta=self.delta[mask] if self.delta is not None else None,
+            iv=self.iv[mask] if self.iv is not None else None,
+            t=self.t[mask] if self.t is not None else None,
+        )
+
+    def within(self, low: float, high: float) -> "ChainArrays":
+        """Contracts with low <= strike <= high."""
+        return self._mask((self.strike >= low) & (self.strike <= high))
+
+    # ── Constructors ──────────────────────────────────────────────────────
+
+    @classmethod
+    def from_frames(cls, calls, puts, expiration: Optional[str] = None) -> "ChainArrays":
+        """
+        Build from yfinance option_chain() calls/puts DataFrames.
+
+        Args:
+            expiration: 'YYYY-MM-DD'; enables time-to-expiry for model greeks
+        """
+        t = years_to_expiry(expiration) if expiration else None
+        parts = [_frame_arrays(calls, True, t), _frame_arrays(puts, False, t)]
+        return cls.concat(parts)
+
+    @classmethod
+    def from_cboe(cls, options: Iterable[Dict]) -> "ChainArrays":
+        """
+        Build from the CBOE delayed-quotes 'options' list.
+
+        Strike is parsed from the OCC symbol (last 8 digits / 1000); call/put
+        is taken from the delta sign, matching GEXCalculator's historical logic.
+        """
+        strikes, ois, gammas, deltas, ivs, ts = [], [], [], [], [], []
+        now = datetime.now()
+        for o in options:
+            sym = o.get("option", "")
+            if not sym or len(sym) < 10:
+                continue
+            try:
+                strike = int(sym[-8:]) / 1000
+            except (ValueError, IndexError):
+                continue
+            try:
+                t = years_to_expiry(datetime.strptime(sym[-15:-9], '%y%m%d'), now)
+            except ValueError:
+                t = np.nan
+            strikes.append(strike)
+            ois.append(o.get("open_interest", 0) or 0)
+            gammas.append(o.get("gamma", 0) or 0)
+            deltas.append(o.get("delta", 0) or 0)
+            ivs.append(o.get("iv", np.nan) or np.nan)
+            ts.append(t)
+
+        delta = np.asarray(deltas, dtype=float)
+        return cls(
+            strike=np.asarray(strikes, dtype=float),
+            open_interest=np.floor(np.asarray(ois, dtype=float)),
+            gamma=np.asarray(gammas, dtype=float),
+            is_call=delta > 0,
+            delta=delta,
+            iv=np.asarray(ivs, dtype=float),
+            t=np.asarray(ts, dtype=float),
+        )
+
+    @classmethod
+    def concat(cls, chains: List["ChainArrays"]) -> "ChainArrays":
+        """Stack several chains (e.g. one per expiration) into one."""
+        chains = [c for c in chains if c is not None]
+        if not chains:
+            return cls(np.empty(0), np.empty(0), np.empty(0), np.empty(0, dtype=bool))
+        deltas = [c.delta for c in chains]
+        ivs = [c.iv for c in chains]
+        ts = [c.t for c in chains]
+        return cls(
+            strike=np.concatenate([c.strike for c in chains]),
+            open_interest=np.concatenate([c.open_interest for c in chains]),
+            gamma=np.concatenate([c.gamma for c in chains]),
+            is_call=np.concatenate([c.is_call for c in chains]),
+            delta=np.concatenate(deltas) if all(d is not None for d in deltas) else None,
+            iv=np.concatenate(ivs) if all(v is not None for v in ivs) else None,
+            t=np.concatenate(ts) if all(v is not None for v in ts) else None,
+        )
+
+
+def _frame_arrays(frame, is_call: bool, t: Optional[float] = None) -> ChainArrays:
+    n = 0 if frame is None else len(frame)
+    if n == 0:
+        return ChainArrays(np.empty(0), np.empty(0), np.empty(0), np.empty(0, dtype=bool),
+                           delta=np.empty(0), iv=np.empty(0), t=np.empty(0))
+
+    def col(name):
+        if name in frame.columns:
+            return frame[name].to_numpy(dtype=float, na_value=np.nan)
+        return np.full(n, np.nan)
+
+    oi = col('openInterest')
+    oi = np.where(np.isnan(oi) | (oi < 0), 0.0, oi)
+    return ChainArrays(
+        strike=col('strike'),
+        open_interest=oi,
+        gamma=col('gamma'),
+        is_call=np.full(n, is_call),
+        delta=col('delta'),
+        iv=col('impliedVolatility'),
+        t=np.full(n, np.nan if t is None else t),
+    )
+
+
+# ─── Max pain ──────────────────────────────────────────────────────────────
+
+def option_pain(chain: ChainArrays, settlements: np.ndarray) -> np.ndarray:
+    """
+    Total intrinsic value paid to option holders at each settlement price.
+
+    call_pain(S) = sum_{K < S} (S - K) * OI  = S * OI_below - (K*OI)_below
+    put_pain(S)  = sum_{K > S} (K - S) * OI  = (K*OI)_above - S * OI_above
+    """
+    settlements = np.asarray(settlements, dtype=float)
+    pain = np.zeros(len(settlements))
+
+    calls, puts = chain.calls, chain.puts
+
+    if len(calls):
+        order = np.argsort(calls.strike, kind='stable')
+        k, oi = calls.strike[order], calls.open_interest[order]
+        cum_oi = np.concatenate(([0.0], np.cumsum(oi)))
+        cum_koi = np.concatenate(([0.0], np.cumsum(k * oi)))
+        idx = np.searchsorted(k, settlements, side='left')  # strikes strictly below S
+        pain += settlements * cum_oi[idx] - cum_koi[idx]
+
+    if len(puts):
+        order = np.argsort(puts.strike, kind='stable')
+        k, oi = puts.strike[order], puts.open_interest[order]
+        cum_oi = np.concatenate(([0.0], np.cumsum(oi)))
+        cum_koi = np.concatenate(([0.0], np.cumsum(k * oi)))
+        idx = np.searchsorted(k, settlements, side='right')  # strikes strictly above S
+        pain += (cum_koi[-1] - cum_koi[idx]) - settlements * (cum_oi[-1] - cum_oi[idx])
+
+    return pain
+
+
+def max_pain(chain: ChainArrays, spot: Optional[float] = None, band_pct: float = 10.0) -> Optional[float]:
+    """
+    Strike minimising total option-holder payout.
+
+    Candidates are the listed strikes within +/- band_pct of spot (all strikes
+    if spot is None or none fall in the band). Ties resolve to the lowest strike.
+    """
+    strikes = np.unique(chain.strike[~np.isnan(chain.strike)])
+    if len(strikes) == 0:
+        return None
+
+    candidates = strikes
+    if spot is not None:
+        in_band = strikes[(strikes >= spot * (1 - band_pct / 100)) & (strikes <= spot * (1 + band_pct / 100))]
+        if len(in_band):
+            candidates = in_band
+
+    pain = option_pain(chain, candidates)
+    return float(candidates[int(np.argmin(pain))])
+
+
+# ─── Model greeks ─────────────────────────────────────────────────────────
+
+def model_gamma(chain: ChainArrays, spot: float, only_missing: bool = True,
+                engine: Optional[GreeksEngine] = None) -> np.ndarray:
+    """
+    Per-contract gamma, filled from Black-Scholes where the feed has none.
+
+    Args:
+        only_missing: Keep vendor gamma where it is present and non-zero
+        engine: GreeksEngine to use (process-wide singleton by default)
+
+    Returns:
+        gamma array (NaN where neither vendor nor model gamma is available)
+    """
+    vendor = chain.gamma
+    if chain.iv is None or chain.t is None or len(chain) == 0:
+        return vendor
+
+    engine = engine or get_greeks_engine()
+    bs = engine.compute(chain.strike, chain.t, chain.iv, chain.is_call, spot=spot).gamma
+    if not only_missing:
+        return bs
+    missing = np.isnan(vendor) | (vendor == 0)
+    return np.where(missing, bs, vendor)
+
+
+# ─── GEX ──────────────────────────────────────────────────────────────────
+
+def gex_by_strike(chain: ChainArrays, call_sign: float = 1.0, put_sign: float = -1.0,
+                  scale: float = 100.0, gamma: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Aggregate gamma exposure per strike.
+
+    Each contract contributes sign * gamma * OI * scale, where sign is
+    call_sign / put_sign. NaN gammas count as zero.
+
+    Args:
+        gamma: Optional per-contract gamma override (same order as chain)
+
+    Returns:
+        (strikes ascending, net GEX per strike, total OI per strike)
+    """
+    if len(chain) == 0:
+        return np.empty(0), np.empty(0), np.empty(0)
+
+    g = chain.gamma if gamma is None else np.asarray(gamma, dtype=float)
+    g = np.nan_to_num(g, nan=0.0)
+    sign = np.where(chain.is_call, call_sign, put_sign)
+    contrib = sign * g * chain.open_interest * scale
+
+    strikes, inverse = np.unique(chain.strike, return_inverse=True)
+    gex = np.bincount(inverse, weights=contrib, minlength=len(strikes))
+    oi = np.bincount(inverse, weights=chain.open_interest, minlength=len(strikes))
+    return strikes, gex, oi
+
+
+def gamma_flip_crossing(strikes: np.ndarray, gex: np.ndarray, spot: float,
+                        max_distance_pct: float = 5.0) -> Optional[float]:
+    """
+    Highest strike (within max_distance_pct of spot) where cumulative GEX,
+    accumulated from the lowest strike up, changes sign. None if no crossing.
+    """
+    if len(strikes) < 2:
+        return None
+    cumulative = np.cumsum(gex)
+    crossed = np.zeros(len(strikes), dtype=bool)
+    crossed[1:] = cumulative[:-1] * cumulative[1:] < 0
+    near = np.abs(strikes - spot) < spot * max_distance_pct / 100
+    hits = np.flatnonzero(crossed & near)
+    return float(strikes[hits[-1]]) if len(hits) else None
+
+
+def gamma_flip_nearest(strikes: np.ndarray, gex: np.ndarray, spot: float) -> Optional[float]:
+    """
+    Walk strikes outward from spot accumulating GEX; return the first strike
+    where the running total is <= 0. Falls back to the strike with the
+    smallest |GEX| if it never goes non-positive.
+    """
+    if len(strikes) == 0:
+        return None
+    order = np.argsort(np.abs(strikes - spot), kind='stable')
+    running = np.cumsum(gex[order])
+    hits = np.flatnonzero(running <= 0)
+    if len(hits):
+        return float(strikes[order[hits[0]]])
+    return float(strikes[int(np.argmin(np.abs(gex)))])
+
+
+def gamma_walls(strikes: np.ndarray, gex: np.ndarray, top_n: int = 10,
+                bottom_n: int = 5) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Indices of the largest positive-GEX strikes (walls / support) and the
+    most negative-GEX strikes (resistance), strongest first.
+    """
+    if len(strikes) == 0:
+        return np.empty(0, dtype=int), np.empty(0, dtype=int)
+    desc = np.argsort(-gex, kind='stable')[:top_n]
+    asc = np.argsort(gex, kind='stable')[:bottom_n]
+    return desc[gex[desc] > 0], asc[gex[asc] < 0]
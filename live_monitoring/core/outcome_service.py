@@ -0,0 +1,209 @@
+"""
+⏱️ OUTCOME SERVICE
+
+Shared price polling for every outcome tracker.
+
+The DP learning OutcomeTracker, the orchestrator's SignalOutcomeTracker and
+the alert/gate settlement jobs each used to poll prices on their own, one
+request per tracked job. With 50+ open interactions in a busy session that is
+50+ quote/bar fetches every cycle for a handful of distinct symbols. This
+module centralises it:
+
+- fetch_prices(): one batched bar download per distinct symbol set
+  (MarketDataBus.download), last close per symbol.
+- OutcomeService: a single poll thread; each registered tracker declares the
+  symbols it needs and an interval, gets a fan-out of the shared prices, and
+  does its own bookkeeping.
+- PriceWindow: fixed-size ring of recent prices plus running min/max, in place
+  of unbounded per-job price histories.
+
+Usage:
+    from live_monitoring.core.outcome_service import get_outcome_service
+
+    service = get_outcome_service()
+    service.register('dp_learning', symbols_fn, on_prices_fn, interval=30)
+    service.start()
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Iterable, Optional
+
+from live_monitoring.core.market_data import MarketDataBus, get_market_data
+
+logger = logging.getLogger(__name__)
+
+RING_SIZE = 120         # 1 hour of 30s polls
+MIN_TICK = 1.0          # seconds; lower bound on the service loop sleep
+
+
+def fetch_prices(symbols: Iterable[str], period: str = '1d', interval: str = '1m',
+                 bus: Optional[MarketDataBus] = None) -> Dict[str, Optional[float]]:
+    """
+    Last close per symbol from one batched bar download.
+
+    Symbols are de-duplicated and upper-cased; missing data maps to None.
+    """
+    bus = bus or get_market_data()
+    symbols = sorted({s.upper() for s in symbols if s})
+    if not symbols:
+        return {}
+    bus.download(symbols, period=period, interval=interval)
+    return {s: bus.get_last_close(s, period=period, interval=interval) for s in symbols}
+
+
+class PriceWindow:
+    """Ring buffer of the last ``size`` prices with running first/last/min/max."""
+
+    __slots__ = ('recent', 'first', 'last', 'min', 'max', 'count')
+
+    def __init__(self, first: float, size: int = RING_SIZE):
+        self.recent = deque([first], maxlen=size)
+        self.first = first
+        self.last = first
+        self.min = first
+        self.max = first
+        self.count = 1
+
+    def add(self, price: float):
+        self.recent.append(price)
+        self.last = price
+        self.count += 1
+        if price < self.min:
+            self.min = price
+        if price > self.max:
+            self.max = price
+
+
+class _Consumer:
+    __slots__ = ('name', 'symbols', 'on_prices', 'interval', 'next_due', 'runs', 'errors')
+
+    def __init__(self, name: str, symbols: Callable[[], Iterable[str]],
+                 on_prices: Callable[[Dict[str, Optional[float]]], None], interval: float):
+        self.name = name
+        self.symbols = symbols
+        self.on_prices = on_prices
+        self.interval = interval
+        self.next_due = 0.0
+        self.runs = 0
+        self.errors = 0
+
+
+class OutcomeService:
+    """
+    One poll loop for all outcome trackers.
+
+    Each cycle collects the symbols of every due tracker, fetches them in one
+    batch and hands the same ``{symbol: price}`` map to each tracker.
+    """
+
+    def __init__(self, bus: Optional[MarketDataBus] = None, period: str = '1d', interval: str = '1m'):
+        self.bus = bus
+        self.period = period
+        self.interval = interval
+        self._consumers: Dict[str, _Consumer] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self.stats = {'cycles': 0, 'symbols_fetched': 0, 'symbols_requested': 0, 'last_cycle_ms': 0.0}
+
+    def register(self, name: str, symbols: Callable[[], Iterable[str]],
+                 on_prices: Callable[[Dict[str, Optional[float]]], None], interval: float = 30):
+        """Add (or replace) a tracker. It first runs on the next cycle."""
+        with self._lock:
+            self._consumers[name] = _Consumer(name, symbols, on_prices, interval)
+        self._wake.set()
+
+    def unregister(self, name: str):
+        with self._lock:
+            self._consumers.pop(name, None)
+
+    def poll_once(self, now: Optional[float] = None) -> int:
+        """Run every due tracker against one shared price batch. Returns trackers run."""
+        now = now if now is not None else time.monotonic()
+        with self._lock:
+            due = [c for c in self._consumers.values() if c.next_due <= now]
+        if not due:
+            return 0
+
+        start = time.monotonic()
+        wanted = {}
+        for consumer in due:
+            consumer.next_due = now + consumer.interval
+            try:
+                wanted[consumer.name] = {s.upper() for s in consumer.symbols() if s}
+            except Exception as e:
+                consumer.errors += 1
+                logger.error(f"❌ Outcome tracker '{consumer.name}' symbols error: {e}")
+
+        symbols = set().union(*wanted.values()) if wanted else set()
+        prices = fetch_prices(symbols, self.period, self.interval, bus=self.bus) if symbols else {}
+
+        ran = 0
+        for consumer in due:
+            if consumer.name not in wanted:
+                continue
+            try:
+                consumer.on_prices(prices)
+                consumer.runs += 1
+                ran += 1
+            except Exception as e:
+                consumer.errors += 1
+                logger.error(f"❌ Outcome tracker '{consumer.name}' error: {e}")
+
+        self.stats['cycles'] += 1
+        self.stats['symbols_fetched'] += len(symbols)
+        self.stats['symbols_requested'] += sum(len(w) for w in wanted.values())
+        self.stats['last_cycle_ms'] = round((time.monotonic() - start) * 1000, 1)
+        return ran
+
+    def start(self):
+        """Start the shared poll thread (idempotent)."""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._loop, daemon=True, name="OutcomeService")
+            self._thread.start()
+        logger.info("⏱️ Outcome service started")
+
+    def stop(self):
+        self._running = False
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def _loop(self):
+        while self._running:
+            try:
+                self.poll_once()
+            except Exception as e:
+                logger.error(f"❌ Outcome service loop error: {e}")
+            with self._lock:
+                next_due = min((c.next_due for c in self._consumers.values()), default=None)
+            wait = 60.0 if next_due is None else max(MIN_TICK, next_due - time.monotonic())
+            self._wake.wait(wait)
+            self._wake.clear()
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            consumers = {c.name: {'interval': c.interval, 'runs': c.runs, 'errors': c.errors}
+                         for c in self._consumers.values()}
+        return {**self.stats, 'consumers': consumers}
+
+
+_service: Optional[OutcomeService] = None
+_service_lock = threading.Lock()
+
+
+def get_outcome_service() -> OutcomeService:
+    """Process-wide OutcomeService singleton."""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = OutcomeService()
+    return _service
@@ -25,6 +25,7 @@ from gamma_exposure import GammaExposureTracker
 from lottery_signals import SignalType, SignalAction, LiveSignal, LotterySignal
 from zero_dte_strategy import ZeroDTEStrategy
 from volatility_expansion import VolatilityExpansionDetector
+from momentum_stream import MomentumStream, MomentumFeatures
 
 # Import narrative pipeline for signal enrichment
 try:
@@ -114,6 +115,7 @@ class SignalGenerator:
         self.lottery_threshold = lottery_confidence_threshold
         self.use_narrative = use_narrative and NARRATIVE_AVAILABLE
         self.narrative_cache = {}  # Cache narrative by (symbol, date)
+        self._momentum_streams = {}  # symbol -> MomentumStream (selloff/rally state)
         
         # Initialize trap matrix orchestrator
         if TRAP_MATRIX_AVAILABLE:
@@ -124,6 +126,7 @@ class SignalGenerator:
                 self.trap_orchestrator = None
         else:
             self.trap_orchestrator = None
+        self._trap_states = {}  # symbol -> MarketState prefetched for this cycle
         self.narrative_cache = {}  # Cache narrative by (symbol, date)
         
         # Initialize sentiment analyzer if enabled
@@ -237,6 +240,20 @@ class SignalGenerator:
             logger.error(f"Error generating signals: {e}")
             return []
             
+    def prefetch_trap_states(self, symbols: List[str]) -> None:
+        """
+        Build Trap Matrix states for a whole cycle's symbols in one shared
+        layer fan-out. Each is used once by the next generate_signals() for
+        that symbol; symbols not prefetched are built on demand.
+        """
+        if not (TRAP_MATRIX_AVAILABLE and self.trap_orchestrator):
+            return
+        try:
+            self._trap_states = self.trap_orchestrator.get_states(symbols)
+        except Exception as e:
+            logger.error(f"Trap Matrix prefetch failed: {e}")
+            self._trap_states = {}
+
     def _apply_holistic_kill_shots(self, symbol: str, current_price: float, inst_context: InstitutionalContext, signals: List) -> List:
         """Apply Trap Matrix vetoes and Narrative divergence rules (Alpha's Kill Shots)."""
         valid_signals = []
@@ -245,9 +262,10 @@ class SignalGenerator:
         is_danger_zone = False
         if TRAP_MATRIX_AVAILABLE and self.trap_orchestrator:
             try:
-                # Get current state from the orchestrator
+                # Get current state from the orchestrator (prefetched for the cycle if possible)
                 # Note: For backtesting, this must be mocked or cached per timestamp
-                trap_state = self.trap_orchestrator.get_current_state(symbol)
+                trap_state = self._trap_states.pop(symbol.upper(), None) \
+                    or self.trap_orchestrator.get_current_state(symbol)
                 
                 # Check if current price is within any active trap zone
                 for t in (trap_state.traps or []):
@@ -535,12 +553,20 @@ class SignalGenerator:
         
         return signals
 
+    def _momentum_features(self, symbol: str, minute_bars: pd.DataFrame) -> Optional[MomentumFeatures]:
+        """Sync the symbol's momentum stream with minute_bars (only new bars are ingested)."""
+        stream = self._momentum_streams.get(symbol)
+        if stream is None:
+            stream = self._momentum_streams[symbol] = MomentumStream()
+        return stream.sync(minute_bars)
+
     def _detect_realtime_selloff(
         self,
         symbol: str,
         current_price: float,
         minute_bars: pd.DataFrame,
         context: InstitutionalContext = None,
+        features: Optional[MomentumFeatures] = None,
     ) -> Optional[LiveSignal]:
         """
         Detect real-time selloff using MULTIPLE detection methods:
@@ -550,32 +576,23 @@ class SignalGenerator:
         3. ACCELERATION: Rate of decline increasing
         
         This catches selloffs EARLY, not after they've happened!
+        
+        Inputs come from the symbol's MomentumStream (synced from minute_bars),
+        or from ``features`` when a caller streams bars itself (backtests).
         """
         try:
-            if minute_bars is None or len(minute_bars) < 5:
+            if features is None:
+                if minute_bars is None or len(minute_bars) < 5:
+                    return None
+                features = self._momentum_features(symbol, minute_bars)
+            if features is None:
                 return None
 
-            closes = minute_bars["Close"]
-            volumes = minute_bars["Volume"]
-            
-            # Get key prices
-            # CRITICAL: Use FIRST bar of the day as day_open, not first of minute_bars
-            day_open = float(minute_bars["Open"].iloc[0])  # First bar's open = day open
-            current_close = float(closes.iloc[-1])
-            
-            # For momentum detection, use only recent bars (last 30)
-            if len(minute_bars) > 30:
-                recent_bars_for_momentum = minute_bars.tail(30)
-                recent_closes = recent_bars_for_momentum["Close"]
-                recent_volumes = recent_bars_for_momentum["Volume"]
-            else:
-                recent_closes = closes
-                recent_volumes = volumes
-            
             # ═══════════════════════════════════════════════════════════════
             # METHOD 1: FROM OPEN DETECTION (EARLY WARNING!)
             # ═══════════════════════════════════════════════════════════════
-            pct_from_open = (current_close - day_open) / day_open
+            # day_open is the FIRST bar of the day, not the first of a recent slice
+            pct_from_open = features.pct_from_open
             
             # Trigger at -0.25% from open (catches weakness EARLY)
             from_open_triggered = pct_from_open <= -0.0025
@@ -583,13 +600,7 @@ class SignalGenerator:
             # ═══════════════════════════════════════════════════════════════
             # METHOD 2: CONSECUTIVE RED BARS (MOMENTUM)
             # ═══════════════════════════════════════════════════════════════
-            # Use recent_closes for momentum (not full day)
-            consecutive_red = 0
-            for i in range(len(recent_closes) - 1, max(0, len(recent_closes) - 10), -1):
-                if recent_closes.iloc[i] < recent_closes.iloc[i-1]:
-                    consecutive_red += 1
-                else:
-                    break
+            consecutive_red = features.consecutive_red
             
             # 3+ consecutive red bars = momentum selling
             momentum_triggered = consecutive_red >= 3
@@ -597,14 +608,7 @@ class SignalGenerator:
             # ═══════════════════════════════════════════════════════════════
             # METHOD 3: ROLLING DECLINE (original method, kept as backup)
             # ═══════════════════════════════════════════════════════════════
-            # Use momentum bars for rolling check too (avoid variable collision)
-            lookback = min(10, len(recent_closes))  # Shortened from 20 to 10
-            rolling_window_closes = recent_closes.tail(lookback)
-            rolling_window_volumes = recent_volumes.tail(lookback)
-            
-            start_price = float(rolling_window_closes.iloc[0])
-            end_price = float(rolling_window_closes.iloc[-1])
-            rolling_change = (end_price - start_price) / start_price
+            rolling_change = features.rolling_change
             
             rolling_triggered = rolling_change <= -0.002  # -0.2% in 10 bars
             
@@ -617,8 +621,8 @@ class SignalGenerator:
                 return None
             
             # Volume check (relaxed - just need above average) - use momentum volumes
-            avg_volume = float(recent_volumes.iloc[:-1].mean()) if len(recent_volumes) > 1 else 0
-            last_volume = float(recent_volumes.iloc[-1])
+            avg_volume = features.avg_volume
+            last_volume = features.last_volume
             volume_elevated = avg_volume > 0 and last_volume > avg_volume * 1.0  # Just above average
             
             # Skip if volume is dead (no conviction)
@@ -766,6 +770,7 @@ class SignalGenerator:
         current_price: float,
         minute_bars: pd.DataFrame,
         context: InstitutionalContext = None,
+        features: Optional[MomentumFeatures] = None,
     ) -> Optional[LiveSignal]:
         """
         Detect real-time rally using MULTIPLE detection methods:
@@ -775,32 +780,21 @@ class SignalGenerator:
         3. ACCELERATION: Rate of rise increasing
         
         This catches rallies EARLY!
+        
+        Inputs come from the symbol's MomentumStream, as for selloffs.
         """
         try:
-            if minute_bars is None or len(minute_bars) < 5:
+            if features is None:
+                if minute_bars is None or len(minute_bars) < 5:
+                    return None
+                features = self._momentum_features(symbol, minute_bars)
+            if features is None:
                 return None
 
-            closes = minute_bars["Close"]
-            volumes = minute_bars["Volume"]
-            
-            # Get key prices
-            # CRITICAL: Use FIRST bar of the day as day_open (now that we pass full day data)
-            day_open = float(minute_bars["Open"].iloc[0])
-            current_close = float(closes.iloc[-1])
-            
-            # For momentum detection, use only recent bars (last 30)
-            if len(minute_bars) > 30:
-                recent_bars_for_momentum = minute_bars.tail(30)
-                momentum_closes = recent_bars_for_momentum["Close"]
-                momentum_volumes = recent_bars_for_momentum["Volume"]
-            else:
-                momentum_closes = closes
-                momentum_volumes = volumes
-            
             # ═══════════════════════════════════════════════════════════════
             # METHOD 1: FROM OPEN DETECTION (EARLY WARNING!)
             # ═══════════════════════════════════════════════════════════════
-            pct_from_open = (current_close - day_open) / day_open
+            pct_from_open = features.pct_from_open
             
             # Trigger at +0.25% from open
             from_open_triggered = pct_from_open >= 0.0025
@@ -808,13 +802,7 @@ class SignalGenerator:
             # ═══════════════════════════════════════════════════════════════
             # METHOD 2: CONSECUTIVE GREEN BARS (MOMENTUM)
             # ═══════════════════════════════════════════════════════════════
-            # Use momentum_closes for momentum (not full day)
-            consecutive_green = 0
-            for i in range(len(momentum_closes) - 1, max(0, len(momentum_closes) - 10), -1):
-                if momentum_closes.iloc[i] > momentum_closes.iloc[i-1]:
-                    consecutive_green += 1
-                else:
-                    break
+            consecutive_green = features.consecutive_green
             
             # 3+ consecutive green bars = momentum buying
             momentum_triggered = consecutive_green >= 3
@@ -822,14 +810,7 @@ class SignalGenerator:
             # ═══════════════════════════════════════════════════════════════
             # METHOD 3: ROLLING RISE (original method, kept as backup)
             # ═══════════════════════════════════════════════════════════════
-            # Use momentum bars for rolling check too (avoid variable collision)
-            lookback = min(10, len(momentum_closes))
-            rolling_window_closes = momentum_closes.tail(lookback)
-            rolling_window_volumes = momentum_volumes.tail(lookback)
-            
-            start_price = float(rolling_window_closes.iloc[0])
-            end_price = float(rolling_window_closes.iloc[-1])
-            rolling_change = (end_price - start_price) / start_price
+            rolling_change = features.rolling_change
             
             rolling_triggered = rolling_change >= 0.002  # +0.2% in 10 bars
             
@@ -842,8 +823,8 @@ class SignalGenerator:
                 return None
             
             # Volume check (relaxed) - use momentum volumes
-            avg_volume = float(momentum_volumes.iloc[:-1].mean()) if len(momentum_volumes) > 1 else 0
-            last_volume = float(momentum_volumes.iloc[-1])
+            avg_volume = features.avg_volume
+            last_volume = features.last_volume
             volume_elevated = avg_volume > 0 and last_volume > avg_volume * 1.0
             
             if not volume_elevated and triggers_hit < 2:
@@ -10,10 +10,11 @@ Key insight: When speculators (specs) and commercials diverge heavily,
 it signals institutional positioning that hasn't hit mainstream yet.
 """
 import logging
-import time
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
 
+from core.utils.tiered_cache import MB, get_cache
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -82,53 +83,40 @@ class COTClient:
         "VX": {"name": "VIX FUTURES", "code": "1170E1", "exchange": "CBOE FUTURES EXCHANGE"},
     }
 
+    DISK_CACHE_DIR = "/tmp/cot_data/cache"
+    DISK_CACHE_TTL = 7 * 24 * 3600  # 7 days (COT is weekly)
+
     def __init__(self, cache_ttl: int = 3600):
         """
         Args:
             cache_ttl: Cache TTL in seconds (default 1 hour — COT is weekly).
         """
-        self._cache: Dict[str, Any] = {}
-        self._cache_ts: Dict[str, float] = {}
         self._cache_ttl = cache_ttl
-        self._df_cache: Optional[Any] = None
-        self._df_cache_ts: float = 0
+        # Parsed positions per contract (stale value served if a refresh fails)
+        self._positions = get_cache("cot_positions", ttl=cache_ttl, max_bytes=1 * MB)
+        # Raw annual report: memory for cache_ttl, disk for 7 days (survives Render restarts)
+        self._reports = get_cache(
+            "cot_reports", ttl=cache_ttl, disk_dir=self.DISK_CACHE_DIR,
+            disk_ttl=self.DISK_CACHE_TTL, max_bytes=128 * MB,
+        )
         logger.info(f"📊 COTClient initialized (cot_reports available: {COT_AVAILABLE})")
 
-    def _is_cached(self, key: str) -> bool:
-        return key in self._cache and (time.time() - self._cache_ts.get(key, 0)) < self._cache_ttl
-
     def _fetch_cot_data(self):
         """Fetch the latest COT legacy futures report.
 
         Priority:
-          1. In-memory cache hit (TTL 1h — COT is weekly, cache is always fresh enough)
-          2. Disk pickle cache in /tmp/cot_data/annual_cache.pkl (7-day TTL — survives Render restarts)
+          1. Memory tier (TTL 1h — COT is weekly, cache is always fresh enough)
+          2. Disk tier in /tmp/cot_data/cache (7-day TTL — survives Render restarts)
           3. cot_reports package download (downloads annual.txt to /tmp/cot_data/)
           4. CFTC direct CSV fallback — fetches most-recent report from cftc.gov
              using only stdlib (no cot_reports dependency).
+        If every source fails, the last cached report is served.
         """
-        import os
-        DISK_CACHE_PATH = "/tmp/cot_data/annual_cache.pkl"
-        DISK_CACHE_TTL  = 7 * 24 * 3600  # 7 days (COT is weekly)
-
-        # 1. In-memory cache
-        if self._df_cache is not None and (time.time() - self._df_cache_ts) < self._cache_ttl:
-            return self._df_cache
+        return self._reports.get_or_load("legacy_fut", self._download_cot_data, ttl=self._cache_ttl)
 
-        # 2. Disk pickle cache — avoid CFTC download on Render cold restarts
-        if os.path.exists(DISK_CACHE_PATH):
-            try:
-                age = time.time() - os.path.getmtime(DISK_CACHE_PATH)
-                if age < DISK_CACHE_TTL:
-                    import pickle
-                    with open(DISK_CACHE_PATH, "rb") as f:
-                        df = pickle.load(f)
-                    self._df_cache = df
-                    self._df_cache_ts = time.time()
-                    logger.info(f"📂 COT disk cache hit (age {age/3600:.1f}h): {len(df)} rows")
-                    return df
-            except Exception as e:
-                logger.warning(f"COT disk cache read failed: {e}")
+    def _download_cot_data(self):
+        """Download the report (steps 3-4 of _fetch_cot_data)."""
+        import os
 
         if not COT_AVAILABLE:
             return self._fetch_cftc_direct()
@@ -146,23 +134,10 @@ class COTClient:
             finally:
                 os.chdir(original_cwd)
 
-            # Persist to disk so next restart skips the download
-            try:
-                import pickle
-                with open(DISK_CACHE_PATH, "wb") as f:
-                    pickle.dump(df, f)
-                logger.info(f"✅ COT data saved to disk cache: {len(df)} rows")
-            except Exception as e:
-                logger.warning(f"COT disk cache write failed: {e}")
-
-            self._df_cache = df
-            self._df_cache_ts = time.time()
             logger.info(f"✅ Fetched COT data: {len(df)} rows")
             return df
         except Exception as e:
             logger.warning(f"⚠️ cot_reports download failed ({e}), trying CFTC direct CSV")
-            if self._df_cache is not None:
-                return self._df_cache
             return self._fetch_cftc_direct()
 
     def _fetch_cftc_direct(self):
@@ -201,10 +176,7 @@ class COTClient:
                 csv_bytes = zf.read(csv_name)
 
                 if PANDAS_AVAILABLE:
-                    import pandas as pd
                     df = pd.read_csv(io.BytesIO(csv_bytes))
-                    self._df_cache = df
-                    self._df_cache_ts = time.time()
                     logger.info(f"✅ CFTC direct: {len(df)} rows from {csv_name}")
                     return df
                 else:
@@ -212,8 +184,6 @@ class COTClient:
                     import csv as _csv
                     reader = _csv.DictReader(io.StringIO(csv_bytes.decode('latin-1')))
                     rows = list(reader)
-                    self._df_cache = rows  # type: ignore[assignment]
-                    self._df_cache_ts = time.time()
                     logger.info(f"✅ CFTC direct (no-pandas): {len(rows)} rows")
                     return rows
             except Exception as ex:
@@ -235,92 +205,91 @@ class COTClient:
         Returns:
             COTPosition with specs/commercials net positions, or None.
         """
-        cache_key = f"pos_{contract_key}"
-        if self._is_cached(cache_key):
-            return self._cache[cache_key]
-        
         if contract_key not in self.CONTRACTS:
             logger.error(f"❌ Unknown contract: {contract_key}. Use: {list(self.CONTRACTS.keys())}")
             return None
         
-        contract = self.CONTRACTS[contract_key]
-        
         try:
-            df = self._fetch_cot_data()
-            
-            # Filter to this contract by CFTC market code OR exact name match
-            market_col = "Market and Exchange Names"
-            code_col = "CFTC Contract Market Code"
-            
-            contract_rows = None
-            
-            # Try by CFTC market code first (most precise)
-            if code_col in df.columns:
-                contract_rows = df[df[code_col].astype(str).str.strip() == contract["code"]]
-            
-            # Fallback to name matching (requires BOTH name AND exchange)
-            if contract_rows is None or contract_rows.empty:
-                if market_col in df.columns:
-                    mask = df[market_col].str.contains(contract["name"], case=False, na=False)
-                    if "exchange" in contract:
-                        mask = mask & df[market_col].str.contains(contract["exchange"], case=False, na=False)
-                    contract_rows = df[mask]
-            
-            if contract_rows is None or contract_rows.empty:
-                logger.warning(f"⚠️ No COT data for {contract['name']}")
-                return None
-            
-            # Sort by date (newest first)
-            date_col = "As of Date in Form YYYY-MM-DD"
-            if date_col not in df.columns:
-                date_col = "As of Date in Form YYMMDD"
-            
-            if date_col in contract_rows.columns:
-                contract_rows = contract_rows.sort_values(date_col, ascending=False)
-            
-            latest = contract_rows.iloc[0]
-            
-            # Extract positioning — use exact CFTC column names
-            specs_long = int(latest.get("Noncommercial Positions-Long (All)", 0) or 0)
-            specs_short = int(latest.get("Noncommercial Positions-Short (All)", 0) or 0)
-            comm_long = int(latest.get("Commercial Positions-Long (All)", 0) or 0)
-            comm_short = int(latest.get("Commercial Positions-Short (All)", 0) or 0)
-            oi = int(latest.get("Open Interest (All)", 0) or 0)
-            nonrep_long = int(latest.get("Nonreportable Positions-Long (All)", 0) or 0)
-            nonrep_short = int(latest.get("Nonreportable Positions-Short (All)", 0) or 0)
-            
-            specs_net = specs_long - specs_short
-            comm_net = comm_long - comm_short
-            nonrep_net = nonrep_long - nonrep_short
-            
-            report_date = str(latest.get("As of Date in Form YYYY-MM-DD", latest.get("As of Date in Form YYMMDD", "")))
-            if "T" in report_date:
-                report_date = report_date.split("T")[0]
-            
-            pos = COTPosition(
-                contract_name=contract["name"],
-                report_date=report_date,
-                specs_long=specs_long,
-                specs_short=specs_short,
-                specs_net=specs_net,
-                comm_long=comm_long,
-                comm_short=comm_short,
-                comm_net=comm_net,
-                nonrep_long=nonrep_long,
-                nonrep_short=nonrep_short,
-                nonrep_net=nonrep_net,
-                open_interest=oi,
-                specs_ratio=specs_net / oi if oi else 0,
+            return self._positions.get_or_load(
+                f"pos_{contract_key}", lambda: self._load_position(contract_key), ttl=self._cache_ttl
             )
-            
-            self._cache[cache_key] = pos
-            self._cache_ts[cache_key] = time.time()
-            logger.info(f"✅ {contract['name']}: Specs NET {specs_net:+,} | Comm NET {comm_net:+,}")
-            return pos
-            
         except Exception as e:
             logger.error(f"❌ COT position error for {contract_key}: {e}")
-            return self._cache.get(cache_key)
+            return None
+
+    def _load_position(self, contract_key: str) -> Optional[COTPosition]:
+        """Parse the latest report row for a contract (raises on fetch errors)."""
+        contract = self.CONTRACTS[contract_key]
+        
+        df = self._fetch_cot_data()
+        
+        # Filter to this contract by CFTC market code OR exact name match
+        market_col = "Market and Exchange Names"
+        code_col = "CFTC Contract Market Code"
+        
+        contract_rows = None
+        
+        # Try by CFTC market code first (most precise)
+        if code_col in df.columns:
+            contract_rows = df[df[code_col].astype(str).str.strip() == contract["code"]]
+        
+        # Fallback to name matching (requires BOTH name AND exchange)
+        if contract_rows is None or contract_rows.empty:
+            if market_col in df.columns:
+                mask = df[market_col].str.contains(contract["name"], case=False, na=False)
+                if "exchange" in contract:
+                    mask = mask & df[market_col].str.contains(contract["exchange"], case=False, na=False)
+                contract_rows = df[mask]
+        
+        if contract_rows is None or contract_rows.empty:
+            logger.warning(f"⚠️ No COT data for {contract['name']}")
+            return None
+        
+        # Sort by date (newest first)
+        date_col = "As of Date in Form YYYY-MM-DD"
+        if date_col not in df.columns:
+            date_col = "As of Date in Form YYMMDD"
+        
+        if date_col in contract_rows.columns:
+            contract_rows = contract_rows.sort_values(date_col, ascending=False)
+        
+        latest = contract_rows.iloc[0]
+        
+        # Extract positioning — use exact CFTC column names
+        specs_long = int(latest.get("Noncommercial Positions-Long (All)", 0) or 0)
+        specs_short = int(latest.get("Noncommercial Positions-Short (All)", 0) or 0)
+        comm_long = int(latest.get("Commercial Positions-Long (All)", 0) or 0)
+        comm_short = int(latest.get("Commercial Positions-Short (All)", 0) or 0)
+        oi = int(latest.get("Open Interest (All)", 0) or 0)
+        nonrep_long = int(latest.get("Nonreportable Positions-Long (All)", 0) or 0)
+        nonrep_short = int(latest.get("Nonreportable Positions-Short (All)", 0) or 0)
+        
+        specs_net = specs_long - specs_short
+        comm_net = comm_long - comm_short
+        nonrep_net = nonrep_long - nonrep_short
+        
+        report_date = str(latest.get("As of Date in Form YYYY-MM-DD", latest.get("As of Date in Form YYMMDD", "")))
+        if "T" in report_date:
+            report_date = report_date.split("T")[0]
+        
+        pos = COTPosition(
+            contract_name=contract["name"],
+            report_date=report_date,
+            specs_long=specs_long,
+            specs_short=specs_short,
+            specs_net=specs_net,
+            comm_long=comm_long,
+            comm_short=comm_short,
+            comm_net=comm_net,
+            nonrep_long=nonrep_long,
+            nonrep_short=nonrep_short,
+            nonrep_net=nonrep_net,
+            open_interest=oi,
+            specs_ratio=specs_net / oi if oi else 0,
+        )
+        
+        logger.info(f"✅ {contract['name']}: Specs NET {specs_net:+,} | Comm NET {comm_net:+,}")
+        return pos
 
     # ── Divergence Detection ─────────────────────────────────────────────
 
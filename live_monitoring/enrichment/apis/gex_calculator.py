@@ -15,10 +15,15 @@ How GEX works:
 """
 import logging
 import time
+import numpy as np
 import requests
 from dataclasses import dataclass, field
 from typing import Optional, Dict, List, Any, Tuple
 
+from live_monitoring.core.options_analytics import (
+    ChainArrays, gex_by_strike, gamma_flip_crossing, gamma_walls, model_gamma,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -136,90 +141,44 @@ class GEXCalculator:
                 logger.warning(f"⚠️ No options data for {ticker}")
                 return GEXResult(ticker=ticker)
             
-            # Parse options and compute GEX
-            strike_min = spot * (1 - range_pct / 100)
-            strike_max = spot * (1 + range_pct / 100)
-            
-            strike_gex: Dict[float, float] = {}
-            strike_oi: Dict[float, int] = {}
-            n_calls = 0
-            n_puts = 0
-            
-            for o in options:
-                sym = o.get("option", "")
-                if not sym or len(sym) < 10:
-                    continue
-                
-                delta = o.get("delta", 0) or 0
-                gamma = o.get("gamma", 0) or 0
-                oi = int(o.get("open_interest", 0) or 0)
-                
-                # Extract strike from symbol (last 8 digits / 1000)
-                try:
-                    strike = int(sym[-8:]) / 1000
-                except (ValueError, IndexError):
-                    continue
-                
-                if strike < strike_min or strike > strike_max:
-                    continue
-                
-                # Determine call/put by delta sign
-                is_call = delta > 0
-                if is_call:
-                    n_calls += 1
-                else:
-                    n_puts += 1
-                
-                # GEX formula: gamma * OI * 100 * spot * 0.01 * direction
-                # Calls: positive GEX (dealers buy dips)
-                # Puts: negative GEX (dealers sell rips)
-                direction = 1 if is_call else -1
-                gex = gamma * oi * 100 * spot * 0.01 * direction
-                
-                strike_gex[strike] = strike_gex.get(strike, 0) + gex
-                strike_oi[strike] = strike_oi.get(strike, 0) + oi
-            
-            # Sort by GEX
-            sorted_strikes = sorted(strike_gex.items(), key=lambda x: x[1], reverse=True)
+            # Parse options into arrays and compute GEX (vectorized)
+            chain = ChainArrays.from_cboe(options).within(
+                spot * (1 - range_pct / 100), spot * (1 + range_pct / 100)
+            )
+            n_calls = int(chain.is_call.sum())
+            n_puts = len(chain) - n_calls
             
-            # Top gamma walls (positive GEX = support)
-            gamma_walls = []
-            for strike, gex in sorted_strikes[:10]:
-                if gex > 0:
-                    gamma_walls.append(GammaWall(
-                        strike=strike, gex=gex,
-                        open_interest=strike_oi.get(strike, 0),
-                        signal="SUPPORT"
-                    ))
+            # GEX formula: gamma * OI * 100 * spot * 0.01 * direction
+            # Calls: positive GEX (dealers buy dips)
+            # Puts: negative GEX (dealers sell rips)
+            # CBOE greeks are occasionally blank/zero → fill from Black-Scholes (IV + expiry)
+            gamma = model_gamma(chain, spot=spot)
+            strikes, gex, oi = gex_by_strike(chain, call_sign=1.0, put_sign=-1.0,
+                                             scale=100 * spot * 0.01, gamma=gamma)
             
-            # Negative gamma zones (negative GEX = resistance)
-            negative_zones = []
-            for strike, gex in sorted(sorted_strikes, key=lambda x: x[1])[:5]:
-                if gex < 0:
-                    negative_zones.append(GammaWall(
-                        strike=strike, gex=gex,
-                        open_interest=strike_oi.get(strike, 0),
-                        signal="RESISTANCE"
-                    ))
+            # Top gamma walls (positive GEX = support), negative zones (resistance)
+            wall_idx, neg_idx = gamma_walls(strikes, gex, top_n=10, bottom_n=5)
+            gamma_walls_list = [
+                GammaWall(strike=float(strikes[i]), gex=float(gex[i]),
+                          open_interest=int(oi[i]), signal="SUPPORT")
+                for i in wall_idx
+            ]
+            negative_zones = [
+                GammaWall(strike=float(strikes[i]), gex=float(gex[i]),
+                          open_interest=int(oi[i]), signal="RESISTANCE")
+                for i in neg_idx
+            ]
             
             # Total GEX
-            total_gex = sum(strike_gex.values())
+            total_gex = float(gex.sum())
             regime = "POSITIVE" if total_gex > 0 else "NEGATIVE"
             
             # Max pain (strike with max total OI)
-            max_pain = max(strike_oi.items(), key=lambda x: x[1])[0] if strike_oi else 0
+            max_pain = float(strikes[int(np.argmax(oi))]) if len(strikes) else 0
             
             # Gamma flip: strike where cumulative GEX crosses zero, within 5% of spot.
             # Returns None (not 0.0) when no zero-crossing is found — frontend shows N/A.
-            gamma_flip: Optional[float] = None
-            sorted_by_strike = sorted(strike_gex.items(), key=lambda x: x[0])
-            cumulative = 0.0
-            prev_cumulative = 0.0
-            for strike, gex in sorted_by_strike:
-                prev_cumulative = cumulative
-                cumulative += gex
-                if prev_cumulative * cumulative < 0 and abs(strike - spot) < spot * 0.05:
-                    gamma_flip = strike
+            gamma_flip = gamma_flip_crossing(strikes, gex, spot, max_distance_pct=5.0)
             
             result = GEXResult(
                 ticker=ticker,
@@ -228,7 +187,7 @@ class GEXCalculator:
                 gamma_regime=regime,
                 gamma_flip=gamma_flip,
                 max_pain=max_pain,
-                gamma_walls=gamma_walls,
+                gamma_walls=gamma_walls_list,
                 negative_zones=negative_zones,
                 total_contracts=len(options),
                 total_calls=n_calls,
@@ -239,7 +198,7 @@ class GEXCalculator:
             self._cache[cache_key] = result
             self._cache_ts[cache_key] = time.time()
             logger.info(f"✅ {ticker} GEX: {regime} ({total_gex:,.0f}), "
-                        f"spot=${spot:,.2f}, walls={len(gamma_walls)}")
+                        f"spot=${spot:,.2f}, walls={len(gamma_walls_list)}")
             return result
             
         except Exception as e:
@@ -19,10 +19,13 @@ import logging
 import time
 import json
 import os
+import threading
 import requests
 from dataclasses import dataclass, field
 from typing import Optional, Dict, List, Any
 
+from core.utils.tiered_cache import MB, get_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -85,54 +88,47 @@ class StockgridClient:
         "Accept-Language": "en-US,en;q=0.9",
     }
 
+    # Parsed results: shared by every client instance, served stale while refreshing
+    STALE_TTL = 600
+    # Raw responses: last known good on disk, used when every retry fails
+    DISK_CACHE_DIR = "/tmp/axlfi_cache"
+
     def __init__(self, cache_ttl: int = 300, max_retries: int = 3):
-        self._cache: Dict[str, Any] = {}
-        self._cache_ts: Dict[str, float] = {}
         self._cache_ttl = cache_ttl
         self._max_retries = max_retries
         self._data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "data")
-        self._disk_cache_dir = "/tmp/axlfi_cache"
-        os.makedirs(self._disk_cache_dir, exist_ok=True)
+        self._cache = get_cache("axlfi", ttl=cache_ttl, stale_ttl=self.STALE_TTL, max_bytes=24 * MB)
+        self._disk_cache = get_cache(
+            "axlfi_http", ttl=cache_ttl, disk_dir=self.DISK_CACHE_DIR, serializer="json",
+            max_bytes=8 * MB, max_disk_bytes=64 * MB,
+        )
         logger.info("📊 StockgridClient initialized (AXLFI pure-requests mode, disk cache ON)")
 
     # ── Internal helpers ─────────────────────────────────────────────────
 
-    def _is_cached(self, key: str) -> bool:
-        return key in self._cache and (time.time() - self._cache_ts.get(key, 0)) < self._cache_ttl
-
-    def _set_cache(self, key: str, data: Any):
-        self._cache[key] = data
-        self._cache_ts[key] = time.time()
+    def _cached(self, key: str, loader):
+        """TTL + stale-while-revalidate lookup in the shared AXLFI cache."""
+        return self._cache.get_or_load(key, loader, ttl=self._cache_ttl)
 
     def _disk_cache_key(self, path: str, params: dict = None) -> str:
-        """Generate a safe filename for disk cache."""
+        """Cache key for a raw response."""
         key = path.replace("/", "_").strip("_")
         if params:
             key += "_" + "_".join(f"{k}={v}" for k, v in sorted(params.items()))
-        return key.replace(" ", "") + ".json"
+        return key.replace(" ", "")
 
-    def _read_disk_cache(self, cache_file: str) -> Optional[dict]:
+    def _read_disk_cache(self, cache_key: str) -> Optional[dict]:
         """Read stale data from disk cache (last known good)."""
-        try:
-            fpath = os.path.join(self._disk_cache_dir, cache_file)
-            if os.path.exists(fpath):
-                with open(fpath) as f:
-                    data = json.load(f)
-                age = time.time() - os.path.getmtime(fpath)
-                logger.info(f"📂 Disk cache hit: {cache_file} (age: {age:.0f}s)")
-                return data
-        except Exception as e:
-            logger.warning(f"Disk cache read error: {e}")
-        return None
+        hit = self._disk_cache.peek(cache_key)
+        if hit is None:
+            return None
+        data, age = hit
+        logger.info(f"📂 Disk cache hit: {cache_key} (age: {age:.0f}s)")
+        return data
 
-    def _write_disk_cache(self, cache_file: str, data: Any):
+    def _write_disk_cache(self, cache_key: str, data: Any):
         """Write successful response to disk cache."""
-        try:
-            fpath = os.path.join(self._disk_cache_dir, cache_file)
-            with open(fpath, "w") as f:
-                json.dump(data, f)
-        except Exception as e:
-            logger.warning(f"Disk cache write error: {e}")
+        self._disk_cache.set(cache_key, data)
 
     def _get(self, path: str, params: dict = None) -> Optional[dict]:
         """Make a GET request with retries + disk-backed cache fallback."""
@@ -167,17 +163,16 @@ class StockgridClient:
 
     def get_top_positions(self, limit: int = 200, sort_by: str = "Dark Pools Position $") -> List[DarkPoolPosition]:
         """Get top tickers by dark pool position (200 available)."""
-        cache_key = f"leaderboard_{limit}"
-        if self._is_cached(cache_key):
-            return self._cache[cache_key]
+        return self._cached(f"leaderboard_{limit}", lambda: self._load_top_positions(limit)) or []
 
+    def _load_top_positions(self, limit: int) -> Optional[List[DarkPoolPosition]]:
         data = self._get("/dark_pools/leaderboard", {
             "metric": "dark_pool_position_dollars",
             "sort": "desc",
             "limit": str(limit),
         })
         if not data:
-            return []
+            return None
 
         positions = []
         for item in data.get("data", []):
@@ -194,7 +189,6 @@ class StockgridClient:
                 sector=item.get("sector", ""),
             ))
 
-        self._set_cache(cache_key, positions)
         return positions
 
     def get_ticker_detail(self, ticker: str = "SPY", window: int = 252) -> Optional["DarkPoolPosition"]:
@@ -211,14 +205,10 @@ class StockgridClient:
         Returns raw dict with: individual_dark_pool_position_data, individual_short_volume_table,
         latest, prices, symbol.
         """
-        cache_key = f"detail_raw_{ticker}"
-        if self._is_cached(cache_key):
-            return self._cache[cache_key]
-
-        data = self._get("/dark_pools/symbol", {"symbol": ticker, "window": str(window)})
-        if data:
-            self._set_cache(cache_key, data)
-        return data
+        return self._cached(
+            f"detail_raw_{ticker}",
+            lambda: self._get("/dark_pools/symbol", {"symbol": ticker, "window": str(window)}) or None,
+        )
 
     def get_ticker_latest(self, ticker: str) -> Optional[DarkPoolPosition]:
         """Get latest dark pool position for a single ticker."""
@@ -279,14 +269,7 @@ class StockgridClient:
         Returns: {as_of_date, expirations, option_minmax, option_walls, symbol}
         option_walls is keyed by date with call_wall, put_wall, poc, etc.
         """
-        cache_key = f"walls_{symbol}"
-        if self._is_cached(cache_key):
-            return self._cache[cache_key]
-
-        data = self._get("/option_walls/data", {"symbol": symbol})
-        if data:
-            self._set_cache(cache_key, data)
-        return data
+        return self._cached(f"walls_{symbol}", lambda: self._get("/option_walls/data", {"symbol": symbol}) or None)
 
     def get_option_walls_today(self, symbol: str = "SPY") -> Optional[OptionWall]:
         """Get today's option wall levels."""
@@ -327,14 +310,7 @@ class StockgridClient:
         Returns: index_returns, movers, signal_symbols, spy_history,
                  status, strategy_metrics, tactical_allocation
         """
-        cache_key = "dashboard"
-        if self._is_cached(cache_key):
-            return self._cache[cache_key]
-
-        data = self._get("/dashboard/all")
-        if data:
-            self._set_cache(cache_key, data)
-        return data
+        return self._cached("dashboard", lambda: self._get("/dashboard/all") or None)
 
     def get_signal_symbols(self) -> List[dict]:
         """Get current signal symbols (from dashboard)."""
@@ -362,14 +338,7 @@ class StockgridClient:
 
     def get_clusters(self) -> Optional[dict]:
         """Get cluster table (SP500, NASDAQ100, all universes)."""
-        cache_key = "clusters"
-        if self._is_cached(cache_key):
-            return self._cache[cache_key]
-
-        data = self._get("/clusters/table")
-        if data:
-            self._set_cache(cache_key, data)
-        return data
+        return self._cached("clusters", lambda: self._get("/clusters/table") or None)
 
     # ── Symbol Info ──────────────────────────────────────────────────────
 
@@ -504,6 +473,22 @@ class StockgridClient:
         return intel
 
 
+# ─── Process-wide Client ────────────────────────────────────────────────────
+
+_client: Optional[StockgridClient] = None
+_client_lock = threading.Lock()
+
+
+def get_stockgrid_client() -> StockgridClient:
+    """Shared StockgridClient (cache_ttl=300) for request paths that used to build one per call."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = StockgridClient(cache_ttl=300)
+    return _client
+
+
 # ─── Standalone Test ────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
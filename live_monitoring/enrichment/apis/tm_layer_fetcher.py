@@ -14,13 +14,22 @@ Cadences:
   GEX         → 5m cache — every 5min during market hours
   COT         → 1h cache — weekly Fri 3:30pm
 
-Adding a new data source = add one method here + call it in fetch_all().
+Fan-out:
+  fetch_all()/fetch_many() run every layer concurrently (one shared pool,
+  also across symbols, in batches that fit it) with a per-layer deadline. The only dependency —
+  dark pool levels need current_price from technicals — is respected by
+  fetching the Stockgrid detail in parallel and building the levels once
+  technicals has landed (or skipping them if it didn't). Latency tracks the
+  slowest layer, not the sum.
+
+Adding a new data source = add one method here + register it in _LAYERS.
 """
 
 import logging
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 
 from .tm_models import MarketState, StalenessInfo
 
@@ -29,6 +38,34 @@ logger = logging.getLogger(__name__)
 # Equity → Futures contract mapping for COT
 _COT_MAP = {"SPY": "ES", "QQQ": "NQ", "IWM": "RTY", "DIA": "YM"}
 
+# Seconds each layer may take before the matrix is built without it
+LAYER_DEADLINES = {
+    "pivots": 8.0,
+    "technicals": 8.0,
+    "dark_pool": 8.0,
+    "gex": 10.0,
+    "cot": 10.0,
+}
+
+# MarketState fields owned by each independent layer (+ its staleness key)
+_LAYERS = {
+    "pivots": (("pivots",), "pivots"),
+    "technicals": (("current_price", "moving_averages", "vix", "vix_regime", "death_cross"), "technicals"),
+    "gex": (("gex_walls", "gamma_flip", "max_pain", "gamma_regime"), "gex"),
+    "cot": (("cot_net_spec", "cot_signal"), "cot"),
+}
+
+_UNSET = object()
+POOL_WORKERS = 16
+_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _layer_pool() -> ThreadPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ThreadPoolExecutor(max_workers=POOL_WORKERS, thread_name_prefix="tm-layer")
+    return _pool
+
 
 class LayerFetcher:
     """
@@ -126,12 +163,29 @@ class LayerFetcher:
 
     # ── 3. Dark Pool ─────────────────────────────────────────────────────────
 
-    def fetch_dark_pool(self, symbol: str, state: MarketState) -> None:
-        """Fetch Stockgrid dark pool positions. Cache TTL: 5m."""
+    def _fetch_dp_detail(self, symbol: str):
+        try:
+            return self._stockgrid.get_ticker_detail(symbol)
+        except Exception as e:
+            logger.warning(f"Dark pool fetch error: {e}")
+            return None
+
+    def fetch_dark_pool(self, symbol: str, state: MarketState, detail=_UNSET) -> None:
+        """
+        Fetch Stockgrid dark pool positions. Cache TTL: 5m.
+
+        Needs state.current_price (technicals); skipped without it rather
+        than pricing levels at 0. Pass a prefetched detail to only build the
+        levels.
+        """
         if not self._stockgrid:
             return
+        if not state.current_price:
+            logger.warning(f"Dark pool layer for {symbol} skipped: no current price from technicals")
+            return
         try:
-            detail = self._stockgrid.get_ticker_detail(symbol)
+            if detail is _UNSET:
+                detail = self._stockgrid.get_ticker_detail(symbol)
             levels = []
 
             # 1. LIVE LEVEL: Current Day Positioning
@@ -269,17 +323,96 @@ class LayerFetcher:
 
     # ── Entry Point ───────────────────────────────────────────────────────────
 
-    def fetch_all(self, symbol: str, state: MarketState) -> None:
+    def fetch_all(self, symbol: str, state: MarketState, parallel: bool = True,
+                  deadlines: Optional[Dict[str, float]] = None) -> None:
         """
         Fetch all 5 data layers into state.
 
         Each fetch is isolated — one failure never blocks others.
-        Order matters: technicals must run before trap classification
-        (sets current_price used by classifiers).
+        Order matters: technicals must land before dark pool levels and trap
+        classification (sets current_price used by both).
         """
+        if parallel:
+            self.fetch_many({symbol: state}, deadlines=deadlines)
+            return
         self._init_agents()
         self.fetch_pivots(symbol, state)
         self.fetch_technicals(symbol, state)  # sets current_price
         self.fetch_dark_pool(symbol, state)
         self.fetch_gex(symbol, state)
         self.fetch_cot(symbol, state)
+
+    def fetch_many(self, states: Dict[str, MarketState],
+                   deadlines: Optional[Dict[str, float]] = None) -> None:
+        """
+        Fetch every layer for several symbols in one concurrent fan-out.
+
+        Independent layers run against a scratch MarketState and are merged
+        into the real state only if they finish within their deadline, so a
+        late layer can never write into a state that is already being
+        classified. Dark pool levels are built after technicals lands.
+
+        Symbols go out in batches that fit the layer pool, so no job waits
+        in the queue while its deadline runs; jobs past their deadline are
+        cancelled.
+        """
+        self._init_agents()
+        deadlines = {**LAYER_DEADLINES, **(deadlines or {})}
+        fetchers = {
+            "pivots": self.fetch_pivots,
+            "technicals": self.fetch_technicals,
+            "gex": self.fetch_gex,
+            "cot": self.fetch_cot,
+        }
+        per_symbol = len(fetchers) + (1 if self._stockgrid else 0)
+        batch_size = max(1, POOL_WORKERS // per_symbol)
+        symbols = list(states)
+        for i in range(0, len(symbols), batch_size):
+            batch = {symbol: states[symbol] for symbol in symbols[i:i + batch_size]}
+            self._fetch_batch(batch, fetchers, deadlines)
+
+    def _fetch_batch(self, states: Dict[str, MarketState], fetchers, deadlines: Dict[str, float]) -> None:
+        pool = _layer_pool()
+        start = time.monotonic()
+
+        jobs = {}  # future -> (symbol, layer, scratch)
+        for symbol, state in states.items():
+            for layer, fetch in fetchers.items():
+                scratch = MarketState(symbol=symbol)
+                jobs[pool.submit(fetch, symbol, scratch)] = (symbol, layer, scratch)
+            if self._stockgrid:
+                jobs[pool.submit(self._fetch_dp_detail, symbol)] = (symbol, "dark_pool", None)
+
+        details = {}
+        pending = set(jobs)
+        while pending:
+            elapsed = time.monotonic() - start
+            for future in [f for f in pending if elapsed >= deadlines[jobs[f][1]]]:
+                symbol, layer, _ = jobs[future]
+                logger.warning(f"⏱️ {layer} layer for {symbol} missed its {deadlines[layer]:.0f}s deadline")
+                future.cancel()
+                pending.discard(future)
+            if not pending:
+                break
+            timeout = min(deadlines[jobs[f][1]] for f in pending) - elapsed
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                symbol, layer, scratch = jobs[future]
+                if layer == "dark_pool":
+                    details[symbol] = future.result()
+                else:
+                    self._merge_layer(layer, scratch, states[symbol])
+
+        # Dependent layer: needs current_price from technicals
+        if self._stockgrid:
+            for symbol, state in states.items():
+                self.fetch_dark_pool(symbol, state, detail=details.get(symbol))
+
+    @staticmethod
+    def _merge_layer(layer: str, scratch: MarketState, state: MarketState) -> None:
+        fields, staleness_key = _LAYERS[layer]
+        if staleness_key not in scratch.staleness:
+            return  # agent unavailable or fetch failed — leave defaults
+        for name in fields:
+            setattr(state, name, getattr(scratch, name))
+        state.staleness[staleness_key] = scratch.staleness[staleness_key]
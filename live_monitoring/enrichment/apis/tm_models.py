@@ -106,6 +106,7 @@ class MarketState:
     staleness: Dict[str, StalenessInfo] = field(default_factory=dict)
     rebuild_reason: str = ""
     version: int = 0
+    delta: Optional[dict] = None  # changes vs. the previous version (see tm_state_differ.build_delta)
 
     def to_dict(self) -> dict:
         return {
@@ -134,4 +135,5 @@ class MarketState:
             "staleness": {k: v.to_dict() for k, v in self.staleness.items()},
             "rebuild_reason": self.rebuild_reason,
             "version": self.version,
+            "delta": self.delta,
         }
@@ -11,9 +11,9 @@ Design rule: Each check is isolated and independently testable.
 """
 
 import logging
-from typing import Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
-from .tm_models import MarketState
+from .tm_models import MarketState, TrapZone
 
 logger = logging.getLogger(__name__)
 
@@ -95,3 +95,60 @@ def should_rebuild(old: MarketState, new: MarketState) -> Tuple[bool, str]:
     rebuild = len(reasons) > 0
     reason = " | ".join(reasons) if reasons else "no_change"
     return rebuild, reason
+
+
+# ─── Incremental Diff ─────────────────────────────────────────────────────────
+
+# Trap types that can emit several zones per state (one per DP level / pivot);
+# the rest are keyed by type alone so a moving price range reads as "changed".
+_MULTI_ZONE_TYPES = {"BULL_TRAP", "LIQUIDITY_TRAP"}
+
+
+def changed_fields(old: Optional[MarketState], new: MarketState, fields: Iterable[str]) -> Optional[Set[str]]:
+    """MarketState fields that differ between versions (None when there is no old state)."""
+    if old is None:
+        return None
+    return {f for f in fields if getattr(old, f) != getattr(new, f)}
+
+
+def trap_key(trap: TrapZone) -> str:
+    """Stable identity of a trap zone across versions."""
+    if trap.trap_type in _MULTI_ZONE_TYPES:
+        return f"{trap.trap_type}@{(trap.price_min + trap.price_max) / 2:.2f}"
+    return trap.trap_type
+
+
+def diff_traps(old: List[TrapZone], new: List[TrapZone]) -> Dict[str, list]:
+    """Added / removed / changed traps between two versions."""
+    old_by_key = {trap_key(t): t for t in old}
+    new_by_key = {trap_key(t): t for t in new}
+    added, changed = [], []
+    for key, trap in new_by_key.items():
+        prev = old_by_key.get(key)
+        if prev is None:
+            added.append({"key": key, **trap.to_dict()})
+        elif prev.to_dict() != trap.to_dict():
+            changed.append({"key": key, **trap.to_dict()})
+    removed = [key for key in old_by_key if key not in new_by_key]
+    return {"added": added, "removed": removed, "changed": changed}
+
+
+def build_delta(old: Optional[MarketState], new: MarketState, changed: Optional[Set[str]]) -> dict:
+    """
+    Compact update from old.version to new.version for pollers / websocket push.
+
+    A client holding from_version applies added/removed/changed; clients on
+    any other version should fetch the full state.
+    """
+    delta = {
+        "symbol": new.symbol,
+        "from_version": old.version if old else None,
+        "version": new.version,
+        "current_price": round(new.current_price, 2),
+        "alert_level": new.alert_level,
+        "rebuild_reason": new.rebuild_reason,
+        "changed_inputs": sorted(changed) if changed is not None else None,
+    }
+    delta.update(diff_traps(old.traps if old else [], new.traps))
+    delta["empty"] = changed is not None and not (changed or delta["added"] or delta["removed"] or delta["changed"])
+    return delta
@@ -20,10 +20,15 @@ Minimum conviction threshold before a trap is emitted:
   CEILING_TRAP      → 3/5
   LIQUIDITY_TRAP    → 2/5
   WAR_HEADLINE      → 2/5
+
+Incremental mode (classify_traps_incremental):
+  Each classifier declares the MarketState fields it reads (CLASSIFIER_INPUTS).
+  Given the set of fields that changed since the previous version, only the
+  classifiers reading one of them are re-run; the rest reuse their last output.
 """
 
 import logging
-from typing import List
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from .tm_models import MarketState, TrapZone
 
@@ -310,6 +315,31 @@ _CLASSIFIERS = [
 ]
 
 
+# MarketState fields each classifier reads. A classifier missing here is
+# always re-run in incremental mode.
+CLASSIFIER_INPUTS: Dict[str, Tuple[str, ...]] = {
+    "_classify_death_cross": ("death_cross", "cot_net_spec", "pivots", "current_price", "moving_averages"),
+    "_classify_bear_trap_coil": ("cot_net_spec", "current_price", "dp_position_dollars", "dp_levels",
+                                 "gamma_regime", "pivots"),
+    "_classify_bull_trap": ("current_price", "dp_levels", "dp_position_dollars", "cot_net_spec", "pivots",
+                            "gex_walls"),
+    "_classify_ceiling_trap": ("gex_walls", "pivots", "cot_net_spec"),
+    "_classify_liquidity_trap": ("pivots", "current_price", "dp_levels"),
+    "_classify_war_headline": ("vix", "vix_regime", "current_price", "cot_net_spec"),
+}
+
+# Union of every classifier input — what the orchestrator diffs between versions
+CLASSIFIER_FIELDS = tuple(sorted({f for fields in CLASSIFIER_INPUTS.values() for f in fields}))
+
+
+def _run_classifier(classifier, state: MarketState) -> List[TrapZone]:
+    try:
+        return classifier(state) or []
+    except Exception as e:
+        logger.warning(f"Classifier {classifier.__name__} failed: {e}")
+        return []
+
+
 def classify_traps(state: MarketState) -> List[TrapZone]:
     """
     Run all classifiers against the current MarketState.
@@ -322,12 +352,43 @@ def classify_traps(state: MarketState) -> List[TrapZone]:
 
     traps = []
     for classifier in _CLASSIFIERS:
-        try:
-            result = classifier(state)
-            if result:
-                traps.extend(result)
-        except Exception as e:
-            logger.warning(f"Classifier {classifier.__name__} failed: {e}")
+        traps.extend(_run_classifier(classifier, state))
 
     traps.sort(key=lambda t: t.conviction, reverse=True)
     return traps
+
+
+def classify_traps_incremental(
+    state: MarketState,
+    changed: Optional[Iterable[str]],
+    previous: Optional[Dict[str, List[TrapZone]]] = None,
+) -> Tuple[List[TrapZone], Dict[str, List[TrapZone]]]:
+    """
+    Re-run only the classifiers whose inputs changed.
+
+    Args:
+        state: the new MarketState
+        changed: MarketState fields that differ from the previous version
+            (None = unknown, re-run everything)
+        previous: per-classifier output from the previous version
+
+    Returns (traps sorted like classify_traps, per-classifier output to pass
+    back in next time).
+    """
+    if not state.current_price:
+        return [], {}
+
+    changed = None if changed is None else set(changed)
+    previous = previous or {}
+    by_classifier: Dict[str, List[TrapZone]] = {}
+    for classifier in _CLASSIFIERS:
+        name = classifier.__name__
+        inputs = CLASSIFIER_INPUTS.get(name)
+        if changed is not None and inputs is not None and name in previous and changed.isdisjoint(inputs):
+            by_classifier[name] = previous[name]
+        else:
+            by_classifier[name] = _run_classifier(classifier, state)
+
+    traps = [t for classifier in _CLASSIFIERS for t in by_classifier[classifier.__name__]]
+    traps.sort(key=lambda t: t.conviction, reverse=True)
+    return traps, by_classifier
@@ -7,7 +7,7 @@ The brain of the Trap Matrix system. Wires the 4 focused modules together.
 This file owns:
   - Singleton agent lifecycle (via LayerFetcher)
   - State version tracking + history for diffing
-  - The get_current_state() public entry point
+  - The get_current_state() / get_states() public entry points
 
 All logic lives in the modules:
   tm_models.py          → data classes (TrapZone, MarketState, StalenessInfo)
@@ -31,12 +31,12 @@ Architecture:
 
 import logging
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Iterable
 
 from .tm_models import MarketState
 from .tm_layer_fetcher import LayerFetcher
-from .tm_trap_classifier import classify_traps
-from .tm_state_differ import compute_alert_level, should_rebuild
+from .tm_trap_classifier import CLASSIFIER_FIELDS, classify_traps_incremental
+from .tm_state_differ import build_delta, changed_fields, compute_alert_level, should_rebuild
 
 logger = logging.getLogger(__name__)
 
@@ -52,30 +52,50 @@ class TrapMatrixOrchestrator:
         print(state.to_dict())
     """
 
-    def __init__(self):
+    def __init__(self, incremental: bool = True):
         self._fetcher = LayerFetcher()
+        self._incremental = incremental
         self._prev_state: Dict[str, MarketState] = {}
         self._version: Dict[str, int] = {}
+        self._classified: Dict[str, dict] = {}  # symbol -> per-classifier traps of the last version
 
     def get_current_state(self, symbol: str) -> MarketState:
         """
         Build the current MarketState for a symbol.
 
         Steps:
-          1. Fetch all 5 data layers (each uses its own cache TTL)
-          2. Classify trap zones from the merged state
+          1. Fetch all 5 data layers concurrently (each uses its own cache TTL)
+          2. Classify trap zones from the merged state (only classifiers
+             whose inputs changed, in incremental mode)
           3. Compute alert level
           4. Diff against previous state to decide if rebuild is needed
-          5. Track version and return
+          5. Track version, attach the delta and return
         """
-        symbol = symbol.upper()
-        state = MarketState(symbol=symbol, timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        return self.get_states([symbol])[symbol.upper()]
 
-        # 1. Fetch (writes into state directly)
-        self._fetcher.fetch_all(symbol, state)
+    def get_states(self, symbols: Iterable[str]) -> Dict[str, MarketState]:
+        """
+        Build MarketStates for several symbols (e.g. SPY+QQQ+IWM) from a
+        single shared layer fan-out.
+        """
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        states = {s.upper(): MarketState(symbol=s.upper(), timestamp=now) for s in symbols}
 
-        # 2. Classify traps
-        state.traps = classify_traps(state)
+        # 1. Fetch (all layers, all symbols, concurrently)
+        self._fetcher.fetch_many(states)
+
+        for symbol, state in states.items():
+            self._finalize(symbol, state)
+        return states
+
+    def _finalize(self, symbol: str, state: MarketState) -> None:
+        prev = self._prev_state.get(symbol)
+        changed = changed_fields(prev, state, CLASSIFIER_FIELDS)
+
+        # 2. Classify traps (reuse classifiers whose inputs did not change)
+        state.traps, self._classified[symbol] = classify_traps_incremental(
+            state, changed if self._incremental else None, self._classified.get(symbol)
+        )
 
         # 3. Alert level
         state.alert_level = compute_alert_level(state)
@@ -84,16 +104,15 @@ class TrapMatrixOrchestrator:
         self._version[symbol] = self._version.get(symbol, 0) + 1
         state.version = self._version[symbol]
 
-        # 5. Rebuild diff
-        prev = self._prev_state.get(symbol)
+        # 5. Rebuild diff + delta
         if prev:
             rebuild, reason = should_rebuild(prev, state)
             state.rebuild_reason = reason if rebuild else "no_change"
         else:
             state.rebuild_reason = "initial_build"
+        state.delta = build_delta(prev, state, changed)
 
         self._prev_state[symbol] = state
-        return state
 
 
 # ─── Standalone Test ─────────────────────────────────────────────────────────
@@ -9,6 +9,7 @@ Modules:
 - squeeze_detector: Detects short squeeze setups using SI%, borrow fees, FTDs
 - gamma_tracker: Tracks dealer gamma exposure and positioning
 - opportunity_scanner: Scans for high institutional flow opportunities
+- scan_pipeline: Rate-limited, day-memoized worker pool for full-market scans
 - ftd_analyzer: Analyzes failure-to-deliver patterns
 - reddit_exploiter: Contrarian signals from Reddit sentiment (NEW!)
 """
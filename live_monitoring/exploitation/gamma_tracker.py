@@ -13,8 +13,8 @@ import sys
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, List, Dict
-import pandas as pd
-import yfinance as yf
+from live_monitoring.core.market_data import get_market_data
+from live_monitoring.core.options_analytics import ChainArrays, max_pain
 
 logger = logging.getLogger(__name__)
 
@@ -95,21 +95,20 @@ class GammaTracker:
         logger.info(f"🔍 Analyzing {symbol} for gamma exposure...")
         
         try:
-            # Step 1: Get options data from yfinance
-            ticker = yf.Ticker(symbol)
+            # Step 1: Get options data (shared market data bus — cached + coalesced)
+            bus = get_market_data()
             
             # Get current price if not provided
             if current_price is None:
-                hist = ticker.history(period='1d')
-                if hist.empty:
+                current_price = bus.get_last_close(symbol, period='1d', interval='1d')
+                if current_price is None:
                     logger.warning(f"   ❌ Failed to get price for {symbol}")
                     return None
-                current_price = float(hist['Close'].iloc[-1])
             
             logger.info(f"   Current price: ${current_price:.2f}")
             
             # Get nearest expiration
-            expirations = ticker.options
+            expirations = bus.get_options(symbol)
             if not expirations:
                 logger.warning(f"   ❌ No options expirations available for {symbol}")
                 return None
@@ -128,8 +127,11 @@ class GammaTracker:
             nearest_exp = expirations[exp_idx]
             logger.info(f"   Using expiration: {nearest_exp} (index {exp_idx})")
             
-            # Get options chain
-            chain = ticker.option_chain(nearest_exp)
+            # Get options chain (already cached by _select_best_expiration)
+            chain = bus.get_option_chain(symbol, nearest_exp)
+            if chain is None:
+                logger.warning(f"   ❌ No options chain for {symbol} {nearest_exp}")
+                return None
             calls = chain.calls
             puts = chain.puts
             
@@ -271,10 +273,9 @@ class GammaTracker:
         Returns:
             Index of best expiration, or None if none suitable
         """
-        import yfinance as yf
         from datetime import datetime
         
-        ticker = yf.Ticker(symbol)
+        bus = get_market_data()
         best_exp_idx = None
         best_score = 0
         
@@ -289,7 +290,9 @@ class GammaTracker:
                     continue
                 
                 # Get options chain
-                chain = ticker.option_chain(exp_str)
+                chain = bus.get_option_chain(symbol, exp_str)
+                if chain is None:
+                    continue
                 call_oi = chain.calls['openInterest'].sum()
                 put_oi = chain.puts['openInterest'].sum()
                 
@@ -336,58 +339,13 @@ class GammaTracker:
         - Total pain = call_pain + put_pain
         
         Max pain is the strike where total pain is MINIMIZED (least payout)
+        
+        Vectorized via options_analytics.max_pain (candidates: strikes within
+        +/-10% of price, or all strikes if none fall in that band).
         """
         try:
-            # Get all unique strikes within reasonable range of current price
-            # Filter to +/- 10% of current price for relevance
-            min_strike = current_price * 0.90
-            max_strike = current_price * 1.10
-            
-            relevant_strikes = sorted([
-                s for s in set(calls['strike'].tolist() + puts['strike'].tolist())
-                if min_strike <= s <= max_strike
-            ])
-            
-            if not relevant_strikes:
-                # Fall back to all strikes if no relevant ones
-                relevant_strikes = sorted(set(calls['strike'].tolist() + puts['strike'].tolist()))
-            
-            if not relevant_strikes:
-                return None
-            
-            # For each potential settlement price, calculate total option value
-            min_pain = float('inf')
-            max_pain_strike = current_price
-            
-            for settlement in relevant_strikes:
-                pain = 0
-                
-                # Calculate call value at this settlement price
-                # Call is ITM if settlement > strike
-                for _, call in calls.iterrows():
-                    oi = call['openInterest']
-                    if pd.isna(oi) or oi <= 0:
-                        continue
-                    if settlement > call['strike']:
-                        # Call is ITM - has intrinsic value (pain for MM)
-                        pain += (settlement - call['strike']) * oi
-                
-                # Calculate put value at this settlement price
-                # Put is ITM if settlement < strike
-                for _, put in puts.iterrows():
-                    oi = put['openInterest']
-                    if pd.isna(oi) or oi <= 0:
-                        continue
-                    if settlement < put['strike']:
-                        # Put is ITM - has intrinsic value (pain for MM)
-                        pain += (put['strike'] - settlement) * oi
-                
-                if pain < min_pain:
-                    min_pain = pain
-                    max_pain_strike = settlement
-            
-            return max_pain_strike
-            
+            chain = ChainArrays.from_frames(calls, puts)
+            return max_pain(chain, spot=current_price, band_pct=10.0)
         except Exception as e:
             logger.error(f"Error calculating max pain: {e}")
             return None
@@ -5,9 +5,11 @@ Scans market for high-potential exploitation opportunities
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional, Tuple
 import logging
 
+from .scan_pipeline import RateLimited, ScanPipeline, get_scan_pipeline
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,24 +39,37 @@ class OpportunityScanner:
     - Short Interest rankings
     - DP activity rankings
     - Options activity
+    
+    Per-symbol lookups run concurrently on the shared scan pipeline (one
+    rate budget per API key, short interest memoized for the day), and
+    tickers that can't reach min_score are dropped before their lookups.
     """
     
-    def __init__(self, api_client):
+    # Max points per component (see _score_ticker)
+    MAX_SI_SCORE = 30
+    MAX_DP_SCORE = 25
+    MIN_TICKER_SCORE = 30
+    
+    def __init__(self, api_client, pipeline: Optional[ScanPipeline] = None):
         """
         Initialize scanner with API client.
         
         Args:
             api_client: UltimateChartExchangeClient instance
+            pipeline: ScanPipeline to run lookups on (defaults to the one shared by the client's API key)
         """
         self.client = api_client
+        self.pipeline = pipeline or get_scan_pipeline(api_client)
     
-    def scan_market(self, min_score: float = 60, max_results: int = 20) -> List[Opportunity]:
+    def scan_market(self, min_score: float = 60, max_results: int = 20,
+                    time_budget: Optional[float] = None) -> List[Opportunity]:
         """
         Scan entire market for opportunities
         
         Args:
             min_score: Minimum composite score (0-100)
             max_results: Maximum number of results to return
+            time_budget: Seconds after which unscored tickers are skipped
         
         Returns:
             List of Opportunity objects sorted by score (highest first)
@@ -62,27 +77,10 @@ class OpportunityScanner:
         opportunities = []
         
         try:
-            # Step 1: Get screener results
-            screener_results = self.client.get_stock_screener(
-                min_price=10.0,
-                min_volume=1_000_000
-            )
+            for opportunity in self.iter_opportunities(min_score, time_budget):
+                opportunities.append(opportunity)
             
-            if not screener_results:
-                logger.warning("⚠️ No screener results found")
-                return opportunities
-            
-            # Step 2: Score each ticker
-            for ticker_data in screener_results:
-                symbol = ticker_data.get('display', ticker_data.get('symbol', ''))
-                if not symbol:
-                    continue
-                
-                opportunity = self._score_ticker(symbol, ticker_data)
-                if opportunity and opportunity.score >= min_score:
-                    opportunities.append(opportunity)
-            
-            # Step 3: Sort by score (highest first)
+            # Sort by score (highest first)
             opportunities.sort(key=lambda x: x.score, reverse=True)
             
             return opportunities[:max_results]
@@ -91,7 +89,77 @@ class OpportunityScanner:
             logger.error(f"❌ Error scanning market: {e}")
             return opportunities
     
-    def _score_ticker(self, symbol: str, screener_data: Dict) -> Optional[Opportunity]:
+    def iter_opportunities(self, min_score: float = 60,
+                           time_budget: Optional[float] = None) -> Iterator[Opportunity]:
+        """
+        Stream opportunities as each ticker finishes scoring (completion
+        order, not score order).
+        
+        Tickers whose screener-only score can't reach min_score even with
+        full SI and DP points are never looked up.
+        """
+        # Step 1: Get screener results
+        screener_results = self.client.get_stock_screener(
+            min_price=10.0,
+            min_volume=1_000_000
+        )
+        
+        if not screener_results:
+            logger.warning("⚠️ No screener results found")
+            return
+        
+        # Step 2: Short-circuit tickers that can't reach min_score
+        floor = max(min_score, self.MIN_TICKER_SCORE)
+        candidates = []
+        for ticker_data in screener_results:
+            symbol = ticker_data.get('display', ticker_data.get('symbol', ''))
+            if not symbol:
+                continue
+            
+            base_score, _ = self._screener_score(ticker_data)
+            if base_score + self.MAX_SI_SCORE + self.MAX_DP_SCORE >= floor:
+                candidates.append((symbol, ticker_data))
+        
+        logger.info(f"🔍 Scoring {len(candidates)}/{len(screener_results)} screener tickers (min score {min_score:.0f})")
+        
+        # Step 3: Score the rest concurrently
+        score = lambda candidate: self._score_ticker(*candidate, min_score=floor)
+        for _, opportunity in self.pipeline.imap(score, candidates, time_budget):
+            if opportunity and opportunity.score >= min_score:
+                yield opportunity
+    
+    def _screener_score(self, screener_data: Dict) -> Tuple[float, List[str]]:
+        """Volume surge and price points, from screener data alone"""
+        score = 0
+        reasons = []
+        
+        # Volume surge (from screener data)
+        volume_str = screener_data.get('reg_volume', '0')
+        try:
+            volume = int(float(volume_str))
+            if volume > 10_000_000:  # High volume
+                volume_score = min((volume / 50_000_000) * 15, 15)
+                score += volume_score
+                reasons.append(f"High volume: {volume:,.0f}")
+        except (ValueError, TypeError):
+            pass
+        
+        # Price momentum (from screener data)
+        price_str = screener_data.get('reg_price', '0')
+        try:
+            price = float(price_str)
+            if price > 0:
+                # Simple momentum proxy - could be enhanced
+                momentum_score = 5  # Base score for being in screener
+                score += momentum_score
+                reasons.append(f"Price: ${price:.2f}")
+        except (ValueError, TypeError):
+            pass
+        
+        return score, reasons
+    
+    def _score_ticker(self, symbol: str, screener_data: Dict,
+                      min_score: float = MIN_TICKER_SCORE) -> Optional[Opportunity]:
         """
         Score a ticker based on multiple factors
         
@@ -105,16 +173,24 @@ class OpportunityScanner:
         Args:
             symbol: Stock ticker
             screener_data: Data from stock screener
+            min_score: Score below which the ticker is dropped (lookups that
+                can no longer lift it above this are skipped)
         
         Returns:
-            Opportunity object if score >= 30, None otherwise
+            Opportunity object if score >= min_score, None otherwise
+        
+        Raises:
+            RateLimited: a lookup ran out of rate budget (the ticker is
+                skipped rather than scored without it)
         """
         score = 0
         reasons = []
         
         try:
-            # Get short interest
-            si_data = self.client.get_short_interest(symbol)
+            screener_score, screener_reasons = self._screener_score(screener_data)
+            
+            # Get short interest (fixed for the day)
+            si_data = self.pipeline.fetch(self.client.get_short_interest, symbol, daily=True)
             if si_data:
                 si_pct = self._extract_si_pct(si_data)
                 if si_pct > 15:
@@ -122,40 +198,22 @@ class OpportunityScanner:
                     score += si_score
                     reasons.append(f"High SI: {si_pct:.1f}%")
             
-            # Get DP activity
-            dp_levels = self.client.get_dark_pool_levels(symbol)
-            if dp_levels and len(dp_levels) > 50:
-                dp_score = min((len(dp_levels) / 200) * 25, 25)
-                score += dp_score
-                reasons.append(f"High DP activity: {len(dp_levels)} levels")
+            # Get DP activity - unless even full DP points can't reach min_score
+            dp_levels = None
+            if screener_score + score + self.MAX_DP_SCORE >= min_score:
+                dp_levels = self.pipeline.fetch(self.client.get_dark_pool_levels, symbol)
+                if dp_levels and len(dp_levels) > 50:
+                    dp_score = min((len(dp_levels) / 200) * 25, 25)
+                    score += dp_score
+                    reasons.append(f"High DP activity: {len(dp_levels)} levels")
             
             # Get options activity (if available)
             # TODO: Add options activity scoring when data available
             
-            # Volume surge (from screener data)
-            volume_str = screener_data.get('reg_volume', '0')
-            try:
-                volume = int(float(volume_str))
-                if volume > 10_000_000:  # High volume
-                    volume_score = min((volume / 50_000_000) * 15, 15)
-                    score += volume_score
-                    reasons.append(f"High volume: {volume:,.0f}")
-            except (ValueError, TypeError):
-                pass
-            
-            # Price momentum (from screener data)
-            price_str = screener_data.get('reg_price', '0')
-            try:
-                price = float(price_str)
-                if price > 0:
-                    # Simple momentum proxy - could be enhanced
-                    momentum_score = 5  # Base score for being in screener
-                    score += momentum_score
-                    reasons.append(f"Price: ${price:.2f}")
-            except (ValueError, TypeError):
-                pass
+            score += screener_score
+            reasons.extend(screener_reasons)
             
-            if score < 30:
+            if score < min_score:
                 return None  # Too low score
             
             return Opportunity(
@@ -167,6 +225,8 @@ class OpportunityScanner:
                 timestamp=datetime.now()
             )
         
+        except RateLimited:
+            raise
         except Exception as e:
             logger.debug(f"Error scoring {symbol}: {e}")
             return None
@@ -177,52 +237,62 @@ class OpportunityScanner:
             return float(si_data[0].get('short_interest', 0))
         return 0.0
     
-    def scan_with_squeeze_detector(self, squeeze_detector, min_score: float = 50) -> List[Opportunity]:
+    def _screener_symbols(self, **screener_args) -> List[str]:
+        screener_results = self.client.get_stock_screener(**screener_args) or []
+        symbols = (t.get('display', t.get('symbol', '')) for t in screener_results)
+        return list(dict.fromkeys(s for s in symbols if s))
+    
+    def _squeeze_opportunities(self, squeeze_detector, symbols: List[str], min_score: float,
+                               detailed: bool = False, time_budget: Optional[float] = None) -> List[Opportunity]:
+        """Run the squeeze detector over symbols concurrently and keep signals >= min_score"""
+        opportunities = []
+        
+        for squeeze_signal in squeeze_detector.iter_watchlist(symbols, time_budget):
+            if squeeze_signal.score < min_score:
+                continue
+            
+            reasons = [f"Squeeze score: {squeeze_signal.score:.0f}/100"]
+            if detailed:
+                reasons += [
+                    f"SI: {squeeze_signal.short_interest_pct:.1f}%",
+                    f"Borrow: {squeeze_signal.borrow_fee_pct:.1f}%"
+                ]
+                logger.info(f"   🔥 Found squeeze: {squeeze_signal.symbol} (Score: {squeeze_signal.score:.0f})")
+            
+            opportunities.append(Opportunity(
+                symbol=squeeze_signal.symbol,
+                score=squeeze_signal.score,
+                reasons=reasons,
+                squeeze_score=squeeze_signal.score,
+                short_interest=squeeze_signal.short_interest_pct,
+                timestamp=datetime.now()
+            ))
+        
+        # Sort by score
+        opportunities.sort(key=lambda x: x.score, reverse=True)
+        
+        return opportunities
+    
+    def scan_with_squeeze_detector(self, squeeze_detector, min_score: float = 50,
+                                   time_budget: Optional[float] = None) -> List[Opportunity]:
         """
         Scan market and run squeeze detector on each candidate
         
         Args:
             squeeze_detector: SqueezeDetector instance
             min_score: Minimum squeeze score threshold
+            time_budget: Seconds after which unanalyzed candidates are skipped
         
         Returns:
             List of opportunities that pass squeeze detector threshold
         """
-        opportunities = []
-        
         try:
-            # Get screener results
-            screener_results = self.client.get_stock_screener(min_price=10.0, min_volume=1_000_000)
-            
-            if not screener_results:
-                return opportunities
-            
-            for ticker_data in screener_results:
-                symbol = ticker_data.get('display', ticker_data.get('symbol', ''))
-                if not symbol:
-                    continue
-                
-                # Run squeeze detector
-                squeeze_signal = squeeze_detector.analyze(symbol)
-                
-                if squeeze_signal and squeeze_signal.score >= min_score:
-                    opportunities.append(Opportunity(
-                        symbol=symbol,
-                        score=squeeze_signal.score,
-                        reasons=[f"Squeeze score: {squeeze_signal.score:.0f}/100"],
-                        squeeze_score=squeeze_signal.score,
-                        short_interest=squeeze_signal.short_interest_pct,
-                        timestamp=datetime.now()
-                    ))
-            
-            # Sort by score
-            opportunities.sort(key=lambda x: x.score, reverse=True)
-            
-            return opportunities
+            symbols = self._screener_symbols(min_price=10.0, min_volume=1_000_000)
+            return self._squeeze_opportunities(squeeze_detector, symbols, min_score, time_budget=time_budget)
         
         except Exception as e:
             logger.error(f"❌ Error scanning with squeeze detector: {e}")
-            return opportunities
+            return []
     
     def get_high_short_interest_stocks(self) -> List[str]:
         """
@@ -259,20 +329,14 @@ class OpportunityScanner:
         
         # SOURCE 2: Scan API for stocks with SI > 15%
         try:
-            screener_results = self.client.get_stock_screener(min_price=5.0, min_volume=500_000)
-            if screener_results:
-                for ticker_data in screener_results:
-                    symbol = ticker_data.get('display', ticker_data.get('symbol', ''))
-                    if not symbol:
-                        continue
-                    
-                    # Check short interest
-                    si_data = self.client.get_short_interest(symbol)
-                    if si_data:
-                        si_pct = self._extract_si_pct(si_data)
-                        if si_pct > 15:  # High SI threshold
-                            high_si_stocks.add(symbol)
-                            logger.info(f"   📡 Discovered high SI: {symbol} ({si_pct:.1f}%)")
+            symbols = self._screener_symbols(min_price=5.0, min_volume=500_000)
+            fetch_si = lambda symbol: self.pipeline.fetch(self.client.get_short_interest, symbol, daily=True)
+            for symbol, si_data in self.pipeline.imap(fetch_si, symbols):
+                if si_data:
+                    si_pct = self._extract_si_pct(si_data)
+                    if si_pct > 15:  # High SI threshold
+                        high_si_stocks.add(symbol)
+                        logger.info(f"   📡 Discovered high SI: {symbol} ({si_pct:.1f}%)")
         except Exception as e:
             logger.debug(f"SI scan error: {e}")
         
@@ -292,42 +356,16 @@ class OpportunityScanner:
         Returns:
             List of squeeze opportunities sorted by score
         """
-        opportunities = []
-        
         try:
             # Get all high SI stocks
             high_si_stocks = self.get_high_short_interest_stocks()
             logger.info(f"🔍 Scanning {len(high_si_stocks)} high-SI stocks for squeeze setups...")
             
-            for symbol in high_si_stocks:
-                try:
-                    squeeze_signal = squeeze_detector.analyze(symbol)
-                    
-                    if squeeze_signal and squeeze_signal.score >= min_score:
-                        opportunities.append(Opportunity(
-                            symbol=symbol,
-                            score=squeeze_signal.score,
-                            reasons=[
-                                f"Squeeze score: {squeeze_signal.score:.0f}/100",
-                                f"SI: {squeeze_signal.short_interest_pct:.1f}%",
-                                f"Borrow: {squeeze_signal.borrow_fee_pct:.1f}%"
-                            ],
-                            squeeze_score=squeeze_signal.score,
-                            short_interest=squeeze_signal.short_interest_pct,
-                            timestamp=datetime.now()
-                        ))
-                        logger.info(f"   🔥 Found squeeze: {symbol} (Score: {squeeze_signal.score:.0f})")
-                except Exception as e:
-                    logger.debug(f"Error analyzing {symbol}: {e}")
-            
-            # Sort by score
-            opportunities.sort(key=lambda x: x.score, reverse=True)
-            
-            return opportunities
+            return self._squeeze_opportunities(squeeze_detector, high_si_stocks, min_score, detailed=True)
         
         except Exception as e:
             logger.error(f"❌ Error in squeeze scan: {e}")
-            return opportunities
+            return []
     
     def get_daily_rankings(self) -> Dict[str, List[Opportunity]]:
         """
@@ -47,6 +47,9 @@ except ImportError:
 sys.path.append(str(Path(__file__).parent.parent.parent / 'core/data'))
 sys.path.append(str(Path(__file__).parent.parent.parent / 'configs'))
 
+from core.utils.tiered_cache import MB, get_cache
+from live_monitoring.exploitation.reddit_scanner import RedditUniverseScanner, TokenBucket
+
 logger = logging.getLogger(__name__)
 
 
@@ -558,10 +561,11 @@ class RedditExploiter:
         self.rate_limit_per_minute = 1000
         self.request_times = []  # Track request timestamps
         self.request_lock = False  # Lock to prevent concurrent rate limit checks
+        self.limiter = TokenBucket(self.rate_limit_per_minute)  # shared by all fetch paths
         
-        # Cache for rate limiting
-        self.cache = {}
+        # Cache for rate limiting (shared, byte-bounded; expired entries kept as fallback)
         self.cache_ttl = 300  # 5 minutes
+        self.cache = get_cache("reddit_mentions", ttl=self.cache_ttl, max_bytes=32 * MB)
         
         # Priority tiers for tickers (higher = more important)
         self.ticker_priorities = {
@@ -651,6 +655,9 @@ class RedditExploiter:
         
         # WSB Analyzer (Task 5.5)
         self.wsb_analyzer = WSBAnalyzer()
+        
+        # Concurrent, cursor-based universe scanner (3-day window, newest 100 mentions)
+        self.scanner = RedditUniverseScanner(self, window_days=3, max_pages=1)
     
     def _check_rate_limit(self) -> bool:
         """
@@ -705,7 +712,8 @@ class RedditExploiter:
                 'rate_limit': int,
                 'remaining': int,
                 'utilization_pct': float,
-                'can_make_request': bool
+                'can_make_request': bool,
+                'tokens_available': int,  # shared token bucket
             }
         """
         now = datetime.now()
@@ -721,7 +729,8 @@ class RedditExploiter:
             'rate_limit': self.rate_limit_per_minute,
             'remaining': remaining,
             'utilization_pct': utilization,
-            'can_make_request': remaining > 0
+            'can_make_request': remaining > 0,
+            'tokens_available': int(self.limiter.available()),
         }
     
     def _fetch_mentions(self, symbol: str, days: int = 7, max_pages: int = 3) -> List[RedditMention]:
@@ -739,20 +748,19 @@ class RedditExploiter:
         cache_key = f"{symbol}_{days}_{max_pages}"
         
         # Check cache first (avoids API call)
-        if cache_key in self.cache:
-            cached_time, cached_data = self.cache[cache_key]
-            if (datetime.now() - cached_time).seconds < self.cache_ttl:
-                logger.debug(f"📦 Cache hit for {symbol}")
-                return cached_data
+        cached_data = self.cache.get(cache_key)
+        if cached_data is not None:
+            logger.debug(f"📦 Cache hit for {symbol}")
+            return cached_data
         
         # Check rate limit before making request
         if not self._check_rate_limit():
             logger.warning(f"⚠️ Rate limit reached, skipping {symbol} (will use cache if available)")
             # Return cached data even if expired (better than nothing)
-            if cache_key in self.cache:
-                cached_time, cached_data = self.cache[cache_key]
+            expired = self.cache.peek(cache_key)
+            if expired is not None:
                 logger.debug(f"   Using expired cache for {symbol}")
-                return cached_data
+                return expired[0]
             return []
         
         mentions = []
@@ -766,7 +774,7 @@ class RedditExploiter:
         
         while next_url and pages_fetched < max_pages:
             # Check rate limit before each page
-            if not self._check_rate_limit():
+            if not self._check_rate_limit() or not self.limiter.try_acquire():
                 logger.warning(f"⚠️ Rate limit reached while fetching {symbol} (got {pages_fetched} pages)")
                 break
             
@@ -822,7 +830,7 @@ class RedditExploiter:
                 break
         
         # Update cache
-        self.cache[cache_key] = (datetime.now(), mentions)
+        self.cache.set(cache_key, mentions, ttl=self.cache_ttl)
         
         return mentions
     
@@ -1631,78 +1639,58 @@ class RedditExploiter:
         )
         
         # Limit tickers if specified or if rate limit is high
-        remaining_requests = self.rate_limit_per_minute - len(self.request_times)
+        remaining_requests = int(self.limiter.available())
         if max_tickers is None:
             # Auto-limit based on rate limit
-            # Each ticker = 1 request (1 page), leave 20% buffer
+            # Each ticker = at most 1 request (1 page), leave 20% buffer
             safe_limit = int(remaining_requests * 0.8)
             max_tickers = min(safe_limit, len(sorted_universe))
             logger.debug(f"   Auto-limiting to {max_tickers} tickers (rate limit: {remaining_requests} remaining)")
         
+        # Concurrent incremental refresh: only mentions newer than the last scan are fetched
+        aggregates = self.scanner.scan(sorted_universe[:max_tickers])
         discoveries = []
-        scanned = 0
-        skipped_due_to_rate_limit = 0
         
-        for symbol in sorted_universe:
-            # Check rate limit before each ticker
-            if not self._check_rate_limit():
-                skipped_due_to_rate_limit += 1
-                logger.debug(f"   ⏭️ Skipping {symbol} (rate limit reached)")
+        for symbol, agg in aggregates.items():
+            mention_count = agg['mention_count']
+            if not mention_count:
                 continue
             
-            if max_tickers and scanned >= max_tickers:
-                logger.debug(f"   ⏭️ Reached max_tickers limit ({max_tickers})")
-                break
+            avg_sentiment = agg['avg_sentiment']
+            wsb_count = agg['wsb_mentions']
             
-            try:
-                mentions = self._fetch_mentions(symbol, days=3, max_pages=1)
-                scanned += 1
-                
-                if not mentions:
-                    continue
-                
-                # Calculate metrics
-                sentiments = [m.sentiment for m in mentions]
-                avg_sentiment = sum(sentiments) / len(sentiments) if sentiments else 0
-                bullish_pct = (len([s for s in sentiments if s > 0.3]) / len(sentiments)) * 100
-                
-                wsb_count = len([m for m in mentions if m.subreddit == 'wallstreetbets'])
-                
-                # Momentum score (higher = more activity)
-                momentum_score = len(mentions) * (1 + abs(avg_sentiment))
-                
-                # Determine discovery reason
-                if abs(avg_sentiment) > min_sentiment_extreme:
-                    if avg_sentiment > 0:
-                        reason = f"🔥 BULLISH ({avg_sentiment:+.2f})"
-                    else:
-                        reason = f"❄️ BEARISH ({avg_sentiment:+.2f})"
-                elif wsb_count > 50:
-                    reason = f"🎰 WSB HOT ({wsb_count} posts)"
-                elif len(mentions) >= 100:
-                    reason = f"📈 HIGH VOLUME ({len(mentions)} posts)"
+            # Momentum score (higher = more activity)
+            momentum_score = mention_count * (1 + abs(avg_sentiment))
+            
+            # Determine discovery reason
+            if abs(avg_sentiment) > min_sentiment_extreme:
+                if avg_sentiment > 0:
+                    reason = f"🔥 BULLISH ({avg_sentiment:+.2f})"
                 else:
-                    continue  # Skip if not interesting
-                
-                discovery = HotTickerDiscovery(
-                    symbol=symbol,
-                    mention_count=len(mentions),
-                    avg_sentiment=avg_sentiment,
-                    bullish_pct=bullish_pct,
-                    wsb_mentions=wsb_count,
-                    momentum_score=momentum_score,
-                    discovery_reason=reason
-                )
-                
-                discoveries.append(discovery)
-                
-            except Exception as e:
-                logger.debug(f"Error scanning {symbol}: {e}")
+                    reason = f"❄️ BEARISH ({avg_sentiment:+.2f})"
+            elif wsb_count > 50:
+                reason = f"🎰 WSB HOT ({wsb_count} posts)"
+            elif mention_count >= 100:
+                reason = f"📈 HIGH VOLUME ({mention_count} posts)"
+            else:
+                continue  # Skip if not interesting
+            
+            discoveries.append(HotTickerDiscovery(
+                symbol=symbol,
+                mention_count=mention_count,
+                avg_sentiment=avg_sentiment,
+                bullish_pct=agg['bullish_pct'],
+                wsb_mentions=wsb_count,
+                momentum_score=momentum_score,
+                discovery_reason=reason
+            ))
         
         # Sort by momentum score
         discoveries.sort(key=lambda x: x.momentum_score, reverse=True)
         
-        logger.info(f"✅ Found {len(discoveries)} hot tickers (scanned {scanned}, skipped {skipped_due_to_rate_limit} due to rate limit)")
+        scan = self.scanner.last_scan
+        logger.info(f"✅ Found {len(discoveries)} hot tickers (scanned {scan['symbols']} in {scan['elapsed_ms']:.0f}ms, "
+                    f"{scan['requests']} requests, {scan['rate_limited']} rate limited)")
         
         return discoveries
     
@@ -1734,13 +1722,10 @@ class RedditExploiter:
         
         emerging = []
         
-        # Scan universe for emerging patterns
-        for symbol in self.scan_universe:
+        # Scan universe for emerging patterns (concurrent, incremental)
+        for symbol, agg in self.scanner.scan(self.scan_universe).items():
             try:
-                # Quick scan: 1 page only
-                mentions = self._fetch_mentions(symbol, days=3, max_pages=1)
-                
-                mention_count = len(mentions)
+                mention_count = agg['mention_count']
                 
                 # Check if in sweet spot
                 if mention_count < min_mentions or mention_count > max_mentions:
@@ -1758,13 +1743,8 @@ class RedditExploiter:
                         if avg_mentions_7d > 0:
                             velocity = mention_count / avg_mentions_7d
                 
-                # Calculate sentiment
-                sentiments = [m.sentiment for m in mentions]
-                avg_sentiment = sum(sentiments) / len(sentiments) if sentiments else 0
-                
-                # Top subreddit
-                subreddit_counts = Counter([m.subreddit for m in mentions])
-                top_subreddit = subreddit_counts.most_common(1)[0][0] if subreddit_counts else 'unknown'
+                avg_sentiment = agg['avg_sentiment']
+                top_subreddit = agg['top_subreddit']
                 
                 # Momentum score (higher = more promising)
                 momentum_score = (
@@ -0,0 +1,336 @@
+"""
+📡 REDDIT UNIVERSE SCANNER
+==========================
+
+Concurrent, cursor-based scanning of the Reddit ticker universe.
+
+The old discovery loops walked the universe one ticker at a time and
+re-downloaded a full page of mentions per symbol on every scan. This scanner:
+
+1. Shares one TOKEN BUCKET across all workers, so a full-universe scan stays
+   inside the ChartExchange per-minute budget no matter how many threads run.
+2. Fans symbols out over a small thread pool.
+3. Keeps a per-symbol HIGH-WATER MARK and only ingests mentions newer than the
+   last scan (the API returns newest first, so pagination stops at the cursor).
+4. Stores mentions in compact per-symbol columns (timestamp / sentiment /
+   subreddit code) and keeps count, sentiment and subreddit aggregates as
+   running sums that are updated on insert and eviction.
+
+Each symbol keeps at most ``max_pages * 100`` mentions inside ``window_days``,
+which is exactly what a fresh ``_fetch_mentions(symbol, days, max_pages)`` call
+would have returned, so discovery thresholds keep their meaning.
+"""
+
+import bisect
+import logging
+import math
+import threading
+import time
+from array import array
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 100
+WSB = 'wallstreetbets'
+
+_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _scan_pool() -> ThreadPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="reddit-scan")
+    return _pool
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# RATE LIMITING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at ``rate_per_minute``."""
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = float(capacity if capacity is not None else rate_per_minute)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._cond = threading.Condition()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def available(self) -> float:
+        with self._cond:
+            self._refill()
+            return self._tokens
+
+    def try_acquire(self, tokens: float = 1.0, timeout: float = 0.0) -> bool:
+        """Take ``tokens``, waiting up to ``timeout`` seconds for a refill."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return True
+                wait = min(deadline - time.monotonic(), (tokens - self._tokens) / self.rate)
+                if wait <= 0:
+                    return False
+                self._cond.wait(wait)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# COLUMNAR MENTION STORE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class SymbolMentions:
+    """
+    Mentions for one symbol as parallel columns, oldest first, plus running
+    aggregates. Evicted rows are skipped via ``head`` and compacted lazily.
+    """
+
+    __slots__ = ('created', 'sentiment', 'subreddit', 'head', 'high_water', 'seen_at_high_water',
+                 'sentiment_sum', 'bullish', 'bearish', 'by_subreddit', 'updated_at')
+
+    def __init__(self):
+        self.created = array('d')       # epoch seconds, ascending
+        self.sentiment = array('d')
+        self.subreddit = array('H')     # codes into MentionStore.vocab
+        self.head = 0
+        self.high_water: Optional[float] = None
+        self.seen_at_high_water: set = set()  # links at the high-water second (dedupe)
+        self.sentiment_sum = 0.0
+        self.bullish = 0
+        self.bearish = 0
+        self.by_subreddit: Counter = Counter()
+        self.updated_at: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self.created) - self.head
+
+    def append(self, created: float, sentiment: float, subreddit: int):
+        self.created.append(created)
+        self.sentiment.append(sentiment)
+        self.subreddit.append(subreddit)
+        self._count(len(self.sentiment) - 1, 1)
+
+    def _count(self, i: int, sign: int):
+        s = self.sentiment[i]
+        self.sentiment_sum += sign * s
+        self.bullish += sign * (s > 0.3)
+        self.bearish += sign * (s < -0.3)
+        self.by_subreddit[self.subreddit[i]] += sign
+
+    def evict(self, cutoff: float, max_rows: int):
+        """Drop rows older than ``cutoff`` and beyond the newest ``max_rows``."""
+        end = len(self.created)
+        keep_from = max(bisect.bisect_left(self.created, cutoff, self.head, end), end - max_rows)
+        for i in range(self.head, keep_from):
+            self._count(i, -1)
+            if self.by_subreddit[self.subreddit[i]] <= 0:
+                del self.by_subreddit[self.subreddit[i]]
+        self.head = max(self.head, keep_from)
+        if self.head and self.head * 2 >= end:
+            self._compact()
+
+    def _compact(self):
+        self.created = self.created[self.head:]
+        self.sentiment = self.sentiment[self.head:]
+        self.subreddit = self.subreddit[self.head:]
+        self.head = 0
+        # Re-derive the float sum so add/subtract drift never accumulates
+        self.sentiment_sum = float(sum(self.sentiment))
+
+    def count_since(self, ts: float) -> int:
+        return len(self.created) - bisect.bisect_left(self.created, ts, self.head)
+
+
+class MentionStore:
+    """Per-symbol ``SymbolMentions`` plus the shared subreddit vocabulary."""
+
+    def __init__(self):
+        self.symbols: Dict[str, SymbolMentions] = {}
+        self.vocab: Dict[str, int] = {}
+        self.names: List[str] = []
+        self._lock = threading.Lock()
+
+    def get(self, symbol: str) -> SymbolMentions:
+        with self._lock:
+            return self.symbols.setdefault(symbol, SymbolMentions())
+
+    def code(self, subreddit: str) -> int:
+        with self._lock:
+            code = self.vocab.get(subreddit)
+            if code is None:
+                code = self.vocab[subreddit] = len(self.names)
+                self.names.append(subreddit)
+            return code
+
+    def aggregates(self, symbol: str, now: Optional[float] = None) -> Dict:
+        """Window metrics for ``symbol`` from the running sums (O(log n))."""
+        col = self.symbols.get(symbol)
+        now = now if now is not None else time.time()
+        n = len(col) if col is not None else 0
+        if not n:
+            return {'symbol': symbol, 'mention_count': 0, 'avg_sentiment': 0.0, 'bullish_pct': 0.0,
+                    'bearish_pct': 0.0, 'wsb_mentions': 0, 'top_subreddit': 'unknown',
+                    'mentions_1h': 0, 'mentions_24h': 0, 'velocity_1h': 0.0, 'velocity_24h': 0.0,
+                    'surge_multiplier': 1.0, 'updated_at': col.updated_at if col is not None else None}
+
+        top = max(col.by_subreddit.items(), key=lambda kv: kv[1])[0]
+        wsb_code = self.vocab.get(WSB)
+        mentions_1h = col.count_since(now - 3600)
+        mentions_24h = col.count_since(now - 86400)
+        velocity_24h = mentions_24h / 24.0
+        return {
+            'symbol': symbol,
+            'mention_count': n,
+            'avg_sentiment': col.sentiment_sum / n,
+            'bullish_pct': col.bullish / n * 100,
+            'bearish_pct': col.bearish / n * 100,
+            'wsb_mentions': col.by_subreddit.get(wsb_code, 0) if wsb_code is not None else 0,
+            'top_subreddit': self.names[top],
+            'mentions_1h': mentions_1h,
+            'mentions_24h': mentions_24h,
+            'velocity_1h': float(mentions_1h),
+            'velocity_24h': velocity_24h,
+            'surge_multiplier': mentions_1h / velocity_24h if velocity_24h > 0 else 1.0,
+            'updated_at': col.updated_at,
+        }
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SCANNER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class RedditUniverseScanner:
+    """
+    Refreshes a universe of symbols concurrently, fetching only mentions
+    newer than each symbol's high-water mark.
+
+    Uses the exploiter's HTTP session, API key and token bucket so scanner
+    traffic and ``_fetch_mentions`` traffic share one rate budget.
+    """
+
+    def __init__(self, exploiter, window_days: int = 3, max_pages: int = 1,
+                 acquire_timeout: float = 2.0):
+        self.exploiter = exploiter
+        self.window_days = window_days
+        self.max_pages = max_pages
+        self.acquire_timeout = acquire_timeout
+        self.store = MentionStore()
+        self.last_scan: Dict = {}
+        self._lock = threading.Lock()  # one scan at a time; workers own distinct symbols
+
+    @property
+    def max_rows(self) -> int:
+        return self.max_pages * PAGE_SIZE
+
+    def scan(self, symbols: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Refresh ``symbols`` in parallel and return ``{symbol: aggregates}``.
+
+        Symbols that could not be refreshed (rate budget exhausted, API error)
+        keep their previously stored mentions.
+        """
+        symbols = list(dict.fromkeys(s.upper() for s in symbols))
+        start = time.monotonic()
+        with self._lock:
+            results = list(_scan_pool().map(self._refresh, symbols))
+            now = time.time()
+            out = {}
+            for symbol in symbols:
+                self.store.get(symbol).evict(now - self.window_days * 86400, self.max_rows)
+                out[symbol] = self.store.aggregates(symbol, now)
+
+        self.last_scan = {
+            'symbols': len(symbols),
+            'refreshed': sum(1 for ok, _, _ in results if ok),
+            'rate_limited': sum(1 for ok, _, limited in results if limited),
+            'requests': sum(r for _, r, _ in results),
+            'elapsed_ms': round((time.monotonic() - start) * 1000, 1),
+        }
+        logger.debug(f"📡 Reddit scan: {self.last_scan}")
+        return out
+
+    def _refresh(self, symbol: str) -> Tuple[bool, int, bool]:
+        """Fetch new mentions for one symbol. Returns (ok, requests, rate_limited)."""
+        ex = self.exploiter
+        col = self.store.get(symbol)
+        high_water = col.high_water
+        if high_water is None:
+            days = self.window_days
+        else:
+            days = max(1, min(self.window_days, math.ceil((time.time() - high_water) / 86400)))
+
+        next_url = f"{ex.base_url}/data/reddit/mentions/stock/{symbol}/"
+        params = {'api_key': ex.api_key, 'days': days}
+        fresh = []      # (created, sentiment, subreddit, link), newest first
+        requests_made = 0
+        reached_cursor = False
+
+        while next_url and requests_made < self.max_pages and not reached_cursor:
+            if not ex.limiter.try_acquire(timeout=self.acquire_timeout):
+                logger.debug(f"   ⏭️ {symbol}: rate budget exhausted, keeping stored mentions")
+                return False, requests_made, True
+            try:
+                resp = ex.session.get(next_url, params=params if requests_made == 0 else None, timeout=10)
+            except Exception as e:
+                logger.warning(f"Error fetching Reddit mentions for {symbol}: {e}")
+                return False, requests_made, False
+            requests_made += 1
+            ex._record_request()
+
+            if resp.status_code == 429:
+                logger.warning(f"⚠️ API returned 429 (rate limit) for {symbol}")
+                return False, requests_made, True
+            if resp.status_code != 200:
+                logger.warning(f"Reddit API error for {symbol}: {resp.status_code}")
+                return False, requests_made, False
+
+            data = resp.json()
+            if isinstance(data, dict):
+                items, next_url = data.get('results', []), data.get('next')
+            else:
+                items, next_url = data, None
+
+            for item in items:
+                try:
+                    created = datetime.strptime(item['created'], '%Y-%m-%d %H:%M:%S').timestamp()
+                    sentiment = float(item.get('sentiment', 0))
+                except Exception as e:
+                    logger.debug(f"Error parsing mention: {e}")
+                    continue
+                link = item.get('link', '')
+                if high_water is not None and (created < high_water or (
+                        created == high_water and link in col.seen_at_high_water)):
+                    reached_cursor = True
+                    continue
+                fresh.append((created, sentiment, item.get('subreddit', 'unknown'), link))
+
+        self._ingest(col, fresh)
+        col.updated_at = time.time()
+        return True, requests_made, False
+
+    def _ingest(self, col: SymbolMentions, fresh: List[Tuple[float, float, str, str]]):
+        if not fresh:
+            return
+        # A full page of new mentions can leave a gap behind it; the gap is
+        # older than the newest max_rows and gets evicted anyway.
+        fresh.reverse()  # oldest first; the stable sort keeps same-second API order
+        fresh.sort(key=lambda row: row[0])
+        for created, sentiment, subreddit, _ in fresh:
+            col.append(created, sentiment, self.store.code(subreddit))
+
+        top = fresh[-1][0]
+        if top != col.high_water:
+            col.seen_at_high_water = set()
+        col.high_water = top
+        col.seen_at_high_water.update(link for created, _, _, link in fresh if created == top)
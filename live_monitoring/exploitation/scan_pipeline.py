@@ -0,0 +1,181 @@
+"""
+⚡ SCAN PIPELINE
+================
+
+Shared plumbing for full-market scans (OpportunityScanner, SqueezeDetector).
+
+The scanners used to walk hundreds of screener rows and make every
+ChartExchange lookup for one symbol before starting the next. Here:
+
+1. Per-symbol work fans out over a small thread pool, and results are
+   yielded as each symbol completes.
+2. Every lookup takes a token from one TOKEN BUCKET per API key, so
+   concurrent scanners share one rate budget. The bucket only holds a small
+   burst and refills at the tier limit minus that burst, so no 60s window
+   exceeds the client's own limit (which would stall it for a minute).
+   A lookup that can't get a token raises RateLimited and the symbol is
+   skipped rather than scored on partial data.
+3. Lookups whose answer is fixed for the day (short interest, FTDs) are
+   memoized per calendar day in a process-wide memo, so repeated scans
+   only refetch intraday data.
+"""
+
+import logging
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, Optional, Tuple
+
+from .reddit_scanner import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE_PER_MINUTE = 250
+MAX_WORKERS = 8
+
+
+class RateLimited(Exception):
+    """No rate budget freed up within ScanPipeline.acquire_timeout."""
+
+
+def _today() -> str:
+    return datetime.now().strftime('%Y-%m-%d')
+
+
+class DailyMemo:
+    """Memo for lookups whose answer is fixed for the day. Failed (None) lookups are not cached."""
+
+    def __init__(self, today: Callable[[], str] = _today):
+        self._today = today
+        self._day: Optional[str] = None
+        self._values: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        day = self._today()
+        with self._lock:
+            if day != self._day:
+                self._day, self._values = day, {}
+            if key in self._values:
+                return self._values[key]
+        value = loader()
+        if value is not None:
+            with self._lock:
+                if day == self._day:
+                    self._values[key] = value
+        return value
+
+
+_daily_memo = DailyMemo()
+
+
+class ScanPipeline:
+    """Rate-limited worker pool for per-symbol lookups."""
+
+    def __init__(self, rate_per_minute: float = DEFAULT_RATE_PER_MINUTE, max_workers: int = MAX_WORKERS,
+                 acquire_timeout: float = 5.0, memo: Optional[DailyMemo] = None, burst: Optional[float] = None):
+        """
+        Args:
+            rate_per_minute: The API key's request limit per rolling minute
+            burst: Requests that may go out back to back (defaults to max_workers)
+        """
+        burst = max(1.0, min(burst if burst is not None else max_workers, rate_per_minute / 2))
+        # burst + one minute of refill never exceeds rate_per_minute
+        self.limiter = TokenBucket(max(rate_per_minute - burst, rate_per_minute / 2), capacity=burst)
+        self.max_workers = max_workers
+        self.acquire_timeout = acquire_timeout
+        self.memo = memo if memo is not None else _daily_memo
+        self.stats = Counter()
+        self._stats_lock = threading.Lock()
+
+    def _count(self, key: str, n: int = 1):
+        with self._stats_lock:
+            self.stats[key] += n
+
+    def fetch(self, method: Callable, *args, daily: bool = False, **kwargs) -> Any:
+        """
+        Call a client lookup under the shared rate budget.
+
+        Args:
+            method: Bound client method, e.g. ``client.get_short_interest``
+            daily: Memoize the result for the rest of the day (keyed on the
+                client class, method name and arguments)
+
+        Returns:
+            The lookup's result
+
+        Raises:
+            RateLimited: no rate budget freed up within ``acquire_timeout``
+        """
+        if daily:
+            owner = type(getattr(method, '__self__', None)).__name__
+            key = (owner, method.__name__, args, tuple(sorted(kwargs.items())))
+            return self.memo.get(key, lambda: self._call(method, args, kwargs))
+        return self._call(method, args, kwargs)
+
+    def _call(self, method: Callable, args: tuple, kwargs: dict) -> Any:
+        if not self.limiter.try_acquire(timeout=self.acquire_timeout):
+            self._count('rate_limited')
+            raise RateLimited(f"{method.__name__}{args}: rate budget exhausted")
+        self._count('requests')
+        return method(*args, **kwargs)
+
+    def imap(self, fn: Callable[[Any], Any], items: Iterable,
+             time_budget: Optional[float] = None) -> Iterator[Tuple[Any, Any]]:
+        """
+        Run ``fn(item)`` for every item on the worker pool, yielding
+        ``(item, result)`` in completion order.
+
+        Items whose call raises are logged and skipped (RateLimited counts as
+        'skipped', anything else as 'errors'). With ``time_budget`` (seconds),
+        items not started before it runs out are skipped too, so a
+        full-market scan always ends inside its scheduler slot.
+        """
+        deadline = time.monotonic() + time_budget if time_budget is not None else None
+        skipped = object()
+
+        def run(item):
+            if deadline is not None and time.monotonic() > deadline:
+                return skipped
+            return fn(item)
+
+        pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="scan")
+        try:
+            futures = {pool.submit(run, item): item for item in items}
+            for future in as_completed(futures):
+                item = futures[future]
+                try:
+                    result = future.result()
+                except RateLimited as e:
+                    logger.debug(f"   ⏭️ Skipping {item}: {e}")
+                    self._count('skipped')
+                    continue
+                except Exception as e:
+                    logger.debug(f"Error scanning {item}: {e}")
+                    self._count('errors')
+                    continue
+                if result is skipped:
+                    self._count('skipped')
+                    continue
+                yield item, result
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+_pipelines: Dict[Hashable, ScanPipeline] = {}
+_pipelines_lock = threading.Lock()
+
+
+def get_scan_pipeline(client) -> ScanPipeline:
+    """One pipeline (and so one rate budget) per ChartExchange API key."""
+    api_key = getattr(client, 'api_key', None)
+    key = api_key if isinstance(api_key, str) and api_key else id(client)
+    with _pipelines_lock:
+        pipeline = _pipelines.get(key)
+        if pipeline is None:
+            limits = getattr(client, 'rate_limits', None)
+            rate = limits.get(getattr(client, 'tier', None)) if isinstance(limits, dict) else None
+            pipeline = _pipelines[key] = ScanPipeline(rate_per_minute=rate or DEFAULT_RATE_PER_MINUTE)
+        return pipeline
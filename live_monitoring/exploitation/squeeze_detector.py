@@ -22,7 +22,7 @@ NO MOCK DATA. Returns None if API fails.
 
 import logging
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator
 from dataclasses import dataclass, field
 import os
 import sys
@@ -32,6 +32,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from core.data.ultimate_chartexchange_client import UltimateChartExchangeClient
 from live_monitoring.core.lottery_signals import LiveSignal, SignalType, SignalAction
+from live_monitoring.core.market_data import get_market_data
+from live_monitoring.exploitation.scan_pipeline import RateLimited, ScanPipeline, get_scan_pipeline
 
 logger = logging.getLogger(__name__)
 
@@ -108,12 +110,16 @@ class SqueezeDetector:
     DP_STOP_BUFFER_PCT = 0.01  # 1% below DP support
     MIN_RR_RATIO = 2.5  # Task 3: Widen target to 2.5:1 (was 2.0) for better profit factor
     
-    def __init__(self, client: UltimateChartExchangeClient):
+    def __init__(self, client: UltimateChartExchangeClient, pipeline: Optional[ScanPipeline] = None):
         """
         Initialize with existing ChartExchange client.
         No wrapper - use the fucking client directly.
+        
+        Lookups go through the scan pipeline shared by every scanner on the
+        same API key (one rate budget, short interest / FTDs memoized daily).
         """
         self.client = client
+        self.pipeline = pipeline or get_scan_pipeline(client)
         logger.info("🔥 SqueezeDetector initialized - ready to find money!")
     
     def analyze(self, symbol: str, current_price: Optional[float] = None, 
@@ -138,30 +144,35 @@ class SqueezeDetector:
         # (Tested: filtering downtrends reduced win rate from 50% to 40%)
         
         # Step 1: Fetch all data (with historical date support)
-        short_data = self._fetch_short_interest(symbol, date=date_str)
-        if short_data is None:
-            logger.debug(f"{symbol}: Failed to get short interest - skipping")
-            return None
-        
-        borrow_data = self._fetch_borrow_fee(symbol, date=date_str)
-        if borrow_data is None:
-            logger.debug(f"{symbol}: Failed to get borrow fee - using 0")
-            borrow_data = {'fee_rate': 0.0}
-        
-        ftd_data = self._fetch_ftd_data(symbol, date=date_str)
-        if ftd_data is None:
-            logger.debug(f"{symbol}: Failed to get FTD data - using 0")
-            ftd_data = []
-        
-        dp_levels = self._fetch_dp_levels(symbol, date=date_str)
-        dp_prints = self._fetch_dp_prints(symbol, date=date_str)
-        
-        # Get current price if not provided
-        if current_price is None:
-            current_price = self._get_current_price(symbol)
-            if current_price is None:
-                logger.warning(f"{symbol}: Failed to get current price - skipping")
+        # Out of rate budget: skip the symbol rather than score it on partial data
+        try:
+            short_data = self._fetch_short_interest(symbol, date=date_str)
+            if short_data is None:
+                logger.debug(f"{symbol}: Failed to get short interest - skipping")
                 return None
+            
+            borrow_data = self._fetch_borrow_fee(symbol, date=date_str)
+            if borrow_data is None:
+                logger.debug(f"{symbol}: Failed to get borrow fee - using 0")
+                borrow_data = {'fee_rate': 0.0}
+            
+            ftd_data = self._fetch_ftd_data(symbol, date=date_str)
+            if ftd_data is None:
+                logger.debug(f"{symbol}: Failed to get FTD data - using 0")
+                ftd_data = []
+            
+            dp_levels = self._fetch_dp_levels(symbol, date=date_str)
+            dp_prints = self._fetch_dp_prints(symbol, date=date_str)
+            
+            # Get current price if not provided
+            if current_price is None:
+                current_price = self._get_current_price(symbol, dp_levels=None if date_str else dp_levels)
+                if current_price is None:
+                    logger.warning(f"{symbol}: Failed to get current price - skipping")
+                    return None
+        except RateLimited as e:
+            logger.warning(f"{symbol}: {e} - skipping")
+            return None
         
         # Step 2: Calculate component scores
         si_pct = self._extract_si_pct(short_data)
@@ -299,17 +310,19 @@ class SqueezeDetector:
         try:
             if date:
                 # Use daily endpoint for historical dates
-                data = self.client.get_short_interest_daily(symbol, date=date)
+                data = self.pipeline.fetch(self.client.get_short_interest_daily, symbol, date=date, daily=True)
                 # Returns list, get most recent entry
                 if data and isinstance(data, list) and len(data) > 0:
                     return data[0]  # Most recent entry for that date
                 return None
             else:
                 # Current data - use main endpoint (returns list)
-                data = self.client.get_short_interest(symbol)
+                data = self.pipeline.fetch(self.client.get_short_interest, symbol, daily=True)
                 if data and isinstance(data, list) and len(data) > 0:
                     return data[0]  # Most recent entry
                 return None
+        except RateLimited:
+            raise
         except Exception as e:
             logger.error(f"Failed to fetch short interest for {symbol}: {e}")
             return None
@@ -317,10 +330,12 @@ class SqueezeDetector:
     def _fetch_borrow_fee(self, symbol: str, date: Optional[str] = None) -> Optional[Dict]:
         """Fetch borrow fee data (supports historical dates)"""
         try:
-            data = self.client.get_borrow_fee(symbol, date=date)
+            data = self.pipeline.fetch(self.client.get_borrow_fee, symbol, date=date)
             if data:
                 return {'fee_rate': data.fee_rate, 'available': data.available_shares}
             return None
+        except RateLimited:
+            raise
         except Exception as e:
             logger.error(f"Failed to fetch borrow fee for {symbol}: {e}")
             return None
@@ -338,10 +353,12 @@ class SqueezeDetector:
                 from datetime import datetime, timedelta
                 target_date = datetime.strptime(date, '%Y-%m-%d')
                 start_date = (target_date - timedelta(days=30)).strftime('%Y-%m-%d')
-                data = self.client.get_failure_to_deliver(symbol, start_date=start_date)
+                data = self.pipeline.fetch(self.client.get_failure_to_deliver, symbol, start_date=start_date, daily=True)
             else:
-                data = self.client.get_failure_to_deliver(symbol)
+                data = self.pipeline.fetch(self.client.get_failure_to_deliver, symbol, daily=True)
             return data if data else []
+        except RateLimited:
+            raise
         except Exception as e:
             logger.error(f"Failed to fetch FTD data for {symbol}: {e}")
             return None
@@ -349,8 +366,11 @@ class SqueezeDetector:
     def _fetch_dp_levels(self, symbol: str, date: Optional[str] = None) -> List[Dict]:
         """Fetch dark pool levels (supports historical dates)"""
         try:
-            data = self.client.get_dark_pool_levels(symbol, date=date)
+            # Levels for a past date never change; today's are refetched
+            data = self.pipeline.fetch(self.client.get_dark_pool_levels, symbol, date=date, daily=date is not None)
             return data if data else []
+        except RateLimited:
+            raise
         except Exception as e:
             logger.error(f"Failed to fetch DP levels for {symbol}: {e}")
             return []
@@ -359,19 +379,22 @@ class SqueezeDetector:
         """Fetch dark pool print summary (supports historical dates)"""
         try:
             # get_dark_pool_summary might not support date, try with date first
-            data = self.client.get_dark_pool_summary(symbol)
+            data = self.pipeline.fetch(self.client.get_dark_pool_summary, symbol)
             # If date provided, filter to that date's data if possible
             # For now, just return summary (API might not support date filtering)
             return data
+        except RateLimited:
+            raise
         except Exception as e:
             logger.error(f"Failed to fetch DP prints for {symbol}: {e}")
             return None
     
-    def _get_current_price(self, symbol: str) -> Optional[float]:
-        """Get current price - try DP levels first, fallback to yfinance"""
+    def _get_current_price(self, symbol: str, dp_levels: Optional[List[Dict]] = None) -> Optional[float]:
+        """Get current price - try DP levels first (reusing already fetched ones), fallback to yfinance"""
         try:
             # Try to get from DP levels (most recent)
-            dp_levels = self.client.get_dark_pool_levels(symbol)
+            if not dp_levels:
+                dp_levels = self.pipeline.fetch(self.client.get_dark_pool_levels, symbol)
             if dp_levels and len(dp_levels) > 0:
                 # Get the level closest to average of all levels
                 prices = [float(l.get('level', 0)) for l in dp_levels if l.get('level')]
@@ -379,14 +402,10 @@ class SqueezeDetector:
                     # Return average as proxy for current price
                     return sum(prices) / len(prices)
             
-            # Fallback to yfinance
-            import yfinance as yf
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period='1d')
-            if not hist.empty:
-                return float(hist['Close'].iloc[-1])
-            
-            return None
+            # Fallback to yfinance (shared market data bus)
+            return get_market_data().get_last_close(symbol, period='1d', interval='1d')
+        except RateLimited:
+            raise
         except Exception as e:
             logger.error(f"Failed to get current price for {symbol}: {e}")
             return None
@@ -501,16 +520,16 @@ class SqueezeDetector:
             date: Historical date (if None, uses today)
         """
         try:
-            import yfinance as yf
             from datetime import timedelta
             
-            ticker = yf.Ticker(symbol)
+            bus = get_market_data()
             
             if date:
                 # For historical dates, get data up to that date
                 # yfinance 1m data only available for last 7 days
                 # So for historical dates, use daily data instead
-                hist = ticker.history(
+                hist = bus.get_history(
+                    symbol,
                     start=(date - timedelta(days=2)).strftime('%Y-%m-%d'),
                     end=date.strftime('%Y-%m-%d'),
                     interval='1d'
@@ -521,7 +540,7 @@ class SqueezeDetector:
                 past_close = hist['Close'].iloc[0]
             else:
                 # Current date - use 5m data
-                data = ticker.history(period='1d', interval='5m')
+                data = bus.get_history(symbol, period='1d', interval='5m')
                 if len(data) < 6:
                     return True  # Not enough data, allow signal
                 recent_close = data['Close'].iloc[-1]
@@ -600,21 +619,21 @@ class SqueezeDetector:
         
         return default_target
     
-    def scan_watchlist(self, symbols: List[str]) -> List[SqueezeSignal]:
+    def iter_watchlist(self, symbols: Iterable[str], time_budget: Optional[float] = None) -> Iterator[SqueezeSignal]:
+        """
+        Analyze symbols concurrently on the scan pipeline and yield signals
+        as each one completes (completion order, not score order).
+        """
+        for _, signal in self.pipeline.imap(self.analyze, list(dict.fromkeys(symbols)), time_budget):
+            if signal:
+                yield signal
+    
+    def scan_watchlist(self, symbols: List[str], time_budget: Optional[float] = None) -> List[SqueezeSignal]:
         """
         Scan a list of symbols for squeeze setups.
-        Returns list of signals (score > 70).
+        Returns list of signals (score >= SIGNAL_THRESHOLD).
         """
-        signals = []
-        
-        for symbol in symbols:
-            try:
-                signal = self.analyze(symbol)
-                if signal:
-                    signals.append(signal)
-            except Exception as e:
-                logger.error(f"Error analyzing {symbol}: {e}")
-                continue
+        signals = list(self.iter_watchlist(symbols, time_budget))
         
         # Sort by score descending
         signals.sort(key=lambda x: x.score, reverse=True)
@@ -133,6 +133,8 @@ class LiveMonitor:
         """Check all symbols for signals"""
         # Check both configured symbols and discovered tickers
         all_symbols = list(self.discovered_tickers)
+        # One Trap Matrix fan-out for the whole cycle instead of one per symbol
+        self.signal_generator.prefetch_trap_states(all_symbols)
         
         for symbol in all_symbols:
             try:
@@ -10,11 +10,12 @@ import hashlib
 import re
 import logging
 import requests
-import sqlite3
 import json
 from datetime import datetime
 from typing import Dict, Optional
 
+from core.utils.sqlite_pool import get_store
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,12 +34,7 @@ class AlertManager:
     def _init_alert_database(self):
         """Initialize database for storing all alerts."""
         try:
-            os.makedirs(os.path.dirname(self.alert_db_path), exist_ok=True)
-            
-            conn = sqlite3.connect(self.alert_db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
+            get_store(self.alert_db_path).executescript("""
                 CREATE TABLE IF NOT EXISTS alerts (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     timestamp TEXT NOT NULL,
@@ -50,15 +46,11 @@ class AlertManager:
                     source TEXT,
                     symbol TEXT,
                     created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-                )
+                );
+                CREATE INDEX IF NOT EXISTS idx_timestamp ON alerts(timestamp);
+                CREATE INDEX IF NOT EXISTS idx_alert_type ON alerts(alert_type);
+                CREATE INDEX IF NOT EXISTS idx_symbol ON alerts(symbol);
             """)
-            
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON alerts(timestamp)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_alert_type ON alerts(alert_type)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_symbol ON alerts(symbol)")
-            
-            conn.commit()
-            conn.close()
             logger.info(f"   ✅ Alert database initialized: {self.alert_db_path}")
         except Exception as e:
             logger.warning(f"   ⚠️ Failed to initialize alert database: {e}")
@@ -70,17 +62,13 @@ class AlertManager:
         description = embed.get('description', '')
         embed_json = json.dumps(embed)
 
-        # ── Write to local SQLite (fast, ephemeral on Render) ──
+        # ── Write to local SQLite (queued; bursts commit as one transaction) ──
         try:
-            conn = sqlite3.connect(self.alert_db_path)
-            cursor = conn.cursor()
-            cursor.execute("""
+            get_store(self.alert_db_path).enqueue("""
                 INSERT INTO alerts (timestamp, alert_type, title, description, content, embed_json, source, symbol)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """, (timestamp, alert_type, title, description, content, embed_json, source, symbol))
-            conn.commit()
-            conn.close()
-            logger.debug(f"   📝 Alert logged to SQLite: {alert_type}")
+            logger.debug(f"   📝 Alert queued for SQLite: {alert_type}")
         except Exception as e:
             logger.debug(f"   ⚠️ Failed to log alert to SQLite: {e}")
 
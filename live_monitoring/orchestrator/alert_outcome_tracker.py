@@ -12,6 +12,8 @@ import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
+from live_monitoring.core.outcome_service import fetch_prices
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,7 +22,7 @@ class AlertOutcomeTracker:
     Tracks directional alert outcomes by comparing alert price
     to actual price after 1h/4h/1d.
 
-    Uses checker_alerts + yfinance to compute:
+    Uses checker_alerts + one batched price fetch per distinct symbol to compute:
     - Was the alert direction correct?
     - What was the actual move?
     - Per-checker win rate over time
@@ -99,45 +101,36 @@ class AlertOutcomeTracker:
             conn.close()
             return {"processed": 0, "message": "No pending alerts to track"}
 
-        try:
-            import yfinance as yf
-        except ImportError:
-            conn.close()
-            return {"processed": 0, "error": "yfinance not installed"}
+        # One batched daily-bar download for the distinct symbols
+        prices = fetch_prices((row[1] for row in pending if row[1]), period="5d", interval="1d")
 
-        processed = 0
+        updates = []
         for row_id, symbol, direction, alert_price, alert_time in pending:
             if not symbol or not alert_price:
                 continue
 
-            try:
-                ticker = yf.Ticker(symbol)
-                hist = ticker.history(period="5d")
-                if hist.empty:
-                    continue
-
-                current_price = float(hist['Close'].iloc[-1])
-                move_pct = (current_price - alert_price) / alert_price * 100
-
-                # Was the direction correct?
-                correct = False
-                if direction in ("LONG", "BUY", "BULLISH") and move_pct > 0:
-                    correct = True
-                elif direction in ("SHORT", "SELL", "BEARISH") and move_pct < 0:
-                    correct = True
-
-                conn.execute("""
-                    UPDATE alert_outcomes
-                    SET price_1d = ?, move_1d_pct = ?, correct_1d = ?,
-                        tracked_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """, (current_price, round(move_pct, 2), 1 if correct else 0, row_id))
-                processed += 1
-
-            except Exception as e:
-                logger.warning(f"Failed to track outcome for {symbol}: {e}")
+            current_price = prices.get(symbol.upper())
+            if current_price is None:
                 continue
 
+            move_pct = (current_price - alert_price) / alert_price * 100
+
+            # Was the direction correct?
+            correct = False
+            if direction in ("LONG", "BUY", "BULLISH") and move_pct > 0:
+                correct = True
+            elif direction in ("SHORT", "SELL", "BEARISH") and move_pct < 0:
+                correct = True
+
+            updates.append((current_price, round(move_pct, 2), 1 if correct else 0, row_id))
+
+        processed = len(updates)
+        conn.executemany("""
+            UPDATE alert_outcomes
+            SET price_1d = ?, move_1d_pct = ?, correct_1d = ?,
+                tracked_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+        """, updates)
         conn.commit()
         conn.close()
 
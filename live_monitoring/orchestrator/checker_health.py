@@ -12,6 +12,8 @@ from typing import Dict, Optional
 from enum import Enum
 import logging
 
+from core.utils.sqlite_pool import get_store
+
 logger = logging.getLogger(__name__)
 
 class CheckerStatus(Enum):
@@ -47,17 +49,15 @@ class CheckerHealthRegistry:
     def __init__(self, db_path: str = "data/checker_health.db"):
         os.makedirs(os.path.dirname(db_path) if os.path.dirname(db_path) else ".", exist_ok=True)
         self.db_path = db_path
+        self.store = get_store(db_path)
         self.deploy_id = str(uuid.uuid4())[:8]  # Short UUID per boot
         self._init_db()
         self._register_all_checkers()
     
     def _init_db(self):
         """Initialize SQLite database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         # Checker runs table
-        cursor.execute("""
+        self.store.executescript("""
             CREATE TABLE IF NOT EXISTS checker_runs (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 checker_name TEXT NOT NULL,
@@ -71,12 +71,12 @@ class CheckerHealthRegistry:
         
         # Add deploy_id column if upgrading from old schema
         try:
-            cursor.execute("ALTER TABLE checker_runs ADD COLUMN deploy_id TEXT")
+            self.store.executescript("ALTER TABLE checker_runs ADD COLUMN deploy_id TEXT")
         except sqlite3.OperationalError:
             pass  # Column already exists
         
         # Alert tracking table
-        cursor.execute("""
+        self.store.executescript("""
             CREATE TABLE IF NOT EXISTS checker_alerts (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 checker_name TEXT NOT NULL,
@@ -91,7 +91,7 @@ class CheckerHealthRegistry:
         """)
         
         # Win rate tracking table
-        cursor.execute("""
+        self.store.executescript("""
             CREATE TABLE IF NOT EXISTS checker_win_rates (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 checker_name TEXT NOT NULL,
@@ -100,11 +100,10 @@ class CheckerHealthRegistry:
                 total_trades INT,
                 total_pnl_pct REAL,
                 UNIQUE(checker_name, date)
-            )
+            );
+            CREATE INDEX IF NOT EXISTS idx_checker_runs_name_time ON checker_runs(checker_name, run_time);
+            CREATE INDEX IF NOT EXISTS idx_checker_alerts_name_time ON checker_alerts(checker_name, alert_time);
         """)
-        
-        conn.commit()
-        conn.close()
     
     def _register_all_checkers(self):
         """Register all checkers with their configs."""
@@ -182,15 +181,11 @@ class CheckerHealthRegistry:
         }
     
     def record_run(self, checker_name: str, success: bool, alerts_generated: int = 0, error: str = None):
-        """Record a checker run with deploy session ID."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
+        """Record a checker run with deploy session ID (queued write)."""
+        self.store.enqueue("""
             INSERT INTO checker_runs (checker_name, success, alerts_generated, error_message, deploy_id)
             VALUES (?, ?, ?, ?, ?)
         """, (checker_name, success, alerts_generated, error, self.deploy_id))
-        conn.commit()
-        conn.close()
         
         # Update in-memory status
         if checker_name in self.checkers:
@@ -205,15 +200,11 @@ class CheckerHealthRegistry:
     def record_alert(self, checker_name: str, alert_type: str, symbol: str = None,
                      direction: str = None, entry_price: float = None):
         """Record an alert generated by a checker."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
+        # Synchronous: the row id keys outcome tracking below
+        alert_id = self.store.write("""
             INSERT INTO checker_alerts (checker_name, alert_type, symbol, direction, entry_price)
             VALUES (?, ?, ?, ?, ?)
         """, (checker_name, alert_type, symbol, direction, entry_price))
-        alert_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
 
         # S3.3: Register for outcome tracking
         if direction and entry_price and symbol:
@@ -233,42 +224,53 @@ class CheckerHealthRegistry:
     
     def get_alerts_count(self, checker_name: str, hours: int = 24) -> int:
         """Get count of alerts in last N hours."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
         cutoff = datetime.now() - timedelta(hours=hours)
-        cursor.execute("""
+        return self.store.query_one("""
             SELECT COUNT(*) FROM checker_alerts
             WHERE checker_name = ? AND alert_time > ?
-        """, (checker_name, cutoff.isoformat()))
-        count = cursor.fetchone()[0]
-        conn.close()
-        return count
+        """, (checker_name, cutoff.isoformat()))[0]
     
     def get_last_run(self, checker_name: str) -> Optional[datetime]:
         """Get last run time for a checker."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
+        row = self.store.query_one("""
             SELECT run_time FROM checker_runs
             WHERE checker_name = ? ORDER BY run_time DESC LIMIT 1
         """, (checker_name,))
-        row = cursor.fetchone()
-        conn.close()
-        if row:
-            try:
-                return datetime.fromisoformat(row[0])
-            except (ValueError, TypeError):
-                # Handle different datetime formats
-                return datetime.strptime(row[0], '%Y-%m-%d %H:%M:%S')
-        return None
+        return self._parse_run_time(row[0]) if row else None
+    
+    @staticmethod
+    def _parse_run_time(value) -> Optional[datetime]:
+        if value is None:
+            return None
+        try:
+            return datetime.fromisoformat(value)
+        except (ValueError, TypeError):
+            # Handle different datetime formats
+            return datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
     
     def get_health_summary(self) -> Dict[str, CheckerHealth]:
         """Get health summary for all checkers."""
-        # Update from database
+        # Update from database (two grouped queries instead of three per checker)
+        now = datetime.now()
+        last_runs = dict(self.store.query(
+            "SELECT checker_name, MAX(run_time) FROM checker_runs GROUP BY checker_name"
+        ))
+        alert_counts = {
+            name: (day, today) for name, day, today in self.store.query("""
+                SELECT checker_name,
+                       COALESCE(SUM(alert_time > ?), 0),
+                       COALESCE(SUM(alert_time > ?), 0)
+                FROM checker_alerts WHERE alert_time > ?
+                GROUP BY checker_name
+            """, (
+                (now - timedelta(hours=24)).isoformat(),
+                (now - timedelta(hours=self._hours_since_midnight())).isoformat(),
+                (now - timedelta(hours=max(24, self._hours_since_midnight()))).isoformat(),
+            ))
+        }
         for name, health in self.checkers.items():
-            health.last_run = self.get_last_run(name)
-            health.alerts_24h = self.get_alerts_count(name, hours=24)
-            health.alerts_today = self.get_alerts_count(name, hours=self._hours_since_midnight())
+            health.last_run = self._parse_run_time(last_runs.get(name))
+            health.alerts_24h, health.alerts_today = alert_counts.get(name, (0, 0))
             
             # Determine status based on last run
             if health.last_run:
@@ -312,16 +314,12 @@ class CheckerHealthRegistry:
             self.checkers[checker_name].win_rate_7d = win_rate
             self.checkers[checker_name].total_trades_7d = total_trades
             
-            # Also store in database
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            # Also store in database (queued write)
             today = datetime.now().strftime('%Y-%m-%d')
-            cursor.execute("""
+            self.store.enqueue("""
                 INSERT OR REPLACE INTO checker_win_rates (checker_name, date, win_rate, total_trades)
                 VALUES (?, ?, ?, ?)
             """, (checker_name, today, win_rate, total_trades))
-            conn.commit()
-            conn.close()
     
     def get_dp_learning_stats(self) -> Dict:
         """Pull stats from DP learning database."""
@@ -330,24 +328,19 @@ class CheckerHealthRegistry:
             return {}
         
         try:
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            
             # Get overall bounce rate
-            cursor.execute("""
+            outcomes = dict(get_store(db_path).query("""
                 SELECT outcome, COUNT(*) 
                 FROM dp_interactions 
                 WHERE outcome IS NOT NULL 
                 GROUP BY outcome
-            """)
-            outcomes = dict(cursor.fetchall())
+            """))
             bounces = outcomes.get('BOUNCE', 0)
             breaks = outcomes.get('BREAK', 0) + outcomes.get('BREAKDOWN', 0)
             total = bounces + breaks
             
             bounce_rate = bounces / total * 100 if total > 0 else 0
             
-            conn.close()
             return {
                 'bounce_rate': bounce_rate,
                 'total_interactions': total,
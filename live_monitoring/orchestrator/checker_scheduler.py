@@ -5,10 +5,18 @@ Manages the interval-based scheduling of all 15+ checker modules.
 Each checker runs on its own interval (e.g., Fed every 5 min, DP every 5 min,
 FTD hourly, Earnings every 4h).
 
+Two dispatch modes:
+- Serial (max_workers=0): due checkers run one after another inside tick().
+- Parallel (max_workers>0): due checkers run on a bounded thread pool, each
+  with its own timeout, so tick wall-time is bounded by the slowest checker
+  instead of the sum of all checkers. Alerts are still sent from the calling
+  thread in registration order, so Discord dispatch stays deterministic.
+
 Extracted from unified_monitor.py run() loop for modularity.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, Future, wait
 from datetime import datetime
 from typing import Callable, Dict, List, Optional, Any
 
@@ -19,7 +27,8 @@ class CheckerSchedule:
     """Configuration for a single checker's schedule."""
 
     def __init__(self, name: str, checker: Any, interval: int, requires_market_hours: bool = True,
-                 custom_handler: Optional[Callable] = None):
+                 custom_handler: Optional[Callable] = None, timeout: Optional[float] = None,
+                 max_concurrency: int = 1):
         """
         Args:
             name: Checker identifier (e.g., 'fed', 'trump', 'dark_pool')
@@ -27,15 +36,24 @@ class CheckerSchedule:
             interval: Seconds between runs
             requires_market_hours: If True, only runs during RTH
             custom_handler: Optional custom handler (for checkers needing special logic like synthesis)
+            timeout: Seconds to wait for this checker in parallel mode (None = scheduler default)
+            max_concurrency: Max runs of this checker allowed in flight at once (parallel mode)
         """
         self.name = name
         self.checker = checker
         self.interval = interval
         self.requires_market_hours = requires_market_hours
         self.custom_handler = custom_handler
+        self.timeout = timeout
+        self.max_concurrency = max(1, max_concurrency)
         self.last_run: Optional[datetime] = None
         self.run_immediately = False  # If True, run on first tick
 
+        # Parallel-mode bookkeeping
+        self.in_flight: List[Future] = []
+        self.timeouts = 0
+        self.last_duration: Optional[float] = None
+
     def is_due(self, now: datetime, is_market_hours: bool) -> bool:
         """Check if this checker should run now."""
         if self.checker is None:
@@ -62,17 +80,41 @@ class CheckerScheduler:
         ...
         # In run loop:
         scheduler.tick(now, is_market_hours)
+
+    Parallel mode:
+        scheduler = CheckerScheduler(run_checker_fn, send_discord_fn, max_workers=4, default_timeout=90)
+        scheduler.register('reddit', reddit_checker, interval=3600, timeout=120)
     """
 
     def __init__(
         self,
         run_checker_with_health: Callable,
         send_discord: Callable,
+        max_workers: int = 0,
+        default_timeout: float = 120.0,
+        record_failure: Optional[Callable] = None,
     ):
+        """
+        Args:
+            run_checker_with_health: fn(name, check_fn) -> alerts, records health
+            send_discord: fn(embed, content, alert_type, source, symbol)
+            max_workers: Thread pool size; 0 keeps the serial dispatch path
+            default_timeout: Per-checker timeout (seconds) in parallel mode
+            record_failure: fn(name, error) recording a failed run in checker
+                health; parallel mode reports timeouts and late errors through it
+        """
         self.run_checker_with_health = run_checker_with_health
         self.send_discord = send_discord
+        self.record_failure = record_failure
         self.schedules: Dict[str, CheckerSchedule] = {}
         self._custom_handlers: Dict[str, Callable] = {}
+        self.max_workers = max(0, max_workers or 0)
+        self.default_timeout = default_timeout
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def parallel(self) -> bool:
+        return self.max_workers > 0
 
     def register(
         self,
@@ -82,6 +124,8 @@ class CheckerScheduler:
         requires_market_hours: bool = True,
         run_immediately: bool = False,
         custom_handler: Optional[Callable] = None,
+        timeout: Optional[float] = None,
+        max_concurrency: int = 1,
     ):
         """Register a checker with its scheduling parameters."""
         schedule = CheckerSchedule(
@@ -90,6 +134,8 @@ class CheckerScheduler:
             interval=interval,
             requires_market_hours=requires_market_hours,
             custom_handler=custom_handler,
+            timeout=timeout,
+            max_concurrency=max_concurrency,
         )
         schedule.run_immediately = run_immediately
         self.schedules[name] = schedule
@@ -111,6 +157,9 @@ class CheckerScheduler:
         """
         Run all due checkers. Returns total number of alerts dispatched.
         """
+        if self.parallel:
+            return self._tick_parallel(now, is_market_hours)
+
         total_alerts = 0
 
         for name, schedule in self.schedules.items():
@@ -125,15 +174,7 @@ class CheckerScheduler:
                 else:
                     # Standard pattern: run checker, dispatch alerts
                     alerts = self.run_checker_with_health(name, schedule.checker.check)
-                    for alert in alerts:
-                        self.send_discord(
-                            alert.embed,
-                            alert.content,
-                            getattr(alert, 'alert_type', name),
-                            getattr(alert, 'source', f"{name}_checker"),
-                            getattr(alert, 'symbol', None),
-                        )
-                    total_alerts += len(alerts)
+                    total_alerts += self._dispatch_alerts(name, alerts)
 
                 schedule.mark_run(now)
 
@@ -143,6 +184,142 @@ class CheckerScheduler:
 
         return total_alerts
 
+    def _dispatch_alerts(self, name: str, alerts: List) -> int:
+        """Send a checker's alerts to Discord (always on the calling thread)."""
+        for alert in alerts:
+            self.send_discord(
+                alert.embed,
+                alert.content,
+                getattr(alert, 'alert_type', name),
+                getattr(alert, 'source', f"{name}_checker"),
+                getattr(alert, 'symbol', None),
+            )
+        return len(alerts)
+
+    # ═══════════════════════════════════════════════════════════════
+    # PARALLEL DISPATCH
+    # ═══════════════════════════════════════════════════════════════
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="checker")
+        return self._executor
+
+    def _timed_run(self, schedule: CheckerSchedule) -> List:
+        """Worker body: run a checker through the health wrapper and time it."""
+        started = datetime.now()
+        try:
+            return self.run_checker_with_health(schedule.name, schedule.checker.check) or []
+        finally:
+            schedule.last_duration = (datetime.now() - started).total_seconds()
+
+    def _record_failure(self, name: str, error: str):
+        if self.record_failure is None:
+            return
+        try:
+            self.record_failure(name, error)
+        except Exception as e:
+            logger.debug(f"Could not record {name} failure in checker health: {e}")
+
+    def _harvest_late(self, schedule: CheckerSchedule) -> List:
+        """Collect alerts from runs that timed out on a previous tick but have since finished."""
+        alerts = []
+        still_running = []
+        for future in schedule.in_flight:
+            if not future.done():
+                still_running.append(future)
+            elif future.cancelled():
+                continue
+            elif future.exception() is not None:
+                logger.error(f"   ❌ {schedule.name} checker error (late run): {future.exception()}")
+                self._record_failure(schedule.name, f"late run failed: {future.exception()}")
+            else:
+                alerts.extend(future.result())
+        schedule.in_flight = still_running
+        return alerts
+
+    def _tick_parallel(self, now: datetime, is_market_hours: bool) -> int:
+        """
+        Fan due checkers out to the pool, wait up to each one's timeout, then
+        dispatch alerts in registration order.
+
+        Runs that exceed their timeout are left in flight (Python threads
+        cannot be killed); their alerts are picked up on a later tick and
+        the checker is not resubmitted while at its max_concurrency.
+        Custom handlers send their own alerts, so they run serially on the
+        calling thread after the pooled checkers have been collected.
+        """
+        executor = self._get_executor()
+        submitted: Dict[str, Future] = {}
+        late: Dict[str, List] = {}
+
+        for name, schedule in self.schedules.items():
+            late_alerts = self._harvest_late(schedule)
+            if late_alerts:
+                late[name] = late_alerts
+
+            if schedule.custom_handler or not schedule.is_due(now, is_market_hours):
+                continue
+
+            if len(schedule.in_flight) >= schedule.max_concurrency:
+                logger.warning(f"   ⏳ {name} still running from a previous tick — skipping")
+                continue
+
+            future = executor.submit(self._timed_run, schedule)
+            schedule.in_flight.append(future)
+            submitted[name] = future
+            schedule.mark_run(now)
+
+        # Wait for each future against its own deadline (relative to tick start)
+        started = datetime.now()
+        for name, future in submitted.items():
+            timeout = self.schedules[name].timeout or self.default_timeout
+            remaining = timeout - (datetime.now() - started).total_seconds()
+            wait([future], timeout=max(0.0, remaining))
+
+        total_alerts = 0
+        for name, schedule in self.schedules.items():
+            alerts = list(late.get(name, []))
+
+            future = submitted.get(name)
+            if future is not None:
+                if future.done():
+                    schedule.in_flight.remove(future)
+                    try:
+                        alerts.extend(future.result())
+                    except Exception as e:
+                        logger.error(f"   ❌ {name} checker error: {e}")
+                        self._record_failure(name, str(e))
+                else:
+                    future.cancel()  # Only succeeds if the worker never started
+                    if future.cancelled():
+                        schedule.in_flight.remove(future)
+                    schedule.timeouts += 1
+                    timeout = schedule.timeout or self.default_timeout
+                    logger.warning(f"   ⏱️ {name} checker exceeded {timeout:.0f}s timeout — results deferred")
+                    self._record_failure(name, f"timed out after {timeout:.0f}s")
+
+            if schedule.custom_handler and schedule.is_due(now, is_market_hours):
+                try:
+                    alerts_count = schedule.custom_handler(now, is_market_hours)
+                    total_alerts += (alerts_count or 0)
+                except Exception as e:
+                    logger.error(f"   ❌ {name} checker error: {e}")
+                schedule.mark_run(now)
+
+            try:
+                total_alerts += self._dispatch_alerts(name, alerts)
+            except Exception as e:
+                logger.error(f"   ❌ {name} dispatch error: {e}")
+
+        return total_alerts
+
+    def shutdown(self, wait_for_running: bool = False):
+        """Stop the worker pool (parallel mode). Pending runs are cancelled."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait_for_running, cancel_futures=True)
+            self._executor = None
+
     @property
     def checker_count(self) -> int:
         return len([s for s in self.schedules.values() if s.checker is not None])
@@ -156,5 +333,8 @@ class CheckerScheduler:
                 "interval": schedule.interval,
                 "last_run": schedule.last_run.isoformat() if schedule.last_run else None,
                 "requires_market_hours": schedule.requires_market_hours,
+                "in_flight": len(schedule.in_flight),
+                "timeouts": schedule.timeouts,
+                "last_duration": schedule.last_duration,
             }
         return status
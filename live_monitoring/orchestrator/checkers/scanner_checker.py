@@ -32,7 +32,8 @@ class ScannerChecker(BaseChecker):
         alert_manager,
         opportunity_scanner=None,
         squeeze_detector=None,
-        unified_mode=False
+        unified_mode=False,
+        time_budget: Optional[float] = None
     ):
         """
         Initialize Scanner checker.
@@ -42,10 +43,13 @@ class ScannerChecker(BaseChecker):
             opportunity_scanner: OpportunityScanner instance
             squeeze_detector: SqueezeDetector instance (optional, for squeeze candidates)
             unified_mode: If True, suppresses individual alerts
+            time_budget: Seconds one check may spend on per-symbol lookups, split
+                between the market scan and the squeeze pass (None = unbounded)
         """
         super().__init__(alert_manager, unified_mode)
         self.opportunity_scanner = opportunity_scanner
         self.squeeze_detector = squeeze_detector
+        self.time_budget = time_budget
         
         # State management
         self.scanned_today: Set[str] = set()
@@ -71,8 +75,12 @@ class ScannerChecker(BaseChecker):
             # Get today's date for tracking
             today = datetime.now().strftime('%Y-%m-%d')
             
+            # Half the budget for the market scan, half for the squeeze pass
+            pass_budget = self.time_budget / 2 if self.time_budget is not None else None
+            
             # Run market scan (lowered threshold from 50 to 45 to catch more opportunities)
-            opportunities = self.opportunity_scanner.scan_market(min_score=45, max_results=10)
+            opportunities = self.opportunity_scanner.scan_market(min_score=45, max_results=10,
+                                                                 time_budget=pass_budget)
             
             if not opportunities:
                 logger.info("   📊 No high-score opportunities found")
@@ -104,7 +112,8 @@ class ScannerChecker(BaseChecker):
             if self.squeeze_detector:
                 squeeze_opportunities = self.opportunity_scanner.scan_with_squeeze_detector(
                     self.squeeze_detector, 
-                    min_score=55
+                    min_score=55,
+                    time_budget=pass_budget
                 )
                 
                 for opp in squeeze_opportunities[:3]:
@@ -20,11 +20,12 @@ Usage:
 """
 
 import logging
-import sqlite3
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, List
 
+from live_monitoring.agents.dp_learning.level_index import get_level_index
+
 logger = logging.getLogger(__name__)
 
 
@@ -764,13 +765,10 @@ class ConfluenceGate:
                 logger.debug(f"⚠️ Gate log failed: {e}")
 
     def _get_price(self, symbol: str) -> Optional[float]:
-        """Fetch current price via yfinance. Fail-safe."""
+        """Fetch current price via the shared market data bus. Fail-safe."""
         try:
-            import yfinance as yf
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period='1d')
-            if not hist.empty:
-                return float(hist['Close'].iloc[-1])
+            from live_monitoring.core.market_data import get_market_data
+            return get_market_data().get_last_close(symbol, period='1d', interval='1d')
         except Exception as e:
             logger.warning(f"⚠️ Gate: price fetch failed for {symbol}: {e}")
         return None
@@ -798,54 +796,20 @@ class ConfluenceGate:
         if not self._dp_db_path or not current_price:
             return None
         try:
-            conn = sqlite3.connect(str(self._dp_db_path))
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute(
-                "SELECT level_price, level_type, outcome, touch_count "
-                "FROM dp_interactions WHERE symbol = ? AND outcome IN ('BOUNCE','BREAK') "
-                "ORDER BY timestamp DESC LIMIT 200",
-                (symbol,),
-            ).fetchall()
-            conn.close()
-            if not rows:
+            level = get_level_index(self._dp_db_path).nearest_strong_level(
+                symbol, current_price, threshold_pct=threshold_pct, min_samples=3, min_bounce_rate=70
+            )
+            if level is None:
                 return None
-
-            # Group by level_price (round to nearest 0.50)
-            levels = {}
-            for r in rows:
-                lp = round(r["level_price"] * 2) / 2  # snap to $0.50 grid
-                if lp not in levels:
-                    levels[lp] = {"type": r["level_type"], "bounces": 0, "breaks": 0, "touches": 0}
-                if r["outcome"] == "BOUNCE":
-                    levels[lp]["bounces"] += 1
-                else:
-                    levels[lp]["breaks"] += 1
-                levels[lp]["touches"] = max(levels[lp]["touches"], r["touch_count"] or 1)
-
-            # Find closest level within threshold
-            best = None
-            best_dist = float("inf")
-            for lp, info in levels.items():
-                total = info["bounces"] + info["breaks"]
-                if total < 3:  # need minimum sample size
-                    continue
-                dist_pct = abs(current_price - lp) / current_price * 100
-                if dist_pct <= threshold_pct and dist_pct < best_dist:
-                    wr = info["bounces"] / total * 100
-                    # Only flag if WR >= 70% (strong level)
-                    if wr >= 70:
-                        best = {
-                            "level_price": lp,
-                            "level_type": info["type"],
-                            "distance_pct": dist_pct,
-                            "bounce_rate": wr,
-                            "total_samples": total,
-                            "touches": info["touches"],
-                            "aligned": True,  # signal near a high-WR level = aligned
-                        }
-                        best_dist = dist_pct
-
-            return best
+            return {
+                "level_price": level.price,
+                "level_type": level.level_type,
+                "distance_pct": level.distance_pct,
+                "bounce_rate": level.bounce_rate,
+                "total_samples": level.total,
+                "touches": level.touches,
+                "aligned": True,  # signal near a high-WR level = aligned
+            }
         except Exception as e:
             logger.debug(f"⚠️ DP proximity check failed: {e}")
             return None
@@ -15,6 +15,8 @@ from datetime import datetime, date
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from live_monitoring.core.outcome_service import fetch_prices
+
 logger = logging.getLogger(__name__)
 
 DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data"
@@ -91,8 +93,6 @@ class GateOutcomeTracker:
             target_date: Date string 'YYYY-MM-DD' (defaults to today)
             stop_pct: Default stop loss percentage for R calculation (1.0 = 1%)
         """
-        import yfinance as yf
-
         target_date = target_date or date.today().isoformat()
         logger.info(f"📊 Settling gate signals for {target_date}")
 
@@ -108,21 +108,19 @@ class GateOutcomeTracker:
         outcomes = self._read_json(OUTCOMES_FILE)
         tickers = set(s["ticker"] for s in allowed)
 
+        # One batched daily-bar download for the distinct tickers
         close_prices = {}
-        for ticker in tickers:
-            try:
-                t = yf.Ticker(ticker)
-                hist = t.history(period="1d")
-                if not hist.empty:
-                    close_prices[ticker] = float(hist["Close"].iloc[-1])
-            except Exception as e:
-                logger.warning(f"   ⚠️ Could not fetch close for {ticker}: {e}")
+        for ticker, close in fetch_prices(tickers, period="1d", interval="1d").items():
+            if close is None:
+                logger.warning(f"   ⚠️ Could not fetch close for {ticker}")
+            else:
+                close_prices[ticker] = close
 
         # Calculate outcomes for allowed signals
         for signal in allowed:
             ticker = signal["ticker"]
             entry = signal["entry_price"]
-            close = close_prices.get(ticker, entry)
+            close = close_prices.get(ticker.upper(), entry)
             direction = signal["direction"].upper()
 
             # P&L calculation
@@ -15,11 +15,12 @@ import os
 import sqlite3
 import logging
 import threading
-import time
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List
 from dataclasses import dataclass, field
 
+from live_monitoring.core.outcome_service import fetch_prices, get_outcome_service
+
 logger = logging.getLogger(__name__)
 
 DB_PATH = os.path.join(
@@ -63,7 +64,7 @@ class SignalOutcomeTracker:
         self._init_db()
         self._active_signals: List[TrackedSignal] = []
         self._lock = threading.Lock()
-        self._poll_thread = None
+        self._service = None
         self._running = False
 
     def _init_db(self):
@@ -163,15 +164,33 @@ class SignalOutcomeTracker:
         finally:
             conn.close()
 
-    def check_outcomes(self):
+    # elapsed-minute window -> snapshot column
+    SNAPSHOT_WINDOWS = ((4, 10, "price_5min"), (14, 20, "price_15min"),
+                        (29, 35, "price_30min"), (59, 65, "price_60min"))
+
+    def _pending_symbols(self) -> List[str]:
+        """Distinct symbols with PENDING signals."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return [r[0] for r in conn.execute(
+                "SELECT DISTINCT symbol FROM signal_outcomes WHERE outcome = 'PENDING'"
+            ).fetchall()]
+        finally:
+            conn.close()
+
+    def check_outcomes(self, prices: Optional[Dict[str, Optional[float]]] = None):
         """
         Check price for all pending signals and update outcomes.
-        Called by background thread or scheduler.
+        Called by the shared OutcomeService or a scheduler.
+
+        Args:
+            prices: {SYMBOL: price} shared across trackers; fetched in one batch
+                for the distinct pending symbols when not given
         """
         conn = sqlite3.connect(self.db_path)
         pending = conn.execute(
-            "SELECT signal_id, symbol, direction, entry_price, stop_pct, target_pct, entry_time "
-            "FROM signal_outcomes WHERE outcome = 'PENDING'"
+            "SELECT signal_id, symbol, direction, entry_price, stop_pct, target_pct, entry_time, "
+            "max_favorable, max_adverse FROM signal_outcomes WHERE outcome = 'PENDING'"
         ).fetchall()
         conn.close()
 
@@ -179,12 +198,18 @@ class SignalOutcomeTracker:
             return
 
         logger.info(f"📊 Checking outcomes for {len(pending)} pending signals...")
+        if prices is None:
+            prices = fetch_prices(row[1] for row in pending)
+
+        snapshots = {column: [] for _, _, column in self.SNAPSHOT_WINDOWS}
+        excursions = []
+        outcomes = []
 
         for row in pending:
-            sig_id, symbol, direction, entry_price, stop_pct, target_pct, entry_time = row
+            sig_id, symbol, direction, entry_price, stop_pct, target_pct, entry_time, max_fav, max_adv = row
 
             try:
-                current_price = self._get_current_price(symbol)
+                current_price = prices.get(symbol.upper())
                 if current_price is None:
                     continue
 
@@ -199,8 +224,12 @@ class SignalOutcomeTracker:
                 elapsed = datetime.now() - entry_dt
                 elapsed_min = elapsed.total_seconds() / 60
 
-                # Update price snapshots
-                self._update_price_snapshot(sig_id, current_price, elapsed_min)
+                # Price snapshot + max favorable / adverse excursion
+                for lo, hi, column in self.SNAPSHOT_WINDOWS:
+                    if lo <= elapsed_min < hi:
+                        snapshots[column].append((current_price, sig_id))
+                        break
+                excursions.append((max(max_fav or 0, move_pct), min(max_adv or 0, move_pct), sig_id))
 
                 # Check outcome
                 outcome = None
@@ -218,9 +247,7 @@ class SignalOutcomeTracker:
                         outcome = "SCRATCH"
 
                 if outcome:
-                    self._record_outcome(
-                        sig_id, outcome, current_price, move_pct
-                    )
+                    outcomes.append((outcome, datetime.now().isoformat(), current_price, move_pct, sig_id))
                     logger.info(
                         f"📊 OUTCOME: {outcome} | {direction} {symbol} "
                         f"| entry=${entry_price:.2f} exit=${current_price:.2f} "
@@ -230,79 +257,31 @@ class SignalOutcomeTracker:
             except Exception as e:
                 logger.error(f"Error checking outcome for {sig_id}: {e}")
 
-    def _update_price_snapshot(self, signal_id: str, price: float, elapsed_min: float):
-        """Update price snapshot columns based on elapsed time."""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            if 4 <= elapsed_min < 10:
-                conn.execute(
-                    "UPDATE signal_outcomes SET price_5min = ? WHERE signal_id = ? AND price_5min IS NULL",
-                    (price, signal_id)
-                )
-            elif 14 <= elapsed_min < 20:
-                conn.execute(
-                    "UPDATE signal_outcomes SET price_15min = ? WHERE signal_id = ? AND price_15min IS NULL",
-                    (price, signal_id)
-                )
-            elif 29 <= elapsed_min < 35:
-                conn.execute(
-                    "UPDATE signal_outcomes SET price_30min = ? WHERE signal_id = ? AND price_30min IS NULL",
-                    (price, signal_id)
-                )
-            elif 59 <= elapsed_min < 65:
-                conn.execute(
-                    "UPDATE signal_outcomes SET price_60min = ? WHERE signal_id = ? AND price_60min IS NULL",
-                    (price, signal_id)
-                )
-
-            # Update max favorable / adverse excursion
-            row = conn.execute(
-                "SELECT direction, entry_price, max_favorable, max_adverse FROM signal_outcomes WHERE signal_id = ?",
-                (signal_id,)
-            ).fetchone()
-            if row:
-                direction, entry, max_fav, max_adv = row
-                if direction == "LONG":
-                    move = (price - entry) / entry * 100
-                else:
-                    move = (entry - price) / entry * 100
+        self._write_cycle(snapshots, excursions, outcomes)
 
-                new_fav = max(max_fav or 0, move)
-                new_adv = min(max_adv or 0, move)
-                conn.execute(
-                    "UPDATE signal_outcomes SET max_favorable = ?, max_adverse = ? WHERE signal_id = ?",
-                    (new_fav, new_adv, signal_id)
-                )
-
-            conn.commit()
-        finally:
-            conn.close()
-
-    def _record_outcome(self, signal_id: str, outcome: str, exit_price: float, pnl_pct: float):
-        """Record final outcome."""
+    def _write_cycle(self, snapshots: Dict[str, list], excursions: list, outcomes: list):
+        """Persist one poll cycle (snapshots, excursions, outcomes) in a single transaction."""
         conn = sqlite3.connect(self.db_path)
         try:
-            conn.execute(
+            for column, rows in snapshots.items():
+                if rows:
+                    conn.executemany(
+                        f"UPDATE signal_outcomes SET {column} = ? WHERE signal_id = ? AND {column} IS NULL",
+                        rows
+                    )
+            conn.executemany(
+                "UPDATE signal_outcomes SET max_favorable = ?, max_adverse = ? WHERE signal_id = ?",
+                excursions
+            )
+            conn.executemany(
                 "UPDATE signal_outcomes SET outcome = ?, outcome_time = ?, exit_price = ?, pnl_pct = ? "
                 "WHERE signal_id = ?",
-                (outcome, datetime.now().isoformat(), exit_price, pnl_pct, signal_id)
+                outcomes
             )
             conn.commit()
         finally:
             conn.close()
 
-    def _get_current_price(self, symbol: str) -> Optional[float]:
-        """Get current price for a symbol."""
-        try:
-            import yfinance as yf
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period='1d', interval='1m')
-            if not hist.empty:
-                return float(hist['Close'].iloc[-1])
-        except Exception as e:
-            logger.warning(f"Price fetch failed for {symbol}: {e}")
-        return None
-
     # ── Win Rate Statistics ──────────────────────────────────────────
 
     def get_win_rates(self) -> Dict:
@@ -424,27 +403,20 @@ class SignalOutcomeTracker:
 
     # ── Background Poll Loop ─────────────────────────────────────────
 
-    def start_background_poll(self):
-        """Start background thread to poll outcomes."""
-        if self._poll_thread and self._poll_thread.is_alive():
+    def start_background_poll(self, service=None):
+        """Poll outcomes on the shared OutcomeService (one price batch for all trackers)."""
+        if self._running:
             return
 
         self._running = True
-        self._poll_thread = threading.Thread(
-            target=self._poll_loop, daemon=True, name="OutcomeTracker"
-        )
-        self._poll_thread.start()
-        logger.info("📊 Signal outcome tracker background poll started")
-
-    def _poll_loop(self):
-        """Background loop to check outcomes."""
-        while self._running:
-            try:
-                self.check_outcomes()
-            except Exception as e:
-                logger.error(f"Outcome poll error: {e}")
-            time.sleep(self.poll_interval)
+        self._service = service or get_outcome_service()
+        self._service.register(f"signal_outcomes:{self.db_path}", self._pending_symbols,
+                               self.check_outcomes, interval=self.poll_interval)
+        self._service.start()
+        logger.info("📊 Signal outcome tracker registered with outcome service")
 
     def stop(self):
         """Stop background polling."""
         self._running = False
+        if self._service is not None:
+            self._service.unregister(f"signal_outcomes:{self.db_path}")
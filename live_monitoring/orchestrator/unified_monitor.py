@@ -87,6 +87,8 @@ class UnifiedAlphaMonitor:
         self.synthesis_interval = 300
         self.squeeze_interval = 3600
         self.reddit_interval = 3600
+        self.scanner_interval = 3600
+        self.scanner_timeout = 180  # Parallel-mode limit; the scan's lookups get 150s of it
         self.premarket_gap_interval = 600
         self.options_flow_interval = 1800
         self.overnight_interval = 7200
@@ -320,7 +322,8 @@ class UnifiedAlphaMonitor:
 
         self.scanner_checker = ScannerChecker(
             alert_manager=self.alert_manager, opportunity_scanner=self.opportunity_scanner,
-            squeeze_detector=self.squeeze_detector, unified_mode=self.unified_mode
+            squeeze_detector=self.squeeze_detector, unified_mode=self.unified_mode,
+            time_budget=min(self.scanner_interval, self.scanner_timeout) - 30
         ) if self.scanner_enabled else None
 
         self.ftd_checker = FTDChecker(
@@ -386,9 +389,14 @@ class UnifiedAlphaMonitor:
 
     def _init_scheduler(self):
         """Register all checkers with the scheduler."""
+        # Parallel dispatch: slow network checkers (Reddit, earnings, FTD) no longer
+        # delay DP/Fed checks due in the same tick. CHECKER_MAX_WORKERS=0 → serial.
         self.scheduler = CheckerScheduler(
             run_checker_with_health=self._run_checker_with_health,
             send_discord=self.send_discord,
+            max_workers=int(os.getenv('CHECKER_MAX_WORKERS', '4')),
+            default_timeout=90,
+            record_failure=lambda name, error: self.health_registry.record_run(name, success=False, error=error),
         )
 
         # Standard checkers (simple run-and-dispatch)
@@ -402,14 +410,14 @@ class UnifiedAlphaMonitor:
         # See: python -m backtests.bt_squeeze / python -m backtests.bt_gamma_pin
         # self.scheduler.register('squeeze', self.squeeze_checker, self.squeeze_interval)
         # self.scheduler.register('gamma', self.gamma_checker, 3600)
-        self.scheduler.register('scanner', self.scanner_checker, 3600)
-        self.scheduler.register('ftd', self.ftd_checker, 3600)
-        self.scheduler.register('reddit', self.reddit_checker, self.reddit_interval)
+        self.scheduler.register('scanner', self.scanner_checker, self.scanner_interval, timeout=self.scanner_timeout)
+        self.scheduler.register('ftd', self.ftd_checker, 3600, timeout=180)
+        self.scheduler.register('reddit', self.reddit_checker, self.reddit_interval, timeout=180)
         self.scheduler.register('premarket_gap', self.premarket_gap_checker, self.premarket_gap_interval, requires_market_hours=False, run_immediately=True)
         self.scheduler.register('options_flow', self.options_flow_checker, self.options_flow_interval, run_immediately=True)
         self.scheduler.register('news_intelligence', self.news_intelligence_checker, 1800, run_immediately=True)
         self.scheduler.register('dp_divergence', self.dp_divergence_checker, self.dp_interval, run_immediately=True)
-        self.scheduler.register('earnings', self.earnings_checker, 3600 * 4, requires_market_hours=False, run_immediately=True)
+        self.scheduler.register('earnings', self.earnings_checker, 3600 * 4, requires_market_hours=False, run_immediately=True, timeout=180)
 
         # Custom-handler checkers (need special logic)
         self.scheduler.register('synthesis', self.synthesis_checker, self.synthesis_interval,
@@ -773,13 +781,10 @@ class UnifiedAlphaMonitor:
         """Get current SPY/QQQ prices."""
         spy_price, qqq_price = 0.0, 0.0
         try:
-            import yfinance as yf
-            spy_hist = yf.Ticker('SPY').history(period='1d', interval='1m')
-            qqq_hist = yf.Ticker('QQQ').history(period='1d', interval='1m')
-            if not spy_hist.empty:
-                spy_price = float(spy_hist['Close'].iloc[-1])
-            if not qqq_hist.empty:
-                qqq_price = float(qqq_hist['Close'].iloc[-1])
+            from live_monitoring.core.market_data import get_market_data
+            prices = get_market_data().get_prices(['SPY', 'QQQ'])
+            spy_price = prices.get('SPY') or 0.0
+            qqq_price = prices.get('QQQ') or 0.0
         except:
             pass
         return spy_price, qqq_price
@@ -959,6 +964,7 @@ class UnifiedAlphaMonitor:
 
             except KeyboardInterrupt:
                 logger.info("\n🛑 Monitor stopped by user")
+                self.scheduler.shutdown()
                 break
             except Exception as e:
                 logger.error(f"❌ Main loop error: {e}")
@@ -78,7 +78,6 @@ DIRECTIVES:
 COMBAT PROTOCOL: Engage. Analyze. Dominate. Extract Alpha."""
 
 
-GROQ_CHAT_URL = "https://api.groq.com/openai/v1/chat/completions"
 GROQ_MODEL_DEFAULT = "llama-3.3-70b-versatile"
 
 
@@ -87,33 +86,22 @@ def _groq_chat(
     max_tokens: int,
     temperature: float,
 ) -> str:
-    """OpenAI-compatible Groq chat; raises on HTTP or empty content."""
-    import requests
+    """OpenAI-compatible Groq chat via the shared LLM gateway; raises on HTTP or empty content."""
+    from core.utils.llm_gateway import get_gateway
 
-    api_key = os.getenv("GROQ_API_KEY", "").strip()
-    if not api_key:
+    if not os.getenv("GROQ_API_KEY", "").strip():
         raise ValueError("GROQ_API_KEY not set")
     model = os.getenv("GROQ_MODEL", GROQ_MODEL_DEFAULT)
-    r = requests.post(
-        GROQ_CHAT_URL,
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-        },
-        json={
-            "model": model,
-            "messages": messages,
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-        },
+    result = get_gateway().complete(
+        messages,
+        model,
+        provider="groq",
+        max_tokens=max_tokens,
+        temperature=temperature,
         timeout=120,
+        use_cache=False,  # high-temperature persona output; identical in-flight prompts still coalesce
     )
-    r.raise_for_status()
-    data = r.json()
-    content = (data.get("choices") or [{}])[0].get("message", {}).get("content") or ""
-    if not content.strip():
-        raise ValueError("Empty Groq response")
-    return content.strip()
+    return result["content"].strip()
 
 
 def query_llm_savage(query: str, level: str = "chained_pro") -> Dict[str, Any]:
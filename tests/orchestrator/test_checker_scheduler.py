@@ -0,0 +1,131 @@
+"""
+Tests for CheckerScheduler serial and parallel dispatch.
+"""
+
+import time
+import threading
+import unittest
+from datetime import datetime, timedelta
+
+from live_monitoring.orchestrator.checker_scheduler import CheckerScheduler
+
+
+class _Alert:
+    def __init__(self, tag):
+        self.embed = {"title": tag}
+        self.content = tag
+        self.alert_type = tag
+
+
+class _SleepyChecker:
+    def __init__(self, tag, delay):
+        self.tag = tag
+        self.delay = delay
+        self.calls = 0
+
+    def check(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        return [_Alert(self.tag)]
+
+
+class TestCheckerScheduler(unittest.TestCase):
+    """Test CheckerScheduler dispatch modes."""
+
+    def setUp(self):
+        self.sent = []
+        self.health = []
+        self.failures = []
+        self._lock = threading.Lock()
+
+    def _run_with_health(self, name, fn):
+        alerts = fn()
+        with self._lock:
+            self.health.append((name, len(alerts)))
+        return alerts
+
+    def _send(self, embed, content, alert_type, source, symbol):
+        self.sent.append(alert_type)
+
+    def _scheduler(self, max_workers, **kwargs):
+        scheduler = CheckerScheduler(self._run_with_health, self._send, max_workers=max_workers,
+                                     record_failure=lambda name, error: self.failures.append((name, error)),
+                                     **kwargs)
+        self.addCleanup(scheduler.shutdown)
+        return scheduler
+
+    def test_serial_dispatch_order(self):
+        scheduler = self._scheduler(0)
+        scheduler.register('a', _SleepyChecker('a', 0), 60, requires_market_hours=False, run_immediately=True)
+        scheduler.register('b', _SleepyChecker('b', 0), 60, requires_market_hours=False, run_immediately=True)
+        self.assertEqual(scheduler.tick(datetime.now(), False), 2)
+        self.assertEqual(self.sent, ['a', 'b'])
+
+    def test_parallel_wall_time_bounded_by_slowest(self):
+        scheduler = self._scheduler(4)
+        for tag in ('slow', 'dp', 'gamma'):
+            delay = 0.3 if tag == 'slow' else 0.2
+            scheduler.register(tag, _SleepyChecker(tag, delay), 60, requires_market_hours=False, run_immediately=True)
+
+        start = time.monotonic()
+        total = scheduler.tick(datetime.now(), False)
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(total, 3)
+        self.assertLess(elapsed, 0.6)
+        # Deterministic dispatch: registration order, not completion order
+        self.assertEqual(self.sent, ['slow', 'dp', 'gamma'])
+        self.assertEqual(sorted(name for name, _ in self.health), ['dp', 'gamma', 'slow'])
+
+    def test_timeout_defers_results_and_limits_concurrency(self):
+        scheduler = self._scheduler(2)
+        slow = _SleepyChecker('slow', 0.4)
+        scheduler.register('slow', slow, 0, requires_market_hours=False, run_immediately=True, timeout=0.05)
+        scheduler.register('fast', _SleepyChecker('fast', 0), 0, requires_market_hours=False, run_immediately=True)
+
+        now = datetime.now()
+        self.assertEqual(scheduler.tick(now, False), 1)
+        self.assertEqual(self.sent, ['fast'])
+        self.assertEqual(scheduler.get_status()['slow']['timeouts'], 1)
+        self.assertEqual(self.failures, [('slow', 'timed out after 0s')])
+
+        # Still running: must not be resubmitted while at max_concurrency
+        scheduler.tick(now + timedelta(seconds=1), False)
+        self.assertEqual(slow.calls, 1)
+
+        time.sleep(0.5)
+        scheduler.tick(now + timedelta(seconds=2), False)
+        self.assertIn('slow', self.sent)
+        self.assertEqual(scheduler.get_status()['slow']['in_flight'], 1)
+
+    def test_late_run_error_logged_and_recorded(self):
+        scheduler = self._scheduler(1)
+
+        class _Broken(_SleepyChecker):
+            def check(self):
+                super().check()
+                raise RuntimeError("upstream 502")
+
+        scheduler.register('broken', _Broken('broken', 0.2), 60, requires_market_hours=False,
+                           run_immediately=True, timeout=0.05)
+        now = datetime.now()
+        scheduler.tick(now, False)
+        time.sleep(0.3)
+        with self.assertLogs('live_monitoring.orchestrator.checker_scheduler', level='ERROR') as logs:
+            scheduler.tick(now + timedelta(seconds=1), False)
+        self.assertIn('upstream 502', logs.output[0])
+        self.assertEqual([name for name, _ in self.failures], ['broken', 'broken'])
+        self.assertIn('upstream 502', self.failures[1][1])
+
+    def test_custom_handler_runs_on_calling_thread(self):
+        scheduler = self._scheduler(2)
+        seen = []
+        scheduler.register('synthesis', object(), 60, requires_market_hours=False,
+                           custom_handler=lambda now, mh: seen.append(threading.current_thread()) or 2)
+        scheduler.schedules['synthesis'].run_immediately = True
+        self.assertEqual(scheduler.tick(datetime.now(), False), 2)
+        self.assertIs(seen[0], threading.current_thread())
+
+
+if __name__ == '__main__':
+    unittest.main()
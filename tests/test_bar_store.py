@@ -0,0 +1,95 @@
+"""
+Tests for the local bar store (partitioning, zero-copy reads, ingest, offline replay).
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from backtesting.engine.data.bar_store import BarStore, infer_interval
+from backtesting.engine.data.market_data import MarketDataProvider
+
+
+def _bars(start, periods, freq="1min", tz="US/Eastern"):
+    idx = pd.date_range(start, periods=periods, freq=freq, tz=tz)
+    close = np.linspace(500, 501, periods)
+    return pd.DataFrame({"Open": close, "High": close + 0.1, "Low": close - 0.1,
+                         "Close": close, "Volume": np.arange(periods) * 100}, index=idx)
+
+
+class TestBarStore(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.store = BarStore(self.root)
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_round_trip_splits_by_session_date(self):
+        data = pd.concat([_bars("2026-03-02 09:30", 390), _bars("2026-03-03 09:30", 390)])
+        self.assertEqual(self.store.write("spy", "1m", data), ["2026-03-02", "2026-03-03"])
+
+        day = self.store.read("SPY", "2026-03-03", "1m")
+        self.assertEqual(len(day), 390)
+        self.assertEqual(str(day.index.tz), "US/Eastern")
+        self.assertEqual(day.index[0], pd.Timestamp("2026-03-03 09:30", tz="US/Eastern"))
+        np.testing.assert_allclose(day["Close"].to_numpy(), data["Close"].iloc[390:].to_numpy())
+        self.assertEqual(self.store.dates("SPY", "1m"), ["2026-03-02", "2026-03-03"])
+
+    def test_read_is_zero_copy_and_read_only(self):
+        self.store.write("SPY", "1m", _bars("2026-03-02 09:30", 30))
+        day = self.store.read("SPY", "2026-03-02", "1m")
+        base = day._mgr.blocks[0].values
+        while not isinstance(base, np.memmap) and getattr(base, "base", None) is not None:
+            base = base.base
+        self.assertIsInstance(base, np.memmap)
+
+        with self.assertRaises(ValueError):
+            day.loc[day.index[0], "Close"] = 0.0
+        edited = day.copy()
+        edited.loc[edited.index[0], "Close"] = 0.0
+        day["Close"] = 0.0  # replacing a whole column is fine
+        again = self.store.read("SPY", "2026-03-02", "1m")
+        self.assertGreater(again["Close"].min(), 0)
+
+    def test_missing_partition_and_coarser_fallback(self):
+        self.assertIsNone(self.store.read("SPY", "2026-03-02", "1m"))
+        self.store.write("SPY", "15m", _bars("2026-03-02 09:30", 26, freq="15min"))
+        data, interval = self.store.read_best("SPY", "2026-03-02", "1m")
+        self.assertEqual(interval, "15m")
+        self.assertEqual(len(data), 26)
+
+    def test_ingest_json_and_naive_csv(self):
+        json_path = os.path.join(self.root, "bars.json")
+        with open(json_path, "w") as f:
+            json.dump([{"timestamp": f"2026-02-17 {h}:{m:02d}:00+00:00", "open": 1, "high": 2,
+                        "low": 0.5, "close": 1.5, "volume": 10}
+                       for h in (14, 15) for m in (30, 45)], f)
+        self.assertEqual(self.store.ingest_file(json_path, "SPY"), ["2026-02-17"])
+        day = self.store.read("SPY", "2026-02-17", "15m")
+        self.assertEqual(day.index[0], pd.Timestamp("2026-02-17 09:30", tz="US/Eastern"))
+
+        csv_path = os.path.join(self.root, "bars.csv")
+        _bars("2025-12-10 09:30", 5, tz=None).rename_axis("Datetime").to_csv(csv_path)
+        self.assertEqual(self.store.ingest_file(csv_path, "SPY"), ["2025-12-10"])
+        self.assertEqual(self.store.read("SPY", "2025-12-10", "1m").index[0].hour, 9)
+
+    def test_infer_interval(self):
+        self.assertEqual(infer_interval(_bars("2026-03-02 09:30", 10, freq="5min").index), "5m")
+        self.assertEqual(infer_interval(_bars("2026-03-02", 3, freq="1D").index), "1d")
+
+    def test_offline_provider_reads_store_only(self):
+        self.store.write("SPY", "1m", _bars("2026-03-02 09:30", 390))
+        provider = MarketDataProvider(bar_store=self.store, offline=True)
+        self.assertEqual(len(provider.get_historical_bars("SPY", "2026-03-02")), 390)
+        self.assertTrue(provider.get_historical_bars("QQQ", "2026-03-02").empty)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Tests for the in-memory DP level index.
+"""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from live_monitoring.agents.dp_learning.level_index import DPLevelIndex
+
+
+class TestDPLevelIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = os.path.join(self.tmp.name, "dp.db")
+        conn = sqlite3.connect(self.db)
+        conn.execute("""
+            CREATE TABLE dp_interactions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT, symbol TEXT,
+                level_price REAL, level_type TEXT, outcome TEXT, touch_count INTEGER
+            )
+        """)
+        rows = [
+            # 685.5 grid: 3 bounces / 1 break -> 75% WR
+            ("2026-03-02T10:00:00", "SPY", 685.40, "SUPPORT", "BOUNCE", 1),
+            ("2026-03-02T10:05:00", "SPY", 685.55, "SUPPORT", "BOUNCE", 2),
+            ("2026-03-02T10:10:00", "SPY", 685.45, "SUPPORT", "BOUNCE", 3),
+            ("2026-03-02T10:15:00", "SPY", 685.50, "RESISTANCE", "BREAK", 1),
+            # 686.0 grid: 2 samples only
+            ("2026-03-02T10:20:00", "SPY", 686.00, "SUPPORT", "BOUNCE", 1),
+            ("2026-03-02T10:25:00", "SPY", 686.00, "SUPPORT", "BOUNCE", 1),
+            # unsettled rows are ignored
+            ("2026-03-02T10:30:00", "SPY", 686.00, "SUPPORT", "PENDING", 1),
+            ("2026-03-02T10:35:00", "SPY", 686.00, "SUPPORT", "FADE", 1),
+        ]
+        conn.executemany(
+            "INSERT INTO dp_interactions (timestamp, symbol, level_price, level_type, outcome, touch_count) "
+            "VALUES (?, ?, ?, ?, ?, ?)", rows,
+        )
+        conn.commit()
+        conn.close()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_nearest_strong_level(self):
+        index = DPLevelIndex(self.db)
+        level = index.nearest_strong_level("SPY", 686.0, threshold_pct=0.5)
+        # 686.0 has too few samples; 685.5 qualifies
+        self.assertEqual(level.price, 685.5)
+        self.assertEqual((level.bounces, level.breaks, level.touches), (3, 1, 3))
+        self.assertEqual(level.level_type, "RESISTANCE")  # newest row wins
+        self.assertAlmostEqual(level.bounce_rate, 75.0)
+        self.assertAlmostEqual(level.distance_pct, 0.5 / 686.0 * 100)
+
+        self.assertIsNone(index.nearest_strong_level("SPY", 686.0, threshold_pct=0.05))
+        self.assertIsNone(index.nearest_strong_level("SPY", 685.5, min_bounce_rate=80))
+        self.assertIsNone(index.nearest_strong_level("QQQ", 685.5))
+
+    def test_incremental_record_and_window(self):
+        index = DPLevelIndex(self.db, window=6)
+        index.nearest_strong_level("SPY", 686.0)  # load
+
+        index.record(100, "SPY", "2026-03-02T11:00:00", 686.1, "SUPPORT", "BOUNCE", 1)
+        # Window of 6 evicts the oldest 685.5 bounce -> 2/1, below 70% WR
+        self.assertEqual(index.nearest_strong_level("SPY", 686.0).price, 686.0)
+        self.assertIsNone(index.nearest_strong_level("SPY", 685.5, threshold_pct=0.01))
+
+        # Re-settling replaces the previous outcome
+        index.record(100, "SPY", "2026-03-02T11:00:00", 686.1, "SUPPORT", "BREAK", 1)
+        self.assertEqual(index.level_at("SPY", 686.0).breaks, 1)
+
+    def test_zone_stats(self):
+        index = DPLevelIndex(self.db)
+        bounce_rate, samples = index.zone_stats("SPY", 685.41, 685.90)
+        self.assertEqual(samples, 6)
+        self.assertAlmostEqual(bounce_rate, 5 / 6 * 100)
+        self.assertEqual(index.zone_stats("SPY", 700.0, 701.0), (None, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+"""
+Tests for the online dp_learning PatternLearner.
+"""
+
+import os
+import random
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from live_monitoring.agents.dp_learning.database import DPDatabase
+from live_monitoring.agents.dp_learning.learner import PatternLearner
+from live_monitoring.agents.dp_learning.models import DPInteraction, DPOutcome, LevelType, Outcome
+
+OUTCOMES = [Outcome.BOUNCE, Outcome.BREAK, Outcome.FADE]
+
+
+def _reference_counts(interactions):
+    """Per-pattern (total, bounce, break) the way the old batch passes counted them."""
+    rules = {
+        'vol_500k': lambda i: 500_000 <= i.level_volume < 1_000_000,
+        'vol_1m': lambda i: 1_000_000 <= i.level_volume < 2_000_000,
+        'vol_2m_plus': lambda i: i.level_volume >= 2_000_000,
+        'morning': lambda i: 9 <= i.timestamp.hour < 11,
+        'midday': lambda i: 11 <= i.timestamp.hour < 14,
+        'afternoon': lambda i: 14 <= i.timestamp.hour < 16,
+        'touch_1': lambda i: i.touch_count == 1,
+        'touch_2': lambda i: i.touch_count == 2,
+        'touch_3_plus': lambda i: i.touch_count >= 3,
+        'support': lambda i: i.level_type == LevelType.SUPPORT,
+        'resistance': lambda i: i.level_type == LevelType.RESISTANCE,
+        'morning_high_vol': lambda i: 9 <= i.timestamp.hour < 11 and i.level_volume >= 1_000_000,
+        '2nd_touch_resistance': lambda i: i.touch_count == 2 and i.level_type == LevelType.RESISTANCE,
+    }
+    out = {}
+    for name, rule in rules.items():
+        hits = [i for i in interactions if rule(i)]
+        out[name] = (len(hits), sum(i.outcome == Outcome.BOUNCE for i in hits),
+                     sum(i.outcome == Outcome.BREAK for i in hits))
+    return out
+
+
+class TestPatternLearner(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = DPDatabase(db_path=os.path.join(self.tmp.name, "dp.db"))
+        self.rng = random.Random(11)
+
+    def tearDown(self):
+        self.db.store.close()
+        self.tmp.cleanup()
+
+    def _settle(self, n, start=datetime(2026, 3, 2, 9, 30), outcome=None):
+        settled = []
+        for k in range(n):
+            interaction = DPInteraction(
+                timestamp=start + timedelta(minutes=7 * k),
+                symbol="SPY",
+                level_price=680 + self.rng.random() * 10,
+                level_volume=self.rng.choice([600_000, 1_500_000, 3_000_000]),
+                level_type=self.rng.choice([LevelType.SUPPORT, LevelType.RESISTANCE]),
+                touch_count=self.rng.randint(1, 4),
+            )
+            interaction.id = self.db.save_interaction(interaction)
+            interaction.outcome = outcome or self.rng.choice(OUTCOMES)
+            self.db.update_outcome(interaction.id, DPOutcome(interaction.id, interaction.outcome, 0, 0))
+            settled.append(interaction)
+        return settled
+
+    def _assert_counts(self, learner, interactions):
+        for name, (total, bounce, brk) in _reference_counts(interactions).items():
+            if total >= learner.min_samples:
+                p = learner.patterns[name]
+                self.assertEqual((p.total_samples, p.bounce_count, p.break_count), (total, bounce, brk), name)
+            else:
+                self.assertNotIn(name, learner.patterns)
+
+    def test_online_updates_match_batch_counts(self):
+        learner = PatternLearner(self.db, min_samples=3)
+        learner.learn(min_samples=3)
+        settled = []
+        for interaction in self._settle(200):
+            learner.observe(interaction)
+            settled.append(interaction)
+        self._assert_counts(learner, settled)
+
+        probe = settled[0]
+        cached = learner.predict(probe)
+        keys = learner.pattern_keys(probe)
+        self.assertIs(learner._lookup(keys), learner._lookup(keys))   # memoized until the next update
+        rebuilt = PatternLearner(self.db, min_samples=3)
+        rebuilt.learn(min_samples=3, rebuild=True)
+        self.assertAlmostEqual(rebuilt.predict(probe).bounce_probability, cached.bounce_probability)
+
+    def test_counters_persist_and_catch_up(self):
+        learner = PatternLearner(self.db, min_samples=3)
+        first = self._settle(50)
+        for interaction in first:
+            learner.observe(interaction)
+
+        # Outcomes settled while no learner was listening are folded in by learn()
+        later = self._settle(20, start=datetime(2026, 3, 3, 9, 30))
+        restarted = PatternLearner(self.db, min_samples=3)
+        self.assertEqual(restarted.patterns['support'].total_samples, learner.patterns['support'].total_samples)
+        restarted.learn(min_samples=3)
+        self._assert_counts(restarted, first + later)
+
+    def test_no_history_cap(self):
+        start = datetime(2026, 3, 2, 9, 30)
+        with self.db.store.transaction() as conn:
+            conn.executemany(
+                "INSERT INTO dp_interactions (timestamp, symbol, level_price, level_volume, level_type, "
+                "touch_count, outcome) VALUES (?, 'SPY', 680.0, 1500000, ?, 1, ?)",
+                [((start + timedelta(minutes=k)).isoformat(), ('SUPPORT', 'RESISTANCE')[k % 2],
+                  OUTCOMES[k % 3].value) for k in range(1100)])
+        learner = PatternLearner(self.db, min_samples=3)
+        learner.learn(min_samples=3)
+        self.assertEqual(learner.patterns['support'].total_samples + learner.patterns['resistance'].total_samples, 1100)
+
+    def test_manual_override_replaces_counted_outcome(self):
+        learner = PatternLearner(self.db, min_samples=1)
+        interaction = self._settle(1, outcome=Outcome.BREAK)[0]
+        learner.observe(interaction)
+        learner.observe(interaction)  # idempotent
+        learner.observe(interaction, Outcome.BOUNCE)
+        key = interaction.level_type.value.lower()
+        p = learner.patterns[key]
+        self.assertEqual((p.total_samples, p.bounce_count, p.break_count), (1, 1, 0))
+
+    def test_decayed_rates_favour_recent_outcomes(self):
+        learner = PatternLearner(self.db, half_life_days=5, min_samples=3)
+        old = self._settle(30, start=datetime(2026, 1, 5, 9, 30), outcome=Outcome.BOUNCE)
+        recent = self._settle(10, start=datetime(2026, 3, 2, 9, 30), outcome=Outcome.BREAK)
+        for interaction in old + recent:
+            learner.observe(interaction)
+        raw = learner.patterns['support'].bounce_count + learner.patterns['resistance'].bounce_count
+        self.assertEqual(raw, 30)   # raw counts are kept; only the rates decay
+        undecayed = PatternLearner(self.db, min_samples=3)
+        undecayed.learn(min_samples=3, rebuild=True)
+        for key in ('support', 'resistance'):
+            self.assertGreater(learner._rates(key)[1], 0.9)
+            self.assertLess(undecayed._rates(key)[1], 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
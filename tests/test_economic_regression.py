@@ -0,0 +1,217 @@
+"""
+Tests for the least-squares backend behind the economic PatternLearners.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import numpy as np
+
+from live_monitoring.agents.economic.engine import EconomicIntelligenceEngine
+from live_monitoring.agents.economic.models import EconomicRelease, EventType
+from live_monitoring.agents.economic.pattern_learner import PatternLearner
+from live_monitoring.agents.economic.regression import FEATURES, release_arrays
+from live_monitoring.agents import economic_learning_engine as engine_module
+from live_monitoring.agents.economic_learning_engine import EconomicLearningEngine
+
+
+def _releases(event_type=EventType.CPI, n=40, base=-4.0, fomc=0.5, vix=0.3, dp=0.25, noise=0.0, seed=3):
+    rng = np.random.default_rng(seed)
+    out = []
+    for i in range(n):
+        s = float(rng.choice([-1, 1]) * rng.uniform(0.4, 2.5))
+        days = int(rng.integers(1, 40))
+        vix_level = float(rng.uniform(12, 30))
+        dp_ratio = float(rng.choice([0.4, 0.5, 0.6]))
+        confirmed = (dp_ratio > 0.55 and s > 0) or (dp_ratio < 0.45 and s < 0)
+        slope = base * (1 + fomc * (days < 7) + vix * (vix_level > 20) + dp * confirmed)
+        shift = 1.5 + s * slope + float(rng.normal(0, noise))
+        out.append(EconomicRelease(
+            date=f"2025-{i % 12 + 1:02d}-{i % 28 + 1:02d}", time="08:30", event_type=event_type,
+            event_name=event_type.value, actual=0, forecast=0, previous=0,
+            surprise_sigma=s, fed_watch_shift_1hr=shift, days_to_fomc=days,
+            vix_level=vix_level, dp_buy_ratio_before=dp_ratio,
+        ))
+    return out
+
+
+def _clock(day):
+    """datetime stand-in whose now() is 08:30 on ``day``."""
+    now = datetime.strptime(f"{day} 08:30", "%Y-%m-%d %H:%M")
+    return type("_Clock", (datetime,), {"now": classmethod(lambda cls: now)})
+
+
+class TestPatternLearner(unittest.TestCase):
+
+    def test_recovers_context_coefficients(self):
+        pattern = PatternLearner().learn_pattern(_releases())
+        self.assertAlmostEqual(pattern.base_impact, -4.0, places=3)
+        self.assertAlmostEqual(pattern.fomc_proximity_boost, 0.5, places=3)
+        self.assertAlmostEqual(pattern.high_vix_multiplier, 1.3, places=3)
+        self.assertAlmostEqual(pattern.dp_confirmation_boost, 0.25, places=3)
+        self.assertEqual(pattern.r_squared, 1.0)
+        self.assertEqual(pattern.mean_absolute_error, 0.0)
+
+    def test_matches_lstsq(self):
+        releases = _releases(noise=2.0)
+        pattern = PatternLearner().learn_pattern(releases)
+
+        X, y, valid = release_arrays(releases)
+        coef, *_ = np.linalg.lstsq(X[valid], y[valid], rcond=None)
+        resid = y[valid] - X[valid] @ coef
+        r2 = 1 - resid @ resid / np.sum((y[valid] - y[valid].mean()) ** 2)
+        self.assertEqual(len(coef), len(FEATURES))
+        self.assertAlmostEqual(pattern.base_impact, round(coef[1], 3))
+        self.assertAlmostEqual(pattern.r_squared, round(r2, 3))
+        self.assertAlmostEqual(pattern.mean_absolute_error, round(np.abs(resid).mean(), 3))
+
+    def test_incremental_update_matches_refit(self):
+        releases = _releases(noise=1.0)
+        learner = PatternLearner()
+        learner.learn_pattern(releases[:-3])
+        self.assertTrue(learner.has_model(EventType.CPI))
+        for r in releases[-3:]:
+            incremental = learner.add_release(r)
+        refit = PatternLearner().learn_pattern(releases)
+        self.assertEqual(incremental.sample_count, len(releases))
+        for field in ("base_impact", "fomc_proximity_boost", "high_vix_multiplier",
+                      "dp_confirmation_boost", "r_squared", "mean_absolute_error"):
+            self.assertAlmostEqual(getattr(incremental, field), getattr(refit, field), msg=field)
+
+    def test_batch_matches_per_type(self):
+        mixed = _releases(EventType.CPI, noise=1.0) + _releases(EventType.NFP, base=6.0, noise=1.0, seed=9) \
+            + _releases(EventType.GDP, n=4, seed=11)
+        patterns = PatternLearner().learn_all_patterns(mixed)
+
+        self.assertEqual(set(patterns), {EventType.CPI.value, EventType.NFP.value})
+        for event_type in (EventType.CPI, EventType.NFP):
+            single = PatternLearner().learn_pattern([r for r in mixed if r.event_type == event_type])
+            self.assertEqual(patterns[event_type.value].base_impact, single.base_impact)
+            self.assertEqual(patterns[event_type.value].r_squared, single.r_squared)
+            self.assertEqual(patterns[event_type.value].event_type, event_type)
+
+    def test_minimum_data_and_unsplit_context(self):
+        learner = PatternLearner()
+        self.assertIsNone(learner.learn_pattern(_releases(n=4)))
+        self.assertIsNone(learner.learn_pattern([]))
+
+        releases = _releases(n=6)
+        for r in releases[2:]:
+            r.fed_watch_shift_1hr = 0
+        self.assertIsNone(learner.learn_pattern(releases))
+
+        # Every release far from FOMC, no VIX > 20, no DP data: context terms stay neutral
+        releases = _releases(noise=0.5)
+        for r in releases:
+            r.days_to_fomc, r.vix_level, r.dp_buy_ratio_before = 30, 15.0, 0.5
+        pattern = learner.learn_pattern(releases)
+        self.assertEqual((pattern.fomc_proximity_boost, pattern.high_vix_multiplier, pattern.dp_confirmation_boost),
+                         (0.0, 1.0, 0.0))
+
+
+class TestLearningEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.engine = EconomicLearningEngine(os.path.join(self.tmp, "econ.db"))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_record_release_updates_incrementally(self):
+        self.engine.seed_historical_data()
+        self.assertIn("nonfarm payrolls", self.engine.learner.models)
+
+        self.engine.record_release("Nonfarm Payrolls", actual=150, forecast=180, previous=227,
+                                   fed_watch_before=70, fed_watch_after=79)
+        incremental = self.engine.db.get_pattern("nonfarm payrolls")
+        refit = self.engine.learner.learn_pattern("Nonfarm Payrolls")
+        self.assertEqual(incremental.sample_count, 6)
+        self.assertEqual(incremental.base_impact, refit.base_impact)
+        self.assertEqual(incremental.avg_prediction_error, refit.avg_prediction_error)
+
+    def _assert_matches_refit(self, event_type):
+        incremental = self.engine.db.get_pattern(event_type)
+        refit = EconomicLearningEngine(self.engine.db.db_path).learner.learn_pattern(event_type)
+        self.assertEqual(incremental.sample_count, refit.sample_count, msg=event_type)
+        self.assertAlmostEqual(incremental.base_impact, refit.base_impact, msg=event_type)
+        self.assertAlmostEqual(incremental.avg_prediction_error, refit.avg_prediction_error, msg=event_type)
+
+    def test_release_updates_every_matching_model(self):
+        self.engine.seed_historical_data()
+        learner = self.engine.learner
+        learner.learn_pattern("CPI")
+        learner.learn_pattern("Core CPI")
+        cpi_count = learner.models["cpi"].release_count
+
+        self.engine.record_release("Core CPI", actual=3.4, forecast=3.2, previous=3.3,
+                                   fed_watch_before=60, fed_watch_after=52)
+        # "cpi" is fit on LIKE '%cpi%', which includes Core CPI
+        self.assertEqual(learner.models["cpi"].release_count, cpi_count + 1)
+        self.assertEqual(learner.models["core cpi"].release_count, 1)
+        self._assert_matches_refit("cpi")
+
+    def test_release_window_matches_refit(self):
+        self.engine.seed_historical_data()
+        learner = self.engine.learner
+        with mock.patch.object(engine_module.PatternLearner, "RELEASE_WINDOW", 4):
+            learner.learn_pattern("Nonfarm Payrolls")
+            for i, (before, after) in enumerate(((70, 79), (75, 70), (72, 74))):
+                with mock.patch.object(engine_module, "datetime", _clock(f"2025-01-{10 + i}")):
+                    self.engine.record_release("Nonfarm Payrolls", actual=150 + after, forecast=180,
+                                               previous=227, fed_watch_before=before, fed_watch_after=after)
+                self.assertEqual(learner.models["nonfarm payrolls"].release_count, 4)
+                self.assertEqual(learner.windows["nonfarm payrolls"][0].fed_watch_shift, after - before)
+            # Re-recording the same day replaces the release, as the database does
+            with mock.patch.object(engine_module, "datetime", _clock("2025-01-12")):
+                self.engine.record_release("Nonfarm Payrolls", actual=140, forecast=180, previous=227,
+                                           fed_watch_before=70, fed_watch_after=81)
+            self.assertEqual([r.fed_watch_shift for r in learner.windows["nonfarm payrolls"]][:3], [11, -5, 9])
+            model = learner.models["nonfarm payrolls"]
+            refit = EconomicLearningEngine(self.engine.db.db_path).learner
+            refit.learn_pattern("Nonfarm Payrolls")
+            expected = refit.models["nonfarm payrolls"]
+            np.testing.assert_allclose(model.xtx, expected.xtx, atol=1e-9)
+            np.testing.assert_allclose(model.xty, expected.xty, atol=1e-9)
+            self.assertEqual(sorted(model.y), sorted(expected.y))
+
+
+class TestIntelligenceEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.engine = EconomicIntelligenceEngine(os.path.join(self.tmp, "econ.db"))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _record(self, date, actual, after):
+        self.engine.record_release("cpi", date=date, actual=actual, forecast=3.1, previous=3.0,
+                                   fed_watch_before=60, fed_watch_after=after)
+
+    def test_record_release_replaces_and_windows_like_the_database(self):
+        with mock.patch.object(PatternLearner, "RELEASE_WINDOW", 5):
+            for i in range(7):
+                self._record(f"2026-0{i + 1}-10", 2.6 + i * 0.15, 60 + (i - 3) * (1.5 + 0.1 * i))
+            # Re-recording a date replaces its row in the database
+            for j in range(3):
+                self._record("2026-05-10", 3.5 + j * 0.1, 55 - j)
+
+            model = self.engine.learner.models["cpi"]
+            stored = self.engine.db.get_releases_by_type(EventType.CPI, limit=5)
+            refit = PatternLearner()
+            refit.learn_pattern(stored)
+            expected = refit.models["cpi"]
+            self.assertEqual(model.release_count, 5)
+            self.assertEqual([r.date for r in self.engine.learner.windows["cpi"]], [r.date for r in stored])
+            np.testing.assert_allclose(model.xtx, expected.xtx, atol=1e-9)
+            np.testing.assert_allclose(model.xty, expected.xty, atol=1e-9)
+            self.assertEqual(sorted(model.y), sorted(expected.y))
+
+
+if __name__ == "__main__":
+    unittest.main()
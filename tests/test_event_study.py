@@ -0,0 +1,100 @@
+"""
+Tests for the batch event-study engine.
+"""
+
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from backtesting.engine.data.bar_store import BarStore
+from live_monitoring.core.event_study import EventStudy, nearest_index
+
+
+def _session(date_str, start_price):
+    idx = pd.date_range(f"{date_str} 09:30", f"{date_str} 15:59", freq="1min", tz="US/Eastern")
+    close = start_price + np.arange(len(idx)) * 0.01
+    return pd.DataFrame({"Open": close, "High": close + 0.05, "Low": close - 0.05,
+                         "Close": close, "Volume": 1000.0}, index=idx)
+
+
+class _CountingStore(BarStore):
+    def __init__(self, root):
+        super().__init__(root)
+        self.reads = 0
+
+    def read_best(self, symbol, date_str, interval="1m"):
+        self.reads += 1
+        return super().read_best(symbol, date_str, interval)
+
+
+class TestEventStudy(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.store = _CountingStore(self.root)
+        self.store.write("SPY", "1m", pd.concat([_session("2026-03-02", 500.0), _session("2026-03-03", 510.0)]))
+        self.study = EventStudy("SPY", store=self.store, fetch_missing=False)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_moves_match_bar_offsets(self):
+        events = [datetime(2026, 3, 2, 10, 0), datetime(2026, 3, 2, 14, 0)]
+        m = self.study.measure(events, horizons=(60, 240))
+
+        self.assertAlmostEqual(m.base_price[0], 500.30)
+        self.assertAlmostEqual(m.move(0, 60), 0.60 / 500.30 * 100)
+        self.assertAlmostEqual(m.move(0, 240), 2.40 / 500.30 * 100)
+        # 14:00 + 4h is past the close: the 15:59 bar is not a 18:00 price
+        self.assertIsNone(m.move(1, 240))
+        self.assertAlmostEqual(m.mfe[1], (503.30 + 0.05 - 502.70) / 502.70 * 100)  # over the 60m horizon
+
+        eod_close, next_close = 503.89, 513.89
+        self.assertAlmostEqual(m.eod[0], (eod_close - 500.30) / 500.30 * 100)
+        self.assertAlmostEqual(m.next_session[0], (next_close - eod_close) / eod_close * 100)
+        self.assertAlmostEqual(m.mfe[0], (500.30 + 2.40 + 0.05 - 500.30) / 500.30 * 100)
+        self.assertAlmostEqual(m.mae[0], -0.05 / 500.30 * 100)
+
+    def test_per_event_horizons_and_missing_data(self):
+        events = [(datetime(2026, 3, 3, 10, 0), (5,)), datetime(2026, 3, 3, 15, 30)]
+        m = self.study.measure(events, horizons=(60,))
+
+        self.assertEqual(m.horizons, (5, 60))
+        self.assertIsNone(m.move(0, 60))
+        self.assertIsNotNone(m.move(0, 5))
+        self.assertIsNone(m.move(1, 60))  # 16:30 is past the last stored bar
+        self.assertIsNone(m.row(1)["next_session"])
+
+    def test_batch_reads_each_session_once(self):
+        events = [datetime(2026, 3, 2, 9, 30) + pd.Timedelta(minutes=5 * i) for i in range(200)]
+        m = self.study.measure(events, horizons=(1, 60))
+        self.assertEqual(self.store.reads, 5)  # 03-02 .. 03-06 weekdays, once each
+        self.assertEqual(len(m), 200)
+
+        self.study.measure(events[:10], horizons=(60,))
+        self.assertEqual(self.store.reads, 5 + 3)  # stored sessions memoized; absent ones retried
+
+    def test_off_hours_events_unmeasured(self):
+        events = [datetime(2026, 3, 2, 20, 0), datetime(2026, 3, 1, 12, 0), datetime(2026, 3, 3, 4, 0),
+                  datetime(2026, 3, 3, 9, 30)]
+        m = self.study.measure(events, horizons=(1, 60, 240))
+        for i in range(3):
+            self.assertEqual(set(m.row(i).values()), {None}, msg=events[i])
+        self.assertAlmostEqual(m.base_price[3], 510.0)
+        self.assertIsNotNone(m.move(3, 240))
+
+    def test_no_bars(self):
+        m = self.study.measure([datetime(2025, 1, 6, 10, 0)])
+        self.assertIsNone(m.row(0)["base_price"])
+
+    def test_nearest_index(self):
+        index = np.array([0, 10, 20])
+        self.assertEqual(nearest_index(index, np.array([-5, 4, 5, 6, 26])).tolist(), [0, 0, 0, 1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""
+Tests for the vectorized exit engine and BaseDetector batch simulation.
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from backtesting.simulation.base_detector import BaseDetector, Signal
+from backtesting.simulation.exit_engine import HIT_STOP, HIT_TARGET, TIMEOUT, entry_indices, resolve_exits
+
+
+class _Detector(BaseDetector):
+    name = "test"
+
+    def detect_signals(self, symbol, data, **kwargs):
+        return []
+
+
+def _frame(highs, lows, closes):
+    idx = pd.date_range("2026-03-02 09:30", periods=len(closes), freq="1min", tz="US/Eastern")
+    return pd.DataFrame({"Open": closes, "High": highs, "Low": lows, "Close": closes}, index=idx)
+
+
+class TestResolveExits(unittest.TestCase):
+
+    def setUp(self):
+        self.high = np.array([100.0, 100.2, 100.5, 101.2, 100.0])
+        self.low = np.array([100.0, 99.9, 99.7, 100.4, 98.0])
+        self.close = np.array([100.0, 100.1, 100.2, 101.0, 99.0])
+
+    def test_first_hit_and_excursions(self):
+        exits = resolve_exits(self.high, self.low, self.close,
+                              entry_idx=[0, 0], is_long=[True, False], entry_price=[100.0, 100.0],
+                              target_price=[101.0, 99.0], stop_price=[99.5, 101.0])
+        # LONG: target touched on bar 3; SHORT: stop touched on bar 3
+        self.assertEqual(exits.reason.tolist(), [HIT_TARGET, HIT_STOP])
+        self.assertEqual(exits.exit_idx.tolist(), [3, 3])
+        self.assertEqual(exits.bars_held.tolist(), [3, 3])
+        self.assertAlmostEqual(exits.max_favorable[0], 1.2)
+        self.assertAlmostEqual(exits.max_adverse[0], 0.3)
+        self.assertAlmostEqual(exits.max_favorable[1], 0.3)
+
+    def test_same_bar_tie_break(self):
+        kwargs = dict(entry_idx=[2], is_long=[True], entry_price=[100.0],
+                      target_price=[101.0], stop_price=[100.5])
+        self.assertEqual(resolve_exits(self.high, self.low, self.close, **kwargs).reason[0], HIT_TARGET)
+        self.assertEqual(resolve_exits(self.high, self.low, self.close, stop_first=True, **kwargs).reason[0],
+                         HIT_STOP)
+
+    def test_timeout_and_forced_exit(self):
+        kwargs = dict(entry_idx=[0], is_long=[True], entry_price=[100.0],
+                      target_price=[105.0], stop_price=[90.0])
+        exits = resolve_exits(self.high, self.low, self.close, max_bars=2, **kwargs)
+        self.assertEqual((exits.reason[0], exits.exit_idx[0], exits.exit_price[0]), (TIMEOUT, 2, 100.2))
+
+        force = np.array([False, True, False, False, False])
+        exits = resolve_exits(self.high, self.low, self.close, force_exit=force, **kwargs)
+        self.assertEqual((exits.reason[0], exits.exit_idx[0]), (TIMEOUT, 1))
+
+    def test_entry_indices(self):
+        index = _frame(self.high, self.low, self.close).index
+        found = entry_indices(index, [index[0], index[2] - pd.Timedelta(seconds=30), index[-1] + pd.Timedelta(minutes=1)])
+        self.assertEqual(found.tolist(), [0, 2, -1])
+
+
+class TestSimulateTrades(unittest.TestCase):
+
+    def test_batch_matches_single(self):
+        rng = np.random.default_rng(7)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, 120)))
+        data = _frame(close * 1.001, close * 0.999, close)
+        detector = _Detector(stop_pct=0.2, target_pct=0.3, max_bars=20)
+
+        signals, entries = [], []
+        for i in range(0, 120, 7):
+            direction = "LONG" if i % 2 else "SHORT"
+            sign = 1 if direction == "LONG" else -1
+            e = close[i]
+            signals.append(Signal("SPY", data.index[i], "TEST", direction, e,
+                                  e * (1 - sign * 0.002), e * (1 + sign * 0.003), 50, ""))
+            entries.append(i)
+
+        batch = detector.simulate_trades(signals, data, entries)
+        for signal, entry, trade in zip(signals, entries, batch):
+            single = detector.simulate_trade(signal, data, entry)
+            self.assertEqual((trade.outcome, trade.bars_held, trade.exit_time),
+                             (single.outcome, single.bars_held, single.exit_time))
+            self.assertAlmostEqual(trade.pnl_pct, single.pnl_pct)
+
+        self.assertEqual(batch[-1].outcome, "NO_DATA")  # entry on the last bar
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Tests for the vectorized Black-Scholes greeks engine.
+"""
+
+import math
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from live_monitoring.core.greeks import GreeksEngine
+from live_monitoring.core.options_analytics import ChainArrays, model_gamma
+
+
+def _bs_price(spot, strike, t, sigma, rate, is_call):
+    d1 = (math.log(spot / strike) + (rate + 0.5 * sigma ** 2) * t) / (sigma * math.sqrt(t))
+    d2 = d1 - sigma * math.sqrt(t)
+    cdf = lambda x: 0.5 * (1 + math.erf(x / math.sqrt(2)))
+    if is_call:
+        return spot * cdf(d1) - strike * math.exp(-rate * t) * cdf(d2)
+    return strike * math.exp(-rate * t) * cdf(-d2) - spot * cdf(-d1)
+
+
+class TestGreeksEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = GreeksEngine(rate=0.04)
+        self.strike = np.array([480.0, 500.0, 520.0, 500.0])
+        self.t = np.array([0.05, 0.05, 0.05, 0.25])
+        self.iv = np.array([0.22, 0.18, 0.16, 0.20])
+        self.is_call = np.array([True, False, True, True])
+
+    def test_matches_finite_differences(self):
+        spot, h = 500.0, 0.01
+        g = self.engine.compute(self.strike, self.t, self.iv, self.is_call, spot=spot)
+        for i in range(len(self.strike)):
+            args = (self.strike[i], self.t[i], self.iv[i], 0.04, self.is_call[i])
+            up, mid, dn = (_bs_price(spot + h, *args), _bs_price(spot, *args), _bs_price(spot - h, *args))
+            self.assertAlmostEqual(g.delta[i], (up - dn) / (2 * h), places=4)
+            self.assertAlmostEqual(g.gamma[i], (up - 2 * mid + dn) / h ** 2, places=3)
+
+            dt = 1e-5
+            later = _bs_price(spot + h, self.strike[i], self.t[i] - dt, self.iv[i], 0.04, self.is_call[i]) \
+                - _bs_price(spot - h, self.strike[i], self.t[i] - dt, self.iv[i], 0.04, self.is_call[i])
+            charm_fd = (later / (2 * h) - g.delta[i]) / dt
+            self.assertAlmostEqual(g.charm[i], charm_fd, delta=abs(charm_fd) * 0.02 + 1e-3)
+
+    def test_spot_move_reuses_snapshot(self):
+        self.engine.compute(self.strike, self.t, self.iv, self.is_call, spot=500.0)
+        self.engine.compute(self.strike, self.t, self.iv, self.is_call, spot=501.0)
+        self.engine.compute(self.strike, self.t, self.iv, self.is_call, spot=501.0)
+        self.assertEqual(self.engine.stats, {'snapshots_built': 1, 'spot_updates': 1, 't_refreshes': 0, 'hits': 1})
+
+    def test_time_decay_refreshes_snapshot(self):
+        self.engine.compute(self.strike, self.t, self.iv, self.is_call, spot=500.0)
+        g = self.engine.compute(self.strike, self.t - 0.01, self.iv, self.is_call, spot=500.0)
+        fresh = GreeksEngine(rate=0.04).compute(self.strike, self.t - 0.01, self.iv, self.is_call, spot=500.0)
+        np.testing.assert_allclose(g.gamma, fresh.gamma)
+        np.testing.assert_allclose(g.charm, fresh.charm)
+        self.assertEqual((self.engine.stats['snapshots_built'], self.engine.stats['t_refreshes']), (1, 1))
+
+    def test_invalid_iv_is_nan(self):
+        g = self.engine.compute([500.0, 500.0], 0.1, [np.nan, 0.0], [True, False], spot=500.0)
+        self.assertTrue(np.isnan(g.gamma).all())
+
+    def test_model_gamma_fills_only_missing(self):
+        calls = pd.DataFrame({'strike': [500.0, 505.0], 'openInterest': [10, 10],
+                              'impliedVolatility': [0.2, 0.2], 'gamma': [np.nan, 0.5]})
+        chain = ChainArrays.from_frames(calls, pd.DataFrame(), expiration='2099-01-01')
+        gamma = model_gamma(chain, spot=500.0, engine=self.engine)
+        self.assertGreater(gamma[0], 0)
+        self.assertEqual(gamma[1], 0.5)
+
+    def test_refetched_chain_hits_snapshot(self):
+        calls = pd.DataFrame({'strike': [495.0, 500.0, 505.0], 'openInterest': [10, 20, 10],
+                              'impliedVolatility': [0.21, 0.2, 0.19]})
+        puts = calls.assign(impliedVolatility=[0.23, 0.22, 0.21])
+        for _ in range(2):
+            chain = ChainArrays.from_frames(calls, puts, expiration='2099-01-01')
+            model_gamma(chain, spot=500.0, engine=self.engine)
+        self.assertEqual(self.engine.stats, {'snapshots_built': 1, 'spot_updates': 0, 't_refreshes': 0, 'hits': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
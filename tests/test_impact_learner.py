@@ -0,0 +1,61 @@
+"""
+Tests for the Fed comment → SPY impact learner.
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from live_monitoring.agents.fed_officials.database import FedOfficialsDatabase
+from live_monitoring.agents.fed_officials.impact_learner import ImpactLearner
+
+
+class TestImpactLearner(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.db = FedOfficialsDatabase(os.path.join(self.tmp, "fed.db"))
+        conn = sqlite3.connect(self.db.db_path)
+        for i, ts in enumerate(("2026-03-02T10:00:00", "2026-03-02T14:00:00", "2026-03-03T10:00:00"), 1):
+            conn.execute("INSERT INTO comments (id, timestamp, official_name, content) VALUES (?, ?, 'Powell', '')",
+                         (i, ts))
+        conn.commit()
+        conn.close()
+        self.learner = ImpactLearner(self.db)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _learn(self, moves):
+        """moves: per comment, (1hr, 4hr) with None for unresolved."""
+        matrix = SimpleNamespace(move=lambda i, h: moves[i][0 if h == 60 else 1])
+        self.learner._measure_spy = lambda times, horizons=(60, 240): matrix
+        return self.learner.learn_from_outcomes([(i + 1, "Powell", "HAWKISH") for i in range(len(moves))])
+
+    def _pattern(self):
+        conn = sqlite3.connect(self.db.db_path)
+        conn.row_factory = sqlite3.Row
+        row = conn.execute("SELECT * FROM market_impact_patterns").fetchone()
+        conn.close()
+        return row
+
+    def test_missing_4hr_move_counts_for_1hr_only(self):
+        self.assertEqual(self._learn([(0.5, None), (-0.2, 0.4), (None, 0.9)]), 2)
+        row = self._pattern()
+        self.assertEqual(row["sample_count"], 2)
+        self.assertAlmostEqual(row["avg_spy_move_1hr"], 0.15)
+        self.assertEqual(row["sample_count_4hr"], 1)
+        self.assertAlmostEqual(row["avg_spy_move_4hr"], 0.4)
+
+    def test_first_sample_without_4hr_stores_null(self):
+        self._learn([(0.5, None)])
+        row = self._pattern()
+        self.assertIsNone(row["avg_spy_move_4hr"])
+        self.assertEqual(row["sample_count_4hr"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
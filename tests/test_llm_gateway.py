@@ -0,0 +1,188 @@
+"""
+Tests for the LLM gateway against a local OpenAI-compatible stub server.
+"""
+
+import asyncio
+import importlib.util
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from core.utils.llm_gateway import LLMGateway, LLMGatewayError, Provider
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.last_body = body
+            server.requests += 1
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        time.sleep(server.delay)
+        with server.lock:
+            server.active -= 1
+
+        if server.fail:
+            self.send_response(500)
+            self.end_headers()
+            return
+        prompt = body["messages"][-1]["content"]
+        payload = json.dumps({
+            "choices": [{"message": {"content": f"echo: {prompt}"}}],
+            "usage": {"prompt_tokens": 7, "completion_tokens": 3},
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestLLMGateway(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        cls.server.lock = threading.Lock()
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}/v1/chat/completions"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def setUp(self):
+        self.server.requests = self.server.active = self.server.max_active = 0
+        self.server.delay = 0.0
+        self.server.fail = False
+        self.tmp = tempfile.mkdtemp()
+        self.db = os.path.join(self.tmp, "llm_cache.db")
+        self.gateways = []
+
+    def tearDown(self):
+        for gw in self.gateways:
+            gw.close()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _gateway(self, max_concurrency=4, cache_db=None):
+        gw = LLMGateway(
+            providers={"stub": Provider("stub", self.url, "STUB_KEY", max_concurrency=max_concurrency, api_key="k")},
+            cache_db=cache_db,
+        )
+        self.gateways.append(gw)
+        return gw
+
+    @staticmethod
+    def _msg(text):
+        return [{"role": "user", "content": text}]
+
+    def test_complete_and_metrics(self):
+        gw = self._gateway()
+        result = gw.complete(self._msg("hello"), "m", provider="stub")
+        self.assertEqual(result["content"], "echo: hello")
+        self.assertEqual(result["source"], "stub")
+        stats = gw.metrics()["providers"]["stub"]
+        self.assertEqual(stats["requests"], 1)
+        self.assertEqual(stats["prompt_tokens"], 7)
+        self.assertEqual(stats["completion_tokens"], 3)
+        self.assertIn("p50", stats["latency_ms"])
+
+    def test_memory_and_sqlite_cache(self):
+        gw = self._gateway(cache_db=self.db)
+        gw.complete(self._msg("cached"), "m", provider="stub")
+        self.assertEqual(gw.complete(self._msg("cached"), "m", provider="stub")["source"], "cache")
+        self.assertEqual(self.server.requests, 1)
+
+        fresh = self._gateway(cache_db=self.db)
+        fresh._memory.clear()
+        self.assertEqual(fresh.complete(self._msg("cached"), "m", provider="stub")["content"], "echo: cached")
+        self.assertEqual(fresh.metrics()["providers"]["stub"]["sqlite_hits"], 1)
+        self.assertEqual(self.server.requests, 1)
+
+        gw.complete(self._msg("cached"), "m", provider="stub", use_cache=False)
+        self.assertEqual(self.server.requests, 2)
+
+    def test_coalesces_identical_in_flight_prompts(self):
+        self.server.delay = 0.2
+        gw = self._gateway()
+
+        async def run():
+            return await asyncio.gather(*(gw.acomplete(self._msg("same"), "m", provider="stub") for _ in range(5)))
+
+        results = asyncio.run(run())
+        self.assertEqual({r["content"] for r in results}, {"echo: same"})
+        self.assertEqual(self.server.requests, 1)
+        self.assertEqual(sorted(r["source"] for r in results), ["coalesced"] * 4 + ["stub"])
+
+    def test_per_provider_concurrency_limit(self):
+        self.server.delay = 0.1
+        gw = self._gateway(max_concurrency=2)
+
+        async def run():
+            await asyncio.gather(*(gw.acomplete(self._msg(f"p{i}"), "m", provider="stub") for i in range(6)))
+
+        asyncio.run(run())
+        self.assertEqual(self.server.requests, 6)
+        self.assertLessEqual(self.server.max_active, 2)
+
+    def test_response_format_passed_through(self):
+        gw = self._gateway()
+        gw.complete(self._msg("json"), "m", provider="stub")
+        self.assertNotIn("response_format", self.server.last_body)
+        gw.complete(self._msg("json"), "m", provider="stub", response_format={"type": "json_object"})
+        self.assertEqual(self.server.last_body["response_format"], {"type": "json_object"})
+        self.assertEqual(self.server.requests, 2)  # different response_format, different cache key
+
+    def test_errors_raise(self):
+        self.server.fail = True
+        gw = self._gateway()
+        with self.assertRaises(LLMGatewayError):
+            gw.complete(self._msg("boom"), "m", provider="stub")
+        with self.assertRaises(LLMGatewayError):
+            gw.complete(self._msg("x"), "m", provider="missing")
+        self.assertEqual(gw.metrics()["providers"]["stub"]["errors"], 1)
+
+
+@unittest.skipUnless(importlib.util.find_spec("langgraph"), "langgraph not installed")
+class TestAlphaPipelineFanOut(unittest.TestCase):
+
+    def test_fan_out_nodes_overlap(self):
+        from backend.app.graph import nodes, pipeline
+
+        async def slow_llm(prompt, role="quick", **kwargs):
+            await asyncio.sleep(0.3)
+            return {"content": "", "source": "stub"}
+
+        with mock.patch.object(nodes, "acall_openrouter", slow_llm), \
+                mock.patch.object(nodes, "_macro_inputs", lambda errors: ("cot", "fed", 20.0)), \
+                mock.patch.object(nodes, "_regime_inputs", lambda errors: ("gex", 20.0)), \
+                mock.patch.object(nodes, "_flow_inputs", lambda symbol, errors: {
+                    "dp_summary": "", "axlfi_summary": "", "spot_price": None, "sv_pct": None,
+                    "call_wall": None, "put_wall": None, "above_call": None}), \
+                mock.patch.object(pipeline, "gate_node", lambda state: {"errors": [], "node_timings": {}}):
+            pipeline._graph = None
+            try:
+                start = time.monotonic()
+                state = pipeline.run_alpha_pipeline("SPY")
+                elapsed = time.monotonic() - start
+            finally:
+                pipeline._graph = None
+
+        # macro/flow/regime in parallel (0.3s) + synthesis (0.3s); sequential would be 1.2s
+        self.assertLess(elapsed, 0.9)
+        self.assertEqual(set(state["node_timings"]), {"macro", "flow", "regime", "synthesis"})
+
+
+if __name__ == '__main__':
+    unittest.main()
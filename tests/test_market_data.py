@@ -0,0 +1,101 @@
+"""
+Tests for the shared MarketDataBus (caching, coalescing, batching).
+"""
+
+import threading
+import time
+import unittest
+
+import pandas as pd
+
+from live_monitoring.core.market_data import MarketDataBus
+
+
+class _FakeFastInfo:
+    def __init__(self, price):
+        self.last_price = price
+
+
+class _FakeTicker:
+    def __init__(self, symbol, counter, delay=0.0):
+        self.symbol = symbol
+        self.counter = counter
+        self.delay = delay
+        self.fast_info = _FakeFastInfo(100.0)
+        self.options = ('2026-01-16', '2026-01-23')
+
+    def history(self, **kwargs):
+        self.counter['history'] += 1
+        time.sleep(self.delay)
+        return pd.DataFrame({'Close': [99.0, 101.5]})
+
+    def option_chain(self, expiration):
+        self.counter['chain'] += 1
+        return ('calls', 'puts', expiration)
+
+
+class TestMarketDataBus(unittest.TestCase):
+
+    def setUp(self):
+        self.counter = {'history': 0, 'chain': 0, 'download': 0}
+
+    def _bus(self, delay=0.0, **kwargs):
+        return MarketDataBus(ticker_factory=lambda s: _FakeTicker(s, self.counter, delay), **kwargs)
+
+    def test_history_is_cached(self):
+        bus = self._bus()
+        self.assertEqual(bus.get_last_close('spy', period='1d', interval='1m'), 101.5)
+        self.assertEqual(bus.get_last_close('SPY', period='1d', interval='1m'), 101.5)
+        self.assertEqual(self.counter['history'], 1)
+        self.assertEqual(bus.get_stats()['hits'], 1)
+
+    def test_concurrent_requests_are_coalesced(self):
+        bus = self._bus(delay=0.2)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(bus.get_last_close('SPY', '1d', '1m')))
+                   for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(results, [101.5] * 8)
+        self.assertEqual(self.counter['history'], 1)
+        self.assertEqual(bus.get_stats()['coalesced'], 7)
+
+    def test_ttl_expiry_refetches(self):
+        bus = self._bus()
+        bus.get_history('SPY', period='1d', interval='1m', ttl=0)
+        bus.get_history('SPY', period='1d', interval='1m', ttl=0)
+        self.assertEqual(self.counter['history'], 2)
+
+    def test_option_chain_cached_per_expiration(self):
+        bus = self._bus()
+        for exp in bus.get_options('SPY'):
+            bus.get_option_chain('SPY', exp)
+            bus.get_option_chain('SPY', exp)
+        self.assertEqual(self.counter['chain'], 2)
+
+    def test_batched_download_fills_cache(self):
+        def fake_download(symbols, **kwargs):
+            self.counter['download'] += 1
+            # Shares get_history()'s cache key, so it must match Ticker.history() (adjusted)
+            self.assertTrue(kwargs.get('auto_adjust'))
+            frames = {s: pd.DataFrame({'Close': [1.0, 2.0 + i]}) for i, s in enumerate(symbols)}
+            return pd.concat(frames, axis=1)
+
+        bus = self._bus(download_fn=fake_download)
+        prices = bus.get_prices(['SPY', 'QQQ'])
+        self.assertEqual(prices, {'SPY': 2.0, 'QQQ': 3.0})
+        bus.get_prices(['SPY', 'QQQ'])
+        self.assertEqual(self.counter['download'], 1)
+        self.assertEqual(self.counter['history'], 0)
+
+    def test_lru_bound(self):
+        bus = self._bus(max_entries=2)
+        for sym in ('A', 'B', 'C'):
+            bus.get_history(sym, period='1d', interval='1m')
+        self.assertEqual(bus.get_stats()['entries'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
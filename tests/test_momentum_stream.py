@@ -0,0 +1,130 @@
+"""
+Tests for the streaming selloff/rally detector state.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent / 'live_monitoring' / 'core'))
+sys.path.append(str(Path(__file__).parent.parent / 'core'))
+
+from momentum_stream import MomentumStream
+
+
+def _reference(minute_bars):
+    """The detectors' original from-scratch computation."""
+    closes = minute_bars["Close"]
+    volumes = minute_bars["Volume"]
+    day_open = float(minute_bars["Open"].iloc[0])
+    current_close = float(closes.iloc[-1])
+    recent_closes = closes.tail(30) if len(minute_bars) > 30 else closes
+    recent_volumes = volumes.tail(30) if len(minute_bars) > 30 else volumes
+
+    red = green = 0
+    for i in range(len(recent_closes) - 1, max(0, len(recent_closes) - 10), -1):
+        if recent_closes.iloc[i] < recent_closes.iloc[i - 1]:
+            red += 1
+        else:
+            break
+    for i in range(len(recent_closes) - 1, max(0, len(recent_closes) - 10), -1):
+        if recent_closes.iloc[i] > recent_closes.iloc[i - 1]:
+            green += 1
+        else:
+            break
+
+    window = recent_closes.tail(min(10, len(recent_closes)))
+    start_price, end_price = float(window.iloc[0]), float(window.iloc[-1])
+    return {
+        'pct_from_open': (current_close - day_open) / day_open,
+        'consecutive_red': red,
+        'consecutive_green': green,
+        'rolling_change': (end_price - start_price) / start_price,
+        'avg_volume': float(recent_volumes.iloc[:-1].mean()),
+        'last_volume': float(recent_volumes.iloc[-1]),
+    }
+
+
+def _session(n=240, seed=3):
+    rng = np.random.default_rng(seed)
+    closes = 600 + np.cumsum(rng.choice([-0.3, -0.1, 0.0, 0.1, 0.3], size=n))
+    opens = np.concatenate([[600.0], closes[:-1]])
+    volumes = rng.integers(50_000, 400_000, size=n).astype(float)
+    volumes[rng.integers(0, n, size=5)] = np.nan
+    index = pd.date_range("2026-03-02 09:30", periods=n, freq="min")
+    return pd.DataFrame({"Open": opens, "Close": closes, "Volume": volumes}, index=index)
+
+
+class TestMomentumStream(unittest.TestCase):
+
+    def _assert_matches(self, features, frame):
+        ref = _reference(frame)
+        for name, expected in ref.items():
+            actual = getattr(features, name)
+            if np.isnan(expected):
+                self.assertTrue(np.isnan(actual), name)
+            else:
+                self.assertEqual(actual, expected, f"{name} at bar {len(frame)}")
+
+    def test_push_matches_full_recompute(self):
+        bars = _session()
+        stream = MomentumStream()
+        for i, (key, row) in enumerate(bars.iterrows()):
+            stream.push(row["Open"], row["Close"], row["Volume"], key=key)
+            features = stream.features()
+            if i + 1 < 5:
+                self.assertIsNone(features)
+            else:
+                self._assert_matches(features, bars.iloc[:i + 1])
+
+    def test_sync_ingests_new_bars_and_replaces_forming_bar(self):
+        bars = _session(seed=8)
+        stream = MomentumStream()
+        for end in range(5, len(bars), 7):
+            frame = bars.iloc[:end].copy()
+            # the live feed's last minute is still forming: first a partial print, then the final one
+            partial = frame.copy()
+            partial.iloc[-1, partial.columns.get_loc("Close")] += 0.5
+            partial.iloc[-1, partial.columns.get_loc("Volume")] = 1.0
+            stream.sync(partial)
+            self._assert_matches(stream.sync(frame), frame)
+            self.assertEqual(stream.count, end)
+
+    def test_sync_rebuilds_on_new_session(self):
+        stream = MomentumStream()
+        stream.sync(_session(seed=1))
+        other = _session(n=60, seed=2)
+        other.index = other.index + pd.Timedelta(days=1)
+        self._assert_matches(stream.sync(other), other)
+        self.assertEqual(stream.count, 60)
+
+
+class TestSignalGeneratorStreaming(unittest.TestCase):
+
+    def test_streamed_features_give_same_signals(self):
+        from signal_generator import SignalGenerator
+
+        generator = SignalGenerator(use_lottery_mode=False, use_narrative=False, api_key=None)
+        bars = _session(n=120, seed=5)
+        stream = MomentumStream()
+        fired = 0
+        for i, (key, row) in enumerate(bars.iterrows()):
+            stream.push(row["Open"], row["Close"], row["Volume"], key=key)
+            frame = bars.iloc[:i + 1]
+            price = float(row["Close"])
+            for detect in (generator._detect_realtime_selloff, generator._detect_realtime_rally):
+                live = detect("SPY", price, frame)
+                streamed = detect("SPY", price, None, features=stream.features())
+                self.assertEqual(live is None, streamed is None)
+                if live is not None:
+                    fired += 1
+                    self.assertEqual(live.rationale, streamed.rationale)
+                    self.assertEqual(live.confidence, streamed.confidence)
+        self.assertGreater(fired, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Tests for vectorized options-chain analytics (max pain, GEX, flip, walls).
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from live_monitoring.core.options_analytics import (
+    ChainArrays, max_pain, option_pain, gex_by_strike,
+    gamma_flip_crossing, gamma_flip_nearest, gamma_walls,
+)
+
+
+def _brute_force_pain(calls, puts, settlement):
+    pain = 0.0
+    for k, oi in zip(calls['strike'], calls['openInterest']):
+        if oi > 0 and settlement > k:
+            pain += (settlement - k) * oi
+    for k, oi in zip(puts['strike'], puts['openInterest']):
+        if oi > 0 and settlement < k:
+            pain += (k - settlement) * oi
+    return pain
+
+
+class TestOptionsAnalytics(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        n = 200
+        self.calls = pd.DataFrame({
+            'strike': np.round(rng.uniform(400, 600, n)),
+            'openInterest': rng.integers(0, 5000, n).astype(float),
+            'gamma': rng.uniform(0, 0.05, n),
+        })
+        self.puts = pd.DataFrame({
+            'strike': np.round(rng.uniform(400, 600, n)),
+            'openInterest': rng.integers(0, 5000, n).astype(float),
+            'gamma': rng.uniform(0, 0.05, n),
+        })
+        self.chain = ChainArrays.from_frames(self.calls, self.puts)
+
+    def test_option_pain_matches_brute_force(self):
+        settlements = np.unique(self.chain.strike)
+        pain = option_pain(self.chain, settlements)
+        for s, p in zip(settlements[::17], pain[::17]):
+            self.assertAlmostEqual(p, _brute_force_pain(self.calls, self.puts, s), places=4)
+
+    def test_max_pain_is_argmin_within_band(self):
+        spot = 500.0
+        strikes = np.unique(self.chain.strike)
+        band = strikes[(strikes >= spot * 0.9) & (strikes <= spot * 1.1)]
+        expected = band[int(np.argmin([_brute_force_pain(self.calls, self.puts, s) for s in band]))]
+        self.assertEqual(max_pain(self.chain, spot=spot), expected)
+
+    def test_nan_open_interest_ignored(self):
+        calls = pd.DataFrame({'strike': [100.0, 105.0], 'openInterest': [np.nan, 10.0]})
+        puts = pd.DataFrame({'strike': [95.0], 'openInterest': [-3.0]})
+        chain = ChainArrays.from_frames(calls, puts)
+        self.assertEqual(chain.open_interest.tolist(), [0.0, 10.0, 0.0])
+
+    def test_gex_by_strike_aggregates_across_expirations(self):
+        doubled = ChainArrays.concat([self.chain, self.chain])
+        strikes, gex, oi = gex_by_strike(self.chain)
+        strikes2, gex2, oi2 = gex_by_strike(doubled)
+        np.testing.assert_array_equal(strikes, strikes2)
+        np.testing.assert_allclose(gex2, gex * 2)
+        np.testing.assert_allclose(oi2, oi * 2)
+
+    def test_gamma_flip_and_walls(self):
+        strikes = np.array([90.0, 95.0, 100.0, 105.0, 110.0])
+        gex = np.array([-50.0, -10.0, 30.0, 40.0, -5.0])
+        self.assertEqual(gamma_flip_crossing(strikes, gex, spot=102.0), 105.0)
+        self.assertIsNone(gamma_flip_crossing(strikes, gex, spot=102.0, max_distance_pct=1.0))
+        self.assertEqual(gamma_flip_nearest(strikes, gex, spot=96.0), 95.0)
+
+        walls, negatives = gamma_walls(strikes, gex, top_n=2, bottom_n=2)
+        self.assertEqual(strikes[walls].tolist(), [105.0, 100.0])
+        self.assertEqual(strikes[negatives].tolist(), [90.0, 95.0])
+
+    def test_from_cboe_parses_occ_symbols(self):
+        chain = ChainArrays.from_cboe([
+            {'option': 'SPY260116C00500000', 'delta': 0.5, 'gamma': 0.01, 'open_interest': 100},
+            {'option': 'SPY260116P00495500', 'delta': -0.4, 'gamma': 0.02, 'open_interest': 50},
+            {'option': 'bad'},
+        ])
+        self.assertEqual(chain.strike.tolist(), [500.0, 495.5])
+        self.assertEqual(chain.is_call.tolist(), [True, False])
+
+
+if __name__ == '__main__':
+    unittest.main()
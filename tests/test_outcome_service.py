@@ -0,0 +1,117 @@
+"""
+Tests for the shared outcome-tracking service.
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from live_monitoring.agents.dp_learning.database import DPDatabase
+from live_monitoring.agents.dp_learning.models import DPInteraction, LevelType
+from live_monitoring.agents.dp_learning.tracker import OutcomeTracker
+from live_monitoring.core.outcome_service import OutcomeService, PriceWindow
+from live_monitoring.orchestrator.signal_outcome_tracker import SignalOutcomeTracker
+
+
+class _FakeBus:
+    """MarketDataBus stand-in: records batched downloads, serves fixed prices."""
+
+    def __init__(self, prices):
+        self.prices = prices
+        self.downloads = []
+
+    def download(self, symbols, period='1d', interval='1m'):
+        self.downloads.append(list(symbols))
+        return list(symbols)
+
+    def get_last_close(self, symbol, period='1d', interval='1m'):
+        return self.prices.get(symbol)
+
+
+class TestOutcomeService(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _dp_tracker(self, service):
+        db = DPDatabase(db_path=os.path.join(self.tmp, "dp.db"))
+        tracker = OutcomeTracker(db, service=service)
+        start = datetime.now() - timedelta(minutes=6)
+        for i in range(60):
+            symbol = ("SPY", "QQQ", "IWM")[i % 3]
+            interaction = DPInteraction(symbol=symbol, level_price=100.0, level_type=LevelType.SUPPORT,
+                                        approach_price=100.1)
+            interaction_id = db.save_interaction(interaction)
+            tracker.track_interaction(interaction, interaction_id)
+            tracker.tracking_jobs[interaction_id]['start_time'] = start
+        return db, tracker
+
+    def test_one_batch_per_distinct_symbol(self):
+        bus = _FakeBus({"SPY": 100.05, "QQQ": 100.05, "IWM": 100.05})
+        service = OutcomeService(bus=bus)
+        db, tracker = self._dp_tracker(service)
+        service.register("dp", tracker._tracked_symbols, tracker._check_all_jobs, interval=30)
+
+        self.assertEqual(service.poll_once(now=0), 1)
+        self.assertEqual(bus.downloads, [["IWM", "QQQ", "SPY"]])   # 60 jobs -> 1 batch of 3 symbols
+        self.assertEqual(service.poll_once(now=10), 0)             # not due yet
+
+        db.store.flush()
+        rows = db.store.query("SELECT COUNT(*) FROM dp_interactions WHERE price_at_5min = 100.05")
+        self.assertEqual(rows[0][0], 60)                           # checkpoints persisted
+        self.assertEqual(len(tracker.tracking_jobs), 60)           # still developing
+
+    def test_jobs_resolve_from_shared_prices(self):
+        bus = _FakeBus({})
+        db, tracker = self._dp_tracker(OutcomeService(bus=bus))
+        outcomes = []
+        tracker.on_outcome = lambda interaction_id, outcome: outcomes.append(outcome.outcome.value)
+
+        tracker._check_all_jobs({"SPY": 99.5, "QQQ": 100.5, "IWM": 100.05})
+        self.assertEqual(outcomes.count("BREAK"), 20)    # SPY breached and confirmed below
+        self.assertEqual(outcomes.count("BOUNCE"), 20)   # QQQ held and moved 0.5% away
+        self.assertEqual(len(tracker.tracking_jobs), 20)
+        job = next(iter(tracker.tracking_jobs.values()))
+        self.assertEqual((job['min_price'], job['max_price']), (100.05, 100.1))
+
+    def test_price_window_is_bounded(self):
+        window = PriceWindow(10.0, size=5)
+        for p in [11.0, 9.0, 12.0] + [10.5] * 20:
+            window.add(p)
+        self.assertEqual(len(window.recent), 5)
+        self.assertEqual((window.min, window.max, window.last, window.count), (9.0, 12.0, 10.5, 24))
+
+    def test_signal_tracker_batches_writes(self):
+        db_path = os.path.join(self.tmp, "signals.db")
+        tracker = SignalOutcomeTracker(db_path=db_path)
+        for i in range(10):
+            tracker.record_entry(f"s{i}", "SPY" if i % 2 else "QQQ", "LONG", 100.0)
+        conn = sqlite3.connect(db_path)
+        past = (datetime.now() - timedelta(minutes=5)).isoformat()
+        conn.execute("UPDATE signal_outcomes SET entry_time = ?", (past,))
+        conn.commit()
+        conn.close()
+
+        bus = _FakeBus({"SPY": 100.5, "QQQ": 99.9})
+        service = OutcomeService(bus=bus)
+        service.register("signals", tracker._pending_symbols, tracker.check_outcomes, interval=300)
+        service.poll_once(now=0)
+        self.assertEqual(bus.downloads, [["QQQ", "SPY"]])
+
+        conn = sqlite3.connect(db_path)
+        rows = dict(conn.execute("SELECT outcome, COUNT(*) FROM signal_outcomes GROUP BY outcome").fetchall())
+        snap = conn.execute("SELECT price_5min, max_adverse FROM signal_outcomes WHERE symbol = 'QQQ'").fetchone()
+        conn.close()
+        self.assertEqual(rows, {"WIN": 5, "PENDING": 5})
+        self.assertEqual(snap[0], 99.9)
+        self.assertAlmostEqual(snap[1], -0.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,185 @@
+"""
+Tests for the multi-day ParallelReplayRunner.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from functools import partial
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from backtesting.engine import parallel_runner, registry as registry_module
+from backtesting.engine.parallel_runner import ParallelReplayRunner
+from backtesting.engine.replayer import SessionReplayer
+from backtesting.simulation.base_detector import Signal, TradeResult
+from live_monitoring.core import signal_generator as signal_generator_module
+
+DATES = ["2026-03-02", "2026-03-03", "2026-03-04", "2026-03-05"]
+
+
+def _bars(symbol, date_str, interval="1m"):
+    seed = sum(map(ord, symbol + date_str))
+    rng = np.random.default_rng(seed)
+    close = 100.0 + np.cumsum(rng.normal(0, 0.1, 120))
+    idx = pd.date_range(f"{date_str} 09:30", periods=len(close), freq="1min")
+    return pd.DataFrame({"Open": close, "High": close + 0.05, "Low": close - 0.05,
+                         "Close": close, "Volume": 100_000}, index=idx)
+
+
+class _Detector:
+    """Signals every `step` bars; each trade exits `hold` bars later."""
+
+    def __init__(self, step, hold):
+        self.step, self.hold = step, hold
+
+    def detect_signals(self, symbol, data):
+        return [Signal(symbol=symbol, timestamp=ts, signal_type="TEST", direction="LONG",
+                       entry_price=float(data["Close"].iloc[i]), stop_price=0.0, target_price=0.0,
+                       confidence=50.0, reasoning="")
+                for i, ts in enumerate(data.index[:-self.hold]) if i % self.step == 0]
+
+    def simulate_trades(self, signals, data, idxs):
+        close = data["Close"].to_numpy()
+        trades = []
+        for signal, i in zip(signals, idxs):
+            exit_price = float(close[i + self.hold])
+            pnl = (exit_price - signal.entry_price) / signal.entry_price * 100
+            trades.append(TradeResult(signal=signal, exit_price=exit_price, exit_time=None, pnl_pct=pnl,
+                                      outcome="WIN" if pnl > 0 else "LOSS", bars_held=self.hold,
+                                      max_favorable=0.0, max_adverse=0.0))
+        return trades
+
+
+class _Registry:
+    def __init__(self):
+        self._detectors = {}
+
+    def load_all(self):
+        self._detectors = {"fast": _Detector(7, 5), "slow": _Detector(20, 30)}
+
+    def get_all(self):
+        return dict(self._detectors, ghost=None)  # listed but failed to build
+
+    def get(self, name):
+        return self._detectors.get(name)
+
+    def print_status(self):
+        pass
+
+
+class _SignalGenerator:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def _apply_holistic_kill_shots(self, symbol, price, inst_context, signals):
+        return signals
+
+
+def _replayer(symbols=("SPY", "QQQ")):
+    registry = _Registry()
+    registry.load_all()
+    context = {"dp_snap": {}, "narrative": {}, "market_ctx": {"direction": "UP", "vix": 15.0}}
+    return SimpleNamespace(
+        symbols=list(symbols),
+        market_provider=SimpleNamespace(get_historical_bars=_bars),
+        load_session_context=lambda date_str: context,
+        registry=registry,
+        signal_generator=_SignalGenerator(),
+        _compile_daily_results=partial(SessionReplayer._compile_daily_results, None),
+    )
+
+
+class TestParallelReplayRunner(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.src = os.path.join(self.tmp, "src")
+        os.makedirs(self.src)
+        with open(os.path.join(self.src, "detector.py"), "w") as f:
+            f.write("VERSION = 1\n")
+        # Worker processes fork from here, so they build the fake registry too
+        self.patches = [
+            mock.patch.object(registry_module, "DetectorRegistry", _Registry),
+            mock.patch.object(signal_generator_module, "SignalGenerator", _SignalGenerator),
+            mock.patch.object(parallel_runner, "_VERSIONED_PATHS", [self.src]),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+        shutil.rmtree(self.tmp)
+
+    def _runner(self, workers, use_cache=True):
+        cache_dir = os.path.join(self.tmp, "cache")
+        return ParallelReplayRunner(_replayer(), workers=workers, io_workers=2,
+                                    cache_dir=cache_dir, use_cache=use_cache)
+
+    def test_parallel_matches_serial(self):
+        serial = self._runner(workers=1, use_cache=False)
+        parallel = self._runner(workers=2, use_cache=False)
+        expected = serial.run(DATES)
+        self.assertEqual(parallel.run(DATES), expected)
+        self.assertEqual([r["date"] for r in expected], DATES)
+        self.assertTrue(any(r["total_trades"] for r in expected))
+        self.assertEqual(parallel.stats["units"], len(DATES) * 2 * 3)
+        self.assertEqual(parallel.wallet.total_donated_usd, serial.wallet.total_donated_usd)
+
+    def test_cache_hit_and_invalidation(self):
+        first = self._runner(workers=1)
+        fresh = first.run(DATES[:2])
+        self.assertEqual(first.stats["cached_days"], 0)
+
+        second = self._runner(workers=1)
+        results = second.run(DATES)
+        self.assertEqual(second.stats["cached_days"], 2)
+        self.assertEqual(second.stats["replayed_days"], 2)
+        self.assertEqual(results[:2], fresh)
+        self.assertEqual(results, self._runner(workers=1, use_cache=False).run(DATES))
+
+        with open(os.path.join(self.src, "detector.py"), "w") as f:
+            f.write("VERSION = 2\n")
+        edited = self._runner(workers=1)
+        edited.run(DATES)
+        self.assertEqual(edited.stats["cached_days"], 0)
+
+    def test_cached_days_reach_wallet(self):
+        uncached = self._runner(workers=1, use_cache=False)
+        uncached.run(DATES)
+        self._runner(workers=1).run(DATES[::2])
+
+        partly_cached = self._runner(workers=1)
+        partly_cached.run(DATES)
+        self.assertEqual(partly_cached.stats["cached_days"], 2)
+        self.assertGreater(uncached.wallet.total_donated_usd, 0)
+        self.assertAlmostEqual(partly_cached.wallet.total_donated_usd, uncached.wallet.total_donated_usd)
+
+    def test_in_process_fallback_skips_missing_detectors(self):
+        runner = self._runner(workers=1, use_cache=False)
+        with mock.patch.object(parallel_runner, "evaluate_detector",
+                               wraps=parallel_runner.evaluate_detector) as evaluate:
+            runner.run(DATES[:1])
+        names = {call.args[0] for call in evaluate.call_args_list}
+        self.assertEqual(names, {"fast", "slow"})
+
+    def test_failed_bar_fetch_drops_only_that_pair(self):
+        def flaky(symbol, date_str, interval="1m"):
+            if (symbol, date_str) == ("QQQ", DATES[1]):
+                raise ConnectionError("yfinance timeout")
+            return _bars(symbol, date_str, interval)
+
+        runner = self._runner(workers=1, use_cache=False)
+        runner.replayer.market_provider = SimpleNamespace(get_historical_bars=flaky)
+        results = runner.run(DATES[:2])
+        self.assertEqual([r["date"] for r in results], DATES[:2])
+        self.assertEqual(runner.stats["units"], (2 * 2 - 1) * 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
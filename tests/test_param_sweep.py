@@ -0,0 +1,90 @@
+"""
+Tests for the vectorized TradingParams sweep.
+"""
+
+import random
+import unittest
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from backtesting.analysis.performance import PerformanceAnalyzer
+from backtesting.config.trading_params import TradingParams
+from backtesting.data.loader import DPAlert
+from backtesting.simulation.current_system import CurrentSystemSimulator
+from backtesting.simulation.narrative_brain import NarrativeBrainSimulator
+from backtesting.simulation.param_sweep import ParamSweep, pareto_frontier
+from backtesting.simulation.trade_simulator import TradeSimulator
+
+
+def _alerts(n=300, seed=11):
+    rng = random.Random(seed)
+    ts = datetime(2026, 3, 2, 9, 30)
+    alerts = []
+    for _ in range(n):
+        ts += timedelta(seconds=rng.randint(5, 400))
+        alerts.append(DPAlert(
+            timestamp=ts, symbol='SPY', level_price=500.0, level_volume=1_000_000,
+            level_type=rng.choice(['SUPPORT', 'RESISTANCE']),
+            outcome=rng.choice(['BOUNCE', 'BOUNCE', 'BREAK', 'FADE']),
+            max_move_pct=rng.uniform(0, 1), confluence_score=rng.choice(range(50, 95, 5)),
+            volume_vs_avg=1.0, touch_count=1, momentum_pct=0.0, market_trend='UP',
+        ))
+    return alerts
+
+
+GRID = {
+    'stop_loss_pct': [0.15, 0.25],
+    'take_profit_pct': [0.30, 0.50],
+    'narrative_min_confluence': [60, 70],
+    'narrative_min_alerts': [2, 3],
+}
+
+
+class TestParamSweep(unittest.TestCase):
+
+    def setUp(self):
+        self.alerts = _alerts()
+
+    def _assert_matches(self, system, simulator_cls):
+        results = ParamSweep(self.alerts, system=system).run(GRID).results
+        self.assertEqual(len(results), 16)
+        for row in results.itertuples():
+            params = TradingParams(
+                stop_loss_pct=row.stop_loss_pct, take_profit_pct=row.take_profit_pct,
+                narrative_min_confluence=row.narrative_min_confluence,
+                narrative_min_alerts=int(row.narrative_min_alerts),
+            )
+            metrics = PerformanceAnalyzer.analyze(
+                simulator_cls(TradeSimulator(params), params).simulate(self.alerts)
+            )
+            self.assertEqual(row.trades, metrics.total_trades)
+            self.assertEqual(row.wins, metrics.winning_trades)
+            self.assertAlmostEqual(row.total_pnl, metrics.total_pnl)
+            self.assertAlmostEqual(row.max_drawdown, metrics.max_drawdown)
+
+    def test_matches_narrative_brain_simulator(self):
+        self._assert_matches('narrative', NarrativeBrainSimulator)
+
+    def test_matches_current_system_simulator(self):
+        self._assert_matches('current', CurrentSystemSimulator)
+
+    def test_invalid_combos_dropped(self):
+        results = ParamSweep(self.alerts).run({'stop_loss_pct': [0.2, 0.5], 'take_profit_pct': [0.4]}).results
+        self.assertEqual(results['stop_loss_pct'].tolist(), [0.2])
+
+        with self.assertRaises(ValueError):
+            ParamSweep(self.alerts).run({'position_size_pct': [1.0]})
+
+    def test_pareto_frontier(self):
+        frame = pd.DataFrame({
+            'expectancy': [0.10, 0.05, 0.10, 0.02],
+            'win_rate': [50.0, 60.0, 50.0, 40.0],
+            'max_drawdown': [1.0, 1.0, 2.0, 3.0],
+        })
+        frontier = pareto_frontier(frame)
+        self.assertEqual(frontier.index.tolist(), [0, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+"""
+Tests for the concurrent, cursor-based Reddit universe scanner.
+"""
+
+import random
+import time
+import unittest
+from datetime import datetime, timedelta
+
+from live_monitoring.exploitation.reddit_exploiter import RedditExploiter
+from live_monitoring.exploitation.reddit_scanner import TokenBucket
+
+SUBREDDITS = ['wallstreetbets', 'stocks', 'investing', 'options']
+
+
+class _Resp:
+    status_code = 200
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+
+class _FakeSession:
+    """ChartExchange-style paginated mentions, newest first."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.feeds = {}
+        self.requests = 0
+        self.rng = random.Random(1)
+
+    def post(self, symbol, n, start=None):
+        """Add ``n`` newer mentions, two per second (the first shares the previous top second)."""
+        feed = self.feeds.setdefault(symbol, [])
+        if feed:
+            start = datetime.strptime(feed[0]['created'], '%Y-%m-%d %H:%M:%S')
+        else:
+            start = start or datetime.now().replace(microsecond=0) - timedelta(minutes=30)
+        for i in range(n):
+            feed.insert(0, {
+                'created': (start + timedelta(seconds=(i + 1) // 2)).strftime('%Y-%m-%d %H:%M:%S'),
+                'sentiment': round(self.rng.uniform(-1, 1), 3),
+                'subreddit': self.rng.choice(SUBREDDITS),
+                'link': f"{symbol}/{len(feed)}",
+            })
+
+    def get(self, url, params=None, timeout=None):
+        self.requests += 1
+        if self.delay:
+            time.sleep(self.delay)
+        symbol = url.rstrip('/').split('/')[-1]
+        feed = self.feeds.get(symbol, [])
+        return _Resp({'results': feed[:100], 'next': None})
+
+
+def _expected(feed, limit=100):
+    """Discovery metrics the old per-ticker loop computed from one page."""
+    page = feed[:limit]
+    sentiments = [m['sentiment'] for m in page]
+    return {
+        'mention_count': len(page),
+        'avg_sentiment': sum(sentiments) / len(page),
+        'bullish_pct': len([s for s in sentiments if s > 0.3]) / len(page) * 100,
+        'wsb_mentions': len([m for m in page if m['subreddit'] == 'wallstreetbets']),
+    }
+
+
+class TestRedditUniverseScanner(unittest.TestCase):
+
+    def setUp(self):
+        self.exploiter = RedditExploiter(api_key='test')
+        self.session = _FakeSession()
+        self.exploiter.session = self.session
+        self.scanner = self.exploiter.scanner
+
+    def _assert_matches(self, agg, feed):
+        expected = _expected(feed)
+        self.assertEqual(agg['mention_count'], expected['mention_count'])
+        self.assertEqual(agg['wsb_mentions'], expected['wsb_mentions'])
+        self.assertAlmostEqual(agg['avg_sentiment'], expected['avg_sentiment'], places=9)
+        self.assertAlmostEqual(agg['bullish_pct'], expected['bullish_pct'], places=9)
+
+    def test_incremental_scans_match_full_refetch(self):
+        self.session.post('TSLA', 60, start=datetime.now().replace(microsecond=0) - timedelta(hours=2))
+        agg = self.scanner.scan(['TSLA'])['TSLA']
+        self._assert_matches(agg, self.session.feeds['TSLA'])
+
+        for n in (5, 30, 80, 0):
+            self.session.post('TSLA', n)
+            agg = self.scanner.scan(['TSLA'])['TSLA']
+            self._assert_matches(agg, self.session.feeds['TSLA'])
+        self.assertEqual(self.scanner.last_scan['requests'], 1)
+
+    def test_ignores_mentions_at_or_below_high_water(self):
+        self.session.post('GME', 10)
+        self.scanner.scan(['GME'])
+        # Re-serving the same page must not double count
+        agg = self.scanner.scan(['GME'])['GME']
+        self.assertEqual(agg['mention_count'], 10)
+
+    def test_discover_hot_tickers_uses_store(self):
+        for symbol in ('TSLA', 'NVDA'):
+            self.session.post(symbol, 120)
+        hot = self.exploiter.discover_hot_tickers(max_tickers=len(self.exploiter.scan_universe))
+        found = {d.symbol: d for d in hot}
+        self.assertEqual(set(found), {'TSLA', 'NVDA'})  # HIGH VOLUME (>= 100 posts)
+        self.assertEqual(found['TSLA'].mention_count, 100)
+        self.assertAlmostEqual(found['TSLA'].avg_sentiment, _expected(self.session.feeds['TSLA'])['avg_sentiment'])
+
+    def test_universe_scan_is_concurrent(self):
+        self.session.delay = 0.05
+        universe = list(dict.fromkeys(self.exploiter.scan_universe))
+        for symbol in universe:
+            self.session.post(symbol, 3)
+        start = time.monotonic()
+        results = self.scanner.scan(universe)
+        elapsed = time.monotonic() - start
+        self.assertEqual(len(results), len(universe))
+        self.assertLess(elapsed, len(universe) * 0.05 / 3)
+
+    def test_token_bucket_caps_burst(self):
+        bucket = TokenBucket(rate_per_minute=60, capacity=5)
+        self.assertEqual(sum(bucket.try_acquire() for _ in range(10)), 5)
+        self.assertTrue(bucket.try_acquire(timeout=1.5))  # refills at 1 token/second
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+Tests for the vectorized ReplayEngine session replay.
+"""
+
+import unittest
+from dataclasses import asdict
+
+import numpy as np
+import pandas as pd
+
+from core.replay_engine import ReplayEngine
+
+
+def _levels():
+    return pd.DataFrame({
+        "level": [99.5, 100.0, 100.6, 99.5, 101.2, 90.0, 110.0],
+        "volume": [1_500_000, 800_000, 2_000_000, 300_000, 600_000, 100_000, 100_000],
+        "trades": [10, 8, 12, 3, 5, 1, 1],
+        "premium": [0, 0, 0, 0, 0, 0, 0],
+    })
+
+
+def _session(n=120, seed=7):
+    rng = np.random.default_rng(seed)
+    close = 100.0 + np.cumsum(rng.normal(0, 0.08, n))
+    idx = pd.date_range("2026-03-02 09:30", periods=n, freq="1min")
+    return pd.DataFrame({
+        "Open": close + rng.normal(0, 0.02, n),
+        "High": close + 0.05,
+        "Low": close - 0.05,
+        "Close": close,
+        "Volume": rng.integers(50_000, 400_000, n),
+    }, index=idx)
+
+
+def _per_bar(engine, df):
+    states = []
+    for i, (timestamp, bar) in enumerate(df.iterrows()):
+        start = max(0, i - engine.regime_window)
+        states.append(engine.process_cycle(timestamp, bar, df["Close"].iloc[start:i + 1],
+                                           df["Volume"].iloc[start:i + 1]))
+    return states
+
+
+class TestReplayBars(unittest.TestCase):
+
+    def test_matches_per_bar_replay(self):
+        df = _session()
+        expected = _per_bar(ReplayEngine(_levels()), df)
+        actual = ReplayEngine(_levels()).replay_bars(df)
+
+        self.assertEqual(len(actual), len(expected))
+        for want, got in zip(expected, actual):
+            want, got = asdict(want), asdict(got)
+            for key, value in want.items():
+                if isinstance(value, float):
+                    self.assertAlmostEqual(got[key], value, places=9, msg=key)
+                else:
+                    self.assertEqual(got[key], value, msg=key)
+
+    def test_nearest_levels_use_first_row_volume(self):
+        engine = ReplayEngine(_levels())
+        self.assertEqual(engine.find_nearest_dp_levels(99.8), (99.5, 100.0, 1_500_000, 800_000))
+        self.assertEqual(engine.find_nearest_dp_levels(100.0), (99.5, 100.6, 1_500_000, 2_000_000))
+        self.assertEqual(engine.find_nearest_dp_levels(98.0), (90.0, 99.5, 100_000, 1_500_000))
+        self.assertEqual(engine.find_nearest_dp_levels(85.0), (None, 90.0, None, 100_000))
+        self.assertEqual(engine.find_nearest_dp_levels(112.0), (110.0, None, 100_000, None))
+
+    def test_warmup_bars_have_no_regime(self):
+        states = ReplayEngine(_levels()).replay_bars(_session(n=10))
+        self.assertEqual([s.regime for s in states[:4]], ["INSUFFICIENT_DATA"] * 4)
+        self.assertNotEqual(states[4].regime, "INSUFFICIENT_DATA")
+
+    def test_empty_session(self):
+        self.assertEqual(ReplayEngine(_levels()).replay_bars(_session(n=0)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
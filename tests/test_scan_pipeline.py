@@ -0,0 +1,222 @@
+"""
+Tests for the rate-limited scan pipeline behind OpportunityScanner and SqueezeDetector.
+"""
+
+import threading
+import time
+import unittest
+from collections import Counter
+from types import SimpleNamespace
+
+from core.data.ultimate_chartexchange_client import UltimateChartExchangeClient
+from live_monitoring.exploitation.opportunity_scanner import OpportunityScanner
+from live_monitoring.exploitation.scan_pipeline import DailyMemo, RateLimited, ScanPipeline
+from live_monitoring.exploitation.squeeze_detector import SqueezeDetector
+
+
+class _FakeClient:
+    """ChartExchange-style client with per-call latency and call counting."""
+
+    def __init__(self, n=60, delay=0.0):
+        self.delay = delay
+        self.calls = Counter()
+        self._lock = threading.Lock()
+        self.rows = []
+        self.si = {}
+        self.levels = {}
+        for i in range(n):
+            symbol = f"T{i:02d}"
+            self.rows.append({'display': symbol,
+                              'reg_price': '0' if i % 9 == 0 else str(20 + i),
+                              'reg_volume': str((i % 7) * 6_000_000)})
+            self.si[symbol] = [{'short_interest': str((i * 7) % 40)}]
+            self.levels[symbol] = [{'level': 20 + i}] * ((i * 13) % 260)
+
+    def _hit(self, name):
+        with self._lock:
+            self.calls[name] += 1
+        if self.delay:
+            time.sleep(self.delay)
+
+    def get_stock_screener(self, **kwargs):
+        return self.rows
+
+    def get_short_interest(self, symbol):
+        self._hit('si')
+        return self.si[symbol]
+
+    def get_dark_pool_levels(self, symbol, date=None):
+        self._hit('dp')
+        return self.levels[symbol]
+
+    def get_borrow_fee(self, symbol, date=None):
+        self._hit('borrow')
+        return SimpleNamespace(fee_rate=5.0, available_shares=1000)
+
+    def get_failure_to_deliver(self, symbol, start_date=None):
+        self._hit('ftd')
+        return [SimpleNamespace(quantity=q) for q in (4000, 1000, 1000)]
+
+    def get_dark_pool_summary(self, symbol, date=None):
+        self._hit('dp_summary')
+        return {'buy_volume': 70, 'sell_volume': 30}
+
+
+def _serial_scan(client, min_score, max_results=100):
+    """Reference: the old one-symbol-at-a-time scan_market."""
+    out = []
+    for row in client.rows:
+        symbol, score = row['display'], 0
+        si_pct = float(client.si[symbol][0]['short_interest'])
+        if si_pct > 15:
+            score += min((si_pct / 30) * 30, 30)
+        levels = client.levels[symbol]
+        if len(levels) > 50:
+            score += min((len(levels) / 200) * 25, 25)
+        volume = int(float(row['reg_volume']))
+        if volume > 10_000_000:
+            score += min((volume / 50_000_000) * 15, 15)
+        if float(row['reg_price']) > 0:
+            score += 5
+        if score >= 30 and score >= min_score:
+            out.append((symbol, round(score, 6)))
+    out.sort(key=lambda x: (-x[1], x[0]))
+    return out[:max_results]
+
+
+def _pipeline(**kwargs):
+    kwargs.setdefault('rate_per_minute', 100_000)
+    return ScanPipeline(memo=DailyMemo(), **kwargs)
+
+
+class TestOpportunityScanner(unittest.TestCase):
+
+    def _scan(self, scanner, min_score):
+        opps = scanner.scan_market(min_score=min_score, max_results=100)
+        return sorted(((o.symbol, round(o.score, 6)) for o in opps), key=lambda x: (-x[1], x[0]))
+
+    def test_matches_serial_scan(self):
+        client = _FakeClient()
+        for min_score in (30, 45, 60, 80):
+            scanner = OpportunityScanner(client, pipeline=_pipeline())
+            self.assertEqual(self._scan(scanner, min_score), _serial_scan(client, min_score), msg=min_score)
+
+    def test_short_circuits_hopeless_tickers(self):
+        client = _FakeClient()
+        OpportunityScanner(client, pipeline=_pipeline()).scan_market(min_score=60)
+        # Tickers with no price and no volume can't reach 60 even with full SI + DP
+        self.assertLess(client.calls['si'], len(client.rows))
+        # DP is skipped whenever SI leaves it unable to reach min_score
+        self.assertLess(client.calls['dp'], client.calls['si'])
+
+    def test_short_interest_memoized_per_day(self):
+        client = _FakeClient()
+        day = ['2026-03-02']
+        scanner = OpportunityScanner(client, pipeline=ScanPipeline(rate_per_minute=100_000,
+                                                                   memo=DailyMemo(lambda: day[0])))
+        scanner.scan_market(min_score=30)
+        first = client.calls['si']
+        scanner.scan_market(min_score=30)
+        self.assertEqual(client.calls['si'], first)
+        # Discovery only fetches the symbols the scan short-circuited
+        discovered = scanner.get_high_short_interest_stocks()
+        self.assertEqual(client.calls['si'], len(client.rows))
+        self.assertIn('T03', discovered)  # 21% SI
+
+        day[0] = '2026-03-03'
+        scanner.scan_market(min_score=30)
+        self.assertEqual(client.calls['si'], len(client.rows) + first)
+
+    def test_streams_concurrently(self):
+        client = _FakeClient(n=40, delay=0.05)
+        scanner = OpportunityScanner(client, pipeline=_pipeline(max_workers=8))
+        start = time.monotonic()
+        first_at = None
+        count = 0
+        for _ in scanner.iter_opportunities(min_score=30):
+            first_at = first_at or time.monotonic() - start
+            count += 1
+        elapsed = time.monotonic() - start
+        serial = (client.calls['si'] + client.calls['dp']) * 0.05
+        self.assertGreater(count, 0)
+        self.assertLess(elapsed, serial / 3)
+        self.assertLess(first_at, elapsed)
+
+    def test_time_budget_and_rate_budget(self):
+        client = _FakeClient(n=40, delay=0.02)
+        scanner = OpportunityScanner(client, pipeline=_pipeline(max_workers=2))
+        scanner.scan_market(min_score=30, time_budget=0.05)
+        self.assertGreater(scanner.pipeline.stats['skipped'], 0)
+
+        starved = OpportunityScanner(client, pipeline=ScanPipeline(rate_per_minute=1, acquire_timeout=0,
+                                                                   memo=DailyMemo()))
+        self.assertEqual(starved.scan_market(min_score=30), [])
+        self.assertGreater(starved.pipeline.stats['rate_limited'], 0)
+
+    def test_rate_limited_tickers_skipped_not_underscored(self):
+        client = _FakeClient()
+        pipeline = ScanPipeline(rate_per_minute=20, burst=10, acquire_timeout=0, memo=DailyMemo())
+        scanner = OpportunityScanner(client, pipeline=pipeline)
+        serial = dict(_serial_scan(client, 30))
+        scanned = self._scan(scanner, 30)
+        self.assertGreater(pipeline.stats['skipped'], 0)
+        for symbol, score in scanned:
+            self.assertEqual(score, serial[symbol], msg=symbol)
+
+
+class TestRateBudget(unittest.TestCase):
+
+    def test_bucket_holds_small_burst(self):
+        pipeline = ScanPipeline(rate_per_minute=250, max_workers=4, acquire_timeout=0, memo=DailyMemo())
+        self.assertEqual(pipeline.limiter.capacity, 4)
+        # Burst plus a minute of refill stays within the tier limit
+        self.assertLessEqual(pipeline.limiter.capacity + pipeline.limiter.rate * 60, 250)
+
+        lookup = lambda: 1
+        for _ in range(4):
+            pipeline.fetch(lookup)
+        with self.assertRaises(RateLimited):
+            pipeline.fetch(lookup)
+
+    def test_client_rate_window_is_thread_safe(self):
+        client = UltimateChartExchangeClient(api_key="test-key-0000", tier=3)
+        client.rate_limits[3] = 10_000
+        sessions = []
+
+        def worker():
+            sessions.append(client.session)
+            for _ in range(500):
+                client._wait_for_rate_limit()
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(client.request_times), 4000)
+        self.assertEqual(len({id(s) for s in sessions}), 8)
+
+
+class TestSqueezeDetector(unittest.TestCase):
+
+    def test_scan_watchlist_memoizes_daily_lookups(self):
+        client = _FakeClient(n=11)
+        detector = SqueezeDetector(client, pipeline=_pipeline())
+        symbols = [f"T{i:02d}" for i in range(1, 11)]  # all have DP levels
+
+        signals = detector.scan_watchlist(symbols + symbols[:3])
+        self.assertEqual([s.score for s in signals], sorted((s.score for s in signals), reverse=True))
+        self.assertEqual(len({s.symbol for s in signals}), len(signals))
+        self.assertTrue(signals)
+        self.assertEqual(client.calls['si'], 10)
+        self.assertEqual(client.calls['ftd'], 10)
+        # Current price reuses the fetched DP levels
+        self.assertEqual(client.calls['dp'], 10)
+
+        detector.scan_watchlist(symbols)
+        self.assertEqual((client.calls['si'], client.calls['ftd']), (10, 10))
+        self.assertEqual(client.calls['borrow'], 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+Tests for the concurrent /signals source aggregator.
+"""
+
+import threading
+import time
+import unittest
+from unittest import mock
+
+from backend.app.signals import aggregator
+from backend.app.signals.aggregator import SignalSnapshot, SourceResult, fan_out, get_snapshot, select_signals
+
+
+def _sig(symbol, type_="SELLOFF", master=False, source="LiveMonitor"):
+    return {"symbol": symbol, "type": type_, "is_master": master, "confidence": 80 if master else 50,
+            "action": "SHORT", "source": source}
+
+
+def _snapshot(**sources):
+    results = {"Regime": SourceResult(1, "ok", 1.0), "KillChain": SourceResult(None, "ok", 1.0),
+               "EconCalendar": SourceResult(None, "ok", 1.0), "MacroRegime": SourceResult(None, "ok", 1.0)}
+    for name in ("MonitorBuffer", "AlertDB", "DarkPoolTrend"):
+        results[name] = SourceResult(sources.get(name, []), "ok", 1.0)
+    return SignalSnapshot(dp_symbol="SPY", results=results)
+
+
+class TestFanOut(unittest.TestCase):
+
+    def test_sources_run_concurrently_under_one_deadline(self):
+        tasks = {f"s{i}": (lambda i=i: time.sleep(0.2) or [i], []) for i in range(4)}
+        start = time.monotonic()
+        results = fan_out(tasks, deadline=2.0)
+        self.assertLess(time.monotonic() - start, 0.6)
+        self.assertEqual([results[f"s{i}"].value for i in range(4)], [[0], [1], [2], [3]])
+        self.assertTrue(all(r.status == "ok" and r.latency_ms >= 150 for r in results.values()))
+
+    def test_slow_and_failing_sources_return_partial_results(self):
+        def boom():
+            raise RuntimeError("upstream down")
+
+        tasks = {
+            "fast": (lambda: ["ok"], []),
+            "slow": (lambda: time.sleep(1.0) or ["late"], []),
+            "broken": (boom, None),
+        }
+        start = time.monotonic()
+        results = fan_out(tasks, deadline=0.2)
+        self.assertLess(time.monotonic() - start, 0.6)
+        self.assertEqual(results["fast"].value, ["ok"])
+        self.assertEqual((results["slow"].status, results["slow"].value), ("timeout", []))
+        self.assertEqual(results["broken"].status, "error")
+        self.assertIsNone(results["broken"].value)
+        self.assertEqual(results["broken"].annotation()["error"], "upstream down")
+        self.assertEqual(results["slow"].annotation()["count"], 0)
+
+
+class TestSnapshotCoalescing(unittest.TestCase):
+
+    def setUp(self):
+        aggregator.clear_snapshots()
+
+    def tearDown(self):
+        aggregator.clear_snapshots()
+
+    def test_concurrent_callers_share_one_build(self):
+        calls = []
+
+        def slow_build(dp_symbol, monitor):
+            calls.append(dp_symbol)
+            time.sleep(0.2)
+            return _snapshot()
+
+        with mock.patch.object(aggregator, "_build_snapshot", side_effect=slow_build):
+            out = []
+            threads = [threading.Thread(target=lambda: out.append(get_snapshot("SPY"))) for _ in range(6)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            again = get_snapshot("SPY")
+
+        self.assertEqual(calls, ["SPY"])
+        self.assertEqual(len({id(s) for s in out}), 1)
+        self.assertIs(again, out[0])
+
+    def test_partial_snapshot_expires_sooner(self):
+        snap = _snapshot()
+        snap.results["AlertDB"] = SourceResult([], "timeout", 4000.0)
+        snap.created = time.time() - aggregator.PARTIAL_TTL - 1
+        with mock.patch.object(aggregator, "_build_snapshot", side_effect=[snap, _snapshot()]) as build:
+            get_snapshot("QQQ")
+            get_snapshot("QQQ")
+        self.assertEqual(build.call_count, 2)
+
+
+class TestSelectSignals(unittest.TestCase):
+
+    def test_filters_apply_after_the_shared_snapshot(self):
+        snap = _snapshot(
+            MonitorBuffer=[_sig("SPY"), _sig("QQQ", master=True), _sig("SPY", type_="RALLY", master=True)],
+            AlertDB=[_sig("SPY", master=True, source="AlertDB"), _sig("QQQ", source="AlertDB")],
+            DarkPoolTrend=[_sig("SPY", source="DarkPool")],
+        )
+        spy = select_signals(snap, symbol="SPY")
+        self.assertEqual(len(spy), 4)
+
+        masters = select_signals(snap, master_only=True)
+        self.assertEqual([s["source"] for s in masters], ["LiveMonitor", "LiveMonitor", "AlertDB", "DarkPool"])
+
+        rally = select_signals(snap, symbol="SPY", signal_type="RALLY")
+        self.assertEqual([s["type"] for s in rally], ["RALLY", "SELLOFF", "SELLOFF"])
+
+    def test_selected_signals_are_copies(self):
+        snap = _snapshot(MonitorBuffer=[_sig("SPY")])
+        select_signals(snap)[0]["confidence"] = 0
+        self.assertEqual(snap.source("MonitorBuffer")[0]["confidence"], 50)
+
+    def test_morning_brief_only_when_sources_are_dry(self):
+        snap = _snapshot()
+        with mock.patch.object(aggregator, "fetch_morning_brief_signals",
+                               return_value=[_sig("SPY", source="MorningBrief"), _sig("QQQ", source="MorningBrief")]) as brief:
+            self.assertEqual(len(select_signals(snap, symbol="QQQ")), 1)
+            self.assertEqual(len(select_signals(snap)), 2)
+        brief.assert_called_once_with(symbol=None)
+        self.assertEqual(snap.annotations()["MorningBrief"]["count"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+Tests for the pooled, WAL-mode SQLite access layer.
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+
+from core.utils.sqlite_pool import SQLiteStore, get_store
+
+
+class TestSQLiteStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "t.db")
+        self.store = SQLiteStore(self.path)
+        self.store.executescript("CREATE TABLE t (id INTEGER PRIMARY KEY AUTOINCREMENT, v INTEGER)")
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_wal_and_pooled_connection(self):
+        self.assertEqual(self.store.query_one("PRAGMA journal_mode")[0], "wal")
+        self.assertIs(self.store.connection(), self.store.connection())
+
+        other = []
+        t = threading.Thread(target=lambda: other.append(self.store.connection()))
+        t.start()
+        t.join()
+        self.assertIsNot(other[0], self.store.connection())
+
+    def test_queued_writes_batched_and_visible_to_reads(self):
+        for i in range(200):
+            self.store.enqueue("INSERT INTO t (v) VALUES (?)", (i,))
+        self.store.enqueue_many("INSERT INTO t (v) VALUES (?)", [(i,) for i in range(50)])
+
+        # Reads wait for the writer, so enqueued rows are always visible
+        self.assertEqual(self.store.query_one("SELECT COUNT(*) FROM t")[0], 250)
+        self.assertLess(self.store.stats['batches'], 201)
+
+    def test_bad_statement_does_not_drop_batch(self):
+        self.store.enqueue("INSERT INTO t (v) VALUES (?)", (1,))
+        self.store.enqueue("INSERT INTO missing (v) VALUES (?)", (2,))
+        self.store.enqueue("INSERT INTO t (v) VALUES (?)", (3,))
+        self.assertTrue(self.store.flush())
+        self.assertEqual([r[0] for r in self.store.query("SELECT v FROM t ORDER BY id")], [1, 3])
+        self.assertEqual(self.store.stats['errors'], 1)
+
+    def test_sync_write_and_transaction(self):
+        row_id = self.store.write("INSERT INTO t (v) VALUES (?)", (7,))
+        self.assertEqual(self.store.query_one("SELECT v FROM t WHERE id = ?", (row_id,))[0], 7)
+
+        with self.assertRaises(RuntimeError):
+            with self.store.transaction() as conn:
+                conn.execute("INSERT INTO t (v) VALUES (8)")
+                raise RuntimeError("boom")
+        self.assertEqual(self.store.query_one("SELECT COUNT(*) FROM t")[0], 1)
+
+    def test_get_store_is_shared(self):
+        path = os.path.join(self.tmp.name, "shared.db")
+        store = get_store(path)
+        self.assertIs(store, get_store(os.path.relpath(path)))
+        store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
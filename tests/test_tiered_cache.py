@@ -0,0 +1,121 @@
+"""
+Tests for the tiered (memory + disk) cache.
+"""
+
+import asyncio
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from core.utils.tiered_cache import TieredCache
+
+
+class TestTieredCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_ttl_and_lru_byte_budget(self):
+        cache = TieredCache("t", ttl=60, max_bytes=300, sizeof=lambda v: 100)
+        for k in "abc":
+            cache.set(k, k.upper())
+        cache.get("a")                      # a becomes most recently used
+        cache.set("d", "D")                 # evicts b
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual([cache.get(k) for k in "acd"], ["A", "C", "D"])
+
+        cache.set("short", 1, ttl=-1)
+        self.assertIsNone(cache.get("short"))
+        self.assertEqual(cache.get("short", allow_stale=True), 1)
+
+    def test_stale_while_revalidate(self):
+        cache = TieredCache("t", ttl=60, stale_ttl=60)
+        cache.set("k", "old", ttl=-1)
+        refreshed = threading.Event()
+
+        def loader():
+            refreshed.set()
+            return "new"
+
+        self.assertEqual(cache.get_or_load("k", loader), "old")
+        self.assertTrue(refreshed.wait(2))
+        for _ in range(100):
+            if cache.get("k") == "new":
+                break
+            time.sleep(0.01)
+        self.assertEqual(cache.get("k"), "new")
+
+    def test_single_flight(self):
+        cache = TieredCache("t", ttl=60)
+        calls = []
+        gate = threading.Event()
+
+        def loader():
+            calls.append(1)
+            gate.wait(2)
+            return 42
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_load("k", loader)))
+                   for _ in range(8)]
+        for t in threads:
+            t.start()
+        time.sleep(0.1)
+        gate.set()
+        for t in threads:
+            t.join()
+        self.assertEqual(results, [42] * 8)
+        self.assertEqual(len(calls), 1)
+
+    def test_stale_on_error(self):
+        cache = TieredCache("t", ttl=60)
+        cache.set("k", "last-good", ttl=-1)
+
+        def boom():
+            raise ConnectionError("rate limited")
+
+        self.assertEqual(cache.get_or_load("k", boom), "last-good")
+        with self.assertRaises(ConnectionError):
+            cache.get_or_load("missing", boom)
+        self.assertIsNone(cache.get_or_load("none", lambda: None))
+        self.assertNotIn("none", cache)
+
+    def test_disk_tier_survives_new_instance(self):
+        for serializer in ("json", "pickle"):
+            first = TieredCache("disk_" + serializer, ttl=60, disk_dir=self.tmp, serializer=serializer)
+            first.set("key:1", {"a": [1, 2]})
+            second = TieredCache("disk_" + serializer, ttl=60, disk_dir=self.tmp, serializer=serializer)
+            self.assertEqual(second.get("key:1"), {"a": [1, 2]})
+            self.assertEqual(second.stats()["disk_hits"], 1)
+
+        cache = TieredCache("clr", ttl=60, disk_dir=self.tmp)
+        cache.set("a_1", 1)
+        cache.set("a_2", 2)
+        cache.set("b_1", 3)
+        self.assertEqual(cache.clear("a_"), 2)
+        self.assertEqual(TieredCache("clr", ttl=60, disk_dir=self.tmp).get("b_1"), 3)
+
+    def test_async_single_flight(self):
+        cache = TieredCache("t", ttl=60)
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "brief"
+
+        async def run():
+            return await asyncio.gather(*(cache.aget_or_load("master", loader) for _ in range(5)))
+
+        self.assertEqual(asyncio.run(run()), ["brief"] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.get("master"), "brief")
+
+
+if __name__ == '__main__':
+    unittest.main()
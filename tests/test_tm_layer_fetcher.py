@@ -0,0 +1,103 @@
+"""
+Tests for the concurrent Trap Matrix layer fan-out.
+"""
+
+import time
+import unittest
+from types import SimpleNamespace
+
+from live_monitoring.enrichment.apis.tm_layer_fetcher import LayerFetcher
+from live_monitoring.enrichment.apis.tm_models import MarketState
+
+
+class _Slow:
+    def __init__(self, delay, result):
+        self.delay = delay
+        self.result = result
+        self._cache_ts = {}
+
+    def __call__(self, *args, **kwargs):
+        time.sleep(self.delay)
+        return self.result
+
+
+def _fetcher(delay=0.2, gex_delay=None, tech_delay=None):
+    fetcher = LayerFetcher()
+    fetcher._initialized = True
+    tech = SimpleNamespace(
+        current_price=500.0, vix=18.0, vix_regime="NORMAL", death_cross=False,
+        stale=False, computed_at="now", to_dict=lambda: {"moving_averages": {"sma_200": 480.0}},
+    )
+    pivots = SimpleNamespace(stale=False, computed_at="now", to_dict=lambda: {"classic": {"pp": 499.0}})
+    gex = SimpleNamespace(
+        gamma_walls=[SimpleNamespace(strike=510.0, gex=1e9, signal=None)],
+        gamma_flip=495.0, max_pain=500.0, gamma_regime="POSITIVE", timestamp="now",
+    )
+    detail = SimpleNamespace(short_volume_pct=60.0, dp_position_dollars=2e9, date="2026-03-02")
+
+    fetcher._tech_agent = SimpleNamespace(compute=_Slow(tech_delay or delay, tech), _cache_ts={})
+    fetcher._pivot_calc = SimpleNamespace(compute=_Slow(delay, pivots), _cache_ts={})
+    fetcher._gex_calc = SimpleNamespace(compute_gex=_Slow(gex_delay or delay, gex))
+    fetcher._cot_client = SimpleNamespace(get_position=_Slow(delay, SimpleNamespace(specs_net=-150_000, report_date="d")))
+    fetcher._stockgrid = SimpleNamespace(get_ticker_detail=_Slow(delay, detail))
+    return fetcher
+
+
+class TestLayerFetcher(unittest.TestCase):
+
+    def test_parallel_matches_sequential(self):
+        sequential = MarketState(symbol="SPY")
+        _fetcher(delay=0).fetch_all("SPY", sequential, parallel=False)
+        parallel = MarketState(symbol="SPY")
+        _fetcher(delay=0).fetch_all("SPY", parallel)
+
+        for name in ("current_price", "pivots", "moving_averages", "gex_walls", "gamma_flip",
+                     "cot_signal", "dp_position_dollars"):
+            self.assertEqual(getattr(parallel, name), getattr(sequential, name), name)
+        self.assertEqual(set(parallel.staleness), set(sequential.staleness))
+        # Dark pool live level priced off technicals' current_price
+        live = [l for l in parallel.dp_levels if l["is_live"]]
+        self.assertEqual(live[0]["price"], 500.0)
+
+    def test_latency_tracks_slowest_layer_across_symbols(self):
+        fetcher = _fetcher(delay=0.2)
+        states = {s: MarketState(symbol=s) for s in ("SPY", "QQQ", "IWM")}
+        start = time.monotonic()
+        fetcher.fetch_many(states)
+        elapsed = time.monotonic() - start
+        self.assertLess(elapsed, 0.6)  # sequential would be 3 symbols x 5 layers x 0.2s
+        self.assertTrue(all(s.current_price == 500.0 for s in states.values()))
+
+    def test_large_watchlist_batches_to_pool(self):
+        fetcher = _fetcher(delay=0.2)
+        states = {f"S{i:02d}": MarketState(symbol=f"S{i:02d}") for i in range(12)}
+        # 60 jobs at once would queue 4 deep on 16 workers and miss a 0.5s deadline
+        fetcher.fetch_many(states, deadlines={layer: 0.5 for layer in
+                                              ("pivots", "technicals", "dark_pool", "gex", "cot")})
+        for state in states.values():
+            self.assertEqual(set(state.staleness), {"pivots", "technicals", "gex", "cot", "dp"}, state.symbol)
+
+    def test_layer_deadline(self):
+        fetcher = _fetcher(delay=0.0, gex_delay=1.0)
+        state = MarketState(symbol="SPY")
+        start = time.monotonic()
+        fetcher.fetch_all("SPY", state, deadlines={"gex": 0.2})
+        self.assertLess(time.monotonic() - start, 0.8)
+        self.assertEqual(state.gex_walls, [])
+        self.assertNotIn("gex", state.staleness)
+        self.assertEqual(state.current_price, 500.0)
+        time.sleep(1.0)  # late GEX result must not leak into the returned state
+        self.assertEqual(state.gex_walls, [])
+
+    def test_dark_pool_skipped_without_technicals(self):
+        fetcher = _fetcher(delay=0.0, tech_delay=1.0)
+        state = MarketState(symbol="SPY")
+        fetcher.fetch_all("SPY", state, deadlines={"technicals": 0.2})
+        self.assertEqual(state.current_price, 0.0)
+        self.assertEqual(state.dp_levels, [])
+        self.assertNotIn("dp", state.staleness)
+        self.assertIn("gex", state.staleness)
+
+
+if __name__ == '__main__':
+    unittest.main()
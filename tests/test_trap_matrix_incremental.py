@@ -0,0 +1,133 @@
+"""
+Tests for incremental Trap Matrix classification and deltas.
+"""
+
+import copy
+import random
+import unittest
+from unittest import mock
+
+from live_monitoring.enrichment.apis import tm_trap_classifier
+from live_monitoring.enrichment.apis.tm_models import MarketState
+from live_monitoring.enrichment.apis.tm_state_differ import changed_fields
+from live_monitoring.enrichment.apis.tm_trap_classifier import (
+    CLASSIFIER_FIELDS, classify_traps, classify_traps_incremental,
+)
+from live_monitoring.enrichment.apis.trap_matrix_orchestrator import TrapMatrixOrchestrator
+
+
+def _state(rng, price=500.0):
+    return MarketState(
+        symbol="SPY",
+        current_price=price,
+        death_cross=rng.random() < 0.5,
+        cot_net_spec=rng.choice([-160_000, -70_000, 20_000, 120_000]),
+        pivots={"classic": {"P": price + rng.uniform(-8, 8), "S1": price - 5, "S2": price - rng.uniform(2, 12),
+                            "S3": price - 15, "R1": price + 5, "R2": price + 12, "R3": price + 20}},
+        moving_averages={"MA200_SMA": {"value": price - 10}},
+        dp_levels=[{"price": price + rng.uniform(-10, 10), "volume": 1_000_000, "type": rng.choice(
+            ["RESISTANCE", "SUPPORT"]), "strength": "STRONG"} for _ in range(3)],
+        dp_position_dollars=rng.choice([0, 2e9]),
+        gex_walls=[{"strike": price + 12, "gex": 2e9, "signal": "RESISTANCE"}],
+        gamma_regime=rng.choice(["NEGATIVE", "POSITIVE"]),
+        vix=rng.choice([18.0, 34.0]),
+        vix_regime="NORMAL",
+    )
+
+
+def _mutate(rng, state):
+    new = copy.deepcopy(state)
+    field = rng.choice(["current_price", "vix", "gex_walls", "cot_net_spec", "death_cross", "none"])
+    if field == "current_price":
+        new.current_price += rng.uniform(-3, 3)
+    elif field == "vix":
+        new.vix = 40.0 if (new.vix or 0) < 30 else 15.0
+    elif field == "gex_walls":
+        new.gex_walls = [{"strike": new.current_price + rng.uniform(5, 25), "gex": 1e9, "signal": "RESISTANCE"}]
+    elif field == "cot_net_spec":
+        new.cot_net_spec = -new.cot_net_spec
+    elif field == "death_cross":
+        new.death_cross = not new.death_cross
+    return new
+
+
+def _as_dicts(traps):
+    return [t.to_dict() for t in traps]
+
+
+class TestIncrementalClassifier(unittest.TestCase):
+
+    def test_matches_full_classification(self):
+        rng = random.Random(3)
+        state = _state(rng)
+        traps, previous = classify_traps_incremental(state, None)
+        self.assertEqual(_as_dicts(traps), _as_dicts(classify_traps(state)))
+        for _ in range(300):
+            new = _mutate(rng, state)
+            traps, previous = classify_traps_incremental(new, changed_fields(state, new, CLASSIFIER_FIELDS), previous)
+            self.assertEqual(_as_dicts(traps), _as_dicts(classify_traps(new)))
+            state = new
+
+    def test_only_dependent_classifiers_rerun(self):
+        rng = random.Random(5)
+        state = _state(rng)
+        _, previous = classify_traps_incremental(state, None)
+
+        calls = []
+        wrapped = []
+        for fn in tm_trap_classifier._CLASSIFIERS:
+            def wrapper(s, fn=fn):
+                calls.append(fn.__name__)
+                return fn(s)
+            wrapper.__name__ = fn.__name__
+            wrapped.append(wrapper)
+
+        with mock.patch.object(tm_trap_classifier, "_CLASSIFIERS", wrapped):
+            classify_traps_incremental(state, set(), previous)
+            self.assertEqual(calls, [])
+            classify_traps_incremental(state, {"gex_walls"}, previous)
+            self.assertEqual(sorted(calls), ["_classify_bull_trap", "_classify_ceiling_trap"])
+
+
+class _FakeFetcher:
+    def __init__(self, states):
+        self.states = iter(states)
+
+    def fetch_many(self, states):
+        for symbol, state in states.items():
+            src = next(self.states)
+            for name in CLASSIFIER_FIELDS:
+                setattr(state, name, copy.deepcopy(getattr(src, name)))
+
+
+class TestOrchestratorDelta(unittest.TestCase):
+
+    def test_delta_between_versions(self):
+        rng = random.Random(9)
+        first = _state(rng)
+        first.vix = 15.0
+        second = copy.deepcopy(first)
+        second.vix = 35.0
+        third = copy.deepcopy(second)
+
+        orch = TrapMatrixOrchestrator()
+        orch._fetcher = _FakeFetcher([first, second, third])
+
+        v1 = orch.get_current_state("SPY")
+        self.assertIsNone(v1.delta["from_version"])
+        self.assertFalse(v1.delta["empty"])
+
+        v2 = orch.get_current_state("SPY")
+        self.assertEqual(v2.delta["from_version"], 1)
+        self.assertEqual(v2.delta["changed_inputs"], ["vix"])
+        self.assertEqual([a["key"] for a in v2.delta["added"]], ["WAR_HEADLINE"])
+        self.assertEqual(v2.delta["removed"], [])
+
+        v3 = orch.get_current_state("SPY")
+        self.assertTrue(v3.delta["empty"])
+        self.assertEqual(_as_dicts(v3.traps), _as_dicts(v2.traps))
+        self.assertIn("delta", v3.to_dict())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+Tests for the inverted similar-statement index behind TrumpPatternAgent.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "live_monitoring", "agents"))
+
+from trump_data_models import StatementSource, TrumpStatement  # noqa: E402
+from trump_database import TrumpDatabase  # noqa: E402
+from trump_pattern_agent import TrumpPatternAgent  # noqa: E402
+from trump_statement_index import minhash_signature  # noqa: E402
+
+
+def _statement(sid, topics, entities, reaction=0.5, text="", minutes=0):
+    return TrumpStatement(
+        id=sid,
+        timestamp=datetime(2026, 3, 2, 10, 0) + timedelta(minutes=minutes),
+        source=StatementSource.TRUTH_SOCIAL,
+        raw_text=text or f"statement {sid}",
+        topics=topics,
+        entities=entities,
+        spy_change_1hr=reaction,
+        market_data_collected=reaction is not None,
+    )
+
+
+def _overlap_scan(history, query, top_k):
+    """Reference: the old full scan over every statement with market data."""
+    out = []
+    for hist in sorted(history, key=lambda s: s.timestamp, reverse=True):
+        if hist.id == query.id or hist.spy_change_1hr is None or not hist.market_data_collected:
+            continue
+        topic_overlap = len(set(query.topics) & set(hist.topics))
+        entity_overlap = len(set(query.entities) & set(hist.entities))
+        score = (topic_overlap * 0.6 + entity_overlap * 0.4) / max(len(query.topics) + len(query.entities), 1)
+        if score > 0.2:
+            out.append((hist.id, round(score, 3)))
+    out.sort(key=lambda x: x[1], reverse=True)
+    return out[:top_k]
+
+
+class TestStatementIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.db = TrumpDatabase(os.path.join(self.tmp, "trump.db"))
+        self.agent = TrumpPatternAgent(db=self.db)
+        topics = ["tariffs", "china", "fed", "rates", "trade"]
+        entities = ["Xi", "Powell", "Apple", "Tesla"]
+        self.history = []
+        for i in range(60):
+            stmt = _statement(f"s{i}", [topics[i % 5], topics[(i * 3) % 5]], [entities[i % 4]],
+                              reaction=None if i % 7 == 0 else (i % 11 - 5) / 10, minutes=i)
+            self.history.append(stmt)
+            self.db.save_statement(stmt)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_matches_full_scan(self):
+        for query in (_statement("q1", ["tariffs", "china"], ["Xi"]),
+                      _statement("q2", ["fed"], ["Powell", "Apple"]),
+                      self.history[3]):
+            similar = self.agent.find_similar_statements(query, top_k=10)
+            self.assertEqual([(s.statement.id, s.similarity_score) for s in similar],
+                             _overlap_scan(self.history, query, 10))
+            for s in similar:
+                self.assertEqual(s.market_reaction, s.statement.spy_change_1hr)
+
+    def test_save_updates_index_incrementally(self):
+        query = _statement("q", ["crypto"], ["Coinbase"])
+        self.assertEqual(self.agent.find_similar_statements(query), [])
+
+        pending = _statement("new", ["crypto"], ["Coinbase"], reaction=None)
+        self.db.save_statement(pending)
+        self.assertEqual(self.agent.find_similar_statements(query), [])
+
+        pending.spy_change_1hr = 1.2
+        pending.market_data_collected = True
+        self.db.save_statement(pending)
+        similar = self.agent.find_similar_statements(query)
+        self.assertEqual([(s.statement.id, s.market_reaction) for s in similar], [("new", 1.2)])
+
+        pending.topics, pending.entities = ["fed"], ["Powell"]
+        self.db.save_statement(pending)
+        self.assertEqual(self.agent.find_similar_statements(query), [])
+
+    def test_other_process_writes_and_backfill_are_picked_up(self):
+        # A second handle on the same file stands in for the collector process
+        self.agent.find_similar_statements(self.history[1])
+        other = TrumpDatabase(self.db.db_path)
+        other.save_statement(_statement("remote", ["gold"], ["Barrick"], reaction=0.7))
+
+        self.db.index.refresh(force=True)
+        similar = self.agent.find_similar_statements(_statement("q", ["gold"], []))
+        self.assertEqual([s.statement.id for s in similar], ["remote"])
+
+        # Statements written before the index existed are indexed on open
+        with self.db._get_connection() as conn:
+            conn.execute("DELETE FROM statement_index")
+            conn.execute("DELETE FROM statement_terms")
+        reopened = TrumpPatternAgent(db=TrumpDatabase(self.db.db_path))
+        self.assertEqual([s.statement.id for s in reopened.find_similar_statements(_statement("q", ["gold"], []))],
+                         ["remote"])
+
+    def test_text_similarity(self):
+        text = "we will put massive tariffs on chinese steel starting monday"
+        self.db.save_statement(_statement("steel", ["misc"], [], reaction=-0.8, text=text))
+        query = _statement("q", ["unrelated"], [], text=text + " morning")
+
+        self.assertEqual(self.agent.find_similar_statements(query), [])
+        similar = self.agent.find_similar_statements(query, text_weight=1.0)
+        self.assertEqual(similar[0].statement.id, "steel")
+        self.assertGreater(similar[0].similarity_score, 0.5)
+
+    def test_minhash_signature(self):
+        sig = minhash_signature("tariffs on china")
+        self.assertEqual(sig, minhash_signature("Tariffs on China!"))
+        self.assertEqual(len(sig), 32)
+        self.assertIsNone(minhash_signature(""))
+
+
+if __name__ == "__main__":
+    unittest.main()
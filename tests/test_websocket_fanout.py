@@ -0,0 +1,104 @@
+"""
+Tests for the queued WebSocket broadcast engine.
+"""
+
+import asyncio
+import json
+import time
+import unittest
+
+from backend.app.core.websocket_manager import ConnectionManager, WebSocketPublisher
+
+
+class _FakeSocket:
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.frames = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        if self.fail:
+            raise RuntimeError("socket closed")
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.frames.append(json.loads(text))
+
+    async def send_json(self, message):
+        await self.send_text(json.dumps(message))
+
+
+async def _drain(manager, timeout=2.0, in_flight=0.1):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and any(c.queue for c in manager._connections.values()):
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(in_flight)  # let the last popped frame finish sending
+
+
+class TestWebSocketFanOut(unittest.TestCase):
+
+    def test_slow_client_does_not_stall_broadcast(self):
+        async def run():
+            manager = ConnectionManager(max_queue=16)
+            publisher = WebSocketPublisher(manager)
+            fast = [_FakeSocket() for _ in range(200)]
+            slow = _FakeSocket(delay=0.5)
+            for ws in fast + [slow]:
+                await manager.connect(ws, channel="unified")
+
+            worst = 0.0
+            for i in range(50):
+                start = time.monotonic()
+                await publisher.publish_alert({"title": f"alert {i}"}, alert_type="dp", symbol=None)
+                worst = max(worst, time.monotonic() - start)
+                await asyncio.sleep(0.005)  # publisher cadence; lets sender tasks run
+
+            deadline = time.monotonic() + 2
+            while time.monotonic() < deadline and any(len(ws.frames) < 50 for ws in fast):
+                await asyncio.sleep(0.01)
+            return worst, fast, slow, manager.get_stats()
+
+        worst, fast, slow, stats = asyncio.run(run())
+        self.assertLess(worst, 0.05)   # publish never waits on the slow socket
+        self.assertTrue(all(len(ws.frames) == 50 for ws in fast))
+        self.assertEqual([f["embed"]["title"] for f in fast[0].frames], [f"alert {i}" for i in range(50)])
+        self.assertLessEqual(len(slow.frames), 1)
+        self.assertGreater(stats["queue"]["dropped"], 0)   # slow client's queue overflowed
+        self.assertLessEqual(stats["queue"]["max_depth"], 16)
+
+    def test_market_channel_latest_price_wins(self):
+        async def run():
+            manager = ConnectionManager()
+            publisher = WebSocketPublisher(manager)
+            ws = _FakeSocket(delay=0.05)
+            await manager.connect(ws, channel="market_SPY")
+            for price in range(100, 110):
+                await publisher.publish_market_data("SPY", {"price": price})
+            await publisher.publish_alert({"title": "dp"}, symbol="SPY")
+            await _drain(manager)
+            return ws.frames, manager.get_stats()
+
+        frames, stats = asyncio.run(run())
+        prices = [f["data"]["price"] for f in frames if f["type"] == "market_data"]
+        self.assertEqual(prices[-1], 109)
+        self.assertLess(len(prices), 10)
+        self.assertEqual(frames[-1]["type"], "alert")
+        self.assertGreater(stats["queue"]["coalesced"], 0)
+
+    def test_failed_socket_is_disconnected(self):
+        async def run():
+            manager = ConnectionManager()
+            ws = _FakeSocket(fail=True)
+            await manager.connect(ws, channel="signals")
+            await manager.broadcast_signals({"type": "signal"})
+            await asyncio.sleep(0.05)
+            return manager.get_stats()
+
+        stats = asyncio.run(run())
+        self.assertEqual(stats["total_connections"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()